@@ -16,12 +16,16 @@ Environment-based switching:
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 import os
+import re
 import shutil
 
+from .artifact_delta import CHUNK_INDEX_SUFFIX
+from .artifacts import MEMBER_INDEX_SUFFIX, ArtifactName
+from .storage_backend import s3_transfer_config
 from .workflow_outputs import WorkflowOutputRoot
 
 
@@ -36,15 +40,173 @@ class ArtifactLocation:
 # Supported artifact archive extensions (in order of preference)
 ARTIFACT_EXTENSIONS = (".tar.zst", ".tar.xz")
 
+# Companion files stored next to an archive and copied along with it.
+SIDECAR_SUFFIXES = (".sha256sum", CHUNK_INDEX_SUFFIX, MEMBER_INDEX_SUFFIX)
+
 
 def _is_artifact_archive(filename: str) -> bool:
     """Check if a filename is a recognized artifact archive."""
     return any(filename.endswith(ext) for ext in ARTIFACT_EXTENSIONS)
 
 
+@dataclass(frozen=True)
+class ArtifactObject:
+    """A stored file (archive or sidecar) as reported by a backend listing."""
+
+    key: str  # Filename relative to the backend root
+    size: int
+    # Content fingerprint: the S3 ETag, or size and mtime for local files.
+    # Only comparable between objects listed from the same kind of backend.
+    # S3Backend uploads and copies with the same parts (s3_transfer_config)
+    # so that multipart ETags of copies match their source.
+    etag: Optional[str] = None
+
+
+@dataclass
+class CopyPlan:
+    """Objects to copy between backends, computed from one listing of each."""
+
+    to_copy: List[ArtifactObject] = field(default_factory=list)
+    up_to_date: List[ArtifactObject] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def copy_bytes(self) -> int:
+        return sum(obj.size for obj in self.to_copy)
+
+
+def plan_artifact_copy(
+    artifact_keys: Iterable[str],
+    source_objects: Dict[str, ArtifactObject],
+    dest_objects: Dict[str, ArtifactObject],
+) -> CopyPlan:
+    """Plans copying artifacts and their sidecars between two listings.
+
+    Objects already present in the destination with the same size and ETag
+    are skipped. Sidecars are only planned if they exist in the source, so
+    no per-object existence checks are needed when executing the plan.
+    """
+    plan = CopyPlan()
+    for artifact_key in sorted(artifact_keys):
+        if artifact_key not in source_objects:
+            plan.missing.append(artifact_key)
+            continue
+        for key in [artifact_key] + [
+            f"{artifact_key}{suffix}" for suffix in SIDECAR_SUFFIXES
+        ]:
+            obj = source_objects.get(key)
+            if obj is None:
+                continue
+            existing = dest_objects.get(key)
+            if (
+                existing is not None
+                and existing.size == obj.size
+                and existing.etag is not None
+                and existing.etag == obj.etag
+            ):
+                plan.up_to_date.append(obj)
+            else:
+                plan.to_copy.append(obj)
+    return plan
+
+
+class ArtifactIndex:
+    """Parsed listing of the objects stored in a backend.
+
+    Archive filenames are parsed once into (name, component, target family)
+    keys, so selecting the artifacts for a stage or GPU family does not
+    rescan or reparse the listing.
+
+    Example:
+        index = backend.artifact_index()
+        index.find({"blas"}, ["generic", "gfx94X-dcgpu"], ["lib", "test"])
+    """
+
+    def __init__(self, objects: Iterable[ArtifactObject]):
+        self.objects: Dict[str, ArtifactObject] = {}
+        # (name, component, target_family) -> extension -> filename
+        self._archives: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+        self._by_target_family: Dict[str, Set[str]] = {}
+        for obj in objects:
+            self.objects[obj.key] = obj
+            an = ArtifactName.from_filename(obj.key)
+            if an is None:
+                continue
+            ext = obj.key[obj.key.index(".tar.") :]
+            key = (an.name, an.component, an.target_family)
+            self._archives.setdefault(key, {})[ext] = obj.key
+            self._by_target_family.setdefault(an.target_family, set()).add(obj.key)
+
+    @staticmethod
+    def from_filenames(filenames: Iterable[str]) -> "ArtifactIndex":
+        """Builds an index from filenames alone, without sizes or ETags."""
+        return ArtifactIndex(ArtifactObject(key=f, size=0) for f in filenames)
+
+    def __len__(self) -> int:
+        return sum(len(exts) for exts in self._archives.values())
+
+    @property
+    def filenames(self) -> Set[str]:
+        """Filenames of all parsed artifact archives."""
+        return set().union(*self._by_target_family.values())
+
+    def for_target_families(self, target_families: Iterable[str]) -> Set[str]:
+        """Archive filenames whose target family is one of target_families."""
+        return set().union(
+            *(self._by_target_family.get(tf, ()) for tf in target_families)
+        )
+
+    def find(
+        self,
+        artifact_names: Iterable[str],
+        target_families: Sequence[str],
+        components: Sequence[str],
+    ) -> List[str]:
+        """Finds archives for artifact names × target families × components.
+
+        Results are ordered by artifact name, then the given target family and
+        component order. Only the preferred extension (see ARTIFACT_EXTENSIONS)
+        is returned when an artifact is stored in several formats.
+        """
+        matched = []
+        for name in sorted(artifact_names):
+            for tf in target_families:
+                for comp in components:
+                    exts = self._archives.get((name, comp, tf))
+                    if not exts:
+                        continue
+                    for ext in ARTIFACT_EXTENSIONS:
+                        if ext in exts:
+                            matched.append(exts[ext])
+                            break
+        return matched
+
+
+def compile_artifact_filter(
+    includes: Sequence[str], excludes: Sequence[str]
+) -> Callable[[str], bool]:
+    """Compiles include/exclude regexes into a filename predicate.
+
+    A filename passes if it matches any include (or there are none) and
+    matches no exclude. Patterns are searched, not anchored.
+    """
+    include_patterns = [re.compile(p) for p in includes]
+    exclude_patterns = [re.compile(p) for p in excludes]
+
+    def _predicate(filename: str) -> bool:
+        if include_patterns and not any(p.search(filename) for p in include_patterns):
+            return False
+        return not any(p.search(filename) for p in exclude_patterns)
+
+    return _predicate
+
+
 class ArtifactBackend(ABC):
     """Abstract base for artifact storage backends."""
 
+    # Cached result of artifact_index(), reset when this backend writes.
+    _artifact_index: Optional[ArtifactIndex] = None
+
     @abstractmethod
     def list_artifacts(self, name_filter: Optional[str] = None) -> List[str]:
         """List available artifact filenames.
@@ -82,6 +244,28 @@ class ArtifactBackend(ABC):
         """Check if an artifact exists in the backend."""
         pass
 
+    @abstractmethod
+    def read_artifact_range(
+        self, artifact_key: str, start: int = 0, length: Optional[int] = None
+    ) -> bytes:
+        """Read a byte range of an artifact (or companion file) into memory.
+
+        Used to fetch small sidecar files and the changed chunks of chunked
+        archives (see artifact_delta.py).
+
+        Args:
+            artifact_key: The artifact filename (e.g., "blas_lib_gfx94X.tar.zst")
+            start: Offset of the first byte to read
+            length: Number of bytes to read (None reads to the end)
+
+        Returns b"" when `start` is at or past the end of the artifact.
+
+        Raises:
+            FileNotFoundError: If the artifact does not exist
+            PermissionError: If the backend denies access to the artifact
+        """
+        pass
+
     @abstractmethod
     def copy_artifact(
         self, artifact_key: str, source_backend: "ArtifactBackend"
@@ -96,6 +280,46 @@ class ArtifactBackend(ABC):
         """
         pass
 
+    def list_objects(self) -> Dict[str, ArtifactObject]:
+        """List all stored files (archives and sidecars) with one listing.
+
+        The default implementation lists archives only, without sizes or
+        ETags, so that every archive is planned for copying.
+
+        Returns:
+            Dict of filename to ArtifactObject
+        """
+        return {key: ArtifactObject(key=key, size=0) for key in self.list_artifacts()}
+
+    def artifact_index(self, refresh: bool = False) -> ArtifactIndex:
+        """Get an index of the stored objects, listing the backend once.
+
+        The index is cached on the backend and reused by later calls until
+        this backend uploads or copies an object, or refresh is set.
+        """
+        if self._artifact_index is None or refresh:
+            self._artifact_index = ArtifactIndex(self.list_objects().values())
+        return self._artifact_index
+
+    def copy_object(
+        self,
+        key: str,
+        source_backend: "ArtifactBackend",
+        size: Optional[int] = None,
+    ) -> None:
+        """Copy one stored file (without sidecars) from source_backend.
+
+        Args:
+            key: Filename of the archive or sidecar
+            source_backend: The backend to copy from
+            size: Object size if known, used to tune multipart copies
+
+        The default implementation delegates archives to copy_artifact(),
+        which also copies their sidecars, and ignores sidecar keys.
+        """
+        if _is_artifact_archive(key):
+            self.copy_artifact(key, source_backend)
+
     @property
     @abstractmethod
     def base_uri(self) -> str:
@@ -162,13 +386,17 @@ class LocalDirectoryBackend(ArtifactBackend):
         """Copy artifact from source to staging."""
         if not source_path.exists():
             raise FileNotFoundError(f"Source artifact not found: {source_path}")
+        self._artifact_index = None
         dest = self._artifact_path(artifact_key)
         dest.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source_path, dest)
-        # Also copy sha256sum if it exists
-        sha_src = source_path.parent / f"{source_path.name}.sha256sum"
-        if sha_src.exists():
-            shutil.copy2(sha_src, self._artifact_path(f"{artifact_key}.sha256sum"))
+        # Also copy sidecar files (sha256sum, chunk and member indexes) if they exist
+        for suffix in SIDECAR_SUFFIXES:
+            sidecar_src = source_path.parent / f"{source_path.name}{suffix}"
+            if sidecar_src.exists():
+                shutil.copy2(
+                    sidecar_src, self._artifact_path(f"{artifact_key}{suffix}")
+                )
 
     def copy_artifact(
         self, artifact_key: str, source_backend: "ArtifactBackend"
@@ -181,18 +409,62 @@ class LocalDirectoryBackend(ArtifactBackend):
         src = source_backend.base_path / artifact_key
         if not src.exists():
             raise FileNotFoundError(f"Artifact not found in source backend: {src}")
-        dest = self.base_path / artifact_key
+        self.copy_object(artifact_key, source_backend)
+        # Also copy sidecar files (sha256sum, chunk and member indexes) if they exist
+        for suffix in SIDECAR_SUFFIXES:
+            sidecar_key = f"{artifact_key}{suffix}"
+            if (source_backend.base_path / sidecar_key).exists():
+                self.copy_object(sidecar_key, source_backend)
+
+    def list_objects(self) -> Dict[str, ArtifactObject]:
+        """List files in the local staging directory."""
+        objects = {}
+        if not self.base_path.exists():
+            return objects
+        with os.scandir(self.base_path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                # copy2 preserves mtimes, so copies keep the same fingerprint.
+                objects[entry.name] = ArtifactObject(
+                    key=entry.name,
+                    size=st.st_size,
+                    etag=f"{st.st_size}-{st.st_mtime_ns}",
+                )
+        return objects
+
+    def copy_object(
+        self,
+        key: str,
+        source_backend: "ArtifactBackend",
+        size: Optional[int] = None,
+    ) -> None:
+        """Copy one file from another local backend."""
+        if not isinstance(source_backend, LocalDirectoryBackend):
+            raise TypeError(
+                f"Cannot copy from {type(source_backend).__name__} to LocalDirectoryBackend"
+            )
+        self._artifact_index = None
+        dest = self.base_path / key
         dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dest)
-        # Also copy sha256sum if it exists
-        sha_src = source_backend.base_path / f"{artifact_key}.sha256sum"
-        if sha_src.exists():
-            shutil.copy2(sha_src, self.base_path / f"{artifact_key}.sha256sum")
+        shutil.copy2(source_backend.base_path / key, dest)
 
     def artifact_exists(self, artifact_key: str) -> bool:
         """Check if artifact exists in local staging."""
         return self._artifact_path(artifact_key).exists()
 
+    def read_artifact_range(
+        self, artifact_key: str, start: int = 0, length: Optional[int] = None
+    ) -> bytes:
+        """Read a byte range of an artifact in local staging."""
+        src = self._artifact_path(artifact_key)
+        if not src.exists():
+            raise FileNotFoundError(f"Artifact not found in local staging: {src}")
+        with open(src, "rb") as f:
+            f.seek(start)
+            return f.read() if length is None else f.read(length)
+
 
 class S3Backend(ArtifactBackend):
     """Backend using AWS S3.
@@ -282,8 +554,15 @@ class S3Backend(ArtifactBackend):
 
     def upload_artifact(self, source_path: Path, artifact_key: str) -> None:
         """Upload to S3."""
+        self._artifact_index = None
         loc = self.output_root.artifact(artifact_key)
-        self.s3_client.upload_file(str(source_path), self.bucket, loc.relative_path)
+        kwargs = {}
+        config = s3_transfer_config(source_path.stat().st_size)
+        if config is not None:
+            kwargs["Config"] = config
+        self.s3_client.upload_file(
+            str(source_path), self.bucket, loc.relative_path, **kwargs
+        )
 
     def copy_artifact(
         self, artifact_key: str, source_backend: "ArtifactBackend"
@@ -293,22 +572,70 @@ class S3Backend(ArtifactBackend):
             raise TypeError(
                 f"Cannot copy from {type(source_backend).__name__} to S3Backend"
             )
+        self.copy_object(artifact_key, source_backend)
+        # Also copy sidecar files (sha256sum, chunk and member indexes) if they exist
+        for suffix in SIDECAR_SUFFIXES:
+            sidecar_key = f"{artifact_key}{suffix}"
+            if source_backend.artifact_exists(sidecar_key):
+                self.copy_object(sidecar_key, source_backend)
+
+    def list_objects(self) -> Dict[str, ArtifactObject]:
+        """List all objects under the run prefix with one paginated listing."""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        page_iterator = paginator.paginate(
+            Bucket=self.bucket, Prefix=f"{self.s3_prefix}/"
+        )
+        objects = {}
+        for page in page_iterator:
+            for obj in page.get("Contents", []):
+                key = obj["Key"].removeprefix(f"{self.s3_prefix}/")
+                if "/" in key:
+                    continue  # Nested prefixes (e.g. logs/) are not artifacts
+                objects[key] = ArtifactObject(
+                    key=key, size=obj.get("Size", 0), etag=obj.get("ETag")
+                )
+        return objects
+
+    def copy_object(
+        self,
+        key: str,
+        source_backend: "ArtifactBackend",
+        size: Optional[int] = None,
+    ) -> None:
+        """Server-side copy of one object (cross-bucket supported).
+
+        Objects above the multipart threshold are copied with parallel
+        UploadPartCopy requests, using the same part sizes as uploads so the
+        copy has the same ETag as its source. The size is looked up in the
+        source if not given.
+        """
+        if not isinstance(source_backend, S3Backend):
+            raise TypeError(
+                f"Cannot copy from {type(source_backend).__name__} to S3Backend"
+            )
+        self._artifact_index = None
         copy_source = {
             "Bucket": source_backend.bucket,
-            "Key": f"{source_backend.s3_prefix}/{artifact_key}",
+            "Key": f"{source_backend.s3_prefix}/{key}",
         }
-        dest_key = f"{self.s3_prefix}/{artifact_key}"
-        self.s3_client.copy(copy_source, self.bucket, dest_key)
-        # Also copy sha256sum if it exists
-        sha_key = f"{artifact_key}.sha256sum"
-        if source_backend.artifact_exists(sha_key):
-            sha_copy_source = {
-                "Bucket": source_backend.bucket,
-                "Key": f"{source_backend.s3_prefix}/{sha_key}",
-            }
-            self.s3_client.copy(
-                sha_copy_source, self.bucket, f"{self.s3_prefix}/{sha_key}"
+        dest_key = f"{self.s3_prefix}/{key}"
+        if size is None:
+            size = source_backend._object_size(key)
+        config = s3_transfer_config(size) if size is not None else None
+        if config is None:
+            self.s3_client.copy(copy_source, self.bucket, dest_key)
+            return
+        self.s3_client.copy(copy_source, self.bucket, dest_key, Config=config)
+
+    def _object_size(self, key: str) -> Optional[int]:
+        """Size of a stored object, or None if it cannot be determined."""
+        try:
+            response = self.s3_client.head_object(
+                Bucket=self.bucket, Key=f"{self.s3_prefix}/{key}"
             )
+        except Exception:
+            return None
+        return response.get("ContentLength")
 
     def artifact_exists(self, artifact_key: str) -> bool:
         """Check if artifact exists in S3."""
@@ -319,6 +646,36 @@ class S3Backend(ArtifactBackend):
         except Exception:
             return False
 
+    def read_artifact_range(
+        self, artifact_key: str, start: int = 0, length: Optional[int] = None
+    ) -> bytes:
+        """Read a byte range of an S3 object with a ranged GET."""
+        from botocore.exceptions import ClientError
+
+        loc = self.output_root.artifact(artifact_key)
+        byte_range = (
+            f"bytes={start}-"
+            if length is None
+            else f"bytes={start}-{start + length - 1}"
+        )
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=loc.relative_path, Range=byte_range
+            )
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in ("NoSuchKey", "404"):
+                raise FileNotFoundError(f"Artifact not found in S3: {loc.s3_uri}")
+            # S3 answers 403 rather than 404 for missing keys when the caller
+            # may not list the bucket.
+            if code in ("AccessDenied", "403"):
+                raise PermissionError(f"Access denied to S3 object: {loc.s3_uri}")
+            # The range starts past the end of the object (e.g. an empty one).
+            if code in ("InvalidRange", "416"):
+                return b""
+            raise
+        return response["Body"].read()
+
 
 def create_backend_from_env(
     run_id: Optional[str] = None,
@@ -0,0 +1,363 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Chunked artifact archives and delta transfer between consecutive builds.
+
+A chunked archive is an ordinary `.tar.zst` made of many independent zstd
+frames instead of one continuous stream. Frames are cut between tar members
+whose name hashes (crc32 of the member name) select a cut, bounded by minimum
+and maximum frame sizes, so members that did not change between two builds
+compress to byte-identical frames. Any zstd decoder reads the concatenated
+frames as a single stream, so consumers need no changes.
+
+Each chunked archive has a sidecar chunk index (`<archive>.chunks.json`)
+listing the offset, length and sha256 of every frame. When fetching an artifact
+that was downloaded before, only the frames whose digests are not present in
+the locally cached previous version are transferred (as ranged reads), and the
+rest are copied from the cache.
+
+Example:
+    cache = DeltaCache(Path("~/.cache/therock/artifacts").expanduser())
+    stats = download_artifact_delta(backend, "blas_lib_gfx94X.tar.zst", dest, cache)
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zlib
+
+# Suffix of the sidecar chunk index uploaded next to an archive.
+CHUNK_INDEX_SUFFIX = ".chunks.json"
+CHUNK_INDEX_VERSION = 1
+
+# Frame size bounds, in uncompressed tar bytes.
+DEFAULT_MIN_FRAME_SIZE = 1 << 20
+DEFAULT_MAX_FRAME_SIZE = 16 << 20
+# Between the bounds, a frame ends after a member whose name hashes to 0 modulo
+# this value, so boundaries depend on the member names rather than offsets.
+DEFAULT_CUT_MODULUS = 8
+
+
+def _get_pyzstd():
+    """Lazy import pyzstd with helpful error message."""
+    try:
+        import pyzstd
+
+        return pyzstd
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "pyzstd is required for zstd compression. "
+            "Install it with: pip install pyzstd"
+        )
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A byte range of a chunked archive holding one zstd frame."""
+
+    offset: int
+    length: int
+    digest: str  # sha256 hex digest of the compressed frame bytes
+
+
+@dataclass
+class ChunkIndex:
+    """Sidecar index describing the frames of a chunked archive."""
+
+    size: int = 0
+    chunks: List[Chunk] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": CHUNK_INDEX_VERSION,
+                "hash_algorithm": "sha256",
+                "size": self.size,
+                "chunks": [[c.offset, c.length, c.digest] for c in self.chunks],
+            }
+        )
+
+    @staticmethod
+    def from_json(text: str) -> "ChunkIndex":
+        data = json.loads(text)
+        if data.get("version") != CHUNK_INDEX_VERSION:
+            raise ValueError(f"Unsupported chunk index version: {data.get('version')}")
+        chunks = [
+            Chunk(offset, length, digest) for offset, length, digest in data["chunks"]
+        ]
+        index = ChunkIndex(size=data["size"], chunks=chunks)
+        index.validate()
+        return index
+
+    def save(self, path: Path):
+        Path(path).write_text(self.to_json())
+
+    @staticmethod
+    def load(path: Path) -> "ChunkIndex":
+        return ChunkIndex.from_json(Path(path).read_text())
+
+    def validate(self):
+        """Checks that chunks are contiguous and cover the whole archive."""
+        offset = 0
+        for chunk in self.chunks:
+            if chunk.offset != offset or chunk.length <= 0:
+                raise ValueError(f"Chunk index is not contiguous at offset {offset}")
+            offset += chunk.length
+        if offset != self.size:
+            raise ValueError(
+                f"Chunk index covers {offset} bytes but archive is {self.size} bytes"
+            )
+
+
+class ChunkedZstdWriter:
+    """Binary file object that writes a multi-frame zstd file.
+
+    Data is compressed into the current frame as it is written. Callers report
+    tar member boundaries via `before_member`/`after_member`, which end frames
+    after members whose name hash selects a cut. `close()` ends the final frame
+    and returns the resulting ChunkIndex.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        level: int,
+        min_frame_size: int = DEFAULT_MIN_FRAME_SIZE,
+        max_frame_size: int = DEFAULT_MAX_FRAME_SIZE,
+        cut_modulus: int = DEFAULT_CUT_MODULUS,
+    ):
+        pyzstd = _get_pyzstd()
+        self._compressor = pyzstd.ZstdCompressor(level_or_option=level)
+        self._continue_mode = pyzstd.ZstdCompressor.CONTINUE
+        self._flush_frame_mode = pyzstd.ZstdCompressor.FLUSH_FRAME
+        self._file = open(path, "wb")
+        self.min_frame_size = min_frame_size
+        self.max_frame_size = max_frame_size
+        self.cut_modulus = cut_modulus
+        self.index = ChunkIndex()
+        # Uncompressed (tar stream) offset at which each frame in index starts.
+        self.frame_starts: List[int] = []
+        self._uncompressed_pos = 0
+        self._frame_uncompressed_size = 0
+        self._frame_hash = hashlib.sha256()
+        self._frame_length = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        if self._frame_uncompressed_size >= self.max_frame_size:
+            self.end_frame()
+        self._emit(self._compressor.compress(data, self._continue_mode))
+        self._uncompressed_pos += len(data)
+        self._frame_uncompressed_size += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._uncompressed_pos
+
+    def before_member(self, size: int):
+        """Isolates large members into their own frames."""
+        if size >= self.min_frame_size and self._frame_uncompressed_size > 0:
+            self.end_frame()
+
+    def after_member(self, name: str):
+        """Ends the frame if the crc32 of the member name selects a cut."""
+        if self._frame_uncompressed_size < self.min_frame_size:
+            return
+        if (
+            self._frame_uncompressed_size >= self.max_frame_size
+            or zlib.crc32(name.encode()) % self.cut_modulus == 0
+        ):
+            self.end_frame()
+
+    def end_frame(self):
+        if self._frame_uncompressed_size == 0:
+            return
+        self._emit(self._compressor.flush(self._flush_frame_mode))
+        self.frame_starts.append(self._uncompressed_pos - self._frame_uncompressed_size)
+        self.index.chunks.append(
+            Chunk(
+                offset=self.index.size,
+                length=self._frame_length,
+                digest=self._frame_hash.hexdigest(),
+            )
+        )
+        self.index.size += self._frame_length
+        self._frame_uncompressed_size = 0
+        self._frame_hash = hashlib.sha256()
+        self._frame_length = 0
+
+    def _emit(self, data: bytes):
+        if data:
+            self._file.write(data)
+            self._frame_hash.update(data)
+            self._frame_length += len(data)
+
+    def close(self) -> ChunkIndex:
+        if not self.closed:
+            self.end_frame()
+            self._file.close()
+            self.closed = True
+        return self.index
+
+
+def chunk_index_path(archive_path: Path) -> Path:
+    """Gets the sidecar chunk index path for an archive."""
+    return archive_path.with_name(archive_path.name + CHUNK_INDEX_SUFFIX)
+
+
+class DeltaCache:
+    """Local cache of previously fetched chunked archives keyed by artifact key.
+
+    Artifact keys (e.g. "blas_lib_gfx94X.tar.zst") are stable across runs, so
+    the cached entry is the most recently fetched version of that artifact,
+    whichever run it came from.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _paths(self, artifact_key: str) -> Tuple[Path, Path]:
+        archive_path = self.cache_dir / artifact_key
+        return archive_path, chunk_index_path(archive_path)
+
+    def lookup(self, artifact_key: str) -> Optional[Tuple[Path, ChunkIndex]]:
+        archive_path, index_path = self._paths(artifact_key)
+        try:
+            index = ChunkIndex.load(index_path)
+            if archive_path.stat().st_size != index.size:
+                return None
+        except (OSError, ValueError):
+            return None
+        return archive_path, index
+
+    def store(self, artifact_key: str, archive_path: Path, index: ChunkIndex):
+        """Stores a copy of an archive and its index, replacing any older one."""
+        cached_archive, cached_index = self._paths(artifact_key)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write the index last so that lookup() never pairs it with a partial
+        # or stale archive.
+        cached_index.unlink(missing_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(archive_path, tmp_name)
+            os.replace(tmp_name, cached_archive)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+        index.save(cached_index)
+
+
+@dataclass
+class DeltaStats:
+    """Bytes reused from the local cache vs. transferred from the backend."""
+
+    reused_bytes: int = 0
+    downloaded_bytes: int = 0
+    full_download: bool = False
+
+
+def _read_range(src: BinaryIO, offset: int, length: int) -> bytes:
+    src.seek(offset)
+    return src.read(length)
+
+
+def _verify_run(run: List[Chunk], data: bytes) -> bool:
+    """Checks the digests of consecutive chunks read as one buffer."""
+    view = memoryview(data)
+    pos = 0
+    for chunk in run:
+        if hashlib.sha256(view[pos : pos + chunk.length]).hexdigest() != chunk.digest:
+            return False
+        pos += chunk.length
+    return pos == len(data)
+
+
+def _group_missing_ranges(
+    chunks: List[Chunk], available: Dict[str, Chunk]
+) -> List[List[Chunk]]:
+    """Groups chunks into runs, each either all cached or all missing.
+
+    Adjacent missing chunks are coalesced so they can be fetched with a single
+    ranged read.
+    """
+    runs: List[List[Chunk]] = []
+    for chunk in chunks:
+        cached = chunk.digest in available
+        if runs and (runs[-1][0].digest in available) == cached and not cached:
+            runs[-1].append(chunk)
+        else:
+            runs.append([chunk])
+    return runs
+
+
+def download_artifact_delta(
+    backend, artifact_key: str, dest_path: Path, cache: DeltaCache
+) -> DeltaStats:
+    """Downloads an artifact, transferring only frames missing from the cache.
+
+    Falls back to a full download when the backend has no readable chunk index
+    for the artifact or there is no cached previous version. Either way the
+    fetched archive becomes the cached version for the next fetch.
+
+    Args:
+        backend: ArtifactBackend to fetch from
+        artifact_key: Artifact filename (e.g. "blas_lib_gfx94X.tar.zst")
+        dest_path: Local path to write the artifact to
+        cache: DeltaCache holding previously fetched versions
+
+    Raises:
+        FileNotFoundError: If the artifact does not exist in the backend
+    """
+    stats = DeltaStats()
+    try:
+        remote_index = ChunkIndex.from_json(
+            backend.read_artifact_range(artifact_key + CHUNK_INDEX_SUFFIX).decode()
+        )
+    except (FileNotFoundError, PermissionError, ValueError):
+        remote_index = None
+
+    cached = cache.lookup(artifact_key) if remote_index else None
+    if remote_index is None or cached is None:
+        backend.download_artifact(artifact_key, dest_path)
+        stats.full_download = True
+        stats.downloaded_bytes = dest_path.stat().st_size
+        if remote_index is not None and stats.downloaded_bytes == remote_index.size:
+            cache.store(artifact_key, dest_path, remote_index)
+        return stats
+
+    cached_path, cached_index = cached
+    available = {chunk.digest: chunk for chunk in cached_index.chunks}
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def fetch_run(run: List[Chunk]) -> bytes:
+        start = run[0].offset
+        length = sum(chunk.length for chunk in run)
+        data = backend.read_artifact_range(artifact_key, start, length)
+        if len(data) != length or not _verify_run(run, data):
+            raise IOError(
+                f"Corrupt ranged read of {length} bytes at offset {start} of {artifact_key}"
+            )
+        stats.downloaded_bytes += length
+        return data
+
+    with open(cached_path, "rb") as cached_file, open(dest_path, "wb") as out:
+        for run in _group_missing_ranges(remote_index.chunks, available):
+            if run[0].digest in available:
+                source = available[run[0].digest]
+                data = _read_range(cached_file, source.offset, source.length)
+                if _verify_run(run, data):
+                    stats.reused_bytes += len(data)
+                else:
+                    # The cached copy was modified; fall back to the backend.
+                    data = fetch_run(run)
+            else:
+                data = fetch_run(run)
+            out.write(data)
+
+    cache.store(artifact_key, dest_path, remote_index)
+    return stats
@@ -23,12 +23,19 @@ contains one relative path per line. That path represents a path into a TheRock
 build directory that its contents are subset from.
 """
 
-from typing import Callable, Optional, Sequence
+from typing import Callable, Iterable, Optional, Sequence
 
+import bisect
+import concurrent.futures
+from dataclasses import dataclass, field
+import json
 import os
 import re
 from pathlib import Path, PurePosixPath
+import shutil
+import stat
 import tarfile
+import threading
 
 from .pattern_match import PatternMatcher, MatchPredicate
 
@@ -46,11 +53,26 @@ def _get_pyzstd():
         )
 
 
+def is_seekable_zstd_archive(path: Path) -> bool:
+    """Checks if an archive uses the seekable zstd format (with a seek table)."""
+    if not path.name.endswith(".tar.zst"):
+        return False
+    return _get_pyzstd().SeekableZstdFile.is_seekable_format_file(path)
+
+
 def _open_archive_for_read(path: Path) -> tarfile.TarFile:
-    """Open a tar archive for reading, auto-detecting compression type."""
+    """Open a tar archive for reading, auto-detecting compression type.
+
+    Seekable zstd archives are opened with random access, so seeking past
+    member data (e.g. when listing or extracting single members) skips
+    decompressing the frames in between.
+    """
     if path.name.endswith(".tar.zst"):
         pyzstd = _get_pyzstd()
-        zstd_file = pyzstd.ZstdFile(path, mode="rb")
+        if is_seekable_zstd_archive(path):
+            zstd_file = pyzstd.SeekableZstdFile(path, mode="rb")
+        else:
+            zstd_file = pyzstd.ZstdFile(path, mode="rb")
         return tarfile.TarFile(fileobj=zstd_file, mode="r")
     elif path.name.endswith(".tar.xz"):
         return tarfile.TarFile.open(path, mode="r:xz")
@@ -58,6 +80,10 @@ def _open_archive_for_read(path: Path) -> tarfile.TarFile:
         raise ValueError(f"Unknown archive format: {path}")
 
 
+# Matches {name}_{component}_{target_family} and an archive extension.
+_ARCHIVE_FILENAME_PATTERN = re.compile(r"^([^_]+)_([^_]+)_([^_]+)\.tar\.(zst|xz)$")
+
+
 class ArtifactName:
     def __init__(self, name: str, component: str, target_family: str):
         self.name = name
@@ -78,8 +104,7 @@ class ArtifactName:
 
     @staticmethod
     def from_filename(filename: str) -> Optional["ArtifactName"]:
-        # Matches {name}_{component}_{target_family} and an archive extension.
-        m = re.match(r"^([^_]+)_([^_]+)_([^_]+)\.tar\.(zst|xz)$", filename)
+        m = _ARCHIVE_FILENAME_PATTERN.match(filename)
         if not m:
             return None
         return ArtifactName(m.group(1), m.group(2), m.group(3))
@@ -100,6 +125,68 @@ class ArtifactName:
         return hash((self.name, self.component, self.target_family))
 
 
+def _split_by_size(
+    members: list[tarfile.TarInfo], parts: int
+) -> list[list[tarfile.TarInfo]]:
+    """Splits members (in archive order) into contiguous runs of similar size."""
+    total = sum(m.size for m in members)
+    target = max(1, -(-total // parts))
+    runs: list[list[tarfile.TarInfo]] = [[]]
+    run_size = 0
+    for member in members:
+        if run_size >= target and len(runs) < parts:
+            runs.append([])
+            run_size = 0
+        runs[-1].append(member)
+        run_size += member.size
+    return runs
+
+
+def extract_archive(
+    archive_path: Path, output_dir: Path, max_workers: Optional[int] = None
+):
+    """Extracts an archive like `TarFile.extractall(output_dir, filter="tar")`.
+
+    Seekable zstd archives are decompressed in parallel: regular files are
+    split into contiguous runs of the tar stream, and each worker extracts its
+    run through its own random-access reader, so every frame is decompressed
+    about once. Directories are created up front and links are made after all
+    files exist. Other archives are extracted serially.
+    """
+    if max_workers == 1 or not is_seekable_zstd_archive(archive_path):
+        with _open_archive_for_read(archive_path) as tf:
+            tf.extractall(output_dir, filter="tar")
+        return
+
+    with _open_archive_for_read(archive_path) as tf:
+        members = [tarfile.tar_filter(m, os.fspath(output_dir)) for m in tf]
+        dirs = [m for m in members if m.isdir()]
+        files = sorted((m for m in members if m.isreg()), key=lambda m: m.offset_data)
+        others = [m for m in members if not m.isdir() and not m.isreg()]
+
+        for member in dirs:
+            (output_dir / member.name).mkdir(parents=True, exist_ok=True)
+
+        def extract_run(run: list[tarfile.TarInfo]):
+            with _open_archive_for_read(archive_path) as worker_tf:
+                for member in run:
+                    worker_tf.extract(member, output_dir, filter="tar")
+
+        workers = max_workers or os.cpu_count() or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [
+                executor.submit(extract_run, run)
+                for run in _split_by_size(files, workers)
+            ]:
+                future.result()
+
+        for member in others:
+            tf.extract(member, output_dir, filter="tar")
+        # Like extractall, set directory attributes last, deepest first.
+        for member in sorted(dirs, key=lambda m: m.name, reverse=True):
+            tf.extract(member, output_dir, filter="tar")
+
+
 class ArtifactCatalog:
     """Scans a directory containing exploded artifact sub-directories.
 
@@ -209,86 +296,474 @@ class ArtifactPopulator:
                     pm.copy_to(destdir=destdir, verbose=self.verbose, remove_dest=False)
             else:
                 # Process as an archive file.
-                with _open_archive_for_read(artifact_path) as tf:
-                    self.on_artifact_archive(artifact_path)
-                    # Read manifest first.
-                    manifest_member = tf.next()
-                    if (
-                        manifest_member is None
-                        or manifest_member.name != "artifact_manifest.txt"
+                self._populate_from_archive(artifact_path)
+        return all_root_relpaths
+
+    def _populate_from_archive(
+        self,
+        artifact_path: Path,
+        owns: Optional[Callable[[str], bool]] = None,
+        deferred_links: Optional[list[tuple[Path, Path]]] = None,
+    ):
+        """Writes the members of one archive.
+
+        Args:
+          artifact_path: Archive to populate from.
+          owns: If given, only non-directory members for whose output relative
+            path (see `_dest_key`) this returns True are written.
+          deferred_links: If given, hardlinks to files not owned by this
+            archive are appended as (target, link) instead of being created.
+        """
+        with _open_archive_for_read(artifact_path) as tf:
+            self.on_artifact_archive(artifact_path)
+            relpaths = _read_archive_manifest(tf, artifact_path)
+            for relpath in relpaths:
+                self.on_relpath(relpath)
+
+            prefix_map = _RelpathPrefixMap(relpaths)
+            created_dirs: set[Path] = set()
+
+            def ensure_dir(path: Path):
+                # Most members share a parent with the previous member, so
+                # skip the mkdir syscalls for directories already created.
+                if path not in created_dirs:
+                    path.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(path)
+
+            # Iterate over all remaining members.
+            while member := tf.next():
+                resolved = prefix_map.resolve(member.name)
+                if resolved is None:
+                    raise IOError(
+                        f"Extracting tar artifact archive, encountered file not in manifest: {member}"
+                    )
+                if (
+                    owns is not None
+                    and not member.isdir()
+                    and not owns(self._dest_key(*resolved))
+                ):
+                    continue
+                dest_path = self._dest_path(*resolved)
+                if dest_path not in created_dirs:
+                    try:
+                        st = os.lstat(dest_path)
+                    except FileNotFoundError:
+                        pass
+                    else:
+                        if not stat.S_ISDIR(st.st_mode):
+                            os.unlink(dest_path)
+                    ensure_dir(dest_path.parent)
+                if member.isfile():
+                    exec_mask = member.mode & 0o111
+                    with tf.extractfile(member) as member_file:
+                        with open(dest_path, "wb") as out_file:
+                            # Stream in bounded chunks rather than reading the
+                            # whole (possibly multi-GB) member into memory.
+                            shutil.copyfileobj(
+                                member_file, out_file, _POPULATE_COPY_BUFSIZE
+                            )
+                            st = os.fstat(out_file.fileno())
+                            if hasattr(os, "fchmod"):
+                                # Windows has no fchmod.
+                                new_mode = st.st_mode | exec_mask
+                                os.fchmod(out_file.fileno(), new_mode)
+                elif member.isdir():
+                    ensure_dir(dest_path)
+                elif member.issym():
+                    dest_path.symlink_to(member.linkname)
+                elif member.islnk():
+                    # Hardlink: find the target file's destination path
+                    link_target = prefix_map.resolve(member.linkname)
+                    if link_target is None:
+                        raise IOError(
+                            f"Hardlink target not in manifest: {member} -> {member.linkname}"
+                        )
+                    target_path = self._dest_path(*link_target)
+                    if deferred_links is not None and not owns(
+                        self._dest_key(*link_target)
                     ):
+                        deferred_links.append((target_path, dest_path))
+                    else:
+                        os.link(target_path, dest_path)
+                else:
+                    raise IOError(f"Unhandled tar member: {member}")
+
+    def _dest_key(self, relpath: str, scoped_path: str) -> str:
+        return scoped_path if self.flatten else f"{relpath}/{scoped_path}"
+
+    def _dest_path(self, relpath: str, scoped_path: str) -> Path:
+        output_path = self.output_path if self.flatten else self.output_path / relpath
+        return output_path / PurePosixPath(scoped_path)
+
+
+class ParallelArtifactFlattener:
+    """Flattens many artifact archives into one directory concurrently.
+
+    The result is the same as `ArtifactPopulator(flatten=True)` applied to the
+    artifacts in order, including last-writer-wins for paths provided by more
+    than one artifact:
+
+    1. The member lists of all archives are read in parallel.
+    2. A global plan assigns each output path to the last archive providing
+       it. A path that is a directory in one archive and a file in another is
+       an error.
+    3. All archives are extracted in parallel, each writing only the paths it
+       owns. Hardlinks to files owned by another archive are created at the
+       end, once their targets exist.
+
+    Exploded artifact directories are populated serially, as before.
+    """
+
+    def __init__(
+        self,
+        *,
+        output_path: Path,
+        verbose: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        self.output_path = output_path
+        self.verbose = verbose
+        self.max_workers = max_workers
+        self.relpaths: set[str] = set()
+
+    def __call__(self, *artifact_paths: Path):
+        if (
+            len(artifact_paths) <= 1
+            or self.max_workers == 1
+            or any(p.is_dir() for p in artifact_paths)
+        ):
+            populator = ArtifactPopulator(
+                output_path=self.output_path, verbose=self.verbose, flatten=True
+            )
+            populator(*artifact_paths)
+            self.relpaths.update(populator.relpaths)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            listings = list(executor.map(_list_archive_members, artifact_paths))
+            owners = self._plan(artifact_paths, listings)
+
+            deferred_links: list[tuple[Path, Path]] = []
+            deferred_links_lock = threading.Lock()
+
+            def populate(index: int):
+                populator = ArtifactPopulator(
+                    output_path=self.output_path, verbose=False, flatten=True
+                )
+                links: list[tuple[Path, Path]] = []
+                populator._populate_from_archive(
+                    artifact_paths[index],
+                    owns=lambda key: owners.get(key) == index,
+                    deferred_links=links,
+                )
+                with deferred_links_lock:
+                    deferred_links.extend(links)
+                return populator.relpaths
+
+            for relpaths in executor.map(populate, range(len(artifact_paths))):
+                self.relpaths.update(relpaths)
+
+        for target_path, link_path in deferred_links:
+            if os.path.lexists(link_path):
+                os.unlink(link_path)
+            os.link(target_path, link_path)
+
+    def _plan(
+        self,
+        artifact_paths: Sequence[Path],
+        listings: list[list[tuple[str, bool]]],
+    ) -> dict[str, int]:
+        """Maps each non-directory output path to the index of its owner."""
+        owners: dict[str, int] = {}
+        dirs: set[str] = set()
+        for index, members in enumerate(listings):
+            for key, is_dir in members:
+                if is_dir:
+                    if key in owners:
                         raise IOError(
-                            f"Artifact archive {artifact_path} must have artifact_manifest.txt as its first member"
+                            f"Directory '{key}' in {artifact_paths[index]} conflicts "
+                            f"with a file from {artifact_paths[owners[key]]}"
                         )
-                    with tf.extractfile(manifest_member) as mf_file:
-                        relpaths = mf_file.read().decode().splitlines()
-                        for relpath in relpaths:
-                            self.on_relpath(relpath)
-                    # Iterate over all remaining members.
-                    while member := tf.next():
-                        member_name = member.name
-                        # Figure out which relpath prefix it is a part of.
-                        for prefix_relpath in relpaths:
-                            output_path = self.output_path
-                            if not self.flatten:
-                                output_path = output_path / prefix_relpath
-                            prefix_relpath += "/"
-                            if member_name.startswith(prefix_relpath):
-                                scoped_path = member_name[len(prefix_relpath) :]
-                                dest_path = output_path / PurePosixPath(scoped_path)
-                                if dest_path.is_symlink() or (
-                                    dest_path.exists() and not dest_path.is_dir()
-                                ):
-                                    os.unlink(dest_path)
-                                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                                if member.isfile():
-                                    exec_mask = member.mode & 0o111
-                                    with tf.extractfile(member) as member_file:
-                                        with open(
-                                            dest_path,
-                                            "wb",
-                                        ) as out_file:
-                                            out_file.write(member_file.read())
-                                            st = os.fstat(out_file.fileno())
-                                            if hasattr(os, "fchmod"):
-                                                # Windows has no fchmod.
-                                                new_mode = st.st_mode | exec_mask
-                                                os.fchmod(out_file.fileno(), new_mode)
-                                elif member.isdir():
-                                    dest_path.mkdir(parents=True, exist_ok=True)
-                                elif member.issym():
-                                    dest_path.symlink_to(member.linkname)
-                                elif member.islnk():
-                                    # Hardlink: find the target file's destination path
-                                    link_target = member.linkname
-                                    for target_prefix in relpaths:
-                                        target_prefix_slash = target_prefix + "/"
-                                        if link_target.startswith(target_prefix_slash):
-                                            target_scoped_path = link_target[
-                                                len(target_prefix_slash) :
-                                            ]
-                                            if self.flatten:
-                                                target_dest_path = (
-                                                    self.output_path
-                                                    / PurePosixPath(target_scoped_path)
-                                                )
-                                            else:
-                                                target_dest_path = (
-                                                    self.output_path
-                                                    / target_prefix
-                                                    / PurePosixPath(target_scoped_path)
-                                                )
-                                            os.link(target_dest_path, dest_path)
-                                            break
-                                    else:
-                                        raise IOError(
-                                            f"Hardlink target not in manifest: {member} -> {link_target}"
-                                        )
-                                else:
-                                    raise IOError(f"Unhandled tar member: {member}")
-                                break
-                        else:
-                            raise IOError(
-                                f"Extracting tar artifact archive, encountered file not in manifest: {member}"
-                            )
-        return all_root_relpaths
+                    dirs.add(key)
+                    continue
+                if key in dirs:
+                    raise IOError(
+                        f"File '{key}' in {artifact_paths[index]} conflicts with a "
+                        f"directory from another artifact"
+                    )
+                previous = owners.get(key)
+                if self.verbose and previous is not None and previous != index:
+                    print(
+                        f"'{key}' from {artifact_paths[index].name} overrides "
+                        f"{artifact_paths[previous].name}"
+                    )
+                owners[key] = index
+        return owners
+
+
+def _read_archive_manifest(tf: tarfile.TarFile, artifact_path: Path) -> list[str]:
+    """Reads the manifest, which must be the first member of an archive."""
+    manifest_member = tf.next()
+    if manifest_member is None or manifest_member.name != "artifact_manifest.txt":
+        raise IOError(
+            f"Artifact archive {artifact_path} must have artifact_manifest.txt as its first member"
+        )
+    with tf.extractfile(manifest_member) as mf_file:
+        return mf_file.read().decode().splitlines()
+
+
+def _list_archive_members(artifact_path: Path) -> list[tuple[str, bool]]:
+    """Lists (flattened output path, is directory) for members of an archive."""
+    index = load_member_index(artifact_path)
+    if index is not None:
+        return index.flattened_members(artifact_path)
+    members = []
+    with _open_archive_for_read(artifact_path) as tf:
+        prefix_map = _RelpathPrefixMap(_read_archive_manifest(tf, artifact_path))
+        while member := tf.next():
+            resolved = prefix_map.resolve(member.name)
+            if resolved is None:
+                raise IOError(
+                    f"Extracting tar artifact archive, encountered file not in manifest: {member}"
+                )
+            members.append((resolved[1], member.isdir()))
+    return members
+
+
+# Buffer size used when streaming archive members to disk.
+_POPULATE_COPY_BUFSIZE = 1024 * 1024
+
+
+class _RelpathPrefixMap:
+    """Resolves archive member names to the manifest relpath containing them.
+
+    Instead of testing every manifest relpath against every member, the
+    member's ancestor directories are looked up in a dict. When relpaths nest,
+    the one listed first in the manifest wins, as with a linear scan.
+    """
+
+    def __init__(self, relpaths: Sequence[str]):
+        self._order: dict[str, int] = {}
+        for i, relpath in enumerate(relpaths):
+            self._order.setdefault(relpath, i)
+        self._max_depth = max(
+            (relpath.count("/") + 1 for relpath in self._order), default=0
+        )
+
+    def resolve(self, member_name: str) -> Optional[tuple[str, str]]:
+        """Returns (relpath, path within relpath), or None if not in any relpath."""
+        best: Optional[tuple[int, str, str]] = None
+        pos = -1
+        for _ in range(self._max_depth):
+            pos = member_name.find("/", pos + 1)
+            if pos < 0:
+                break
+            order = self._order.get(member_name[:pos])
+            if order is not None and (best is None or order < best[0]):
+                best = (order, member_name[:pos], member_name[pos + 1 :])
+        return None if best is None else best[1:]
+
+
+# ---------------------------------------------------------------------------
+# Member index sidecars.
+#
+# `fileset_tool.py artifact-archive --member-index` writes
+# `<archive>.members.json` next to an archive, listing every member with its
+# type, size, mode, link target and data offset in the uncompressed tar
+# stream. For multi-frame (chunked) zstd archives it also records where each
+# frame starts, so single members can be read by decompressing only the frames
+# that hold them. Listing and overlap checks then never decompress the archive.
+# ---------------------------------------------------------------------------
+
+MEMBER_INDEX_SUFFIX = ".members.json"
+MEMBER_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """A tar member as recorded in a member index."""
+
+    name: str
+    type: str  # Decoded tarfile type flag (e.g. tarfile.REGTYPE)
+    size: int
+    mode: int
+    linkname: str
+    offset_data: int  # Offset of the member data in the uncompressed tar stream
+
+    def isdir(self) -> bool:
+        return self.type.encode() == tarfile.DIRTYPE
+
+    def isfile(self) -> bool:
+        return self.type.encode() in tarfile.REGULAR_TYPES
+
+    def issym(self) -> bool:
+        return self.type.encode() == tarfile.SYMTYPE
+
+    def islnk(self) -> bool:
+        return self.type.encode() == tarfile.LNKTYPE
+
+
+@dataclass(frozen=True)
+class ArchiveFrame:
+    """An independently decompressible zstd frame of an archive."""
+
+    offset: int  # Compressed offset in the archive file
+    length: int  # Compressed length
+    uncompressed_offset: int  # Offset of the frame's data in the tar stream
+
+
+@dataclass
+class ArchiveMemberIndex:
+    """Sidecar listing of the members of an artifact archive."""
+
+    prefixes: list[str] = field(default_factory=list)
+    members: list[ArchiveMember] = field(default_factory=list)
+    # Empty unless the archive is a multi-frame zstd file.
+    frames: list[ArchiveFrame] = field(default_factory=list)
+    # Size of the indexed archive, used to detect stale sidecars.
+    archive_size: int = 0
+    _by_name: Optional[dict[str, ArchiveMember]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @staticmethod
+    def from_tarinfos(
+        prefixes: Sequence[str],
+        tarinfos: Iterable[tarfile.TarInfo],
+        archive_size: int,
+        frames: Sequence[ArchiveFrame] = (),
+    ) -> "ArchiveMemberIndex":
+        """Builds an index from the members of an archive that was written.
+
+        The manifest is expected as the first member and is not indexed.
+        """
+        members = [
+            ArchiveMember(
+                name=ti.name,
+                type=ti.type.decode(),
+                size=ti.size,
+                mode=ti.mode,
+                linkname=ti.linkname,
+                offset_data=ti.offset_data,
+            )
+            for ti in tarinfos
+            if ti.name != "artifact_manifest.txt"
+        ]
+        return ArchiveMemberIndex(list(prefixes), members, list(frames), archive_size)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": MEMBER_INDEX_VERSION,
+                "archive_size": self.archive_size,
+                "prefixes": self.prefixes,
+                "members": [
+                    [m.name, m.type, m.size, m.mode, m.linkname, m.offset_data]
+                    for m in self.members
+                ],
+                "frames": [
+                    [f.offset, f.length, f.uncompressed_offset] for f in self.frames
+                ],
+            },
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def from_json(text: str) -> "ArchiveMemberIndex":
+        data = json.loads(text)
+        if data.get("version") != MEMBER_INDEX_VERSION:
+            raise ValueError(f"Unsupported member index version: {data.get('version')}")
+        return ArchiveMemberIndex(
+            prefixes=data["prefixes"],
+            members=[ArchiveMember(*m) for m in data["members"]],
+            frames=[ArchiveFrame(*f) for f in data["frames"]],
+            archive_size=data["archive_size"],
+        )
+
+    def save(self, path: Path):
+        Path(path).write_text(self.to_json())
+
+    @staticmethod
+    def load(path: Path) -> "ArchiveMemberIndex":
+        return ArchiveMemberIndex.from_json(Path(path).read_text())
+
+    def flattened_members(self, artifact_path: Path) -> list[tuple[str, bool]]:
+        """Lists (flattened output path, is directory) like _list_archive_members."""
+        prefix_map = _RelpathPrefixMap(self.prefixes)
+        members = []
+        for member in self.members:
+            resolved = prefix_map.resolve(member.name)
+            if resolved is None:
+                raise IOError(
+                    f"Member index of {artifact_path} lists a file not in the "
+                    f"manifest: {member.name}"
+                )
+            members.append((resolved[1], member.isdir()))
+        return members
+
+    def get_member(self, name: str) -> ArchiveMember:
+        if self._by_name is None:
+            self._by_name = {m.name: m for m in self.members}
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise KeyError(f"No member '{name}' in archive index") from None
+
+    def read_member(self, archive_path: Path, name: str) -> bytes:
+        """Reads the contents of one regular file member.
+
+        Hardlinks are followed. For multi-frame and seekable zstd archives only
+        the frames holding the member are read and decompressed; otherwise the
+        archive is streamed up to the member.
+        """
+        member = self.get_member(name)
+        if member.islnk():
+            member = self.get_member(member.linkname)
+        if not member.isfile():
+            raise IOError(f"Member '{name}' of {archive_path} is not a regular file")
+        if member.size == 0:
+            return b""
+        if not self.frames and is_seekable_zstd_archive(archive_path):
+            with _get_pyzstd().SeekableZstdFile(archive_path, mode="rb") as f:
+                f.seek(member.offset_data)
+                return f.read(member.size)
+        if not self.frames:
+            with _open_archive_for_read(archive_path) as tf:
+                with tf.extractfile(member.name) as f:
+                    return f.read()
+
+        starts = [f.uncompressed_offset for f in self.frames]
+        end = member.offset_data + member.size
+        first = bisect.bisect_right(starts, member.offset_data) - 1
+        last = bisect.bisect_left(starts, end) - 1
+        frames = self.frames[first : last + 1]
+        with open(archive_path, "rb") as f:
+            f.seek(frames[0].offset)
+            compressed = f.read(
+                frames[-1].offset + frames[-1].length - frames[0].offset
+            )
+        data = _get_pyzstd().decompress(compressed)
+        start = member.offset_data - frames[0].uncompressed_offset
+        return data[start : start + member.size]
+
+
+def member_index_path(archive_path: Path) -> Path:
+    """Gets the sidecar member index path for an archive."""
+    return archive_path.with_name(archive_path.name + MEMBER_INDEX_SUFFIX)
+
+
+def load_member_index(archive_path: Path) -> Optional[ArchiveMemberIndex]:
+    """Loads the member index of an archive, or None if it has none.
+
+    An index written for a different version of the archive (detected by its
+    size) is ignored.
+    """
+    try:
+        index = ArchiveMemberIndex.load(member_index_path(archive_path))
+    except FileNotFoundError:
+        return None
+    if index.archive_size != archive_path.stat().st_size:
+        return None
+    return index
@@ -276,6 +276,46 @@ class BuildTopology:
                 collected.add(dep_name)
                 self._collect_transitive_artifact_deps(dep_name, collected)
 
+    def get_transitive_artifact_deps(self, artifact_name: str) -> Set[str]:
+        """
+        Get all direct and transitive dependencies of an artifact.
+
+        Args:
+            artifact_name: Name of the artifact
+
+        Returns:
+            Set of artifact names the artifact depends on (excluding itself)
+        """
+        collected: Set[str] = set()
+        self._collect_transitive_artifact_deps(artifact_name, collected)
+        collected.discard(artifact_name)
+        return collected
+
+    def get_artifacts_for_submodule(self, submodule_name: str) -> Set[str]:
+        """
+        Get all artifacts built from sources in a submodule.
+
+        Follows submodule -> source sets -> artifact groups -> artifacts.
+
+        Args:
+            submodule_name: Git submodule name (as in .gitmodules)
+
+        Returns:
+            Set of artifact names whose artifact group uses the submodule
+        """
+        source_set_names = {
+            source_set.name
+            for source_set in self.source_sets.values()
+            if any(s.name == submodule_name for s in source_set.submodules)
+        }
+        artifacts = set()
+        for group in self.artifact_groups.values():
+            if source_set_names.intersection(group.source_sets):
+                artifacts.update(
+                    a.name for a in self.get_artifacts_in_group(group.name)
+                )
+        return artifacts
+
     def get_produced_artifacts(self, build_stage: str) -> Set[str]:
         """
         Get all artifacts produced by a build stage.
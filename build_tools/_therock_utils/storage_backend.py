@@ -18,15 +18,27 @@ Usage::
 
     # Copy between storage locations (e.g. S3-to-S3 promotion)
     backend.copy_file(source_location, dest_location)
+
+    # Per-transfer byte/latency metrics
+    print(backend.metrics.summary())
+
+``upload_files()`` runs transfers through an ``AdaptiveConcurrencyLimiter``
+which raises the number of concurrent transfers while aggregate throughput
+keeps improving and halves it when S3 throttles requests.  Large files are
+uploaded as multipart uploads with part sizes scaled to the file size (see
+``multipart_settings``).
 """
 
 import concurrent.futures
 import logging
+import math
 import mimetypes
 import os
 import shutil
+import threading
 import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from _therock_utils.storage_location import StorageLocation
@@ -64,13 +76,277 @@ def infer_content_type(path: Path) -> str:
     return guessed or _DEFAULT_CONTENT_TYPE
 
 
+# ---------------------------------------------------------------------------
+# Transfer metrics and concurrency control
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TransferRecord:
+    """Bytes and latency of a single completed transfer."""
+
+    operation: str  # "upload" or "copy"
+    destination: str
+    size_bytes: int
+    start_time: float
+    end_time: float
+    attempts: int = 1
+
+    @property
+    def seconds(self) -> float:
+        return self.end_time - self.start_time
+
+
+@dataclass
+class TransferMetrics:
+    """Thread-safe collection of transfer records for a backend."""
+
+    records: list[TransferRecord] = field(default_factory=list)
+    throttle_events: int = 0
+    peak_concurrency: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, record: TransferRecord):
+        with self._lock:
+            self.records.append(record)
+
+    def record_throttle(self):
+        with self._lock:
+            self.throttle_events += 1
+
+    def record_concurrency(self, in_flight: int):
+        with self._lock:
+            self.peak_concurrency = max(self.peak_concurrency, in_flight)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(r.size_bytes for r in self.records)
+
+    @property
+    def wall_seconds(self) -> float:
+        """Time from the first transfer starting to the last one finishing."""
+        if not self.records:
+            return 0.0
+        return max(r.end_time for r in self.records) - min(
+            r.start_time for r in self.records
+        )
+
+    @property
+    def throughput_bytes_per_second(self) -> float:
+        wall = self.wall_seconds
+        return self.total_bytes / wall if wall > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.records)} transfers, {self.total_bytes / (1 << 20):.1f} MiB "
+            f"in {self.wall_seconds:.1f}s "
+            f"({self.throughput_bytes_per_second / (1 << 20):.1f} MiB/s, "
+            f"peak concurrency {self.peak_concurrency}, "
+            f"{self.throttle_events} throttled requests)"
+        )
+
+
+# Default upper bound of an adaptive concurrency limit, relative to its
+# initial value.
+_DEFAULT_MAX_CONCURRENCY_FACTOR = 4
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits in-flight transfers, adapting the limit to observed throughput.
+
+    After every window of completed transfers (one per allowed slot), the
+    aggregate throughput of the window is compared to the previous one. The
+    limit grows by one while throughput improves and steps back when a
+    previous increase made it worse. Throttling errors halve the limit
+    (additive increase, multiplicative decrease). The limit may grow up to
+    *maximum*, by default ``_DEFAULT_MAX_CONCURRENCY_FACTOR`` times *initial*.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int | None = None):
+        if maximum is None:
+            maximum = initial * _DEFAULT_MAX_CONCURRENCY_FACTOR
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._holder = threading.local()
+        self._window_bytes = 0
+        self._window_count = 0
+        self._window_start = time.monotonic()
+        self._last_throughput: float | None = None
+        self._last_change = 0
+
+    def acquire(self) -> int:
+        """Waits for a free slot. Returns the number of transfers in flight."""
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+            self._holder.slot = True
+            return self.in_flight
+
+    def release(self, size_bytes: int = 0):
+        with self._condition:
+            self.in_flight -= 1
+            self._holder.slot = False
+            self._window_bytes += size_bytes
+            self._window_count += 1
+            if self._window_count >= self.limit:
+                self._end_window()
+            self._condition.notify_all()
+
+    def on_throttle(self):
+        with self._condition:
+            new_limit = max(self.minimum, self.limit // 2)
+            if new_limit != self.limit:
+                logger.info(
+                    "Throttled, reducing transfer concurrency %d -> %d",
+                    self.limit,
+                    new_limit,
+                )
+                self.limit = new_limit
+                self._last_change = -1
+            self._reset_window(throughput=None)
+
+    def backoff(self, seconds: float):
+        """Waits *seconds* before retrying a failed transfer.
+
+        If the calling thread holds a slot, the slot is given up while
+        waiting so other transfers proceed, and a slot is reacquired
+        afterwards under the current (possibly throttled) limit.
+        """
+        holds_slot = getattr(self._holder, "slot", False)
+        if holds_slot:
+            with self._condition:
+                self.in_flight -= 1
+                self._holder.slot = False
+                self._condition.notify_all()
+        time.sleep(seconds)
+        if holds_slot:
+            self.acquire()
+
+    def _end_window(self):
+        elapsed = time.monotonic() - self._window_start
+        throughput = self._window_bytes / elapsed if elapsed > 0 else 0.0
+        last = self._last_throughput
+        if last is None or throughput > last * 1.05:
+            if self.limit < self.maximum:
+                self.limit += 1
+                self._last_change = 1
+        elif throughput < last * 0.9 and self._last_change > 0:
+            self.limit = max(self.minimum, self.limit - 1)
+            self._last_change = -1
+        else:
+            self._last_change = 0
+        self._reset_window(throughput)
+
+    def _reset_window(self, throughput: float | None):
+        self._last_throughput = throughput
+        self._window_bytes = 0
+        self._window_count = 0
+        self._window_start = time.monotonic()
+
+
+# Files below this size are uploaded with a single request.
+_MULTIPART_THRESHOLD = 64 * (1 << 20)
+_MIN_PART_SIZE = 16 * (1 << 20)
+# S3 allows up to 10,000 parts; stay well below so large parts amortize
+# per-request overhead.
+_TARGET_MAX_PARTS = 1000
+_MAX_PARTS_IN_FLIGHT = 16
+# boto3's default TransferConfig.multipart_threshold.
+_BOTO3_MULTIPART_THRESHOLD = 8 * (1 << 20)
+
+
+def multipart_settings(size_bytes: int) -> tuple[int, int] | None:
+    """Returns (part size, concurrent parts) for a file, or None for single-part.
+
+    Part sizes are whole MiB, at least 16 MiB, and grow with the file so a
+    transfer never needs more than ~1000 parts.
+    """
+    if size_bytes < _MULTIPART_THRESHOLD:
+        return None
+    mib = 1 << 20
+    part_size = max(
+        _MIN_PART_SIZE, math.ceil(size_bytes / _TARGET_MAX_PARTS / mib) * mib
+    )
+    parts = math.ceil(size_bytes / part_size)
+    return part_size, min(_MAX_PARTS_IN_FLIGHT, parts)
+
+
+def s3_transfer_config(size_bytes: int):
+    """Returns the boto3 ``TransferConfig`` to upload or copy an object, or None.
+
+    S3 derives multipart ETags from the part boundaries, so every upload and
+    copy of an object uses the parts from ``multipart_settings`` for their
+    ETags to match. None means boto3's defaults transfer the object with a
+    single request anyway.
+    """
+    if size_bytes < _BOTO3_MULTIPART_THRESHOLD:
+        return None
+    from boto3.s3.transfer import TransferConfig
+
+    settings = multipart_settings(size_bytes)
+    if settings is None:
+        return TransferConfig(multipart_threshold=_MULTIPART_THRESHOLD)
+    part_size, max_parts_in_flight = settings
+    return TransferConfig(
+        multipart_threshold=_MULTIPART_THRESHOLD,
+        multipart_chunksize=part_size,
+        max_concurrency=max_parts_in_flight,
+    )
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
 # ---------------------------------------------------------------------------
 # StorageBackend ABC
 # ---------------------------------------------------------------------------
 
 
 class StorageBackend(ABC):
-    """Abstract base class for storage operations."""
+    """Abstract base class for storage operations.
+
+    Backends record a ``TransferRecord`` per completed transfer in
+    ``metrics``.  Backends that return a limiter from
+    ``_concurrency_limiter()`` upload batches concurrently.
+    """
+
+    @property
+    def metrics(self) -> TransferMetrics:
+        """Per-transfer byte/latency metrics of this backend."""
+        if getattr(self, "_metrics", None) is None:
+            self._metrics = TransferMetrics()
+        return self._metrics
+
+    def _concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        """Returns the limiter for concurrent uploads, or None for sequential."""
+        return None
+
+    def _record_transfer(
+        self,
+        operation: str,
+        destination: str,
+        size_bytes: int,
+        start_time: float,
+        attempts: int = 1,
+    ):
+        self.metrics.record(
+            TransferRecord(
+                operation=operation,
+                destination=destination,
+                size_bytes=size_bytes,
+                start_time=start_time,
+                end_time=time.monotonic(),
+                attempts=attempts,
+            )
+        )
 
     @abstractmethod
     def upload_file(self, source: Path, dest: StorageLocation) -> None:
@@ -93,8 +369,11 @@ class StorageBackend(ABC):
     def upload_files(self, files: list[tuple[Path, StorageLocation]]) -> int:
         """Upload multiple files.
 
-        The base implementation uploads sequentially.  Subclasses may
-        override to upload in parallel (see ``S3StorageBackend``).
+        Uploads sequentially unless the backend has a concurrency limiter,
+        in which case files are uploaded in parallel, largest first, with
+        the number of in-flight uploads adapted to the observed throughput.
+        If any files fail (after per-file retries), a ``RuntimeError`` is
+        raised listing the failures.
 
         Args:
             files: List of ``(local_source, destination)`` pairs.
@@ -102,8 +381,46 @@ class StorageBackend(ABC):
         Returns:
             Number of files uploaded.
         """
-        for source, dest in files:
-            self.upload_file(source, dest)
+        limiter = self._concurrency_limiter()
+        if limiter is None or len(files) <= 1:
+            for source, dest in files:
+                self.upload_file(source, dest)
+            return len(files)
+
+        # Starting the largest files first keeps a long tail from being
+        # dominated by a single big upload.
+        sized = sorted(
+            ((_file_size(src), src, dst) for src, dst in files),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+
+        def upload(size: int, source: Path, dest: StorageLocation):
+            self.metrics.record_concurrency(limiter.acquire())
+            try:
+                self.upload_file(source, dest)
+            finally:
+                limiter.release(size)
+
+        failed: list[tuple[StorageLocation, BaseException]] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=limiter.maximum) as pool:
+            future_to_dest = {
+                pool.submit(upload, size, src, dst): dst for size, src, dst in sized
+            }
+            for future in concurrent.futures.as_completed(future_to_dest):
+                dest = future_to_dest[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    failed.append((dest, exc))
+
+        logger.info("Uploaded %s", self.metrics.summary())
+        if failed:
+            first_loc, first_exc = failed[0]
+            raise RuntimeError(
+                f"Failed to upload {len(failed)}/{len(files)} files. "
+                f"First failure: {first_loc.s3_uri}: {first_exc}"
+            )
         return len(files)
 
     def upload_directory(
@@ -125,26 +442,38 @@ class StorageBackend(ABC):
 
         Symlinks are skipped. Subdirectory structure is preserved.
         """
-        if not source_dir.is_dir():
-            raise FileNotFoundError(f"Source directory not found: {source_dir}")
-
-        patterns = include or ["*"]
-        files: set[Path] = set()
-        for pattern in patterns:
-            files.update(source_dir.rglob(pattern))
-        sorted_files = sorted(f for f in files if f.is_file() and not f.is_symlink())
-
-        file_list = [
-            (
-                f,
-                StorageLocation(
-                    dest.bucket,
-                    f"{dest.relative_path}/{f.relative_to(source_dir).as_posix()}",
-                ),
-            )
-            for f in sorted_files
-        ]
-        return self.upload_files(file_list)
+        return self.upload_files(list_directory_uploads(source_dir, dest, include))
+
+
+def list_directory_uploads(
+    source_dir: Path,
+    dest: StorageLocation,
+    include: list[str] | None = None,
+) -> list[tuple[Path, StorageLocation]]:
+    """List the ``(local_source, destination)`` pairs for uploading a directory.
+
+    This is what ``StorageBackend.upload_directory`` uploads. Callers can
+    combine the result with other files into a single ``upload_files`` call.
+    """
+    if not source_dir.is_dir():
+        raise FileNotFoundError(f"Source directory not found: {source_dir}")
+
+    patterns = include or ["*"]
+    files: set[Path] = set()
+    for pattern in patterns:
+        files.update(source_dir.rglob(pattern))
+    sorted_files = sorted(f for f in files if f.is_file() and not f.is_symlink())
+
+    return [
+        (
+            f,
+            StorageLocation(
+                dest.bucket,
+                f"{dest.relative_path}/{f.relative_to(source_dir).as_posix()}",
+            ),
+        )
+        for f in sorted_files
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -158,9 +487,33 @@ _S3_INITIAL_BACKOFF_SECONDS = 1.0
 # Default number of concurrent uploads — matches the AWS CLI default.
 _S3_DEFAULT_UPLOAD_CONCURRENCY = 10
 
+# S3 error codes indicating request-rate throttling.
+_S3_THROTTLING_CODES = {
+    "SlowDown",
+    "Throttling",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "ServiceUnavailable",
+    "503",
+}
+
+
+def _is_throttling_error(exc: BaseException) -> bool:
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        code = response.get("Error", {}).get("Code")
+        if code in _S3_THROTTLING_CODES:
+            return True
+    # boto3's managed transfers wrap client errors in S3UploadFailedError,
+    # which only carries the message.
+    return "SlowDown" in str(exc)
+
+
+def _s3_retry(operation: str, location: str, func, *args, backoff=None, **kwargs):
+    """Call *func* with retries and exponential backoff on failure.
 
-def _s3_retry(operation: str, location: str, func, *args, **kwargs):
-    """Call *func* with retries and exponential backoff on failure."""
+    *backoff* waits between attempts (default: ``time.sleep``).
+    """
     last_exc: Exception | None = None
     for attempt in range(_S3_MAX_RETRIES):
         try:
@@ -178,7 +531,7 @@ def _s3_retry(operation: str, location: str, func, *args, **kwargs):
                     exc,
                     wait,
                 )
-                time.sleep(wait)
+                (backoff or time.sleep)(wait)
     raise RuntimeError(
         f"S3 {operation} failed after {_S3_MAX_RETRIES} attempts: {location}"
     ) from last_exc
@@ -193,9 +546,12 @@ class S3StorageBackend(StorageBackend):
     (``AWS_SHARED_CREDENTIALS_FILE``), instance metadata, etc.  This
     matches how the ``aws`` CLI resolves credentials.
 
-    ``upload_files()`` uploads in parallel using a thread pool whose size
-    is controlled by *upload_concurrency* (default: 10, matching the AWS
-    CLI).  The boto3 connection pool is sized to match.
+    ``upload_files()`` uploads in parallel, starting with *upload_concurrency*
+    concurrent uploads (default: 10, matching the AWS CLI).  Concurrency
+    backs off when S3 throttles requests, and grows (up to
+    *max_upload_concurrency*, default four times *upload_concurrency*) while
+    throughput improves.  The boto3 connection pool is sized for the maximum
+    number of uploads, each with up to ``_MAX_PARTS_IN_FLIGHT`` parts.
     """
 
     def __init__(
@@ -203,9 +559,14 @@ class S3StorageBackend(StorageBackend):
         *,
         dry_run: bool = False,
         upload_concurrency: int = _S3_DEFAULT_UPLOAD_CONCURRENCY,
+        max_upload_concurrency: int | None = None,
     ):
         self._dry_run = dry_run
         self._upload_concurrency = upload_concurrency
+        self._limiter = AdaptiveConcurrencyLimiter(
+            upload_concurrency, maximum=max_upload_concurrency
+        )
+        self._max_upload_concurrency = self._limiter.maximum
         self._s3_client = None
 
     @property
@@ -217,44 +578,36 @@ class S3StorageBackend(StorageBackend):
 
             self._s3_client = boto3.client(
                 "s3",
-                config=Config(max_pool_connections=self._upload_concurrency),
+                config=Config(
+                    max_pool_connections=self._max_upload_concurrency
+                    * _MAX_PARTS_IN_FLIGHT
+                ),
             )
         return self._s3_client
 
-    def upload_files(self, files: list[tuple[Path, StorageLocation]]) -> int:
-        """Upload multiple files in parallel.
-
-        Uses a ``ThreadPoolExecutor`` with *upload_concurrency* workers.
-        Each individual file upload retries internally via ``_s3_retry``.
-        If any files still fail after retries, a ``RuntimeError`` is
-        raised listing the failures.
-        """
-        if not files:
-            return 0
-        if self._dry_run or len(files) == 1:
-            return super().upload_files(files)
+    def _concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        return None if self._dry_run else self._limiter
 
-        failed: list[tuple[StorageLocation, BaseException]] = []
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self._upload_concurrency,
-        ) as pool:
-            future_to_dest = {
-                pool.submit(self.upload_file, src, dst): dst for src, dst in files
-            }
-            for future in concurrent.futures.as_completed(future_to_dest):
-                dest = future_to_dest[future]
-                try:
-                    future.result()
-                except Exception as exc:
-                    failed.append((dest, exc))
+    def _call_with_retries(self, operation: str, location: str, func) -> int:
+        """Calls ``_s3_retry``, feeding throttling errors to the limiter.
 
-        if failed:
-            first_loc, first_exc = failed[0]
-            raise RuntimeError(
-                f"Failed to upload {len(failed)}/{len(files)} files. "
-                f"First failure: {first_loc.s3_uri}: {first_exc}"
-            )
-        return len(files)
+        Returns the number of attempts made.
+        """
+        attempts = 0
+
+        def attempt():
+            nonlocal attempts
+            attempts += 1
+            try:
+                return func()
+            except Exception as exc:
+                if _is_throttling_error(exc):
+                    self.metrics.record_throttle()
+                    self._limiter.on_throttle()
+                raise
+
+        _s3_retry(operation, location, attempt, backoff=self._limiter.backoff)
+        return attempts
 
     def upload_file(self, source: Path, dest: StorageLocation) -> None:
         content_type = infer_content_type(source)
@@ -262,15 +615,26 @@ class S3StorageBackend(StorageBackend):
             logger.info("[DRY RUN] %s -> %s (%s)", source, dest.s3_uri, content_type)
             return
 
-        _s3_retry(
+        size = _file_size(source)
+        kwargs = {}
+        config = s3_transfer_config(size)
+        if config is not None:
+            kwargs["Config"] = config
+
+        start_time = time.monotonic()
+        client = self.s3_client
+        attempts = self._call_with_retries(
             "upload",
             dest.s3_uri,
-            self.s3_client.upload_file,
-            str(source),
-            dest.bucket,
-            dest.relative_path,
-            ExtraArgs={"ContentType": content_type},
+            lambda: client.upload_file(
+                str(source),
+                dest.bucket,
+                dest.relative_path,
+                ExtraArgs={"ContentType": content_type},
+                **kwargs,
+            ),
         )
+        self._record_transfer("upload", dest.s3_uri, size, start_time, attempts)
 
     def copy_file(self, source: StorageLocation, dest: StorageLocation) -> None:
         if self._dry_run:
@@ -278,14 +642,18 @@ class S3StorageBackend(StorageBackend):
             return
 
         copy_source = {"Bucket": source.bucket, "Key": source.relative_path}
-        _s3_retry(
+        start_time = time.monotonic()
+        client = self.s3_client
+        attempts = self._call_with_retries(
             "copy",
             f"{source.s3_uri} -> {dest.s3_uri}",
-            self.s3_client.copy_object,
-            Bucket=dest.bucket,
-            Key=dest.relative_path,
-            CopySource=copy_source,
+            lambda: client.copy_object(
+                Bucket=dest.bucket,
+                Key=dest.relative_path,
+                CopySource=copy_source,
+            ),
         )
+        self._record_transfer("copy", dest.s3_uri, 0, start_time, attempts)
 
 
 # ---------------------------------------------------------------------------
@@ -298,11 +666,25 @@ class LocalStorageBackend(StorageBackend):
 
     Mirrors the remote directory layout under *staging_dir* so that
     downstream tools can be tested against a local file tree.
+
+    Uploads are sequential by default.  With *upload_concurrency* > 1,
+    ``upload_files()`` uses the same adaptive concurrent path as
+    ``S3StorageBackend``, never exceeding *upload_concurrency*.
     """
 
-    def __init__(self, staging_dir: Path, *, dry_run: bool = False):
+    def __init__(
+        self, staging_dir: Path, *, dry_run: bool = False, upload_concurrency: int = 1
+    ):
         self._staging_dir = staging_dir
         self._dry_run = dry_run
+        self._limiter = (
+            AdaptiveConcurrencyLimiter(upload_concurrency, maximum=upload_concurrency)
+            if upload_concurrency > 1
+            else None
+        )
+
+    def _concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        return None if self._dry_run else self._limiter
 
     def upload_file(self, source: Path, dest: StorageLocation) -> None:
         target = dest.local_path(self._staging_dir)
@@ -310,8 +692,10 @@ class LocalStorageBackend(StorageBackend):
             logger.info("[DRY RUN] %s -> %s", source, target)
             return
 
+        start_time = time.monotonic()
         target.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source, target)
+        self._record_transfer("upload", str(target), _file_size(target), start_time)
 
     def copy_file(self, source: StorageLocation, dest: StorageLocation) -> None:
         src = source.local_path(self._staging_dir)
@@ -320,8 +704,10 @@ class LocalStorageBackend(StorageBackend):
             logger.info("[DRY RUN] copy %s -> %s", src, dst)
             return
 
+        start_time = time.monotonic()
         dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(src, dst)
+        self._record_transfer("copy", str(dst), _file_size(dst), start_time)
 
 
 # ---------------------------------------------------------------------------
@@ -334,6 +720,7 @@ def create_storage_backend(
     staging_dir: Path | None = None,
     dry_run: bool = False,
     upload_concurrency: int | None = None,
+    max_upload_concurrency: int | None = None,
 ) -> StorageBackend:
     """Create a storage backend.
 
@@ -342,12 +729,18 @@ def create_storage_backend(
             that copies files under this directory.  Otherwise returns an
             ``S3StorageBackend``.
         dry_run: If ``True``, the backend logs actions without writing.
-        upload_concurrency: Max concurrent uploads for S3 (default: 10).
-            Ignored for local backends.
+        upload_concurrency: Initial concurrent uploads (default: 10 for S3,
+            1 for local backends).
+        max_upload_concurrency: Upper bound the adaptive concurrency may
+            grow to for S3 (default: four times *upload_concurrency*).
     """
     if staging_dir is not None:
-        return LocalStorageBackend(staging_dir, dry_run=dry_run)
+        return LocalStorageBackend(
+            staging_dir, dry_run=dry_run, upload_concurrency=upload_concurrency or 1
+        )
     kwargs: dict = {"dry_run": dry_run}
     if upload_concurrency is not None:
         kwargs["upload_concurrency"] = upload_concurrency
+    if max_upload_concurrency is not None:
+        kwargs["max_upload_concurrency"] = max_upload_concurrency
     return S3StorageBackend(**kwargs)
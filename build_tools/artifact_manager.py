@@ -49,21 +49,26 @@ import os
 import platform as platform_module
 import shutil
 import sys
-import tarfile
 import threading
 import time
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Union
 
 from _therock_utils.build_topology import BuildTopology
 from _therock_utils.artifact_backend import (
     ArtifactBackend,
-    ARTIFACT_EXTENSIONS,
+    ArtifactIndex,
     LocalDirectoryBackend,
+    SIDECAR_SUFFIXES,
     S3Backend,
     create_backend_from_env,
+    plan_artifact_copy,
 )
-from _therock_utils.artifacts import ArtifactName, ArtifactPopulator
+from _therock_utils.artifact_delta import (
+    DeltaCache,
+    download_artifact_delta,
+)
+from _therock_utils.artifacts import ArtifactName, ArtifactPopulator, extract_archive
 from _therock_utils.workflow_outputs import WorkflowOutputRoot
 
 # Component types that artifacts are split into
@@ -80,31 +85,6 @@ def _delay_for_retry(seconds: float):
     time.sleep(seconds)
 
 
-def _get_pyzstd():
-    """Lazy import pyzstd with helpful error message."""
-    try:
-        import pyzstd
-
-        return pyzstd
-    except ModuleNotFoundError:
-        raise ModuleNotFoundError(
-            "pyzstd is required for zstd artifact decompression. "
-            "Install it with: pip install pyzstd"
-        )
-
-
-def _open_archive_for_read(path: Path) -> tarfile.TarFile:
-    """Open a tar archive for reading, auto-detecting compression type."""
-    if path.name.endswith(".tar.zst"):
-        pyzstd = _get_pyzstd()
-        zstd_file = pyzstd.ZstdFile(path, mode="rb")
-        return tarfile.TarFile(fileobj=zstd_file, mode="r")
-    elif path.name.endswith(".tar.xz"):
-        return tarfile.TarFile.open(path, mode="r:xz")
-    else:
-        raise ValueError(f"Unknown archive format: {path}")
-
-
 def get_default_topology_path() -> Path:
     """Get the default BUILD_TOPOLOGY.toml path from the repository root."""
     script_dir = Path(__file__).parent
@@ -152,24 +132,17 @@ def parse_target_families(args: argparse.Namespace) -> List[str]:
 def find_available_artifacts(
     artifact_names: Set[str],
     target_families: List[str],
-    available: Set[str],
+    available: Union[Set[str], ArtifactIndex],
 ) -> List[str]:
-    """Find which artifacts exist in the available set.
+    """Find which artifacts exist in the available set or backend index.
 
-    Iterates artifact_names × target_families × components × extensions,
-    returning filenames that are present in `available`. Prefers .tar.zst
-    over .tar.xz when both exist.
+    Iterates artifact_names × target_families × components, returning
+    filenames that are present in `available`. Prefers .tar.zst over .tar.xz
+    when both exist.
     """
-    matched = []
-    for artifact_name in sorted(artifact_names):
-        for tf in target_families:
-            for comp in ARTIFACT_COMPONENTS:
-                for ext in ARTIFACT_EXTENSIONS:
-                    filename = f"{artifact_name}_{comp}_{tf}{ext}"
-                    if filename in available:
-                        matched.append(filename)
-                        break  # Found this artifact, don't check other extensions
-    return matched
+    if not isinstance(available, ArtifactIndex):
+        available = ArtifactIndex.from_filenames(available)
+    return available.find(artifact_names, target_families, ARTIFACT_COMPONENTS)
 
 
 # =============================================================================
@@ -184,6 +157,8 @@ class DownloadRequest:
     artifact_key: str
     dest_path: Path
     backend: ArtifactBackend
+    # Cache of previously fetched chunked archives for delta transfers
+    delta_cache: Optional[DeltaCache] = None
 
 
 @dataclass
@@ -209,7 +184,23 @@ def download_artifact(request: DownloadRequest) -> Optional[Path]:
         try:
             log(f"  ++ Downloading {request.artifact_key}")
             request.dest_path.parent.mkdir(parents=True, exist_ok=True)
-            request.backend.download_artifact(request.artifact_key, request.dest_path)
+            if request.delta_cache is not None:
+                stats = download_artifact_delta(
+                    request.backend,
+                    request.artifact_key,
+                    request.dest_path,
+                    request.delta_cache,
+                )
+                if not stats.full_download:
+                    log(
+                        f"  ++ Delta fetched {request.artifact_key}: "
+                        f"{stats.downloaded_bytes} bytes downloaded, "
+                        f"{stats.reused_bytes} bytes reused"
+                    )
+            else:
+                request.backend.download_artifact(
+                    request.artifact_key, request.dest_path
+                )
             return request.dest_path
         except FileNotFoundError:
             # Artifact doesn't exist - not an error, just skip
@@ -299,8 +290,7 @@ def extract_artifact(request: ExtractRequest) -> Optional[Path]:
             if output_dir.exists():
                 shutil.rmtree(output_dir)
             log(f"  ++ Extracting {archive_path.name}")
-            with _open_archive_for_read(archive_path) as tf:
-                tf.extractall(output_dir, filter="tar")
+            extract_archive(archive_path, output_dir)
 
         if request.delete_archive:
             archive_path.unlink()
@@ -346,8 +336,8 @@ def do_fetch(args: argparse.Namespace):
     )
     log(f"Using backend: {backend.base_uri}")
 
-    # Get list of available artifacts
-    available = set(backend.list_artifacts())
+    # Index available artifacts with a single listing
+    available = backend.artifact_index()
     log(f"Found {len(available)} artifacts in backend")
 
     # Build download requests
@@ -355,12 +345,14 @@ def do_fetch(args: argparse.Namespace):
     download_dir = output_dir / ".download_cache"
     download_dir.mkdir(parents=True, exist_ok=True)
 
+    delta_cache = DeltaCache(args.delta_cache) if args.delta_cache else None
     matched_filenames = find_available_artifacts(inbound, target_families, available)
     download_requests = [
         DownloadRequest(
             artifact_key=filename,
             dest_path=download_dir / filename,
             backend=backend,
+            delta_cache=delta_cache,
         )
         for filename in matched_filenames
     ]
@@ -477,6 +469,10 @@ class CompressRequest:
     compression_level: Optional[int] = (
         None  # None = use algorithm default (3 for zstd, 6 for xz)
     )
+    # Write a multi-frame archive with a chunk index for delta fetches
+    chunked: bool = False
+    # Write a seekable multi-frame archive for random-access extraction
+    seekable: bool = False
 
 
 @dataclass
@@ -511,8 +507,13 @@ def compress_artifact(request: CompressRequest) -> Optional[Path]:
         ]
         if request.compression_level is not None:
             cmd.extend(["--compression-level", str(request.compression_level)])
+        if request.chunked:
+            cmd.append("--chunked")
+        if request.seekable:
+            cmd.append("--seekable")
         cmd.extend(
             [
+                "--member-index",
                 "--hash-file",
                 str(request.archive_path) + ".sha256sum",
                 str(request.source_dir),
@@ -541,14 +542,15 @@ def upload_artifact(request: UploadRequest) -> bool:
             log(f"  ++ Uploading {request.artifact_key}")
             request.backend.upload_artifact(request.source_path, request.artifact_key)
 
-            # Also upload sha256sum if it exists
-            sha_path = request.source_path.with_suffix(
-                request.source_path.suffix + ".sha256sum"
-            )
-            if sha_path.exists():
-                request.backend.upload_artifact(
-                    sha_path, f"{request.artifact_key}.sha256sum"
+            # Also upload sha256sum, chunk and member indexes if they exist
+            for suffix in SIDECAR_SUFFIXES:
+                sidecar_path = request.source_path.with_suffix(
+                    request.source_path.suffix + suffix
                 )
+                if sidecar_path.exists():
+                    request.backend.upload_artifact(
+                        sidecar_path, f"{request.artifact_key}{suffix}"
+                    )
 
             return True
         except Exception as e:
@@ -626,6 +628,8 @@ def do_push(args: argparse.Namespace):
                     archive_path=upload_dir / archive_name,
                     compression_type=args.compression_type,
                     compression_level=args.compression_level,
+                    chunked=args.chunked,
+                    seekable=args.seekable,
                 )
             )
         elif (item.suffix == ".xz" and item.name.endswith(".tar.xz")) or (
@@ -720,23 +724,23 @@ def do_push(args: argparse.Namespace):
 
 @dataclass
 class CopyRequest:
-    """Request to copy a single artifact between backends."""
+    """Request to copy a single stored file (archive or sidecar) between backends."""
 
     artifact_key: str
     source_backend: ArtifactBackend
     dest_backend: ArtifactBackend
+    size: Optional[int] = None
 
 
 def copy_single_artifact(request: CopyRequest) -> bool:
-    """Copy a single artifact with retry logic."""
+    """Copy a single file with retry logic."""
     MAX_RETRIES = 3
     BASE_DELAY_SECONDS = 2
 
     for attempt in range(MAX_RETRIES):
         try:
-            log(f"  ++ Copying {request.artifact_key}")
-            request.dest_backend.copy_artifact(
-                request.artifact_key, request.source_backend
+            request.dest_backend.copy_object(
+                request.artifact_key, request.source_backend, size=request.size
             )
             return True
         except Exception as e:
@@ -822,54 +826,80 @@ def do_copy(args: argparse.Namespace):
     log(f"Source: {source_backend.base_uri}")
     log(f"Dest:   {dest_backend.base_uri}")
 
-    # List available artifacts in source
-    available = set(source_backend.list_artifacts())
+    # List source and destination once. The plan skips files that are
+    # already present in the destination and avoids per-file existence checks.
+    available = source_backend.artifact_index()
+    dest_objects = dest_backend.list_objects()
     log(f"Found {len(available)} artifacts in source")
 
-    # Build copy requests from matched artifacts
     matched_filenames = find_available_artifacts(produced, target_families, available)
-    copy_requests = [
-        CopyRequest(
-            artifact_key=filename,
-            source_backend=source_backend,
-            dest_backend=dest_backend,
-        )
-        for filename in matched_filenames
-    ]
-
-    if not copy_requests:
+    if not matched_filenames:
         log("No matching artifacts found to copy")
         return
 
+    plan = plan_artifact_copy(matched_filenames, available.objects, dest_objects)
+    log(
+        f"Plan: copy {len(plan.to_copy)} files ({_format_size(plan.copy_bytes)}), "
+        f"{len(plan.up_to_date)} already up to date"
+    )
+
     if args.dry_run:
-        log(f"\nDry run: would copy {len(copy_requests)} artifacts:")
-        for req in copy_requests:
-            log(f"  {req.artifact_key}")
+        log(f"\nDry run: would copy {len(plan.to_copy)} files:")
+        for obj in plan.to_copy:
+            log(f"  {obj.key} ({_format_size(obj.size)})")
         return
 
-    log(f"\nCopying {len(copy_requests)} artifacts...")
+    # Start the largest copies first so they overlap with the small ones.
+    copy_requests = [
+        CopyRequest(
+            artifact_key=obj.key,
+            source_backend=source_backend,
+            dest_backend=dest_backend,
+            size=obj.size,
+        )
+        for obj in sorted(plan.to_copy, key=lambda obj: obj.size, reverse=True)
+    ]
+    log(f"\nCopying {len(copy_requests)} files...")
 
     failed_artifacts = []
+    copied_bytes = 0
+    start_time = time.monotonic()
     with concurrent.futures.ThreadPoolExecutor(
         max_workers=args.concurrency
     ) as executor:
         futures = {
             executor.submit(copy_single_artifact, req): req for req in copy_requests
         }
-        for future in concurrent.futures.as_completed(futures):
+        for i, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            req = futures[future]
             if not future.result():
-                failed_artifacts.append(futures[future].artifact_key)
+                failed_artifacts.append(req.artifact_key)
+                continue
+            copied_bytes += req.size or 0
+            elapsed = max(time.monotonic() - start_time, 1e-6)
+            log(
+                f"  [{i}/{len(copy_requests)}] {req.artifact_key} "
+                f"({_format_size(copied_bytes)}, "
+                f"{_format_size(copied_bytes / elapsed)}/s)"
+            )
 
     copied_count = len(copy_requests) - len(failed_artifacts)
-    log(f"\nCopied {copied_count}/{len(copy_requests)} artifacts")
+    log(
+        f"\nCopied {copied_count}/{len(copy_requests)} files, "
+        f"skipped {len(plan.up_to_date)} up to date"
+    )
 
     if failed_artifacts:
-        log(f"ERROR: {len(failed_artifacts)} artifacts failed to copy:")
+        log(f"ERROR: {len(failed_artifacts)} files failed to copy:")
         for name in sorted(failed_artifacts):
             log(f"  - {name}")
         sys.exit(1)
 
 
+def _format_size(num_bytes: float) -> str:
+    return f"{num_bytes / (1 << 20):.1f} MiB"
+
+
 # =============================================================================
 # Info Commands
 # =============================================================================
@@ -911,11 +941,22 @@ def do_info(args: argparse.Namespace):
             log(f"  - {name}")
 
     # Show target families if provided
+    target_families = ["generic"]
     if args.amdgpu_families:
-        families = args.amdgpu_families.split(",")
-        target_families = ["generic"] + families
+        target_families += args.amdgpu_families.split(",")
         log(f"\nTarget families: {', '.join(target_families)}")
 
+    # Show which artifact files a run already has, from one backend listing
+    if args.run_id:
+        backend = create_backend_from_env(run_id=args.run_id, platform=args.platform)
+        index = backend.artifact_index()
+        log(f"\nBackend: {backend.base_uri} ({len(index)} artifacts)")
+        for label, names in [("Inbound", inbound), ("Produced", produced)]:
+            found = find_available_artifacts(names, target_families, index)
+            log(f"{label} files available ({len(found)}):")
+            for filename in found:
+                log(f"  - {filename}")
+
 
 def do_list_stages(args: argparse.Namespace):
     """List all build stages."""
@@ -1045,6 +1086,14 @@ def main(argv: Optional[List[str]] = None):
         default=None,
         help="Number of concurrent extractions (default: auto)",
     )
+    fetch_parser.add_argument(
+        "--delta-cache",
+        type=Path,
+        default=os.getenv("THEROCK_ARTIFACT_DELTA_CACHE") or None,
+        help="Directory caching previously fetched chunked archives. Only "
+        "changed chunks are downloaded when a cached version exists "
+        "(default: $THEROCK_ARTIFACT_DELTA_CACHE)",
+    )
     fetch_parser.set_defaults(func=do_fetch)
 
     # push command
@@ -1074,6 +1123,20 @@ def main(argv: Optional[List[str]] = None):
         default=None,
         help="Compression level (default: 3 for zstd, 6 for xz)",
     )
+    push_parser.add_argument(
+        "--chunked",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="Write chunked zstd archives with a chunk index so consumers can "
+        "fetch deltas against previously fetched versions",
+    )
+    push_parser.add_argument(
+        "--seekable",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="Write seekable zstd archives so consumers can extract single "
+        "members and decompress large archives in parallel",
+    )
     push_parser.add_argument(
         "--compress-concurrency",
         type=int,
@@ -1133,6 +1196,24 @@ def main(argv: Optional[List[str]] = None):
         type=str,
         help="Comma-separated GPU families to show file lists for",
     )
+    info_parser.add_argument(
+        "--run-id",
+        type=str,
+        default=None,
+        help="Also list the stage's artifact files available for this run",
+    )
+    info_parser.add_argument(
+        "--platform",
+        type=str,
+        default=os.getenv("THEROCK_PLATFORM", platform_module.system().lower()),
+        help="Platform name (default: current platform)",
+    )
+    info_parser.add_argument(
+        "--local-staging-dir",
+        type=Path,
+        default=os.getenv("THEROCK_LOCAL_STAGING_DIR"),
+        help="Local staging directory (sets THEROCK_LOCAL_STAGING_DIR)",
+    )
     info_parser.set_defaults(func=do_info)
 
     # list-stages command
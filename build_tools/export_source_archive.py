@@ -45,45 +45,107 @@ system. The build system will automatically use these if available.
 
 from abc import ABC, abstractmethod
 import argparse
+import collections
+import concurrent.futures
+import io
+import os
 from pathlib import Path
+import stat
 import subprocess
 import sys
 import tarfile
-import tempfile
+from typing import Iterable, Iterator
 
 from _therock_utils.pattern_match import PatternMatcher
 
 REPO_DIR = Path(__file__).resolve().parent.parent
 
+# Files up to this size are read ahead by the prefetch thread pool. Larger
+# files are streamed from disk by the writer to bound memory use.
+PREFETCH_MAX_FILE_SIZE = 8 << 20
+
+ARCHIVE_SUFFIXES = [".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".tar.zst"]
+
+
+def _get_pyzstd():
+    """Lazy import pyzstd with helpful error message."""
+    try:
+        import pyzstd
+
+        return pyzstd
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "pyzstd is required for zstd compression. "
+            "Install it with: pip install pyzstd"
+        )
+
+
+class _ZstdTarFile(tarfile.TarFile):
+    """TarFile wrapper that writes to a (multi-threaded) zstd-compressed file."""
+
+    def __init__(self, path: Path, compresslevel: int, threads: int):
+        pyzstd = _get_pyzstd()
+        self._zstd_file = pyzstd.ZstdFile(
+            path,
+            mode="wb",
+            level_or_option={
+                pyzstd.CParameter.compressionLevel: compresslevel,
+                pyzstd.CParameter.nbWorkers: threads,
+            },
+        )
+        super().__init__(fileobj=self._zstd_file, mode="w")
+
+    def close(self):
+        super().close()
+        self._zstd_file.close()
+
+
+def archive_suffix(p: Path) -> str:
+    """Returns the archive type suffix of a path (e.g. ".tar.gz")."""
+    for suffix in sorted(ARCHIVE_SUFFIXES, key=len, reverse=True):
+        if p.name.endswith(suffix):
+            return suffix
+    raise ValueError(f"Unsupported archive file extension for: {p.name}")
+
 
 class ArchiveWriter(ABC):
     @staticmethod
-    def create(p: Path, compresslevel: int):
-        name = p.name
-        if name.endswith(".tar"):
+    def create(p: Path, compresslevel: int, threads: int = 0):
+        """Creates a writer for the archive type given by the file extension.
+
+        `threads` is the number of compression worker threads for zstd
+        archives (0 compresses on the calling thread). It is ignored for
+        other types.
+        """
+        suffix = archive_suffix(p)
+        if suffix == ".tar":
             return TarArchiveWriter(
                 tarfile.open(p, mode="w", compresslevel=compresslevel)
             )
-        elif name.endswith(".tar.gz") or name.endswith(".tgz"):
+        elif suffix in [".tar.gz", ".tgz"]:
             return TarArchiveWriter(
                 tarfile.open(p, mode="w:gz", compresslevel=compresslevel)
             )
-        elif name.endswith(".tar.bz2"):
+        elif suffix == ".tar.bz2":
             return TarArchiveWriter(
                 tarfile.open(p, mode="w:bz2", compresslevel=compresslevel)
             )
-        elif name.endswith(".tar.xz"):
-            return TarArchiveWriter(
-                tarfile.open(p, mode="w:xz", compresslevel=compresslevel)
-            )
+        elif suffix == ".tar.xz":
+            return TarArchiveWriter(tarfile.open(p, mode="w:xz", preset=compresslevel))
         else:
-            raise ValueError(f"Unsupported archive file extension for: {name}")
+            return TarArchiveWriter(_ZstdTarFile(p, compresslevel, threads))
 
     @abstractmethod
     def close(self): ...
 
     @abstractmethod
-    def add_file(self, path: Path, arcname: str): ...
+    def add_file(
+        self,
+        path: Path,
+        arcname: str,
+        st: os.stat_result | None = None,
+        data: bytes | None = None,
+    ): ...
 
     @abstractmethod
     def add_directory(self, path: Path, arcname: str): ...
@@ -99,42 +161,81 @@ class TarArchiveWriter(ArchiveWriter):
     def close(self):
         self.archive.close()
 
-    def add_file(self, path: Path, arcname: str):
-        self.archive.add(str(path), arcname, recursive=False)
+    def add_file(
+        self,
+        path: Path,
+        arcname: str,
+        st: os.stat_result | None = None,
+        data: bytes | None = None,
+    ):
+        """Adds a file, symlink or directory entry.
+
+        Headers are built from a single lstat (`st`, if already known) rather
+        than `TarFile.add`, which also looks up user and group names. If the
+        file contents were already read, they are passed as `data`.
+        """
+        if st is None:
+            st = os.lstat(path)
+        info = tarfile.TarInfo(arcname)
+        info.mode = stat.S_IMODE(st.st_mode)
+        info.mtime = st.st_mtime
+        info.uid = st.st_uid
+        info.gid = st.st_gid
+        if stat.S_ISLNK(st.st_mode):
+            info.type = tarfile.SYMTYPE
+            info.linkname = os.readlink(path)
+            self.archive.addfile(info)
+        elif stat.S_ISDIR(st.st_mode):
+            info.type = tarfile.DIRTYPE
+            self.archive.addfile(info)
+        elif data is not None:
+            info.size = len(data)
+            self.archive.addfile(info, io.BytesIO(data))
+        else:
+            info.size = st.st_size
+            with open(path, "rb") as f:
+                self.archive.addfile(info, f)
 
     def add_directory(self, path: Path, arcname: str):
         self.archive.add(str(path), arcname, recursive=True)
 
     def add_text(self, text: str, arcname: str):
-        with tempfile.NamedTemporaryFile(mode="wt") as tf:
-            tf.write(text)
-            self.archive.add(Path(tf.name), arcname)
+        data = text.encode()
+        info = tarfile.TarInfo(arcname)
+        info.size = len(data)
+        self.archive.addfile(info, io.BytesIO(data))
 
 
 def git_ls_files(repo_dir: Path, recurse_submodules: bool = False):
     cl = ["git", "ls-files"]
     if recurse_submodules:
         cl += ["--recurse-submodules"]
-    cl += [str(repo_dir)]
-    lines = subprocess.check_output(cl).decode()
+    lines = subprocess.check_output(cl, cwd=repo_dir).decode()
     return lines.splitlines()
 
 
 def git_head_revision(repo_dir: Path) -> str:
     cl = ["git", "rev-parse", "HEAD"]
-    return subprocess.check_output(cl).decode().strip()
+    return subprocess.check_output(cl, cwd=repo_dir).decode().strip()
 
 
 def git_origin(repo_dir: Path) -> str:
     cl = ["git", "remote", "get-url", "origin"]
     try:
-        return subprocess.check_output(cl).decode().strip()
+        return subprocess.check_output(cl, cwd=repo_dir).decode().strip()
     except subprocess.CalledProcessError:
         # It is legal for there to be no origin.
         return ""
 
 
-def progress_iter(iterable, desc: str | None):
+def git_submodule_paths(repo_dir: Path) -> list[str]:
+    """Returns the paths of the initialized top-level submodules."""
+    cl = ["git", "submodule", "--quiet", "foreach", "echo $sm_path"]
+    lines = subprocess.check_output(cl, cwd=repo_dir).decode()
+    return lines.splitlines()
+
+
+def progress_iter(iterable, desc: str | None, total: int | None = None):
     try:
         import tqdm
     except ImportError:
@@ -142,14 +243,71 @@ def progress_iter(iterable, desc: str | None):
     return tqdm.tqdm(
         iterable,
         desc=desc,
+        total=total,
         unit="file",
         bar_format="{l_bar}|{bar}| {n_fmt}/{total_fmt}{postfix}",
     )
 
 
+def _read_source_file(path: Path) -> tuple[os.stat_result, bytes | None]:
+    st = os.lstat(path)
+    if stat.S_ISREG(st.st_mode) and st.st_size <= PREFETCH_MAX_FILE_SIZE:
+        with open(path, "rb") as f:
+            return st, f.read()
+    return st, None
+
+
+def prefetch_files(
+    entries: list[tuple[Path, str]], jobs: int
+) -> Iterator[tuple[Path, str, os.stat_result, bytes | None]]:
+    """Stats and reads files on a thread pool, yielding them in order.
+
+    At most a bounded window of files is read ahead of the consumer so that
+    memory use stays proportional to `jobs`.
+    """
+    if jobs <= 1:
+        for path, arcname in entries:
+            yield (path, arcname, *_read_source_file(path))
+        return
+
+    window = jobs * 4
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = collections.deque()
+        for path, arcname in entries:
+            pending.append((path, arcname, executor.submit(_read_source_file, path)))
+            if len(pending) > window:
+                path, arcname, future = pending.popleft()
+                yield (path, arcname, *future.result())
+        while pending:
+            path, arcname, future = pending.popleft()
+            yield (path, arcname, *future.result())
+
+
+def add_files(
+    writer: ArchiveWriter,
+    entries: list[tuple[Path, str]],
+    desc: str | None,
+    jobs: int,
+):
+    """Adds (path, arcname) entries to the archive, in order."""
+    for path, arcname, st, data in progress_iter(
+        prefetch_files(entries, jobs), desc=desc, total=len(entries)
+    ):
+        writer.add_file(path, arcname, st=st, data=data)
+
+
 def create_archive(
-    writer: ArchiveWriter, source_dir: Path, prebuilt_artifacts_dir: Path | None
+    writer: ArchiveWriter,
+    source_dir: Path,
+    prebuilt_artifacts_dir: Path | None,
+    jobs: int = 8,
+    source_files: Iterable[str] | None = None,
 ):
+    """Writes the export of source_dir to writer.
+
+    `source_files` overrides the files listed from git, which is used when the
+    submodules are exported to separate archives.
+    """
     # Write some metadata.
     head_revision = git_head_revision(source_dir)
     origin = git_origin(source_dir)
@@ -164,23 +322,120 @@ def create_archive(
 
     # Get the source files. If generating a pre-built archive, we do not
     # recurse submodules. Otherwise, we do.
-    source_files = git_ls_files(
-        source_dir, recurse_submodules=prebuilt_artifacts_dir is None
+    if source_files is None:
+        source_files = git_ls_files(
+            source_dir, recurse_submodules=prebuilt_artifacts_dir is None
+        )
+    add_files(
+        writer,
+        [(source_dir / source_file, source_file) for source_file in source_files],
+        desc="Adding source files",
+        jobs=jobs,
     )
-    for source_file in progress_iter(source_files, desc="Adding source files"):
-        source_abs_path = source_dir / source_file
-        writer.add_file(source_abs_path, source_file)
 
     if prebuilt_artifacts_dir:
         pm = PatternMatcher()
         pm.add_basedir(prebuilt_artifacts_dir)
-        artifact_files = list(pm.matches())
-        for relpath, direntry in progress_iter(
-            artifact_files, desc="Adding prebuilt files"
-        ):
-            # We canonically organize source tarballs to have artifacts in
-            # build/artifacts, no matter where they came from.
-            writer.add_file(Path(direntry.path), f"build/artifacts/{relpath}")
+        # We canonically organize source tarballs to have artifacts in
+        # build/artifacts, no matter where they came from.
+        add_files(
+            writer,
+            [
+                (Path(direntry.path), f"build/artifacts/{relpath}")
+                for relpath, direntry in pm.matches()
+            ],
+            desc="Adding prebuilt files",
+            jobs=jobs,
+        )
+
+
+def group_files_by_submodule(
+    files: list[str], submodule_paths: list[str]
+) -> tuple[list[str], dict[str, list[str]]]:
+    """Splits files into super-project files and files of each submodule.
+
+    Files of nested submodules are grouped with their top-level submodule.
+    """
+    submodule_set = set(submodule_paths)
+    superproject_files: list[str] = []
+    submodule_files: dict[str, list[str]] = {path: [] for path in submodule_paths}
+    for file in files:
+        parts = file.split("/")
+        for i in range(1, len(parts)):
+            prefix = "/".join(parts[:i])
+            if prefix in submodule_set:
+                submodule_files[prefix].append(file)
+                break
+        else:
+            superproject_files.append(file)
+    return superproject_files, submodule_files
+
+
+def submodule_archive_path(output: Path, output_dir: Path, submodule_path: str):
+    suffix = archive_suffix(output)
+    return output_dir / (submodule_path.replace("/", "_") + suffix)
+
+
+def create_split_archives(
+    output: Path,
+    submodule_output_dir: Path,
+    source_dir: Path,
+    compresslevel: int,
+    jobs: int,
+    threads: int,
+) -> list[Path]:
+    """Exports the super-project and each top-level submodule separately.
+
+    The super-project archive (with the metadata files) is written to
+    `output` and each submodule to its own archive in `submodule_output_dir`,
+    all in parallel. Member names keep their full path from the source root,
+    so extracting every archive into one directory reproduces the full export.
+
+    Returns:
+        Paths of the submodule archives that were written.
+    """
+    files = git_ls_files(source_dir, recurse_submodules=True)
+    superproject_files, submodule_files = group_files_by_submodule(
+        files, git_submodule_paths(source_dir)
+    )
+    submodule_output_dir.mkdir(parents=True, exist_ok=True)
+    archive_count = len(submodule_files) + 1
+    archive_jobs = min(jobs, archive_count)
+    read_jobs = max(1, jobs // archive_count)
+
+    def write_superproject():
+        writer = ArchiveWriter.create(output, compresslevel, threads)
+        try:
+            create_archive(
+                writer, source_dir, None, read_jobs, source_files=superproject_files
+            )
+        finally:
+            writer.close()
+
+    def write_submodule(submodule_path: str) -> Path:
+        archive_path = submodule_archive_path(
+            output, submodule_output_dir, submodule_path
+        )
+        writer = ArchiveWriter.create(archive_path, compresslevel, threads)
+        try:
+            for path, arcname, st, data in prefetch_files(
+                [(source_dir / f, f) for f in submodule_files[submodule_path]],
+                read_jobs,
+            ):
+                writer.add_file(path, arcname, st=st, data=data)
+        finally:
+            writer.close()
+        print(f"Wrote {archive_path}")
+        return archive_path
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=archive_jobs) as executor:
+        superproject_future = executor.submit(write_superproject)
+        submodule_futures = [
+            executor.submit(write_submodule, submodule_path)
+            for submodule_path in submodule_files
+        ]
+        superproject_future.result()
+        return [future.result() for future in submodule_futures]
 
 
 def main(argv: list[str]):
@@ -201,10 +456,46 @@ def main(argv: list[str]):
     p.add_argument(
         "--compress-level", type=int, default=4, help="Tar compression level"
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Number of threads reading source files (and writing archives "
+        "with --submodule-archive-dir)",
+    )
+    p.add_argument(
+        "--compress-threads",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Compression worker threads per archive (.tar.zst only)",
+    )
+    p.add_argument(
+        "--submodule-archive-dir",
+        type=Path,
+        help="If specified, writes each top-level submodule to its own archive "
+        "in this directory, in parallel, and only the super-project to --output",
+    )
     args = p.parse_args(argv)
-    writer = ArchiveWriter.create(args.output, compresslevel=args.compress_level)
+    # Archived files are read relative to the source dir, from worker threads.
+    args.source_dir = args.source_dir.resolve()
+    if args.submodule_archive_dir:
+        if args.prebuilt_artifacts:
+            p.error("--submodule-archive-dir cannot be used with --prebuilt-artifacts")
+        create_split_archives(
+            args.output,
+            args.submodule_archive_dir,
+            args.source_dir,
+            compresslevel=args.compress_level,
+            jobs=args.jobs,
+            threads=args.compress_threads,
+        )
+        return
+
+    writer = ArchiveWriter.create(
+        args.output, compresslevel=args.compress_level, threads=args.compress_threads
+    )
     try:
-        create_archive(writer, args.source_dir, args.prebuilt_artifacts)
+        create_archive(writer, args.source_dir, args.prebuilt_artifacts, args.jobs)
     finally:
         writer.close()
 
@@ -34,15 +34,18 @@ import argparse
 import concurrent.futures
 from pathlib import Path
 import platform
-import re
 import shutil
 import sys
 
-from _therock_utils.artifact_backend import ArtifactBackend, S3Backend
+from _therock_utils.artifact_backend import (
+    ArtifactBackend,
+    S3Backend,
+    compile_artifact_filter,
+)
 from _therock_utils.artifacts import (
-    ArtifactName,
     ArtifactPopulator,
-    _open_archive_for_read,
+    ParallelArtifactFlattener,
+    extract_archive,
 )
 from _therock_utils.workflow_outputs import WorkflowOutputRoot
 from artifact_manager import DownloadRequest, download_artifact
@@ -84,15 +87,8 @@ def list_artifacts_for_group(
 
     log(f"Matching artifact target families: {sorted(targets_to_match)}")
 
-    # Get all artifacts from backend
-    all_artifacts = backend.list_artifacts()
-
-    # Use structured ArtifactName parsing for reliable matching
-    data = set()
-    for filename in all_artifacts:
-        an = ArtifactName.from_filename(filename)
-        if an and an.target_family in targets_to_match:
-            data.add(filename)
+    # The backend index parses each filename once, keyed by target family
+    data = backend.artifact_index().for_target_families(targets_to_match)
 
     if not data:
         log(
@@ -106,31 +102,11 @@ def filter_artifacts(
     artifacts: set[str], includes: list[str], excludes: list[str]
 ) -> set[str]:
     """Filters artifacts based on include and exclude regex lists"""
-
-    def _should_include(artifact_name: str) -> bool:
-        if not includes and not excludes:
-            return True
-
-        # If includes, then one include must match.
-        if includes:
-            for include in includes:
-                pattern = re.compile(include)
-                if pattern.search(artifact_name):
-                    break
-            else:
-                return False
-
-        # If excludes, then no excludes must match.
-        if excludes:
-            for exclude in excludes:
-                pattern = re.compile(exclude)
-                if pattern.search(artifact_name):
-                    return False
-
-        # Included and not excluded.
-        return True
-
-    return {a for a in artifacts if _should_include(a)}
+    if not includes and not excludes:
+        return set(artifacts)
+    # Compile the patterns once rather than per artifact.
+    should_include = compile_artifact_filter(includes, excludes)
+    return {a for a in artifacts if should_include(a)}
 
 
 def get_postprocess_mode(args) -> str | None:
@@ -165,9 +141,8 @@ def extract_artifact(
         output_dir = archive_file.parent / artifact_name
         if output_dir.exists():
             shutil.rmtree(output_dir)
-        with _open_archive_for_read(archive_file) as tf:
-            log(f"++ Extracting '{archive_file.name}' to '{artifact_name}'")
-            tf.extractall(archive_file.parent / artifact_name, filter="tar")
+        log(f"++ Extracting '{archive_file.name}' to '{artifact_name}'")
+        extract_archive(archive_file, output_dir)
     elif postprocess_mode == "flatten":
         output_dir = archive_file.parent
         log(f"++ Flattening '{archive_file.name}' to '{artifact_name}'")
@@ -182,6 +157,24 @@ def extract_artifact(
         archive_file.unlink()
 
 
+def flatten_artifacts(
+    archive_paths: list[Path],
+    *,
+    output_dir: Path,
+    delete_archives: bool,
+    max_workers: int | None = None,
+):
+    """Flattens archives into output_dir concurrently, in the given order."""
+    log(f"++ Flattening {len(archive_paths)} artifacts to '{output_dir}'")
+    flattener = ParallelArtifactFlattener(
+        output_path=output_dir, verbose=True, max_workers=max_workers
+    )
+    flattener(*archive_paths)
+    if delete_archives:
+        for archive_path in archive_paths:
+            archive_path.unlink()
+
+
 def run(args):
     run_github_repo = args.run_github_repo
     run_id = args.run_id
@@ -259,6 +252,19 @@ def run(args):
             [f.result() for f in download_futures]
             return
 
+        if postprocess_mode == "flatten":
+            # Flattening merges every archive into one directory, so plan all
+            # of them together to get deterministic results for overlapping
+            # paths (last artifact in sorted order wins).
+            downloaded = [f.result() for f in download_futures]
+            flatten_artifacts(
+                [path for path in downloaded if path is not None],
+                output_dir=output_dir,
+                delete_archives=args.delete_after_extract,
+                max_workers=args.extract_concurrency,
+            )
+            return
+
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=args.extract_concurrency
         ) as extract_executor:
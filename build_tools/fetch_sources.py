@@ -13,8 +13,21 @@
 # Legacy flag-based fetching:
 #   Use --include-* flags to control which project groups to fetch.
 #   This is the original behavior and is still supported.
+#
+# Reference-cached fetching:
+#   Use --reference-cache <dir> (or THEROCK_GIT_REFERENCE_CACHE) to keep a
+#   local bare mirror per submodule URL. Submodules are then cloned with
+#   `--reference` against the mirror, so only objects missing from the cache
+#   are downloaded. Submodules, nested submodules and patches are processed
+#   concurrently with up to --fetch-jobs workers.
+#   By default the objects are then copied into the checkout (--dissociate).
+#   With --no-dissociate, checkouts borrow objects from the mirrors through
+#   .git/objects/info/alternates, so mirrors must never lose objects: they are
+#   refreshed without --prune and without automatic gc, and must not be gc'd
+#   or pruned by hand while such checkouts exist.
 
 import argparse
+import concurrent.futures
 import hashlib
 from pathlib import Path
 import platform
@@ -22,8 +35,9 @@ import shlex
 import shutil
 import subprocess
 import sys
-from typing import List
+from typing import Callable, Iterable, List
 import os
+import re
 
 THIS_SCRIPT_DIR = Path(__file__).resolve().parent
 THEROCK_DIR = THIS_SCRIPT_DIR.parent
@@ -52,6 +66,154 @@ def run_command(args: list[str | Path], cwd: Path, env: dict[str, str] | None =
     subprocess.check_call(args, cwd=str(cwd), env=full_env, stdin=subprocess.DEVNULL)
 
 
+def run_parallel(fn: Callable, items: Iterable, max_workers: int) -> list:
+    """Calls fn on each item with up to max_workers threads.
+
+    Results are returned in input order. All items are processed even if some
+    fail; the first failure is then re-raised.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        concurrent.futures.wait(futures)
+    return [future.result() for future in futures]
+
+
+def get_reference_mirror_dir(reference_cache: Path, url: str) -> Path:
+    """Gets the bare mirror directory caching objects for a submodule URL."""
+    normalized_url = url.rstrip("/")
+    if normalized_url.endswith(".git"):
+        normalized_url = normalized_url[: -len(".git")]
+    basename = re.sub(r"[^A-Za-z0-9_.-]", "_", normalized_url.rsplit("/", 1)[-1])
+    url_hash = hashlib.sha1(normalized_url.encode()).hexdigest()[:12]
+    return reference_cache / f"{basename}-{url_hash}.git"
+
+
+def update_reference_mirror(reference_cache: Path, url: str) -> Path | None:
+    """Creates or refreshes the bare mirror for a URL.
+
+    Mirrors only ever gain objects: refs deleted upstream are kept and no gc
+    runs, since checkouts made with --no-dissociate may borrow any object.
+
+    Returns the mirror directory, or None if it could not be populated, in
+    which case the submodule is fetched without a reference.
+    """
+    mirror_dir = get_reference_mirror_dir(reference_cache, url)
+    try:
+        if (mirror_dir / "HEAD").exists():
+            run_command(
+                [
+                    "git",
+                    "-c",
+                    "gc.auto=0",
+                    "-c",
+                    "maintenance.auto=false",
+                    "fetch",
+                    "--quiet",
+                    "origin",
+                ],
+                cwd=mirror_dir,
+            )
+        else:
+            reference_cache.mkdir(parents=True, exist_ok=True)
+            staging_dir = mirror_dir.with_name(mirror_dir.name + ".tmp")
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+            run_command(
+                ["git", "clone", "--mirror", "--quiet", url, staging_dir],
+                cwd=reference_cache,
+            )
+            staging_dir.rename(mirror_dir)
+    except (subprocess.CalledProcessError, OSError) as e:
+        log(f"WARNING: Could not update reference mirror for {url}: {e}")
+        return mirror_dir if (mirror_dir / "HEAD").exists() else None
+    return mirror_dir
+
+
+def update_submodules(
+    args,
+    repo_dir: Path,
+    submodule_names: List[str],
+    update_args: List[str],
+):
+    """Runs `git submodule update --init` for submodules of repo_dir.
+
+    Without a reference cache, a single git invocation updates all submodules
+    (parallelized by git itself via --jobs). With a reference cache, each
+    submodule is updated separately so it can use the mirror for its own URL,
+    and up to --fetch-jobs updates run concurrently.
+    """
+    submodule_paths = [
+        get_submodule_path(name, cwd=repo_dir) for name in submodule_names
+    ]
+    if not submodule_paths:
+        return
+    if not args.reference_cache:
+        run_command(
+            ["git", "submodule", "update", "--init"]
+            + update_args
+            + ["--"]
+            + submodule_paths,
+            cwd=repo_dir,
+        )
+        return
+
+    reference_cache = Path(args.reference_cache).resolve()
+    submodule_urls = [get_submodule_url(name, cwd=repo_dir) for name in submodule_names]
+    # Mirrors are shared by URL, so populate each one exactly once.
+    unique_urls = list(dict.fromkeys(submodule_urls))
+    mirror_dirs = dict(
+        zip(
+            unique_urls,
+            run_parallel(
+                lambda url: update_reference_mirror(reference_cache, url),
+                unique_urls,
+                args.fetch_jobs,
+            ),
+        )
+    )
+
+    # Registering submodules writes to the superproject config, so do it once
+    # up front rather than racing on the config lock from each worker.
+    run_command(
+        ["git", "submodule", "init", "--"] + submodule_paths,
+        cwd=repo_dir,
+    )
+
+    def update_one(path_and_url):
+        submodule_path, url = path_and_url
+        reference_args = []
+        mirror_dir = mirror_dirs[url]
+        if mirror_dir:
+            reference_args += ["--reference", mirror_dir]
+            if args.dissociate:
+                reference_args += ["--dissociate"]
+        run_command(
+            ["git", "submodule", "update", "--init"]
+            + update_args
+            + reference_args
+            + ["--", submodule_path],
+            cwd=repo_dir,
+        )
+
+    run_parallel(update_one, zip(submodule_paths, submodule_urls), args.fetch_jobs)
+
+
+def get_submodule_update_args(args) -> List[str]:
+    update_args = []
+    if args.depth:
+        update_args += ["--depth", str(args.depth)]
+    if args.progress:
+        update_args += ["--progress"]
+    if args.jobs:
+        update_args += ["--jobs", str(args.jobs)]
+    if args.remote:
+        update_args += ["--remote"]
+    return update_args
+
+
 def get_projects_from_topology(stage: str) -> List[str]:
     """Get submodule names for a build stage from BUILD_TOPOLOGY.toml."""
     from _therock_utils.build_topology import BuildTopology
@@ -120,61 +282,36 @@ def get_enabled_projects(args) -> List[str]:
 
 def fetch_nested_submodules(args, projects):
     """Fetch nested submodules for projects specified in --nested-submodules."""
-    update_args = []
-    if args.depth:
-        update_args += ["--depth", str(args.depth)]
-    if args.progress:
-        update_args += ["--progress"]
-    if args.jobs:
-        update_args += ["--jobs", str(args.jobs)]
-    if args.remote:
-        update_args += ["--remote"]
-
-    for parent, nested_submodules in dict(args.nested_submodules).items():
-        if len(nested_submodules) == 0:
-            continue
+    update_args = get_submodule_update_args(args)
 
-        # Skip if parent project wasn't fetched
-        if parent not in projects:
-            continue
+    parents = [
+        (parent, nested_submodules)
+        for parent, nested_submodules in dict(args.nested_submodules).items()
+        # Skip if there is nothing to fetch or the parent project wasn't fetched
+        if nested_submodules and parent in projects
+    ]
 
-        # Fetch the nested submodules
+    # Each parent is a separate repository, so they can be updated concurrently.
+    def fetch_one(parent_and_nested):
+        parent, nested_submodules = parent_and_nested
         parent_dir = THEROCK_DIR / get_submodule_path(parent)
-        nested_submodule_paths = [
-            get_submodule_path(nested_submodule, cwd=parent_dir)
-            for nested_submodule in nested_submodules
-        ]
-        run_command(
-            ["git", "submodule", "update", "--init"]
-            + update_args
-            + ["--"]
-            + nested_submodule_paths,
-            cwd=parent_dir,
-        )
+        update_submodules(args, parent_dir, nested_submodules, update_args)
+
+    run_parallel(fetch_one, parents, args.fetch_jobs)
 
 
 def run(args):
     projects = get_enabled_projects(args)
-    submodule_paths = ALWAYS_SUBMODULE_PATHS + [
-        get_submodule_path(project) for project in projects
-    ]
     # TODO(scotttodd): Check for git lfs?
-    update_args = []
-    if args.depth:
-        update_args += ["--depth", str(args.depth)]
-    if args.progress:
-        update_args += ["--progress"]
-    if args.jobs:
-        update_args += ["--jobs", str(args.jobs)]
-    if args.remote:
-        update_args += ["--remote"]
     if args.update_submodules:
-        run_command(
-            ["git", "submodule", "update", "--init"]
-            + update_args
-            + ["--"]
-            + submodule_paths,
-            cwd=THEROCK_DIR,
+        always_submodule_names = [
+            get_submodule_name(path) for path in ALWAYS_SUBMODULE_PATHS
+        ]
+        update_submodules(
+            args,
+            THEROCK_DIR,
+            list(dict.fromkeys(always_submodule_names + projects)),
+            get_submodule_update_args(args),
         )
     if args.dvc_projects:
         pull_large_files(args.dvc_projects, projects)
@@ -242,7 +379,8 @@ def apply_patches(args, projects):
     patch_version_dir: Path = PATCHES_DIR / args.patch_tag
     if not patch_version_dir.exists():
         log(f"ERROR: Patch directory {patch_version_dir} does not exist")
-    for patch_project_dir in patch_version_dir.iterdir():
+    patch_project_dirs = []
+    for patch_project_dir in sorted(patch_version_dir.iterdir()):
         log(f"* Processing project patch directory {patch_project_dir}:")
         # Check that project patch directory was included
         if not patch_project_dir.name in projects:
@@ -250,59 +388,80 @@ def apply_patches(args, projects):
                 f"* Project patch directory {patch_project_dir.name} was not included. Skipping."
             )
             continue
-        submodule_path = get_submodule_path(patch_project_dir.name)
-        submodule_url = get_submodule_url(patch_project_dir.name)
-        submodule_revision = get_submodule_revision(submodule_path)
-        project_dir = THEROCK_DIR / submodule_path
-        project_revision_file = project_dir.with_name(f".{project_dir.name}.smrev")
+        patch_project_dirs.append(patch_project_dir)
 
-        if not project_dir.exists():
-            log(f"WARNING: Source directory {project_dir} does not exist. Skipping.")
-            continue
-        patch_files = list(patch_project_dir.glob("*.patch"))
-        patch_files.sort()
-        log(f"Applying {len(patch_files)} patches")
-        run_command(
-            [
-                "git",
-                "-c",
-                "user.name=therockbot",
-                "-c",
-                "user.email=therockbot@amd.com",
-                "am",
-                "--whitespace=nowarn",
-            ]
-            + patch_files,
-            cwd=project_dir,
-            env={
-                "GIT_COMMITTER_DATE": "Thu, 1 Jan 2099 00:00:00 +0000",
-            },
+    # Projects are independent repositories, so `git am` can run concurrently.
+    patched_submodule_paths = [
+        submodule_path
+        for submodule_path in run_parallel(
+            apply_project_patches, patch_project_dirs, args.fetch_jobs
         )
-        # Since it is in a patched state, make it invisible to changes.
+        if submodule_path
+    ]
+
+    # Since they are in a patched state, make them invisible to changes.
+    # This touches the superproject index, so it is done once for all projects.
+    if patched_submodule_paths:
         run_command(
-            ["git", "update-index", "--skip-worktree", "--", submodule_path],
+            ["git", "update-index", "--skip-worktree", "--"] + patched_submodule_paths,
             cwd=THEROCK_DIR,
         )
 
-        # Generate the .smrev patch state file.
-        # This file consists of two lines: The git origin and a summary of the
-        # state of the source tree that was checked out. This can be consumed
-        # by individual build steps in lieu of heuristics for asking git. If
-        # the tree is in a patched state, the commit hashes of HEAD may be
-        # different from checkout-to-checkout, but the .smrev file will have
-        # stable contents so long as the submodule pin and contents of the
-        # hashes are the same.
-        # Note that this does not track the dirty state of the tree. If full
-        # fidelity hashes of the tree state are needed for development/dirty
-        # trees, then another mechanism must be used.
-        patches_hash = hashlib.sha1()
-        for patch_file in patch_files:
-            patch_contents = Path(patch_file).read_bytes()
-            patches_hash.update(patch_contents)
-        patches_digest = patches_hash.digest().hex()
-        project_revision_file.write_text(
-            f"{submodule_url}\n{submodule_revision}+PATCHED:{patches_digest}\n"
-        )
+
+def apply_project_patches(patch_project_dir: Path) -> str | None:
+    """Applies patches for one project and writes its .smrev file.
+
+    Returns the patched submodule path, or None if the project was skipped.
+    """
+    submodule_path = get_submodule_path(patch_project_dir.name)
+    submodule_url = get_submodule_url(patch_project_dir.name)
+    submodule_revision = get_submodule_revision(submodule_path)
+    project_dir = THEROCK_DIR / submodule_path
+    project_revision_file = project_dir.with_name(f".{project_dir.name}.smrev")
+
+    if not project_dir.exists():
+        log(f"WARNING: Source directory {project_dir} does not exist. Skipping.")
+        return None
+    patch_files = list(patch_project_dir.glob("*.patch"))
+    patch_files.sort()
+    log(f"Applying {len(patch_files)} patches to {patch_project_dir.name}")
+    run_command(
+        [
+            "git",
+            "-c",
+            "user.name=therockbot",
+            "-c",
+            "user.email=therockbot@amd.com",
+            "am",
+            "--whitespace=nowarn",
+        ]
+        + patch_files,
+        cwd=project_dir,
+        env={
+            "GIT_COMMITTER_DATE": "Thu, 1 Jan 2099 00:00:00 +0000",
+        },
+    )
+
+    # Generate the .smrev patch state file.
+    # This file consists of two lines: The git origin and a summary of the
+    # state of the source tree that was checked out. This can be consumed
+    # by individual build steps in lieu of heuristics for asking git. If
+    # the tree is in a patched state, the commit hashes of HEAD may be
+    # different from checkout-to-checkout, but the .smrev file will have
+    # stable contents so long as the submodule pin and contents of the
+    # hashes are the same.
+    # Note that this does not track the dirty state of the tree. If full
+    # fidelity hashes of the tree state are needed for development/dirty
+    # trees, then another mechanism must be used.
+    patches_hash = hashlib.sha1()
+    for patch_file in patch_files:
+        patch_contents = Path(patch_file).read_bytes()
+        patches_hash.update(patch_contents)
+    patches_digest = patches_hash.digest().hex()
+    project_revision_file.write_text(
+        f"{submodule_url}\n{submodule_revision}+PATCHED:{patches_digest}\n"
+    )
+    return submodule_path
 
 
 # Gets the the relative path to a submodule given its name.
@@ -326,9 +485,34 @@ def get_submodule_path(name: str, cwd=THEROCK_DIR) -> str:
     return relpath
 
 
-# Gets the the relative path to a submodule given its name.
+# Gets the name of a submodule given its relative path.
 # Raises an exception on failure.
-def get_submodule_url(name: str) -> str:
+def get_submodule_name(path: str, cwd=THEROCK_DIR) -> str:
+    config_lines = (
+        subprocess.check_output(
+            [
+                "git",
+                "config",
+                "--file",
+                ".gitmodules",
+                "--get-regexp",
+                r"^submodule\..*\.path$",
+            ],
+            cwd=cwd,
+        )
+        .decode()
+        .splitlines()
+    )
+    for line in config_lines:
+        key, value = line.split(maxsplit=1)
+        if value.strip() == path:
+            return key[len("submodule.") : -len(".path")]
+    raise ValueError(f"No submodule with path '{path}' in {cwd}/.gitmodules")
+
+
+# Gets the the URL of a submodule given its name.
+# Raises an exception on failure.
+def get_submodule_url(name: str, cwd=THEROCK_DIR) -> str:
     relpath = (
         subprocess.check_output(
             [
@@ -339,7 +523,7 @@ def get_submodule_url(name: str) -> str:
                 "--get",
                 f"submodule.{name}.url",
             ],
-            cwd=str(THEROCK_DIR),
+            cwd=str(cwd),
         )
         .decode()
         .strip()
@@ -422,6 +606,28 @@ def main(argv):
         help="Number of jobs to use for updating submodules",
         default=None,
     )
+    parser.add_argument(
+        "--fetch-jobs",
+        type=int,
+        help="Number of submodules, nested submodule parents and patched "
+        "projects to process concurrently",
+        default=min(8, os.cpu_count() or 1),
+    )
+    parser.add_argument(
+        "--reference-cache",
+        type=str,
+        help="Directory of bare mirrors (one per submodule URL) used as "
+        "`git --reference` object stores. Defaults to $THEROCK_GIT_REFERENCE_CACHE",
+        default=os.getenv("THEROCK_GIT_REFERENCE_CACHE") or None,
+    )
+    parser.add_argument(
+        "--dissociate",
+        default=True,
+        action=argparse.BooleanOptionalAction,
+        help="Copy objects out of the reference cache after cloning so the "
+        "checkout does not depend on the cache (--no-dissociate saves disk "
+        "space, but the cache must then never be pruned or gc'd)",
+    )
     parser.add_argument(
         "--nested-submodules",
         nargs="+",
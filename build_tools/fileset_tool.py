@@ -16,14 +16,21 @@ with the following changes:
 * It does not support character classes.
 """
 
-from typing import Callable
+from typing import Callable, Sequence
 import argparse
 from pathlib import Path
 import sys
 import shutil
 import tarfile
 
-from _therock_utils.artifacts import ArtifactPopulator
+from _therock_utils.artifacts import (
+    ArchiveFrame,
+    ArchiveMemberIndex,
+    ArtifactPopulator,
+    ParallelArtifactFlattener,
+    member_index_path,
+)
+from _therock_utils.artifact_delta import ChunkedZstdWriter, chunk_index_path
 import _therock_utils.artifact_builder as artifact_builder
 from _therock_utils.hash_util import calculate_hash, write_hash
 from _therock_utils.pattern_match import PatternMatcher
@@ -82,14 +89,22 @@ def do_artifact_archive(args):
     output_path: Path = args.o
     if output_path.exists():
         output_path.unlink()
+    index_path = member_index_path(output_path)
+    index_path.unlink(missing_ok=True)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    prefixes: list[str] = []
     with _open_archive(
-        output_path, args.compression_type, args.compression_level
+        output_path,
+        args.compression_type,
+        args.compression_level,
+        args.chunked,
+        seekable_frame_size=args.frame_size if args.seekable else None,
     ) as arc:
         for artifact_path in args.artifact:
             manifest_path: Path = artifact_path / "artifact_manifest.txt"
             relpaths = manifest_path.read_text().splitlines()
+            prefixes.extend(relpath for relpath in relpaths if relpath)
             # Important: The manifest must be stored first.
             arc.add(manifest_path, arcname=manifest_path.name, recursive=False)
             for relpath in relpaths:
@@ -104,6 +119,14 @@ def do_artifact_archive(args):
                     fullpath = f"{relpath}/{subpath}"
                     arc.add(dir_entry.path, arcname=fullpath, recursive=False)
 
+    if args.member_index:
+        ArchiveMemberIndex.from_tarinfos(
+            prefixes,
+            arc.members,
+            archive_size=output_path.stat().st_size,
+            frames=arc.frames,
+        ).save(index_path)
+
     if args.hash_file:
         digest = calculate_hash(output_path, args.hash_algorithm)
         write_hash(args.hash_file, digest)
@@ -122,7 +145,25 @@ def _get_pyzstd():
         )
 
 
-class _ZstdTarFile(tarfile.TarFile):
+class _IndexedTarFile(tarfile.TarFile):
+    """TarFile that records where each member's data starts when writing.
+
+    TarFile only sets TarInfo.offset_data when reading; the member index
+    needs it for archives being written.
+    """
+
+    # Frames of a multi-frame zstd archive, available after close().
+    frames: Sequence[ArchiveFrame] = ()
+
+    def addfile(self, tarinfo, fileobj=None, **kwargs) -> None:
+        super().addfile(tarinfo, fileobj, **kwargs)
+        padded_size = 0
+        if fileobj is not None:
+            padded_size = -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        self.members[-1].offset_data = self.offset - padded_size
+
+
+class _ZstdTarFile(_IndexedTarFile):
     """TarFile wrapper that writes to a zstd-compressed file."""
 
     def __init__(self, path: Path, compression_level: int) -> None:
@@ -137,22 +178,91 @@ class _ZstdTarFile(tarfile.TarFile):
         self._zstd_file.close()
 
 
+class _ChunkedZstdTarFile(_IndexedTarFile):
+    """TarFile wrapper that writes a multi-frame zstd file plus chunk index.
+
+    Frames end after members whose name hash selects a cut, so that unchanged
+    members produce identical frames across builds (see artifact_delta.py). For
+    that, member headers are normalized like a reproducible tar: timestamps and
+    ownership vary from build to build and are not carried over.
+    """
+
+    def __init__(self, path: Path, compression_level: int) -> None:
+        self._path = path
+        self._writer = ChunkedZstdWriter(path, compression_level)
+        super().__init__(fileobj=self._writer, mode="w")
+
+    def addfile(self, tarinfo, fileobj=None, **kwargs) -> None:
+        tarinfo.mtime = 0
+        tarinfo.uid = tarinfo.gid = 0
+        tarinfo.uname = tarinfo.gname = ""
+        self._writer.before_member(tarinfo.size)
+        super().addfile(tarinfo, fileobj, **kwargs)
+        self._writer.after_member(tarinfo.name)
+
+    def close(self) -> None:
+        super().close()
+        index = self._writer.close()
+        index.save(chunk_index_path(self._path))
+        self.frames = [
+            ArchiveFrame(chunk.offset, chunk.length, start)
+            for chunk, start in zip(index.chunks, self._writer.frame_starts)
+        ]
+
+
+class _SeekableZstdTarFile(_IndexedTarFile):
+    """TarFile wrapper that writes a seekable-format zstd file.
+
+    The tar stream is split into independent frames of at most `frame_size`
+    uncompressed bytes and a seek table is appended, so readers can decompress
+    any byte range (and thus any member) without reading the frames before it.
+    """
+
+    def __init__(self, path: Path, compression_level: int, frame_size: int) -> None:
+        pyzstd = _get_pyzstd()
+        self._zstd_file = pyzstd.SeekableZstdFile(
+            path,
+            mode="wb",
+            level_or_option=compression_level,
+            max_frame_content_size=frame_size,
+        )
+        super().__init__(fileobj=self._zstd_file, mode="w")
+
+    def close(self) -> None:
+        super().close()
+        self._zstd_file.close()
+
+
 def _open_archive(
-    p: Path, compression_type: str, compression_level: int | None
+    p: Path,
+    compression_type: str,
+    compression_level: int | None,
+    chunked: bool = False,
+    seekable_frame_size: int | None = None,
 ) -> tarfile.TarFile:
+    if chunked and compression_type != "zstd":
+        raise ValueError("Chunked archives require zstd compression")
+    if seekable_frame_size is not None and compression_type != "zstd":
+        raise ValueError("Seekable archives require zstd compression")
+    if chunked and seekable_frame_size is not None:
+        raise ValueError("Chunked and seekable archives are mutually exclusive")
     if compression_type == "zstd":
         level = compression_level if compression_level is not None else 3
+        if chunked:
+            return _ChunkedZstdTarFile(p, level)
+        if seekable_frame_size is not None:
+            return _SeekableZstdTarFile(p, level, seekable_frame_size)
         return _ZstdTarFile(p, level)
     elif compression_type == "xz":
         level = compression_level if compression_level is not None else 6
-        return tarfile.TarFile.open(p, mode="x:xz", preset=level)
+        return _IndexedTarFile.open(p, mode="x:xz", preset=level)
     else:
         raise ValueError(f"Unknown compression type: {compression_type}")
 
 
 def _do_artifact_flatten(args):
-    flattener = ArtifactPopulator(
-        output_path=args.o, verbose=args.verbose, flatten=True
+    flattener = ParallelArtifactFlattener(
+        output_path=args.o, verbose=args.verbose, max_workers=args.jobs
     )
     flattener(*args.artifact)
     relpaths = list(flattener.relpaths)
@@ -295,6 +405,34 @@ def main(cl_args: list[str]):
         default=None,
         help="Compression level (default: 3 for zstd, 6 for xz)",
     )
+    artifact_archive_p.add_argument(
+        "--chunked",
+        action="store_true",
+        help="Write independent zstd frames cut at member boundaries chosen by "
+        "a hash of the member name, plus a <archive>.chunks.json index, so "
+        "consecutive builds can be fetched as deltas (zstd only)",
+    )
+    artifact_archive_p.add_argument(
+        "--seekable",
+        action="store_true",
+        help="Write the seekable zstd format (independent frames plus a seek "
+        "table) so members can be read and extracted in parallel without "
+        "decompressing the whole archive (zstd only)",
+    )
+    artifact_archive_p.add_argument(
+        "--frame-size",
+        type=int,
+        default=4 << 20,
+        help="Maximum uncompressed bytes per frame of seekable archives "
+        "(default: 4 MiB)",
+    )
+    artifact_archive_p.add_argument(
+        "--member-index",
+        action="store_true",
+        help="Also write a <archive>.members.json index of member paths, sizes, "
+        "modes, link targets and data offsets, so archives can be listed (and "
+        "chunked archives read by member) without decompressing them",
+    )
     artifact_archive_p.add_argument(
         "--hash-file",
         type=Path,
@@ -319,6 +457,13 @@ def main(cl_args: list[str]):
     artifact_flatten_p.add_argument(
         "--verbose", action="store_true", help="Print verbose status"
     )
+    artifact_flatten_p.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of archives to flatten concurrently (default: auto). "
+        "Later artifacts still win for overlapping paths",
+    )
     artifact_flatten_p.set_defaults(func=_do_artifact_flatten)
 
     # 'artifact-flatten-split' command
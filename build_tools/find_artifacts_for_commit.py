@@ -26,9 +26,16 @@ For script-to-script composition:
 """
 
 import argparse
+import concurrent.futures
 from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
 import platform as platform_module
 import sys
+import tempfile
+import threading
+import time
 import urllib.request
 import urllib.error
 
@@ -97,7 +104,109 @@ class ArtifactRunInfo:
         print(f"  S3 Index:            {self.s3_index_url}")
 
 
-def check_if_artifacts_exist(info: ArtifactRunInfo) -> bool:
+class ArtifactProbeCache:
+    """On-disk cache of artifact index URL existence checks.
+
+    Positive results are kept for longer than negative ones: once a run's
+    index is uploaded it stays until retention expires, while a missing index
+    may appear any minute for an in-progress run.
+
+    Set THEROCK_ARTIFACT_PROBE_CACHE=0 to disable the default cache.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        positive_ttl_seconds: float = 6 * 60 * 60,
+        negative_ttl_seconds: float = 5 * 60,
+    ):
+        self.path = Path(path)
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, list] | None = None
+
+    def _load(self) -> dict[str, list]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, url: str) -> bool | None:
+        """Returns the cached result for url, or None if absent or expired."""
+        with self._lock:
+            entry = self._load().get(url)
+        if not entry:
+            return None
+        exists, checked_at = entry
+        ttl = self.positive_ttl_seconds if exists else self.negative_ttl_seconds
+        if time.time() - checked_at > ttl:
+            return None
+        return exists
+
+    def put(self, url: str, exists: bool):
+        with self._lock:
+            self._load()[url] = [exists, time.time()]
+
+    def save(self):
+        """Writes the cache, dropping expired entries."""
+        with self._lock:
+            if self._entries is None:
+                return
+            now = time.time()
+            max_ttl = max(self.positive_ttl_seconds, self.negative_ttl_seconds)
+            entries = {
+                url: entry
+                for url, entry in self._entries.items()
+                if now - entry[1] <= max_ttl
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+                )
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Failed to write {self.path}: {e}", file=sys.stderr)
+
+
+_default_probe_cache: ArtifactProbeCache | None = None
+_default_probe_cache_lock = threading.Lock()
+
+
+def get_default_probe_cache() -> ArtifactProbeCache | None:
+    """Returns the per-user probe cache, or None if disabled."""
+    global _default_probe_cache
+    if os.getenv("THEROCK_ARTIFACT_PROBE_CACHE", "1").lower() in ("0", "false", "off"):
+        return None
+    with _default_probe_cache_lock:
+        if _default_probe_cache is None:
+            cache_home = os.getenv("XDG_CACHE_HOME") or (Path.home() / ".cache")
+            _default_probe_cache = ArtifactProbeCache(
+                Path(cache_home) / "therock" / "artifact_probe_cache.json"
+            )
+        return _default_probe_cache
+
+
+def probe_url(url: str, timeout: float = 10) -> bool:
+    """Returns True if an HTTP HEAD request for url succeeds with 200."""
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status == 200
+    except urllib.error.HTTPError:
+        return False
+    except urllib.error.URLError:
+        return False
+
+
+def check_if_artifacts_exist(
+    info: ArtifactRunInfo, cache: ArtifactProbeCache | None = None
+) -> bool:
     """Checks if artifacts exist at the expected S3 location.
 
     Performs an HTTP HEAD request to the S3 index URL to verify artifacts
@@ -109,18 +218,31 @@ def check_if_artifacts_exist(info: ArtifactRunInfo) -> bool:
 
     Args:
         info: ArtifactRunInfo with the S3 location to check
+        cache: Probe cache to consult and update (default: per-user cache)
 
     Returns:
         True if artifacts are likely to exist, False otherwise
     """
-    try:
-        request = urllib.request.Request(info.s3_index_url, method="HEAD")
-        with urllib.request.urlopen(request, timeout=10) as response:
-            return response.status == 200
-    except urllib.error.HTTPError:
-        return False
-    except urllib.error.URLError:
-        return False
+    cache = cache or get_default_probe_cache()
+    url = info.s3_index_url
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            return cached
+    exists = probe_url(url)
+    if cache is not None:
+        cache.put(url, exists)
+    return exists
+
+
+def check_artifacts_exist_concurrently(
+    infos: list[ArtifactRunInfo], max_workers: int = 8
+) -> list[bool]:
+    """Runs check_if_artifacts_exist for several locations in parallel."""
+    if len(infos) <= 1:
+        return [check_if_artifacts_exist(info) for info in infos]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(check_if_artifacts_exist, infos))
 
 
 def find_artifacts_for_commit(
@@ -173,6 +295,7 @@ def find_artifacts_for_commit(
         )
         external_repo = output_root.external_repo
         bucket = output_root.bucket
+        candidates = []
         for group in artifact_groups:
             if group in found:
                 continue
@@ -189,8 +312,17 @@ def find_artifacts_for_commit(
                 artifact_group=group,
                 s3_bucket=bucket,
             )
-            if check_if_artifacts_exist(info):
-                found[group] = info
+            candidates.append(info)
+        # Probe all remaining groups for this run at once.
+        for info, exists in zip(
+            candidates, check_artifacts_exist_concurrently(candidates)
+        ):
+            if exists:
+                found[info.artifact_group] = info
+
+    cache = get_default_probe_cache()
+    if cache is not None:
+        cache.save()
 
     # Return in the same order as requested
     return [found[g] for g in artifact_groups if g in found]
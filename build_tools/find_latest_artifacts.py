@@ -28,6 +28,7 @@ For script-to-script composition:
 """
 
 import argparse
+import concurrent.futures
 import platform as platform_module
 import sys
 
@@ -49,6 +50,7 @@ def find_latest_artifacts(
     branch: str = "main",
     max_commits: int = 50,
     verbose: bool = False,
+    max_workers: int = 8,
 ) -> list[ArtifactRunInfo] | None:
     """Find the most recent commit on a branch with artifacts for all groups.
 
@@ -65,6 +67,9 @@ def find_latest_artifacts(
         platform: Target platform ("linux" or "windows"), or None for current
         max_commits: Maximum number of commits to search through
         verbose: If True, print progress information
+        max_workers: Number of commits to look up concurrently. Commits are
+            still evaluated newest first, and lookups for older commits are
+            cancelled once a match is found.
 
     Returns:
         List of ArtifactRunInfo (one per group) for the most recent commit
@@ -87,14 +92,8 @@ def find_latest_artifacts(
             file=sys.stderr,
         )
 
-    for i, commit in enumerate(commits):
-        if verbose:
-            print(
-                f"  [{i + 1}/{len(commits)}] Checking {commit[:8]}...",
-                file=sys.stderr,
-            )
-
-        results = find_artifacts_for_commit(
+    def lookup(commit: str) -> list[ArtifactRunInfo]:
+        return find_artifacts_for_commit(
             commit=commit,
             artifact_groups=artifact_groups,
             github_repository_name=github_repository_name,
@@ -102,30 +101,52 @@ def find_latest_artifacts(
             platform=platform,
         )
 
-        if not results:
-            if verbose:
-                print("    No artifacts found", file=sys.stderr)
-            continue
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        # Keep a window of lookups in flight ahead of the commit being
+        # evaluated, so the newest matching commit wins without waiting on
+        # every older one.
+        futures: list[concurrent.futures.Future] = []
+        next_to_submit = 0
+        for i, commit in enumerate(commits):
+            while next_to_submit < len(commits) and next_to_submit < i + max_workers:
+                futures.append(executor.submit(lookup, commits[next_to_submit]))
+                next_to_submit += 1
 
-        if len(results) < len(artifact_groups):
-            found_groups = [r.artifact_group for r in results]
             if verbose:
                 print(
-                    f"    Partial: found {', '.join(found_groups)} "
-                    f"(need all {len(artifact_groups)})",
+                    f"  [{i + 1}/{len(commits)}] Checking {commit[:8]}...",
                     file=sys.stderr,
                 )
-            continue
 
-        if verbose:
-            run_ids = sorted(set(r.workflow_run_id for r in results))
-            print(
-                f"    Found all {len(artifact_groups)} group(s): "
-                f"run(s) {', '.join(run_ids)}",
-                file=sys.stderr,
-            )
+            results = futures[i].result()
+
+            if not results:
+                if verbose:
+                    print("    No artifacts found", file=sys.stderr)
+                continue
 
-        return results
+            if len(results) < len(artifact_groups):
+                found_groups = [r.artifact_group for r in results]
+                if verbose:
+                    print(
+                        f"    Partial: found {', '.join(found_groups)} "
+                        f"(need all {len(artifact_groups)})",
+                        file=sys.stderr,
+                    )
+                continue
+
+            if verbose:
+                run_ids = sorted(set(r.workflow_run_id for r in results))
+                print(
+                    f"    Found all {len(artifact_groups)} group(s): "
+                    f"run(s) {', '.join(run_ids)}",
+                    file=sys.stderr,
+                )
+
+            return results
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
     return None
 
@@ -174,6 +195,12 @@ def main(argv: list[str] | None = None) -> int:
         default=50,
         help="Maximum commits to search (default: 50, max: 100)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Number of commits to look up concurrently (default: 8)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -192,6 +219,7 @@ def main(argv: list[str] | None = None) -> int:
             branch=args.branch,
             max_commits=args.max_commits,
             verbose=args.verbose,
+            max_workers=args.jobs,
         )
     except GitHubAPIError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -65,11 +65,25 @@ from configure_ci_path_filters import (
     get_git_submodule_paths,
     is_ci_run_required,
 )
+from configure_ci_test_impact import (
+    get_git_submodule_modified_paths,
+    get_git_submodule_names,
+    get_impacted_test_jobs,
+)
 from github_actions_utils import *
 
 THIS_SCRIPT_DIR = Path(__file__).resolve().parent
 THEROCK_DIR = THIS_SCRIPT_DIR.parent.parent
 
+# Add build_tools to path for _therock_utils imports.
+sys.path.insert(0, str(THEROCK_DIR / "build_tools"))
+from _therock_utils.build_topology import BuildTopology
+
+# Replaces punctuation with spaces when sanitizing comma/space separated inputs.
+_PUNCTUATION_TRANSLATOR = str.maketrans(
+    string.punctuation, " " * len(string.punctuation)
+)
+
 # --------------------------------------------------------------------------- #
 # Matrix creation logic based on PR, push, or workflow_dispatch
 # --------------------------------------------------------------------------- #
@@ -321,8 +335,9 @@ def matrix_generator(
         # Sanitizing the string to remove any punctuation from the input
         # After replacing punctuation with spaces, turning string input to an array
         # (ex: ",gfx94X ,|.gfx1201" -> "gfx94X   gfx1201" -> ["gfx94X", "gfx1201"])
-        translator = str.maketrans(string.punctuation, " " * len(string.punctuation))
-        requested_target_names = input_gpu_targets.translate(translator).split()
+        requested_target_names = input_gpu_targets.translate(
+            _PUNCTUATION_TRANSLATOR
+        ).split()
 
         selected_target_names.extend(
             filter_known_names(requested_target_names, "target", lookup_matrix)
@@ -560,6 +575,39 @@ def matrix_generator(
     return matrix_output, unique_test_names
 
 
+def select_impacted_tests(
+    base_ref: str, modified_paths: List[str], submodule_paths: List[str]
+) -> Optional[List[str]]:
+    """Selects test jobs impacted by the modified paths of a pull request.
+
+    Submodule pointer bumps are expanded to the files changed inside the
+    submodule when both commits are available locally, so that e.g. a
+    rocm-libraries bump touching only rocFFT selects only FFT tests.
+
+    Returns:
+        List of impacted test names, or None if all tests should run.
+    """
+    expanded_paths = []
+    for path in modified_paths:
+        inner_paths = None
+        if path in submodule_paths:
+            inner_paths = get_git_submodule_modified_paths(
+                base_ref, path, repo_root=THEROCK_DIR
+            )
+        expanded_paths.extend(inner_paths if inner_paths else [path])
+
+    topology = BuildTopology(THEROCK_DIR / "BUILD_TOPOLOGY.toml")
+    submodule_names = get_git_submodule_names(repo_root=THEROCK_DIR)
+    impacted_tests = get_impacted_test_jobs(
+        expanded_paths, test_matrix, topology, submodule_names
+    )
+    # An empty selection would be interpreted downstream as "no filtering",
+    # so only narrow the test list when at least one test is impacted.
+    if not impacted_tests or len(impacted_tests) == len(test_matrix):
+        return None
+    return impacted_tests
+
+
 # --------------------------------------------------------------------------- #
 # Core script logic
 # --------------------------------------------------------------------------- #
@@ -663,6 +711,17 @@ def main(base_args, linux_families, windows_families):
             combined_test_labels = list(set(linux_test_output + windows_test_output))
             test_type = "full"
             test_type_reason = f"test label(s) specified: {combined_test_labels}"
+        elif is_pull_request and modified_paths:
+            # Otherwise, only run the test jobs impacted by the modified paths
+            impacted_tests = select_impacted_tests(
+                base_ref, modified_paths, submodule_paths
+            )
+            if impacted_tests is not None:
+                print(
+                    f"Selecting test jobs impacted by modified paths: {impacted_tests}"
+                )
+                linux_test_output = impacted_tests
+                windows_test_output = impacted_tests
 
         for matrix_row in linux_variants_output + windows_variants_output:
             # If the "run-full-tests-only" flag is set for this family, we do not run tests if it is a smoke test type
@@ -0,0 +1,389 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""CI test-impact analysis for selecting test jobs based on modified files.
+
+This module provides utilities to:
+- Map modified paths (in-tree directories, submodules, monorepo projects) to
+  the artifacts they contribute to
+- Expand those artifacts through BUILD_TOPOLOGY.toml dependencies
+- Select the test jobs from `test_matrix` whose fetched artifacts are affected
+
+Every mapping is conservative: if any modified path cannot be attributed to a
+known set of artifacts, the analysis reports that all tests must run.
+
+Public API:
+    get_git_submodule_names() - Get a mapping of submodule path -> submodule name
+    get_git_submodule_modified_paths() - Get paths modified inside a bumped submodule
+    get_modified_artifacts() - Map modified paths to the artifacts they affect
+    get_impacted_test_jobs() - Select test jobs affected by modified paths
+"""
+
+import fnmatch
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from configure_ci_path_filters import _is_path_skippable
+
+THIS_SCRIPT_DIR = Path(__file__).resolve().parent
+THEROCK_DIR = THIS_SCRIPT_DIR.parent.parent
+
+sys.path.insert(0, str(THEROCK_DIR / "build_tools"))
+from _therock_utils.build_topology import BuildTopology
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+
+def get_git_submodule_names(repo_root: Optional[str] = None) -> Dict[str, str]:
+    """Returns a mapping of submodule path -> submodule name from .gitmodules.
+
+    Submodule names (not paths) are what BUILD_TOPOLOGY.toml source sets use.
+
+    Args:
+        repo_root: Path to the repository root directory. If None, uses current directory.
+
+    Returns:
+        Dict of relative submodule path to submodule name, or empty dict on failure
+    """
+    try:
+        response = subprocess.run(
+            ["git", "config", "-f", ".gitmodules", "--get-regexp", r"\.path$"],
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True,
+            timeout=60,
+            cwd=repo_root,
+        ).stdout.splitlines()
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        print("Reading .gitmodules failed.", file=sys.stderr)
+        return {}
+
+    submodule_names = {}
+    for line in response:
+        # The line will be "submodule.{name}.path {path}".
+        key, _, path = line.partition(" ")
+        name = key[len("submodule.") : -len(".path")]
+        submodule_names[path.strip()] = name
+    return submodule_names
+
+
+def get_git_submodule_modified_paths(
+    base_ref: str, submodule_path: str, repo_root: Optional[str] = None
+) -> Optional[List[str]]:
+    """Returns the paths modified inside a submodule whose pointer was bumped.
+
+    Resolves the old and new submodule commits from the superproject diff and
+    lists the files changed between them. This requires both commits to be
+    available in the local submodule checkout, which is often not the case on
+    shallow CI checkouts.
+
+    Args:
+        base_ref: Git reference of the superproject to compare against
+        submodule_path: Relative path of the submodule in the superproject
+        repo_root: Path to the repository root directory. If None, uses current directory.
+
+    Returns:
+        Modified paths prefixed with `submodule_path`, or None if unavailable
+    """
+    try:
+        diff = subprocess.run(
+            ["git", "diff", base_ref, "--", submodule_path],
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True,
+            timeout=60,
+            cwd=repo_root,
+        ).stdout
+        old_match = re.search(r"^-Subproject commit ([0-9a-f]+)", diff, re.MULTILINE)
+        new_match = re.search(r"^\+Subproject commit ([0-9a-f]+)", diff, re.MULTILINE)
+        if not old_match or not new_match:
+            return None
+        submodule_dir = Path(repo_root or ".") / submodule_path
+        changed = subprocess.run(
+            [
+                "git",
+                "diff",
+                "--name-only",
+                old_match.group(1),
+                new_match.group(1),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            text=True,
+            timeout=60,
+            cwd=submodule_dir,
+        ).stdout.splitlines()
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return None
+    return [f"{submodule_path}/{path}" for path in changed]
+
+
+def get_modified_artifacts(
+    paths: Iterable[str],
+    topology: BuildTopology,
+    submodule_names: Dict[str, str],
+) -> Optional[Set[str]]:
+    """Maps modified paths to the set of artifacts they (transitively) affect.
+
+    Args:
+        paths: Modified file paths relative to the repository root
+        topology: Parsed BUILD_TOPOLOGY.toml
+        submodule_names: Mapping of submodule path -> submodule name
+
+    Returns:
+        Set of affected artifact names (including reverse dependents), or None
+        if any path could not be attributed and everything should be tested
+    """
+    directly_modified: Set[str] = set()
+    for path in paths:
+        if _is_path_skippable(path) or _is_path_test_script(path):
+            continue
+        artifacts = _get_artifacts_for_path(path, topology, submodule_names)
+        if artifacts is None:
+            print(f"  test impact: '{path}' is not attributable, selecting all tests")
+            return None
+        directly_modified.update(artifacts)
+
+    return _expand_reverse_dependents(directly_modified, topology)
+
+
+def get_impacted_test_jobs(
+    paths: Optional[Iterable[str]],
+    test_matrix: dict,
+    topology: BuildTopology,
+    submodule_names: Dict[str, str],
+) -> Optional[List[str]]:
+    """Selects the test jobs affected by a set of modified paths.
+
+    A test job is affected if any artifact it fetches (per its
+    `fetch_artifact_args`) is modified or depends on a modified artifact, or
+    if its own test script was modified.
+
+    Args:
+        paths: Modified file paths relative to the repository root
+        test_matrix: Test matrix from fetch_test_configurations.py
+        topology: Parsed BUILD_TOPOLOGY.toml
+        submodule_names: Mapping of submodule path -> submodule name
+
+    Returns:
+        Sorted list of affected test job keys, or None if all tests should run
+    """
+    if paths is None:
+        return None
+    paths = list(paths)
+
+    modified_artifacts = get_modified_artifacts(paths, topology, submodule_names)
+    if modified_artifacts is None:
+        return None
+
+    modified_scripts = {Path(p).name for p in paths if _is_path_test_script(p)}
+
+    impacted = []
+    for key, job in test_matrix.items():
+        if any(script in job["test_script"] for script in modified_scripts):
+            impacted.append(key)
+            continue
+        tested_artifacts = _get_tested_artifacts(job)
+        if tested_artifacts is None or tested_artifacts & modified_artifacts:
+            impacted.append(key)
+    return sorted(impacted)
+
+
+# ============================================================================
+# Private Constants
+# ============================================================================
+
+# In-tree (non-submodule) path patterns and the artifacts they build.
+# Patterns are checked in order and the first match wins, so more specific
+# patterns must come first. Paths matching none of these (top-level CMake,
+# build_tools/, cmake/, workflows, ...) can affect any artifact.
+_IN_TREE_PATH_ARTIFACTS = [
+    ("math-libs/BLAS/*", ["blas"]),
+    ("math-libs/support/*", ["support"]),
+    ("math-libs/*rocPRIM*", ["prim"]),
+    ("math-libs/*rocRAND*", ["rand"]),
+    ("math-libs/artifact-fft.toml", ["fft"]),
+    ("math-libs/artifact-prim.toml", ["prim"]),
+    ("math-libs/artifact-rand.toml", ["rand"]),
+    ("math-libs/artifact-rocwmma.toml", ["rocwmma"]),
+    ("math-libs/artifact-libhipcxx.toml", ["libhipcxx"]),
+    ("math-libs/*", ["blas", "fft", "prim", "rand", "rocwmma", "libhipcxx"]),
+    ("ml-libs/artifact-composable-kernel.toml", ["composable-kernel"]),
+    ("ml-libs/artifact-miopen.toml", ["miopen"]),
+    ("ml-libs/artifact-hipdnn.toml", ["hipdnn"]),
+    ("ml-libs/artifact-miopenprovider.toml", ["miopenprovider"]),
+    ("ml-libs/artifact-hipblasltprovider.toml", ["hipblasltprovider"]),
+    ("ml-libs/artifact-hipdnn-samples.toml", ["hipdnn-samples"]),
+    (
+        "ml-libs/*",
+        [
+            "composable-kernel",
+            "miopen",
+            "hipdnn",
+            "miopenprovider",
+            "hipblasltprovider",
+            "hipdnn-samples",
+        ],
+    ),
+    ("comm-libs/artifact-rccl.toml", ["rccl"]),
+    ("comm-libs/*rccl*", ["rccl"]),
+    ("comm-libs/artifact-rocshmem.toml", ["rocshmem"]),
+    ("comm-libs/*", ["rccl", "rocshmem"]),
+    ("iree-libs/*", ["iree-compiler", "fusilliprovider"]),
+    ("media-libs/*", ["rocdecode", "rocjpeg"]),
+    ("dctools/*", ["rdc"]),
+    ("debug-tools/*", ["amd-dbgapi", "rocgdb", "rocr-debug-agent"]),
+    ("profiler/artifact-aqlprofile.toml", ["aqlprofile"]),
+    ("profiler/artifact-rocprofiler-sdk.toml", ["rocprofiler-sdk"]),
+    ("profiler/artifact-rocprofiler-compute.toml", ["rocprofiler-compute"]),
+    ("profiler/artifact-rocprofiler-systems.toml", ["rocprofiler-systems"]),
+    (
+        "profiler/*",
+        [
+            "aqlprofile",
+            "rocprofiler-sdk",
+            "rocprofiler-compute",
+            "rocprofiler-systems",
+        ],
+    ),
+]
+
+# Monorepo submodules with per-project subdirectories. Changes confined to a
+# known project only affect that project's artifacts instead of every artifact
+# built from the monorepo.
+_MONOREPO_PROJECT_ARTIFACTS = {
+    "rocm-libraries": {
+        "composablekernel": ["composable-kernel"],
+        "hipblas": ["blas"],
+        "hipblas-common": ["blas"],
+        "hipblaslt": ["blas"],
+        "hipcub": ["prim"],
+        "hipdnn": ["hipdnn"],
+        "hipfft": ["fft"],
+        "hiprand": ["rand"],
+        "hipsolver": ["blas"],
+        "hipsparse": ["blas"],
+        "hipsparselt": ["blas"],
+        "miopen": ["miopen"],
+        "rocblas": ["blas"],
+        "rocfft": ["fft"],
+        "rocprim": ["prim"],
+        "rocrand": ["rand"],
+        "rocsolver": ["blas"],
+        "rocsparse": ["blas"],
+        "rocthrust": ["prim"],
+        "rocwmma": ["rocwmma"],
+    },
+    "rocm-systems": {
+        "amdsmi": ["core-amdsmi"],
+        "aqlprofile": ["aqlprofile"],
+        "clr": ["core-hip", "core-ocl"],
+        "hip": ["core-hip"],
+        "hip-tests": ["core-hiptests"],
+        "rccl": ["rccl"],
+        "rocprofiler-compute": ["rocprofiler-compute"],
+        "rocprofiler-sdk": ["rocprofiler-sdk"],
+        "rocprofiler-systems": ["rocprofiler-systems"],
+        "rocr-runtime": ["core-runtime"],
+    },
+}
+
+# fetch_artifact_args flags that don't name a topology artifact directly.
+_FETCH_FLAG_ARTIFACTS = {
+    "debug-tools": ["amd-dbgapi", "rocgdb", "rocr-debug-agent"],
+    "tests": [],
+}
+
+# Artifacts that install_rocm_from_artifacts.py always fetches alongside any
+# selected artifact flags (see `base_artifact_patterns` there).
+_BASE_FETCHED_ARTIFACTS = [
+    "amd-llvm",
+    "base",
+    "core-amdsmi",
+    "core-hip",
+    "core-hipinfo",
+    "core-ocl",
+    "core-runtime",
+    "host-suite-sparse",
+    "rocprofiler-sdk",
+    "sysdeps",
+]
+
+_TEST_SCRIPTS_DIR = "build_tools/github_actions/test_executable_scripts/"
+
+
+# ============================================================================
+# Private Helper Functions
+# ============================================================================
+
+
+def _is_path_test_script(path: str) -> bool:
+    """Checks if a path is one of the per-job test executable scripts."""
+    return path.startswith(_TEST_SCRIPTS_DIR) and path.endswith(".py")
+
+
+def _get_artifacts_for_path(
+    path: str, topology: BuildTopology, submodule_names: Dict[str, str]
+) -> Optional[Set[str]]:
+    """Maps a single path to the artifacts built from it, or None if unknown."""
+    # Submodules: either the submodule pointer itself or a path inside it.
+    for submodule_path, submodule_name in submodule_names.items():
+        if path == submodule_path:
+            return topology.get_artifacts_for_submodule(submodule_name) or None
+        if path.startswith(submodule_path + "/"):
+            project_artifacts = _get_monorepo_project_artifacts(
+                submodule_name, path[len(submodule_path) + 1 :]
+            )
+            if project_artifacts is not None:
+                return project_artifacts
+            return topology.get_artifacts_for_submodule(submodule_name) or None
+
+    for pattern, artifacts in _IN_TREE_PATH_ARTIFACTS:
+        if fnmatch.fnmatch(path, pattern):
+            return set(artifacts)
+    return None
+
+
+def _get_monorepo_project_artifacts(
+    submodule_name: str, relpath: str
+) -> Optional[Set[str]]:
+    """Maps a path inside a monorepo submodule to its project's artifacts."""
+    projects = _MONOREPO_PROJECT_ARTIFACTS.get(submodule_name)
+    parts = relpath.split("/")
+    if not projects or len(parts) < 3 or parts[0] != "projects":
+        return None
+    artifacts = projects.get(parts[1].lower())
+    return set(artifacts) if artifacts is not None else None
+
+
+def _expand_reverse_dependents(
+    artifacts: Set[str], topology: BuildTopology
+) -> Set[str]:
+    """Adds every artifact that transitively depends on one of `artifacts`."""
+    expanded = set(artifacts)
+    for artifact in topology.get_artifacts():
+        if topology.get_transitive_artifact_deps(artifact.name) & artifacts:
+            expanded.add(artifact.name)
+    return expanded
+
+
+def _get_tested_artifacts(job: dict) -> Optional[Set[str]]:
+    """Returns the artifacts a test job fetches, or None if it fetches everything."""
+    fetch_args = job.get("fetch_artifact_args")
+    if not fetch_args:
+        return None
+    artifacts = set()
+    for arg in fetch_args.split():
+        flag = arg.removeprefix("--")
+        artifacts.update(_FETCH_FLAG_ARTIFACTS.get(flag, [flag]))
+    if not artifacts:
+        # Without any artifact flags, all artifacts are fetched.
+        return None
+    return artifacts | set(_BASE_FETCHED_ARTIFACTS)
@@ -6,7 +6,9 @@
 See also https://pypi.org/project/github-action-utils/.
 """
 
+import concurrent.futures
 from enum import Enum, auto
+import hashlib
 import json
 import logging
 import os
@@ -15,8 +17,11 @@ import re
 import shutil
 import subprocess
 import sys
-from typing import Mapping
+import tempfile
+import threading
+from typing import Callable, Iterable, Iterator, Mapping
 from urllib.error import HTTPError, URLError
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from urllib.request import urlopen, Request
 
 
@@ -34,6 +39,56 @@ class GitHubAPIError(Exception):
     pass
 
 
+class GitHubResponseCache:
+    """On-disk cache of GitHub REST API responses, validated with ETags.
+
+    Each entry stores the ETag and parsed body of a response. Cached entries
+    are sent back to GitHub as `If-None-Match` conditional requests, and a
+    `304 Not Modified` reply (which does not count against the primary rate
+    limit) is answered from the cache.
+
+    Entries are never evicted, so the default cache is opt-in: set
+    THEROCK_GITHUB_API_CACHE=1 to enable it for long-lived developer machines.
+
+    See https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#use-conditional-requests-if-appropriate
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> tuple[str, object] | None:
+        """Returns the cached (etag, body) for key, or None if absent."""
+        try:
+            entry = json.loads(self._entry_path(key).read_text())
+            return entry["etag"], entry["body"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, etag: str, body: object):
+        path = self._entry_path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=path.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump({"etag": etag, "body": body}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _log(f"Warning: failed to write GitHub API cache entry {path}: {e}")
+
+
+def get_default_response_cache() -> GitHubResponseCache | None:
+    """Returns the per-user GitHub API response cache, or None if not enabled."""
+    if os.getenv("THEROCK_GITHUB_API_CACHE", "").lower() not in ("1", "true", "on"):
+        return None
+    cache_home = os.getenv("XDG_CACHE_HOME") or (Path.home() / ".cache")
+    return GitHubResponseCache(Path(cache_home) / "therock" / "github_api")
+
+
 class GitHubAPI:
     """Client for making GitHub API requests.
 
@@ -65,6 +120,12 @@ class GitHubAPI:
     For most use cases, use the module-level functions which use a shared
     singleton instance:
         response = gha_send_request("https://api.github.com/repos/owner/repo")
+
+    Requests made with the REST API (GITHUB_TOKEN or unauthenticated) are
+    revalidated against `response_cache` when one is given. Requests made via
+    the gh CLI are not cached. At most `max_concurrent_requests` requests are
+    in flight at once across all threads using the instance, to stay clear of
+    GitHub's secondary rate limits.
     """
 
     class AuthMethod(Enum):
@@ -79,10 +140,16 @@ class GitHubAPI:
         # Use the GitHub REST API without authenticating, subject to rate limits.
         UNAUTHENTICATED = auto()
 
-    def __init__(self):
+    def __init__(
+        self,
+        response_cache: GitHubResponseCache | None = None,
+        max_concurrent_requests: int = 8,
+    ):
         self._auth_method: GitHubAPI.AuthMethod | None = None
         self._github_token: str | None = None
         self._gh_cli_path: str | None = None
+        self._response_cache = response_cache
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
 
     def _detect_auth_method(self) -> AuthMethod:
         """Detects the best available GitHub API authentication method.
@@ -147,6 +214,17 @@ class GitHubAPI:
 
         return headers
 
+    def _get_cache_key(self, url: str) -> str:
+        """Gets the response cache key for url under the current credentials.
+
+        Responses may differ by credentials (e.g. private repositories), so
+        the key includes a digest of the token rather than the token itself.
+        """
+        identity = "anonymous"
+        if self.get_auth_method() == GitHubAPI.AuthMethod.GITHUB_TOKEN:
+            identity = hashlib.sha256(self._github_token.encode()).hexdigest()
+        return hashlib.sha256(f"{identity}\n{url}".encode()).hexdigest()
+
     def _send_request_via_gh_cli(self, url: str, timeout_seconds: int) -> object:
         """Sends a GitHub API request using the gh CLI.
 
@@ -199,12 +277,23 @@ class GitHubAPI:
             GitHubAPIError: If the request fails for any reason.
         """
         headers = self._get_request_headers()
+        cache_key = None
+        cached = None
+        if self._response_cache is not None:
+            cache_key = self._get_cache_key(url)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
         request = Request(url, headers=headers)
 
         try:
             with urlopen(request, timeout=timeout_seconds) as response:
                 body = response.read().decode("utf-8")
+                etag = response.headers.get("ETag")
         except HTTPError as e:
+            if e.code == 304 and cached is not None:
+                return cached[1]
+
             # Try to read the error response body for more context
             error_body = ""
             try:
@@ -241,12 +330,16 @@ class GitHubAPI:
             ) from e
 
         try:
-            return json.loads(body)
+            result = json.loads(body)
         except json.JSONDecodeError as e:
             raise GitHubAPIError(
                 f"Invalid JSON response from {url}: {e.msg} at position {e.pos}"
             ) from e
 
+        if cache_key is not None and isinstance(etag, str):
+            self._response_cache.put(cache_key, etag, result)
+        return result
+
     def send_request(self, url: str, timeout_seconds: int = 300) -> object:
         """Sends a request to the given GitHub REST API URL.
 
@@ -264,18 +357,76 @@ class GitHubAPI:
         """
         auth_method = self.get_auth_method()
 
-        if auth_method == GitHubAPI.AuthMethod.GH_CLI:
-            return self._send_request_via_gh_cli(url, timeout_seconds)
+        with self._request_slots:
+            if auth_method == GitHubAPI.AuthMethod.GH_CLI:
+                return self._send_request_via_gh_cli(url, timeout_seconds)
+
+            if auth_method == GitHubAPI.AuthMethod.UNAUTHENTICATED:
+                _log("Warning: No GitHub auth available, requests may be rate limited")
 
-        if auth_method == GitHubAPI.AuthMethod.UNAUTHENTICATED:
-            _log("Warning: No GitHub auth available, requests may be rate limited")
+            return self._send_request_via_rest_api(url, timeout_seconds)
 
-        return self._send_request_via_rest_api(url, timeout_seconds)
+    def paginate(
+        self,
+        url: str,
+        items_key: str | None = None,
+        per_page: int = 100,
+        max_items: int | None = None,
+        timeout_seconds: int = 300,
+    ) -> Iterator:
+        """Iterates over the items of a paginated GitHub REST API endpoint.
+
+        See `gha_paginate` for the meaning of the arguments.
+        """
+        return _paginate(
+            lambda page_url: self.send_request(page_url, timeout_seconds),
+            url,
+            items_key=items_key,
+            per_page=per_page,
+            max_items=max_items,
+        )
+
+
+def _set_query_params(url: str, **params) -> str:
+    """Returns url with the given query parameters added or replaced."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update({k: str(v) for k, v in params.items()})
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _paginate(
+    send_request: Callable[[str], object],
+    url: str,
+    items_key: str | None,
+    per_page: int,
+    max_items: int | None,
+) -> Iterator:
+    if max_items is not None:
+        per_page = max(1, min(per_page, max_items))
+    per_page = min(per_page, 100)  # Maximum allowed by the API.
+
+    count = 0
+    page = 1
+    while True:
+        response = send_request(_set_query_params(url, per_page=per_page, page=page))
+        items = response.get(items_key, []) if items_key else response
+        for item in items:
+            yield item
+            count += 1
+            if max_items is not None and count >= max_items:
+                return
+        # A short page is the last one, which saves requesting an empty page.
+        if len(items) < per_page:
+            return
+        if items_key and count >= response.get("total_count", float("inf")):
+            return
+        page += 1
 
 
 # Module-level singleton with cached state.
 # Tests may opt to use separate instances to exercise the state more precisely.
-_default_github_api = GitHubAPI()
+_default_github_api = GitHubAPI(response_cache=get_default_response_cache())
 
 
 def is_authenticated_github_api_available() -> bool:
@@ -397,6 +548,62 @@ def gha_send_request(url: str, timeout_seconds: int = 300) -> object:
     return _default_github_api.send_request(url, timeout_seconds=timeout_seconds)
 
 
+def gha_paginate(
+    url: str,
+    items_key: str | None = None,
+    per_page: int = 100,
+    max_items: int | None = None,
+) -> Iterator:
+    """Iterates over the items of a paginated GitHub REST API endpoint.
+
+    Pages are requested lazily with the `page` and `per_page` query
+    parameters, so stopping iteration early avoids fetching later pages.
+
+    Args:
+        url: Full GitHub API URL, which may include other query parameters
+        items_key: Key of the item list for endpoints that wrap it in an
+            object (e.g. "workflow_runs"), or None for endpoints returning
+            a list
+        per_page: Items to request per page (at most 100)
+        max_items: Maximum number of items to yield, or None for all
+
+    Raises:
+        GitHubAPIError: If any page request fails.
+
+    See: https://docs.github.com/en/rest/using-the-rest-api/using-pagination-in-the-rest-api
+    """
+    return _paginate(
+        gha_send_request,
+        url,
+        items_key=items_key,
+        per_page=per_page,
+        max_items=max_items,
+    )
+
+
+def gha_send_requests(
+    urls: Iterable[str], timeout_seconds: int = 300, max_workers: int = 8
+) -> list[object]:
+    """Sends requests to several GitHub REST API URLs concurrently.
+
+    Requests still share the concurrency limit of the default GitHubAPI
+    instance with any other threads issuing requests.
+
+    Returns:
+        Parsed JSON responses, in the same order as urls.
+
+    Raises:
+        GitHubAPIError: If any request fails.
+    """
+    urls = list(urls)
+    if len(urls) <= 1 or max_workers <= 1:
+        return [gha_send_request(url, timeout_seconds) for url in urls]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda url: gha_send_request(url, timeout_seconds), urls)
+        )
+
+
 def gha_query_workflow_run_by_id(github_repository: str, workflow_run_id: str) -> dict:
     """Gets metadata for a workflow run by its run ID.
 
@@ -425,10 +632,7 @@ def gha_query_workflow_runs_for_commit(
     Uses the GitHub REST API endpoint: /actions/workflows/{workflow}/runs?head_sha={sha}
 
     A commit may have multiple workflow runs if the workflow was retriggered.
-    The list is ordered by most recent first.
-
-    Note: The API returns up to 30 results by default (first page only).
-    For a single commit this is typically sufficient.
+    The list is ordered by most recent first. All pages of results are read.
 
     Args:
         github_repository: Repository in "owner/repo" format (e.g., "ROCm/TheRock")
@@ -446,8 +650,7 @@ def gha_query_workflow_runs_for_commit(
         f"/actions/workflows/{workflow_file_name}/runs"
         f"?head_sha={git_commit_sha}&sort=created&direction=desc"
     )
-    response = gha_send_request(url)
-    runs = response.get("workflow_runs", [])
+    runs = list(gha_paginate(url, items_key="workflow_runs"))
     # Sort client-side as defense in depth — the API default order is not
     # documented and community reports suggest it may not be chronological.
     runs.sort(key=lambda r: r["created_at"], reverse=True)
@@ -494,21 +697,14 @@ def gha_query_recent_branch_commits(
     Args:
         github_repository_name: Repository in "owner/repo" format
         branch: Branch name (default: "main")
-        max_count: Maximum number of commits to retrieve
-                   (max 100 per API, without pagination)
+        max_count: Maximum number of commits to retrieve. Counts above the
+                   API per_page limit of 100 are read over several pages.
 
     Returns:
         List of commit SHAs, most recent first.
     """
-    if max_count > 100:
-        _log(
-            f"Warning: max_count of {max_count} commits to query exceeds API per_page limit of 100"
-        )
-
-    url = f"https://api.github.com/repos/{github_repository_name}/commits?sha={branch}&per_page={max_count}"
-    response = gha_send_request(url)
-
-    return [commit["sha"] for commit in response]
+    url = f"https://api.github.com/repos/{github_repository_name}/commits?sha={branch}"
+    return [commit["sha"] for commit in gha_paginate(url, max_items=max_count)]
 
 
 def str2bool(value: str | None) -> bool:
@@ -11,6 +11,7 @@ post_build_upload.py [-h]
   [--upload | --no-upload] (default enabled if the `CI` env var is set)
   [--run-id RUN_ID]
   [--output-dir OUTPUT_DIR]
+  [--log-compression {gz,zst}]
   [--dry-run]
 
 This script runs after building TheRock, where this script does:
@@ -22,16 +23,18 @@ This script runs after building TheRock, where this script does:
 
 In the case that a CI build fails, this step will always upload available logs and artifacts.
 
+Artifact uploads (the bulk of the transfer) start as soon as the artifact index
+is written and run in the background while logs are archived and indexed.
+
 For AWS credentials to upload, reach out to the #rocm-ci channel in the AMD Developer Community Discord
 """
 
 import argparse
+import concurrent.futures
 from datetime import datetime
 import os
 from pathlib import Path
 import platform
-import shlex
-import subprocess
 import sys
 import tarfile
 
@@ -43,7 +46,11 @@ PLATFORM = platform.system().lower()
 # Add build_tools to path for _therock_utils imports.
 sys.path.insert(0, str(THEROCK_DIR / "build_tools"))
 from _therock_utils.workflow_outputs import WorkflowOutputRoot
-from _therock_utils.storage_backend import StorageBackend, create_storage_backend
+from _therock_utils.storage_backend import (
+    StorageBackend,
+    create_storage_backend,
+    list_directory_uploads,
+)
 
 # Importing indexer.py
 sys.path.append(str(THEROCK_DIR / "third-party" / "indexer"))
@@ -55,11 +62,6 @@ def log(*args):
     sys.stdout.flush()
 
 
-def run_command(cmd: list[str], cwd: Path):
-    log(f"++ Exec [{cwd}]$ {shlex.join(cmd)}")
-    subprocess.run(cmd, check=True)
-
-
 # This method will output logs of the Windows Time Service and is meant
 # to help debug spurious AWS auth issues caused by time differences when
 # uploading with the AWS CLI tool. For context, see this issue and PR:
@@ -91,27 +93,83 @@ def write_time_sync_log():
         log("[*] time.log and/or start.log not present in H:")
 
 
-def create_ninja_log_archive(build_dir: Path):
-    log_dir = build_dir / "logs"
+# Directories under the build dir that never contain .ninja_log files but may
+# be very large (staged install trees, packaged artifacts, ...).
+_NINJA_LOG_PRUNE_DIRS = {"artifacts", "dist", "stage", "logs", "CMakeFiles"}
+_NINJA_LOG_MAX_DEPTH = 8
 
-    # Python equivalent of `find  ~/TheRock/build -iname .ninja_log``
+
+def find_ninja_logs(build_dir: Path, max_depth: int = _NINJA_LOG_MAX_DEPTH):
+    """Finds .ninja_log files under build_dir.
+
+    Equivalent to `find build -name .ninja_log`, but walks with scandir, does
+    not follow directory symlinks, skips `_NINJA_LOG_PRUNE_DIRS` and stops
+    descending after `max_depth` levels.
+    """
     found_files = []
-    log(f"[*] Create ninja log archive from: {build_dir}")
+    pending = [(build_dir, 0)]
+    while pending:
+        dir_path, depth = pending.pop()
+        try:
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name == ".ninja_log" and entry.is_file(follow_symlinks=False):
+                found_files.append(Path(entry.path))
+            elif (
+                depth < max_depth
+                and entry.name not in _NINJA_LOG_PRUNE_DIRS
+                and entry.is_dir(follow_symlinks=False)
+            ):
+                pending.append((Path(entry.path), depth + 1))
+    return sorted(found_files)
+
+
+class _ZstdTarFile(tarfile.TarFile):
+    """TarFile wrapper that writes to a multi-threaded zstd-compressed file."""
+
+    def __init__(self, path: Path):
+        import pyzstd
+
+        self._zstd_file = pyzstd.ZstdFile(
+            path,
+            mode="wb",
+            level_or_option={
+                pyzstd.CParameter.compressionLevel: 3,
+                pyzstd.CParameter.nbWorkers: os.cpu_count() or 1,
+            },
+        )
+        super().__init__(fileobj=self._zstd_file, mode="w")
 
-    glob_pattern_ninja = f"**/.ninja_log"
-    log(f"[*] Path glob: {glob_pattern_ninja}")
-    found_files = list(build_dir.glob(glob_pattern_ninja))
+    def close(self):
+        super().close()
+        self._zstd_file.close()
+
+
+def _open_log_archive(archive_name: Path, compression: str) -> tarfile.TarFile:
+    if compression == "zst":
+        return _ZstdTarFile(archive_name)
+    return tarfile.open(archive_name, "w:gz")
+
+
+def create_ninja_log_archive(build_dir: Path, compression: str = "gz"):
+    log_dir = build_dir / "logs"
+
+    log(f"[*] Create ninja log archive from: {build_dir}")
+    found_files = find_ninja_logs(build_dir)
 
     if len(found_files) == 0:
         print("No ninja log files found to archive... Skipping", file=sys.stderr)
         return
 
     files_to_archive = found_files
-    archive_name = log_dir / "ninja_logs.tar.gz"
+    archive_name = log_dir / f"ninja_logs.tar.{compression}"
     if archive_name.exists():
         print(f"NOTE: Archive exists: {archive_name}", file=sys.stderr)
+    log_dir.mkdir(parents=True, exist_ok=True)
     added_count = 0
-    with tarfile.open(archive_name, "w:gz") as tar:
+    with _open_log_archive(archive_name, compression) as tar:
         log(f"[+] Create archive: {archive_name}")
         for file_path in files_to_archive:
             tar.add(file_path)
@@ -124,23 +182,16 @@ def index_log_files(build_dir: Path, artifact_group: str):
     log_dir = build_dir / "logs"
     index_file = log_dir / "index.html"
 
-    indexer_path = THEROCK_DIR / "third-party" / "indexer" / "indexer.py"
-
     if log_dir.is_dir():
         log(
-            f"[INFO] Found '{log_dir}' directory. Indexing '*.log' and '*.tar.gz' files..."
-        )
-        run_command(
-            [
-                sys.executable,
-                str(indexer_path),
-                log_dir.as_posix(),  # unnamed path arg in front of -f
-                "-f",
-                "*.log",
-                "*.tar.gz",  # accepts nargs! Take care not to consume path
-            ],
-            cwd=Path.cwd(),
+            f"[INFO] Found '{log_dir}' directory. Indexing '*.log' and log archive files..."
         )
+        indexer_args = argparse.Namespace()
+        indexer_args.filter = ["*.log", "*.tar.gz", "*.tar.zst"]
+        indexer_args.output_file = "index.html"
+        indexer_args.verbose = False
+        indexer_args.recursive = False
+        indexer.process_dir(log_dir, indexer_args)
     else:
         log(f"[WARN] Log directory '{log_dir}' not found. Skipping indexing.")
         return
@@ -215,7 +266,7 @@ def upload_logs(
     #   - therock-build-prof/ subdirectory (resource profiling)
     # Content-type is inferred per file by the backend.
     log("Uploading logs")
-    backend.upload_directory(log_dir, output_root.log_dir(artifact_group))
+    files = list_directory_uploads(log_dir, output_root.log_dir(artifact_group))
 
     # Resource profiling summaries (generated by resource_info.py --finalize)
     # live in a subdirectory but are also expected at the log root for direct
@@ -225,10 +276,14 @@ def upload_logs(
         for filename in ["comp-summary.html", "comp-summary.md"]:
             file_path = resource_prof_dir / filename
             if file_path.is_file():
-                backend.upload_file(
-                    file_path, output_root.log_file(artifact_group, filename)
+                files.append(
+                    (file_path, output_root.log_file(artifact_group, filename))
                 )
-                log(f"[INFO] Uploaded {file_path} (flattened)")
+                log(f"[INFO] Uploading {file_path} (flattened)")
+
+    # A single batch lets the backend upload all files concurrently.
+    count = backend.upload_files(files)
+    log(f"[INFO] Uploaded {count} log files")
 
 
 def upload_manifest(
@@ -276,43 +331,65 @@ def write_gha_build_summary(
 
 
 def run(args):
-    log("Creating Ninja log archive")
-    log("--------------------------")
-    create_ninja_log_archive(args.build_dir)
-
-    log(f"Indexing log files in {str(args.build_dir)}")
-    log("------------------")
-    index_log_files(args.build_dir, args.artifact_group)
-
     log(f"Indexing artifact files in {str(args.build_dir)}")
     log("------------------")
     index_artifact_files(args.build_dir)
 
-    if not args.upload:
-        return
-
-    output_root = WorkflowOutputRoot.from_workflow_run(
-        run_id=args.run_id, platform=PLATFORM
-    )
-    backend = create_storage_backend(staging_dir=args.output_dir, dry_run=args.dry_run)
-
-    log("Write Windows time sync log")
-    log("----------------------")
-    write_time_sync_log()
+    # Upload artifacts only if the job not failed. They do not depend on the
+    # log archive or index, so upload them while those are being created.
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    artifacts_future = None
+    if args.upload:
+        output_root = WorkflowOutputRoot.from_workflow_run(
+            run_id=args.run_id, platform=PLATFORM
+        )
+        backend = create_storage_backend(
+            staging_dir=args.output_dir, dry_run=args.dry_run
+        )
 
-    # Upload artifacts only if the job not failed
-    if not args.job_status or args.job_status == "success":
-        log("Upload build artifacts")
+        log("Write Windows time sync log")
         log("----------------------")
-        upload_artifacts(args.artifact_group, args.build_dir, output_root, backend)
-
-    log("Upload log")
-    log("----------")
-    upload_logs(args.artifact_group, args.build_dir, output_root, backend)
-
-    log("Upload manifest")
-    log("----------------")
-    upload_manifest(args.artifact_group, args.build_dir, output_root, backend)
+        write_time_sync_log()
+
+        if not args.job_status or args.job_status == "success":
+            log("Upload build artifacts (in background)")
+            log("----------------------")
+            artifacts_future = executor.submit(
+                upload_artifacts,
+                args.artifact_group,
+                args.build_dir,
+                output_root,
+                backend,
+            )
+
+    try:
+        log("Creating Ninja log archive")
+        log("--------------------------")
+        create_ninja_log_archive(args.build_dir, args.log_compression)
+
+        log(f"Indexing log files in {str(args.build_dir)}")
+        log("------------------")
+        index_log_files(args.build_dir, args.artifact_group)
+
+        if not args.upload:
+            return
+
+        log("Upload log")
+        log("----------")
+        upload_logs(args.artifact_group, args.build_dir, output_root, backend)
+
+        log("Upload manifest")
+        log("----------------")
+        upload_manifest(args.artifact_group, args.build_dir, output_root, backend)
+
+        if artifacts_future is not None:
+            log("Wait for build artifact upload")
+            log("----------------------")
+            artifacts_future.result()
+    finally:
+        executor.shutdown(wait=True)
+
+    log(f"[INFO] Transfers: {backend.metrics.summary()}")
 
     log("Write github actions build summary")
     log("--------------------")
@@ -353,6 +430,13 @@ if __name__ == "__main__":
         default=None,
         help="Output to local directory instead of S3 (for testing)",
     )
+    parser.add_argument(
+        "--log-compression",
+        choices=["gz", "zst"],
+        default="gz",
+        help="Compression of the ninja log archive. 'zst' uses multi-threaded "
+        "zstd and is named ninja_logs.tar.zst (default: gz)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -286,6 +286,57 @@ class ConfigureCITest(unittest.TestCase):
         )
         self.assertEqual(linux_test_labels, [])
 
+    def test_select_impacted_tests_narrows_selection(self):
+        # Changing one test script only impacts its own test job, plus the jobs
+        # that do not declare the artifacts they fetch (always impacted).
+        impacted = configure_ci.select_impacted_tests(
+            "HEAD",
+            ["build_tools/github_actions/test_executable_scripts/test_rocfft.py"],
+            [],
+        )
+        self.assertIn("rocfft", impacted)
+        self.assertNotIn("rocblas", impacted)
+        self.assertLess(len(impacted), len(configure_ci.test_matrix))
+
+    def test_select_impacted_tests_unattributable_path_runs_all(self):
+        self.assertIsNone(
+            configure_ci.select_impacted_tests("HEAD", ["CMakeLists.txt"], [])
+        )
+
+    @patch("configure_ci.gha_append_step_summary")
+    @patch("configure_ci.gha_set_output")
+    @patch("configure_ci.get_git_submodule_paths", return_value=[])
+    @patch(
+        "configure_ci.get_git_modified_paths",
+        return_value=[
+            "build_tools/github_actions/test_executable_scripts/test_rocfft.py"
+        ],
+    )
+    def test_main_pull_request_without_labels_selects_impacted_tests(
+        self, mock_modified_paths, mock_submodule_paths, mock_set_output, mock_summary
+    ):
+        base_args = {
+            "github_event_name": "pull_request",
+            "base_ref": "HEAD^",
+            "build_variant": "release",
+            "pr_labels": "{}",
+        }
+        configure_ci.main(base_args, linux_families={}, windows_families={})
+
+        output = mock_set_output.call_args.args[0]
+        linux_test_labels = json.loads(output["linux_test_labels"])
+        self.assertEqual(
+            linux_test_labels,
+            configure_ci.select_impacted_tests(
+                "HEAD^",
+                ["build_tools/github_actions/test_executable_scripts/test_rocfft.py"],
+                [],
+            ),
+        )
+        self.assertIn("rocfft", linux_test_labels)
+        self.assertNotIn("rocblas", linux_test_labels)
+        self.assertEqual(json.loads(output["windows_test_labels"]), linux_test_labels)
+
     def test_main_linux_branch_push_matrix_generator(self):
         base_args = {"branch_name": "main", "build_variant": "release"}
         linux_target_output, linux_test_labels = configure_ci.matrix_generator(
@@ -0,0 +1,154 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+from pathlib import Path
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+
+from configure_ci_test_impact import (
+    BuildTopology,
+    get_impacted_test_jobs,
+    get_modified_artifacts,
+)
+
+TOPOLOGY = """
+[source_sets.rocm-libraries]
+submodules = ["rocm-libraries"]
+
+[source_sets.rocm-systems]
+submodules = ["rocm-systems"]
+
+[artifact_groups.core-runtime]
+type = "generic"
+source_sets = ["rocm-systems"]
+
+[artifact_groups.math-libs]
+type = "per-arch"
+source_sets = ["rocm-libraries"]
+
+[artifacts.core-runtime]
+artifact_group = "core-runtime"
+type = "target-neutral"
+
+[artifacts.blas]
+artifact_group = "math-libs"
+type = "target-specific"
+artifact_deps = ["core-runtime"]
+
+[artifacts.fft]
+artifact_group = "math-libs"
+type = "target-specific"
+artifact_deps = ["core-runtime"]
+
+[artifacts.rand]
+artifact_group = "math-libs"
+type = "target-specific"
+artifact_deps = ["core-runtime"]
+
+[artifacts.miopen]
+artifact_group = "math-libs"
+type = "target-specific"
+artifact_deps = ["blas", "rand"]
+"""
+
+SUBMODULE_NAMES = {
+    "rocm-libraries": "rocm-libraries",
+    "rocm-systems": "rocm-systems",
+}
+
+TEST_MATRIX = {
+    "hipblaslt": {
+        "fetch_artifact_args": "--blas --tests",
+        "test_script": "python test_hipblaslt.py",
+    },
+    "rocfft": {
+        "fetch_artifact_args": "--fft --rand --tests",
+        "test_script": "python test_rocfft.py",
+    },
+    "miopen": {
+        "fetch_artifact_args": "--blas --miopen --rand --tests",
+        "test_script": "python test_miopen.py",
+    },
+}
+
+
+class ConfigureCITestImpactTest(unittest.TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".toml", delete=False
+        ) as temp_file:
+            temp_file.write(textwrap.dedent(TOPOLOGY))
+            self.topology_path = temp_file.name
+        self.topology = BuildTopology(self.topology_path)
+
+    def tearDown(self):
+        os.unlink(self.topology_path)
+
+    def impacted(self, paths):
+        return get_impacted_test_jobs(
+            paths, TEST_MATRIX, self.topology, SUBMODULE_NAMES
+        )
+
+    def test_monorepo_project_selects_only_its_tests(self):
+        paths = ["rocm-libraries/projects/rocfft/library/src/plan.cpp"]
+        self.assertEqual(self.impacted(paths), ["rocfft"])
+
+    def test_reverse_dependents_are_impacted(self):
+        paths = ["rocm-libraries/projects/hipblaslt/library/src/gemm.cpp"]
+        self.assertEqual(self.impacted(paths), ["hipblaslt", "miopen"])
+
+    def test_shared_dependency_impacts_all_dependents(self):
+        paths = ["rocm-libraries/projects/rocrand/library/src/rng.cpp"]
+        self.assertEqual(self.impacted(paths), ["miopen", "rocfft"])
+
+    def test_submodule_bump_uses_topology_source_sets(self):
+        modified = get_modified_artifacts(
+            ["rocm-libraries"], self.topology, SUBMODULE_NAMES
+        )
+        self.assertEqual(modified, {"blas", "fft", "rand", "miopen"})
+
+    def test_in_tree_path(self):
+        self.assertEqual(
+            self.impacted(["math-libs/BLAS/CMakeLists.txt"]), ["hipblaslt", "miopen"]
+        )
+
+    def test_test_script_selects_its_job(self):
+        paths = ["build_tools/github_actions/test_executable_scripts/test_rocfft.py"]
+        self.assertEqual(self.impacted(paths), ["rocfft"])
+
+    def test_skippable_paths_select_nothing(self):
+        self.assertEqual(self.impacted(["docs/README.md"]), [])
+
+    def test_unattributable_path_selects_all(self):
+        self.assertIsNone(self.impacted(["CMakeLists.txt"]))
+        self.assertIsNone(
+            self.impacted(["rocm-libraries/projects/rocfft/a.cpp", "cmake/x.cmake"])
+        )
+
+    def test_unknown_monorepo_project_falls_back_to_submodule(self):
+        paths = ["rocm-libraries/shared/tensile/a.py"]
+        self.assertEqual(self.impacted(paths), ["hipblaslt", "miopen", "rocfft"])
+
+    def test_base_dependency_impacts_everything(self):
+        paths = ["rocm-systems/projects/rocr-runtime/src/core.cpp"]
+        self.assertEqual(self.impacted(paths), ["hipblaslt", "miopen", "rocfft"])
+
+    def test_job_without_fetch_args_always_impacted(self):
+        test_matrix = dict(TEST_MATRIX)
+        test_matrix["hip-tests"] = {"test_script": "python test_hiptests.py"}
+        impacted = get_impacted_test_jobs(
+            ["rocm-libraries/projects/rocfft/a.cpp"],
+            test_matrix,
+            self.topology,
+            SUBMODULE_NAMES,
+        )
+        self.assertEqual(impacted, ["hip-tests", "rocfft"])
+
+
+if __name__ == "__main__":
+    unittest.main()
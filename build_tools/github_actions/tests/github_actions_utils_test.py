@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 import subprocess
 import sys
+import tempfile
 import unittest
 from unittest import mock
 from urllib.error import HTTPError, URLError
@@ -13,10 +14,14 @@ sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
 from github_actions_utils import (
     GitHubAPI,
     GitHubAPIError,
+    GitHubResponseCache,
+    get_default_response_cache,
+    gha_paginate,
     gha_query_last_successful_workflow_run,
     gha_query_recent_branch_commits,
     gha_query_workflow_run_by_id,
     gha_query_workflow_runs_for_commit,
+    gha_send_requests,
     is_authenticated_github_api_available,
 )
 
@@ -431,6 +436,75 @@ class GitHubAPITest(unittest.TestCase):
             self.assertIn("Invalid JSON", str(ctx.exception))
             self.assertIsInstance(ctx.exception.__cause__, json.JSONDecodeError)
 
+    # -------------------------------------------------------------------------
+    # Response cache tests
+    # -------------------------------------------------------------------------
+
+    def _mock_response(self, body: bytes, etag: str | None):
+        mock_response = mock.MagicMock()
+        mock_response.read.return_value = body
+        mock_response.headers = {"ETag": etag} if etag else {}
+        mock_response.__enter__.return_value = mock_response
+        return mock_response
+
+    def test_rest_api_not_modified_served_from_cache(self):
+        """A 304 reply to a conditional request should return the cached body."""
+        os.environ["GITHUB_TOKEN"] = "test-token"
+        url = "https://api.github.com/repos/test/test"
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api = GitHubAPI(response_cache=GitHubResponseCache(Path(cache_dir)))
+
+            with mock.patch(
+                "github_actions_utils.urlopen",
+                return_value=self._mock_response(b'{"id": 1}', '"etag-1"'),
+            ):
+                self.assertEqual(api.send_request(url), {"id": 1})
+
+            not_modified = HTTPError(
+                url=url, code=304, msg="Not Modified", hdrs={}, fp=None
+            )
+            with mock.patch(
+                "github_actions_utils.urlopen", side_effect=not_modified
+            ) as mock_urlopen:
+                self.assertEqual(api.send_request(url), {"id": 1})
+
+            request = mock_urlopen.call_args.args[0]
+            self.assertEqual(request.get_header("If-none-match"), '"etag-1"')
+
+    def test_rest_api_cache_is_keyed_by_credentials(self):
+        """Responses cached for one token should not be revalidated for another."""
+        url = "https://api.github.com/repos/test/test"
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = GitHubResponseCache(Path(cache_dir))
+            os.environ["GITHUB_TOKEN"] = "token-a"
+            with mock.patch(
+                "github_actions_utils.urlopen",
+                return_value=self._mock_response(b'{"id": 1}', '"etag-1"'),
+            ):
+                GitHubAPI(response_cache=cache).send_request(url)
+
+            os.environ["GITHUB_TOKEN"] = "token-b"
+            with mock.patch(
+                "github_actions_utils.urlopen",
+                return_value=self._mock_response(b'{"id": 2}', None),
+            ) as mock_urlopen:
+                result = GitHubAPI(response_cache=cache).send_request(url)
+
+            self.assertEqual(result, {"id": 2})
+            request = mock_urlopen.call_args.args[0]
+            self.assertIsNone(request.get_header("If-none-match"))
+
+    def test_default_response_cache_is_opt_in(self):
+        """The on-disk cache is only used when THEROCK_GITHUB_API_CACHE is set."""
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "/xdg"}):
+            os.environ.pop("THEROCK_GITHUB_API_CACHE", None)
+            self.assertIsNone(get_default_response_cache())
+            os.environ["THEROCK_GITHUB_API_CACHE"] = "0"
+            self.assertIsNone(get_default_response_cache())
+            os.environ["THEROCK_GITHUB_API_CACHE"] = "1"
+            cache = get_default_response_cache()
+            self.assertEqual(cache.cache_dir, Path("/xdg/therock/github_api"))
+
 
 class GitHubActionsUtilsTest(unittest.TestCase):
     def setUp(self):
@@ -521,6 +595,60 @@ class GitHubActionsUtilsTest(unittest.TestCase):
         self.assertEqual(runs[0]["id"], 2, "Newer run should be first")
         self.assertEqual(runs[1]["id"], 1, "Older run should be second")
 
+    def test_gha_paginate_follows_pages(self):
+        """Pages are requested until a short page is returned."""
+        pages = {
+            "1": {"total_count": 5, "workflow_runs": [{"id": 1}, {"id": 2}]},
+            "2": {"total_count": 5, "workflow_runs": [{"id": 3}, {"id": 4}]},
+            "3": {"total_count": 5, "workflow_runs": [{"id": 5}]},
+        }
+        requested_urls = []
+
+        def send_request(url, timeout_seconds=300):
+            requested_urls.append(url)
+            page = url.rsplit("page=", 1)[1]
+            return pages[page]
+
+        with mock.patch("github_actions_utils.gha_send_request", send_request):
+            runs = list(
+                gha_paginate(
+                    "https://api.github.com/repos/o/r/actions/runs?status=success",
+                    items_key="workflow_runs",
+                    per_page=2,
+                )
+            )
+
+        self.assertEqual([run["id"] for run in runs], [1, 2, 3, 4, 5])
+        self.assertEqual(len(requested_urls), 3)
+        self.assertIn("status=success", requested_urls[0])
+        self.assertIn("per_page=2", requested_urls[0])
+
+    def test_gha_query_recent_branch_commits_paginates(self):
+        """Counts above the per_page limit are read over several pages."""
+        requested_urls = []
+
+        def send_request(url, timeout_seconds=300):
+            requested_urls.append(url)
+            page = int(url.rsplit("page=", 1)[1])
+            return [{"sha": f"{page}-{i}"} for i in range(100)]
+
+        with mock.patch("github_actions_utils.gha_send_request", send_request):
+            commits = gha_query_recent_branch_commits("o/r", max_count=150)
+
+        self.assertEqual(len(commits), 150)
+        self.assertEqual(commits[100], "2-0")
+        self.assertEqual(len(requested_urls), 2)
+
+    def test_gha_send_requests_preserves_order(self):
+        """Concurrent requests return responses in the order of the URLs."""
+        urls = [f"https://api.github.com/repos/o/r/actions/runs/{i}" for i in range(8)]
+        with mock.patch(
+            "github_actions_utils.gha_send_request",
+            lambda url, timeout_seconds=300: {"url": url},
+        ):
+            responses = gha_send_requests(urls, max_workers=4)
+        self.assertEqual([r["url"] for r in responses], urls)
+
     @_skip_unless_authenticated_github_api_is_available
     def test_gha_query_last_successful_workflow_run(self):
         """Test querying for the last successful workflow run on a branch."""
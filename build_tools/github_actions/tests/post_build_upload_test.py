@@ -8,6 +8,7 @@ with a temp directory so no mocking of subprocess or boto3 is needed.
 
 import os
 import sys
+import tarfile
 import tempfile
 import unittest
 from pathlib import Path
@@ -37,6 +38,57 @@ def _make_output_root(
     )
 
 
+class TestLogArchive(unittest.TestCase):
+    """Tests for create_ninja_log_archive() and index_log_files()."""
+
+    def _make_build_dir(self, tmp: str) -> Path:
+        build_dir = Path(tmp)
+        (build_dir / ".ninja_log").write_text("# ninja log v5\n")
+        sub_build = build_dir / "math-libs" / "BLAS" / "build"
+        sub_build.mkdir(parents=True)
+        (sub_build / ".ninja_log").write_text("# ninja log v5\n")
+        # Pruned directories are not searched.
+        stage = build_dir / "math-libs" / "BLAS" / "stage"
+        stage.mkdir()
+        (stage / ".ninja_log").write_text("ignored")
+        return build_dir
+
+    def test_find_ninja_logs_prunes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            build_dir = self._make_build_dir(tmp)
+            found = post_build_upload.find_ninja_logs(build_dir)
+            self.assertEqual(
+                found,
+                [
+                    build_dir / ".ninja_log",
+                    build_dir / "math-libs" / "BLAS" / "build" / ".ninja_log",
+                ],
+            )
+            self.assertEqual(
+                post_build_upload.find_ninja_logs(build_dir, max_depth=0),
+                [build_dir / ".ninja_log"],
+            )
+
+    def test_zstd_archive_and_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            build_dir = self._make_build_dir(tmp)
+            post_build_upload.create_ninja_log_archive(build_dir, "zst")
+            archive = build_dir / "logs" / "ninja_logs.tar.zst"
+
+            import pyzstd
+
+            with pyzstd.ZstdFile(archive) as f, tarfile.open(
+                fileobj=f, mode="r|"
+            ) as tar:
+                names = [member.name for member in tar]
+            self.assertEqual(len(names), 2)
+
+            post_build_upload.index_log_files(build_dir, "gfx94X-dcgpu")
+            index = (build_dir / "logs" / "index.html").read_text()
+            self.assertIn("ninja_logs.tar.zst", index)
+            self.assertIn('a href="../../index-gfx94X-dcgpu.html"', index)
+
+
 class TestUploadArtifacts(unittest.TestCase):
     """Tests for upload_artifacts()."""
 
@@ -57,6 +57,24 @@ class TestFindPackageFiles(unittest.TestCase):
             self.assertEqual(files, [])
 
 
+class TestGenerateIndex(unittest.TestCase):
+    """Tests for generate_index()."""
+
+    def test_simple_index_is_opt_in(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            dist_dir = Path(tmp)
+            (dist_dir / "rocm-1.0.tar.gz").write_bytes(b"sdist")
+
+            upload_python_packages.generate_index(dist_dir)
+            self.assertTrue((dist_dir / "index.html").is_file())
+            self.assertFalse((dist_dir / "simple").exists())
+            self.assertFalse((dist_dir / "index-manifest.json").exists())
+
+            upload_python_packages.generate_index(dist_dir, simple_index=True)
+            self.assertTrue((dist_dir / "simple" / "rocm" / "index.html").is_file())
+            self.assertTrue((dist_dir / "index-manifest.json").is_file())
+
+
 class TestUploadPackages(unittest.TestCase):
     """Tests for upload_packages()."""
 
@@ -15,6 +15,7 @@ Usage:
     --run-id RUN_ID
     [--output-dir OUTPUT_DIR]  # Local output instead of S3
     [--bucket BUCKET]          # Override bucket selection (defaults to auto-select)
+    [--simple-index]           # Also generate a PEP 503 index
     [--dry-run]                # Print what would happen without taking action
 
 Modes:
@@ -26,6 +27,10 @@ Output Layout:
   {bucket}/{external_repo}{run_id}-{platform}/python/{artifact_group}/
     *.whl, *.tar.gz   # Wheel and sdist files
     index.html        # File listing for pip --find-links
+  With --simple-index, also:
+    *.whl.metadata    # Wheel METADATA files (PEP 658)
+    simple/           # PEP 503 index for pip --index-url
+    index-manifest.json  # Indexed files, for incremental index updates
 
 Installation:
   pip install rocm[libraries,devel] --pre \\
@@ -40,6 +45,7 @@ import subprocess
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "packaging" / "python"))
 from _therock_utils.workflow_outputs import WorkflowOutputRoot
 from _therock_utils.storage_location import StorageLocation
 from _therock_utils.storage_backend import StorageBackend, create_storage_backend
@@ -47,6 +53,7 @@ from github_actions_utils import (
     gha_append_step_summary,
     gha_set_output,
 )
+from generate_release_index import update_local_index
 
 THEROCK_DIR = Path(__file__).resolve().parent.parent.parent
 PLATFORM = platform.system().lower()
@@ -73,8 +80,13 @@ def _make_output_root(
     return WorkflowOutputRoot.from_workflow_run(run_id=run_id, platform=PLATFORM)
 
 
-def generate_index(dist_dir: Path, dry_run: bool = False):
-    """Generates an index.html file listing packages for pip --find-links."""
+def generate_index(dist_dir: Path, dry_run: bool = False, simple_index: bool = False):
+    """Generates an index.html file listing packages for pip --find-links.
+
+    With `simple_index`, also updates the PEP 503 index in `dist_dir/simple`.
+    This hashes every package not yet in the index manifest of `dist_dir`,
+    which in CI (a fresh dist directory each run) means all of them.
+    """
     indexer_script = THEROCK_DIR / "third-party" / "indexer" / "indexer.py"
     if not indexer_script.is_file():
         raise FileNotFoundError(f"Indexer script not found: {indexer_script}")
@@ -90,9 +102,15 @@ def generate_index(dist_dir: Path, dry_run: bool = False):
 
     if dry_run:
         log(f"[DRY RUN] Would run: {shlex.join(cmd)}")
+        if simple_index:
+            log(f"[DRY RUN] Would update simple index in {dist_dir / 'simple'}")
         return
 
     run_command(cmd)
+    if not simple_index:
+        return
+    updated = update_local_index(dist_dir)
+    log(f"[INFO] Updated {len(updated)} simple index pages in {dist_dir / 'simple'}")
 
 
 def find_package_files(dist_dir: Path) -> list[Path]:
@@ -155,7 +173,7 @@ def run(args: argparse.Namespace):
     log("")
     log("Generating index.html")
     log("---------------------")
-    generate_index(dist_dir, dry_run=args.dry_run)
+    generate_index(dist_dir, dry_run=args.dry_run, simple_index=args.simple_index)
 
     output_root = _make_output_root(args.run_id, bucket_override=args.bucket)
     packages_loc = output_root.python_packages(args.artifact_group)
@@ -215,6 +233,12 @@ def main():
         default=None,
         help="Override S3 bucket (default: auto-select from workflow run)",
     )
+    parser.add_argument(
+        "--simple-index",
+        action="store_true",
+        help="Also generate a PEP 503 simple index and PEP 658 metadata files "
+        "(hashes every package)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -4,30 +4,218 @@
 
 # Merges a number of compile_commands.json files.
 # Usage:
-#   python merge_compile_commands.py {output} {inputs...}
+#   python merge_compile_commands.py [--rewrite-prefix OLD=NEW]...
+#       {output} {inputs...}
 # If any input file is empty or missing, it will be silently ignored. This is
 # so that the build graph doesn't need to conditionally deal with sub projects
 # that do not populate it.
+#
+# Inputs are parsed and written one entry at a time, so memory use does not
+# grow with the size of the merged database. Entries with the same directory,
+# file and command are only written once. `--rewrite-prefix` replaces a path
+# prefix in the directory, file, output and command of every entry (e.g. to map
+# a build container's paths to the host's).
+#
+# A `{output}.stamp` file records the size, mtime and sha256 of every input.
+# If no input changed, the output is not regenerated (only touched, so that
+# build systems consider it up to date).
 
 from pathlib import Path
-import sys
+from typing import Iterator
+import argparse
+import codecs
+import hashlib
 import json
+import os
+import sys
 
-all_files = sys.argv[1:]
-if len(all_files) < 1:
-    print("Usage: merge_compile_commands.py {output_file} {inputs...}")
-output_file = all_files[0]
-input_files = all_files[1:]
+STAMP_VERSION = 1
+READ_SIZE = 1 << 20
 
-records = []
 
-for input_file in input_files:
-    input_path = Path(input_file)
-    if not input_path.exists() or input_path.stat().st_size == 0:
-        continue
+def iter_entries(input_path: Path) -> Iterator[dict]:
+    """Incrementally parses the entries of a compile_commands.json array."""
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    eof = False
+    started = False
     with open(input_path, "rb") as f:
-        this_records = json.load(f)
-    records.extend(this_records)
 
-with open(output_file, "wt") as f:
-    json.dump(records, f, check_circular=False, indent="  ")
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            data = f.read(READ_SIZE)
+            eof = not data
+            buffer = buffer[pos:] + utf8_decoder.decode(data, final=eof)
+            pos = 0
+            return True
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buffer):
+                if fill():
+                    continue
+                raise ValueError(f"Unterminated JSON array in {input_path}")
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError(f"Expected a JSON array in {input_path}")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                entry, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Most likely the entry continues past the buffered data.
+                if fill():
+                    continue
+                raise
+            pos = end
+            yield entry
+
+
+def parse_rewrite_prefix(value: str) -> tuple[str, str]:
+    old, sep, new = value.partition("=")
+    if not sep or not old:
+        raise argparse.ArgumentTypeError(f"Expected OLD=NEW, got '{value}'")
+    return old, new
+
+
+def rewrite_entry(entry: dict, rewrites: list[tuple[str, str]]) -> dict:
+    def rewrite(value: str) -> str:
+        for old, new in rewrites:
+            value = value.replace(old, new)
+        return value
+
+    for key in ("directory", "file", "output", "command"):
+        if isinstance(entry.get(key), str):
+            entry[key] = rewrite(entry[key])
+    if isinstance(entry.get("arguments"), list):
+        entry["arguments"] = [rewrite(arg) for arg in entry["arguments"]]
+    return entry
+
+
+def entry_key(entry: dict) -> bytes:
+    command = entry.get("command")
+    if command is None:
+        command = entry.get("arguments")
+    key = json.dumps([entry.get("directory"), entry.get("file"), command])
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+def file_sha256(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(READ_SIZE):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def input_stamps(input_paths: list[Path], previous: dict) -> list[list]:
+    """Gets [path, size, mtime_ns, sha256] for each input.
+
+    Hashes are only computed for inputs whose size or mtime differ from the
+    previous stamp.
+    """
+    stamps = []
+    for input_path in input_paths:
+        try:
+            st = input_path.stat()
+        except FileNotFoundError:
+            stamps.append([str(input_path), 0, 0, None])
+            continue
+        prev = previous.get(str(input_path))
+        if prev is not None and prev[1:3] == [st.st_size, st.st_mtime_ns]:
+            digest = prev[3]
+        else:
+            digest = file_sha256(input_path)
+        stamps.append([str(input_path), st.st_size, st.st_mtime_ns, digest])
+    return stamps
+
+
+def load_stamp(stamp_path: Path) -> dict:
+    try:
+        return json.loads(stamp_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def inputs_unchanged(previous: dict, stamp: dict) -> bool:
+    if previous.get("version") != stamp["version"]:
+        return False
+    if previous.get("options") != stamp["options"]:
+        return False
+    digests = [(path, digest) for path, _, _, digest in stamp["inputs"]]
+    return digests == [(path, digest) for path, _, _, digest in previous["inputs"]]
+
+
+def merge(output_path: Path, input_paths: list[Path], rewrites: list[tuple[str, str]]):
+    seen: set[bytes] = set()
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp{os.getpid()}")
+    try:
+        with open(tmp_path, "wt") as out:
+            out.write("[")
+            first = True
+            for input_path in input_paths:
+                if not input_path.exists() or input_path.stat().st_size == 0:
+                    continue
+                for entry in iter_entries(input_path):
+                    if rewrites:
+                        entry = rewrite_entry(entry, rewrites)
+                    key = entry_key(entry)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    text = json.dumps(entry, check_circular=False, indent="  ")
+                    out.write("\n  " if first else ",\n  ")
+                    out.write(text.replace("\n", "\n  "))
+                    first = False
+            out.write("]" if first else "\n]")
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def main(argv: list[str]):
+    p = argparse.ArgumentParser(
+        "merge_compile_commands.py",
+        usage="merge_compile_commands.py {output_file} {inputs...}",
+    )
+    p.add_argument(
+        "--rewrite-prefix",
+        type=parse_rewrite_prefix,
+        action="append",
+        default=[],
+        metavar="OLD=NEW",
+        help="Replace a path prefix in every entry (may be repeated)",
+    )
+    p.add_argument("output_file", type=Path)
+    p.add_argument("input_files", type=Path, nargs="*")
+    args = p.parse_args(argv)
+
+    output_path: Path = args.output_file
+    stamp_path = output_path.with_name(f"{output_path.name}.stamp")
+    previous = load_stamp(stamp_path)
+    options = [list(rewrite) for rewrite in args.rewrite_prefix]
+    previous_inputs = {}
+    if previous.get("version") == STAMP_VERSION and previous.get("options") == options:
+        previous_inputs = {stamp[0]: stamp for stamp in previous["inputs"]}
+    stamps = input_stamps(args.input_files, previous_inputs)
+    stamp = {"version": STAMP_VERSION, "options": options, "inputs": stamps}
+
+    if output_path.exists() and inputs_unchanged(previous, stamp):
+        # Inputs may have been rewritten with the same contents: just mark the
+        # output as up to date.
+        os.utime(output_path)
+    else:
+        merge(output_path, args.input_files, args.rewrite_prefix)
+    stamp_path.write_text(json.dumps(stamp))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
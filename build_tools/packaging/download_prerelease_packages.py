@@ -16,7 +16,11 @@ Options to just list architectures found matching the version or list all packag
 per architecture without downloading are also available. Packages that are not known
 to be either a package to promote or a PyPI dependency are also listed.
 
-Previously downloaded packages are skipped.
+Previously downloaded packages are skipped. Each bucket prefix is listed once
+and objects are downloaded concurrently (`--jobs`), with multipart objects
+fetched part by part (`--part-jobs`). Interrupted downloads resume from a
+`<file>.part` file, and every object is checked against its S3 ETag (MD5 of
+the object, or of its parts) while streaming, unless `--no-verify` is given.
 
 PREREQUISITES:
   - pip install -r ./build_tools/packaging/requirements.txt
@@ -105,13 +109,20 @@ PACKAGE CATEGORIES:
 """
 
 import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import List, Tuple, Union, Dict
+from typing import List, Optional, Tuple, Union, Dict
 
 try:
     import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError
+    from botocore.config import Config
+    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 except ImportError:
     print("[ERROR]: boto3 not installed. Please run:")
     print("  pip install boto3")
@@ -119,9 +130,17 @@ except ImportError:
 
 
 # Constants
-# Maximum number of S3 keys to check when validating architecture
-MAX_S3_KEYS_CHECK = 100
 BYTES_TO_MB = 1024 * 1024  # Conversion factor from bytes to MB
+# Number of files downloaded concurrently
+DEFAULT_DOWNLOAD_JOBS = 8
+# Number of parts of one multipart object downloaded concurrently
+DEFAULT_PART_JOBS = 4
+# Size of the chunks streamed from a GET response
+READ_CHUNK_SIZE = 1024 * 1024
+# Attempts at streaming a part or range before a file download fails
+STREAM_ATTEMPTS = 4
+# Seconds to wait before retrying a stream, multiplied by the attempt number
+STREAM_RETRY_BACKOFF_SECONDS = 1.0
 
 # Package categories
 PACKAGES_TO_PROMOTE = {
@@ -181,6 +200,46 @@ def categorize_package(filename: str) -> str:
     return "unknown"
 
 
+# Listings per (client, bucket, prefix), shared by all architecture lookups
+_listing_cache: Dict[Tuple[object, str, str], List[dict]] = {}
+_listing_lock = threading.Lock()
+
+
+def list_prefix(s3_client, bucket_name: str, prefix: str) -> List[dict]:
+    """List all objects under a bucket prefix, caching the result.
+
+    Architecture discovery, package listings and tarball listings all filter
+    this one listing instead of listing the bucket again for every architecture.
+
+    Returns:
+        List of S3 object dicts (with at least "Key" and "Size")
+    """
+    cache_key = (s3_client, bucket_name, prefix)
+    with _listing_lock:
+        if cache_key in _listing_cache:
+            return _listing_cache[cache_key]
+
+    objects = []
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        objects.extend(page.get("Contents", []))
+
+    with _listing_lock:
+        _listing_cache[cache_key] = objects
+    return objects
+
+
+def _objects_in_arch(
+    s3_client, bucket_name: str, bucket_prefix: str, arch: str
+) -> List[dict]:
+    arch_prefix = f"{bucket_prefix}{arch}/"
+    return [
+        obj
+        for obj in list_prefix(s3_client, bucket_name, bucket_prefix)
+        if obj["Key"].startswith(arch_prefix)
+    ]
+
+
 def list_architectures(
     s3_client, bucket_name: str, bucket_prefix: str, version: str
 ) -> List[str]:
@@ -197,26 +256,13 @@ def list_architectures(
     """
     print(f"Discovering architectures with version {version}...")
 
-    # List all "directories" in the bucket prefix
     try:
-        response = s3_client.list_objects_v2(
-            Bucket=bucket_name,
-            Prefix=bucket_prefix,
-            Delimiter="/",
-            MaxKeys=MAX_S3_KEYS_CHECK,
-        )
-
-        architectures = []
-        if "CommonPrefixes" in response.keys():
-            # "CommonPrefixes" is a list of prefixes that are the "directories" in the S3 bucket
-            for prefix in response["CommonPrefixes"]:
-                arch = prefix["Prefix"].replace(bucket_prefix, "").rstrip("/")
-                # Check if the arch folder contains files with the specified version
-                if has_version_in_arch(
-                    s3_client, bucket_name, bucket_prefix, arch, version
-                ):
-                    architectures.append(arch)
-                    print(f"  Found: {arch}")
+        # The "directories" in the bucket prefix whose files contain the version
+        architectures = set()
+        for obj in list_prefix(s3_client, bucket_name, bucket_prefix):
+            arch, sep, path = obj["Key"][len(bucket_prefix) :].partition("/")
+            if sep and version in path:
+                architectures.add(arch)
 
         if len(architectures) == 0:
             print(
@@ -225,6 +271,8 @@ def list_architectures(
             )
             sys.exit(1)
 
+        for arch in sorted(architectures):
+            print(f"  Found: {arch}")
         return sorted(architectures)
 
     except ClientError as e:
@@ -241,18 +289,10 @@ def has_version_in_arch(
 ) -> bool:
     """Check if an architecture folder contains files with the specified version."""
     try:
-        paginator = s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=bucket_name, Prefix=f"{bucket_prefix}{arch}/")
-
-        for page in pages:
-            if "Contents" not in page:
-                continue
-
-            for obj in page["Contents"]:
-                if version in obj["Key"]:
-                    return True
-
-        return False
+        return any(
+            version in obj["Key"]
+            for obj in _objects_in_arch(s3_client, bucket_name, bucket_prefix, arch)
+        )
     except ClientError:
         return False
 
@@ -273,39 +313,30 @@ def list_packages_for_arch(
         Tuple of (packages_to_promote, dependencies, unknown_packages)
         Each is a list of tuples (full_filepath_in_s3, size)
     """
-    prefix = f"{bucket_prefix}{arch}/"
-
     packages_to_promote = []
     dependencies = []
     unknown = []
 
     try:
-        paginator = s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        for obj in _objects_in_arch(s3_client, bucket_name, bucket_prefix, arch):
+            key = obj["Key"]
+            filename = key.split("/")[-1]
 
-        for page in pages:
-            if "Contents" not in page:
+            # Skip directories and index files
+            if not filename or filename == "index.html":
                 continue
 
-            for obj in page["Contents"]:
-                key = obj["Key"]
-                filename = key.split("/")[-1]
-
-                # Skip directories and index files
-                if not filename or filename == "index.html":
-                    continue
-
-                # Skip files that don't match version (for packages to promote)
-                # Dependencies don't need version matching
-                category = categorize_package(filename)
+            # Skip files that don't match version (for packages to promote)
+            # Dependencies don't need version matching
+            category = categorize_package(filename)
 
-                if category == "promote":
-                    if version in filename:
-                        packages_to_promote.append((key, obj["Size"]))
-                elif category == "dependency":
-                    dependencies.append((key, obj["Size"]))
-                else:
-                    unknown.append((key, obj["Size"]))
+            if category == "promote":
+                if version in filename:
+                    packages_to_promote.append((key, obj["Size"]))
+            elif category == "dependency":
+                dependencies.append((key, obj["Size"]))
+            else:
+                unknown.append((key, obj["Size"]))
 
         return packages_to_promote, dependencies, unknown
 
@@ -330,29 +361,22 @@ def list_tarball_for_arch(
         List of tuples (tarball_key, size) for matching tarballs
     """
     try:
-        paginator = s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=bucket_name, Prefix=bucket_prefix)
-
         tarballs = []
 
-        for page in pages:
-            if "Contents" not in page:
-                continue
-
-            for obj in page["Contents"]:
-                key = obj["Key"]
-                filename = key.split("/")[-1]
+        for obj in list_prefix(s3_client, bucket_name, bucket_prefix):
+            key = obj["Key"]
+            filename = key.split("/")[-1]
 
-                # Skip directories and index files
-                if not filename or filename == "index.html":
-                    continue
+            # Skip directories and index files
+            if not filename or filename == "index.html":
+                continue
 
-                if (
-                    filename.startswith("therock-dist")
-                    and arch + "-" + version in filename
-                    and filename.endswith(".tar.gz")
-                ):
-                    tarballs.append((key, obj["Size"]))
+            if (
+                filename.startswith("therock-dist")
+                and arch + "-" + version in filename
+                and filename.endswith(".tar.gz")
+            ):
+                tarballs.append((key, obj["Size"]))
 
         return tarballs
     except ClientError as e:
@@ -360,26 +384,377 @@ def list_tarball_for_arch(
         return []
 
 
-def download_file(s3_client, bucket_name: str, key: str, local_path: Path) -> bool:
+class DownloadStats:
+    """Thread-safe byte counters used to report download throughput."""
+
+    def __init__(self):
+        self.start_time = time.monotonic()
+        self.downloaded_bytes = 0
+        self.resumed_bytes = 0
+        self.files = 0
+        self._lock = threading.Lock()
+
+    def add(self, downloaded_bytes: int, resumed_bytes: int = 0):
+        with self._lock:
+            self.downloaded_bytes += downloaded_bytes
+            self.resumed_bytes += resumed_bytes
+            self.files += 1
+
+    def summary(self) -> str:
+        elapsed = max(time.monotonic() - self.start_time, 1e-6)
+        mb = self.downloaded_bytes / BYTES_TO_MB
+        text = (
+            f"{self.files} file(s), {mb:.2f} MB in {elapsed:.1f}s "
+            f"({mb / elapsed:.2f} MB/s)"
+        )
+        if self.resumed_bytes:
+            text += f", {self.resumed_bytes / BYTES_TO_MB:.2f} MB resumed"
+        return text
+
+
+class ChecksumMismatchError(Exception):
+    pass
+
+
+def _etag_md5(etag: str) -> Tuple[Optional[str], int]:
+    """Parse an S3 ETag into (md5 hex digest, number of parts).
+
+    Single part uploads have the MD5 of the object as ETag, multipart uploads
+    the MD5 of the concatenated part MD5s followed by "-<parts>". ETags of
+    objects encrypted with SSE-KMS or SSE-C are not MD5s; the digest is None
+    for anything that does not look like one.
+    """
+    digest, _, parts = etag.strip('"').partition("-")
+    if len(digest) != 32 or not all(c in "0123456789abcdef" for c in digest):
+        return None, int(parts) if parts.isdigit() else 1
+    return digest, int(parts) if parts else 0
+
+
+def _load_part_state(state_path: Path, etag: str, size: int) -> Optional[dict]:
+    try:
+        state = json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if state.get("etag") != etag or state.get("size") != size:
+        return None
+    return state
+
+
+def _save_part_state(state_path: Path, state: dict):
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state))
+    os.replace(tmp_path, state_path)
+
+
+def _stream_to_file(body, f, hasher) -> int:
+    written = 0
+    try:
+        while chunk := body.read(READ_CHUNK_SIZE):
+            f.write(chunk)
+            hasher.update(chunk)
+            written += len(chunk)
+    finally:
+        body.close()
+    return written
+
+
+def _with_stream_retries(description: str, fetch):
+    """Calls `fetch`, retrying on connection errors (e.g. a dropped stream).
+
+    `fetch` must continue from wherever the previous attempt stopped.
+    """
+    for attempt in range(1, STREAM_ATTEMPTS + 1):
+        try:
+            return fetch()
+        except BotoCoreError as e:
+            if attempt == STREAM_ATTEMPTS:
+                raise
+            print(
+                f"    [WARN]: {description}: {e}, retrying "
+                f"({attempt}/{STREAM_ATTEMPTS - 1})"
+            )
+            time.sleep(STREAM_RETRY_BACKOFF_SECONDS * attempt)
+
+
+def _download_single(
+    s3_client,
+    bucket_name: str,
+    key: str,
+    part_path: Path,
+    state_path: Path,
+    state: dict,
+    size: int,
+) -> Tuple[str, int, int]:
+    """Download an object in one GET, continuing a partial `.part` file.
+
+    If the connection drops, the rest is requested again from the current
+    offset.
+
+    Returns:
+        Tuple of (md5 hex digest, downloaded bytes, resumed bytes)
+    """
+    hasher = hashlib.md5()
+    offset = 0
+    if part_path.exists():
+        offset = min(part_path.stat().st_size, size)
+        with open(part_path, "rb") as f:
+            while offset - f.tell() > 0:
+                hasher.update(f.read(min(READ_CHUNK_SIZE, offset - f.tell())))
+    _save_part_state(state_path, state)
+
+    with open(part_path, "r+b" if offset else "wb") as f:
+        f.truncate(offset)
+        f.seek(offset)
+
+        def fetch_rest():
+            position = f.tell()
+            if position < size:
+                response = s3_client.get_object(
+                    Bucket=bucket_name, Key=key, Range=f"bytes={position}-"
+                )
+                _stream_to_file(response["Body"], f, hasher)
+
+        _with_stream_retries(key, fetch_rest)
+        downloaded = f.tell() - offset
+    if offset + downloaded != size:
+        raise IOError(f"expected {size} bytes, got {offset + downloaded}")
+    return hasher.hexdigest(), downloaded, offset
+
+
+def _download_multipart(
+    s3_client,
+    bucket_name: str,
+    key: str,
+    part_path: Path,
+    state_path: Path,
+    state: dict,
+    size: int,
+    parts: int,
+    part_jobs: int,
+) -> Tuple[str, int, int]:
+    """Download a multipart object part by part, concurrently.
+
+    Parts are fetched with `PartNumber` so their boundaries match the upload
+    and each part can be checked against its MD5. A part whose connection
+    drops is fetched again. Completed parts are recorded in the state file so
+    an interrupted download resumes with the missing ones.
+
+    Returns:
+        Tuple of (md5 hex digest of the part digests, downloaded bytes,
+        resumed bytes)
+    """
+    done: Dict[str, str] = state.setdefault("done", {})
+    part_size = state["part_size"]
+    if not part_path.exists() or part_path.stat().st_size != size:
+        done.clear()
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+    _save_part_state(state_path, state)
+    resumed = sum(min(part_size, size - (int(n) - 1) * part_size) for n in done)
+    state_lock = threading.Lock()
+
+    def stream_part(part_number: int) -> Tuple[int, str]:
+        hasher = hashlib.md5()
+        response = s3_client.get_object(
+            Bucket=bucket_name, Key=key, PartNumber=part_number
+        )
+        with open(part_path, "r+b") as f:
+            f.seek((part_number - 1) * part_size)
+            written = _stream_to_file(response["Body"], f, hasher)
+        return written, hasher.hexdigest()
+
+    def fetch_part(part_number: int) -> int:
+        expected = min(part_size, size - (part_number - 1) * part_size)
+        written, digest = _with_stream_retries(
+            f"{key} part {part_number}", lambda: stream_part(part_number)
+        )
+        if written != expected:
+            raise IOError(
+                f"part {part_number}: expected {expected} bytes, got {written}"
+            )
+        with state_lock:
+            done[str(part_number)] = digest
+            _save_part_state(state_path, state)
+        return written
+
+    missing = [n for n in range(1, parts + 1) if str(n) not in done]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=part_jobs) as executor:
+        downloaded = sum(executor.map(fetch_part, missing))
+
+    hasher = hashlib.md5()
+    for n in range(1, parts + 1):
+        hasher.update(bytes.fromhex(done[str(n)]))
+    return hasher.hexdigest(), downloaded, resumed
+
+
+def download_file(
+    s3_client,
+    bucket_name: str,
+    key: str,
+    local_path: Path,
+    part_jobs: int = DEFAULT_PART_JOBS,
+    verify: bool = True,
+    stats: Optional[DownloadStats] = None,
+) -> bool:
     """Download a single file from S3.
 
+    The object is written to `<local_path>.part` and only renamed to
+    `local_path` once complete and verified. Progress is recorded in
+    `<local_path>.part.json`, so a later call resumes an interrupted download
+    as long as the object (ETag and size) did not change.
+
     Args:
         s3_client: boto3 S3 client
         bucket_name: S3 bucket name
         key: S3 object key
         local_path: Local file path to save to
+        part_jobs: Number of parts of a multipart object to download concurrently
+        verify: Check the downloaded bytes against the object's ETag
+        stats: Optional DownloadStats to add the downloaded bytes to
 
     Returns:
         True if successful, False otherwise
     """
+    part_path = local_path.with_name(local_path.name + ".part")
+    state_path = local_path.with_name(local_path.name + ".part.json")
+    start_time = time.monotonic()
     try:
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        s3_client.download_file(bucket_name, key, str(local_path))
-        return True
-    except ClientError as e:
+        head = s3_client.head_object(Bucket=bucket_name, Key=key)
+        etag = head["ETag"]
+        size = head["ContentLength"]
+        expected_md5, parts = _etag_md5(etag)
+
+        state = _load_part_state(state_path, etag, size)
+        if state is None:
+            state = {"etag": etag, "size": size}
+            part_path.unlink(missing_ok=True)
+        if parts > 1 and "part_size" not in state:
+            state["part_size"] = s3_client.head_object(
+                Bucket=bucket_name, Key=key, PartNumber=1
+            )["ContentLength"]
+        part_size = state.get("part_size", 0)
+        # Parts are only fetched separately if they all have the same size,
+        # which is what every S3 client uploads.
+        if parts > 1 and (parts - 1) * part_size < size <= parts * part_size:
+            digest, downloaded, resumed = _download_multipart(
+                s3_client,
+                bucket_name,
+                key,
+                part_path,
+                state_path,
+                state,
+                size,
+                parts,
+                part_jobs,
+            )
+            digest = f"{digest}-{parts}"
+        else:
+            state.pop("done", None)
+            digest, downloaded, resumed = _download_single(
+                s3_client, bucket_name, key, part_path, state_path, state, size
+            )
+            if parts == 1:
+                digest = f"{hashlib.md5(bytes.fromhex(digest)).hexdigest()}-1"
+            elif parts > 1:
+                # Part boundaries are unknown, so the ETag cannot be checked.
+                expected_md5 = None
+
+        if verify and expected_md5 is not None:
+            expected = f"{expected_md5}-{parts}" if parts else expected_md5
+            if digest != expected:
+                part_path.unlink(missing_ok=True)
+                state_path.unlink(missing_ok=True)
+                raise ChecksumMismatchError(
+                    f"checksum mismatch (got {digest}, expected ETag {expected})"
+                )
+
+        os.replace(part_path, local_path)
+        state_path.unlink(missing_ok=True)
+    except (BotoCoreError, ClientError, OSError, ChecksumMismatchError) as e:
         print(f"    [ERROR]: Failed to download {key}: {e}")
         return False
 
+    elapsed = max(time.monotonic() - start_time, 1e-6)
+    mb = downloaded / BYTES_TO_MB
+    resumed_text = f", resumed at {resumed / BYTES_TO_MB:.2f} MB" if resumed else ""
+    print(
+        f"    \tDone: {local_path.name} ({mb:.2f} MB in {elapsed:.1f}s, "
+        f"{mb / elapsed:.2f} MB/s{resumed_text})"
+    )
+    if stats is not None:
+        stats.add(downloaded, resumed)
+    return True
+
+
+def download_files(
+    s3_client,
+    bucket_name: str,
+    objects: List[Tuple[str, int]],
+    output_dir: Path,
+    jobs: int = DEFAULT_DOWNLOAD_JOBS,
+    part_jobs: int = DEFAULT_PART_JOBS,
+    verify: bool = True,
+    stats: Optional[DownloadStats] = None,
+    indent: str = "  ",
+) -> Tuple[int, int]:
+    """Download objects into output_dir concurrently.
+
+    Files that already exist with the listed size are skipped.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket_name: S3 bucket name
+        objects: List of tuples (key, size) to download
+        output_dir: Directory to save the files to
+        jobs: Number of files to download concurrently
+        part_jobs: Number of parts of one file to download concurrently
+        verify: Check the downloaded bytes against the objects' ETags
+        stats: Optional DownloadStats to add the downloaded bytes to
+        indent: Indentation of the progress output
+
+    Returns:
+        Tuple of (successful_downloads, failed_downloads)
+    """
+    success_count = 0
+    fail_count = 0
+    pending = []
+    for idx, (key, size) in enumerate(objects):
+        filename = key.split("/")[-1]
+        local_path = output_dir / filename
+        progress = f"{indent}({idx+1}/{len(objects)})   \t"
+
+        # Skip if already exists
+        if local_path.exists() and local_path.stat().st_size == size:
+            print(f"{progress}SKIP (exists): {filename} ({size/BYTES_TO_MB:.2f} MB)")
+            success_count += 1
+            continue
+
+        print(f"{progress}Downloading: {filename} ({size/BYTES_TO_MB:.2f} MB)")
+        pending.append((key, local_path))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                download_file,
+                s3_client,
+                bucket_name,
+                key,
+                local_path,
+                part_jobs,
+                verify,
+                stats,
+            )
+            for key, local_path in pending
+        ]
+        for future in futures:
+            if future.result():
+                success_count += 1
+            else:
+                fail_count += 1
+
+    return success_count, fail_count
+
 
 def download_packages(
     s3_client,
@@ -389,6 +764,10 @@ def download_packages(
     version: str,
     output_dir: Path,
     include_dependencies: bool = False,
+    jobs: int = DEFAULT_DOWNLOAD_JOBS,
+    part_jobs: int = DEFAULT_PART_JOBS,
+    verify: bool = True,
+    stats: Optional[DownloadStats] = None,
 ) -> Tuple[int, int]:
     """Download packages for an architecture. By default, only packages to promote are downloaded.
        Unknown packages are always skipped.
@@ -401,6 +780,10 @@ def download_packages(
         version: Version pattern
         output_dir: Base output directory
         include_dependencies: Include dependency packages in download (default: False)
+        jobs: Number of files to download concurrently
+        part_jobs: Number of parts of one file to download concurrently
+        verify: Check the downloaded bytes against the objects' ETags
+        stats: Optional DownloadStats to add the downloaded bytes to
 
     Returns:
         Tuple of (successful_downloads, failed_downloads)
@@ -417,15 +800,12 @@ def download_packages(
     if unknown:
         print(f"  Unknown packages (skipped): {len(unknown)}")
         for key in unknown:
-            print(f"    - {key[0].split("/")[-1]}")
+            print(f"    - {key[0].split('/')[-1]}")
     print("")
     print("-" * 80)
 
     arch_dir = output_dir / arch
 
-    success_count = 0
-    fail_count = 0
-
     if include_dependencies:
         all_packages = packages_to_promote + dependencies
         print(
@@ -443,28 +823,16 @@ def download_packages(
         )
         return 0, 0
 
-    for idx, obj in enumerate(all_packages):
-        key, size = obj
-        filename = key.split("/")[-1]
-        local_path = arch_dir / filename
-
-        # Skip if already exists
-        if local_path.exists():
-            print(
-                f"  ({idx+1}/{len(all_packages)})   \tSKIP (exists): {filename} ({size/BYTES_TO_MB:.2f} MB)"
-            )
-            success_count += 1
-            continue
-
-        print(
-            f"  ({idx+1}/{len(all_packages)})   \tDownloading: {filename} ({size/BYTES_TO_MB:.2f} MB)"
-        )
-        if download_file(s3_client, bucket_name, key, local_path):
-            success_count += 1
-        else:
-            fail_count += 1
-
-    return success_count, fail_count
+    return download_files(
+        s3_client,
+        bucket_name,
+        all_packages,
+        arch_dir,
+        jobs=jobs,
+        part_jobs=part_jobs,
+        verify=verify,
+        stats=stats,
+    )
 
 
 def download_tarball(
@@ -474,6 +842,10 @@ def download_tarball(
     arch: str,
     version: str,
     output_dir: Path,
+    jobs: int = DEFAULT_DOWNLOAD_JOBS,
+    part_jobs: int = DEFAULT_PART_JOBS,
+    verify: bool = True,
+    stats: Optional[DownloadStats] = None,
 ) -> Tuple[int, int]:
     """Download tarball for an architecture.
 
@@ -484,6 +856,10 @@ def download_tarball(
         arch: Architecture name
         version: Version pattern
         output_dir: Base output directory
+        jobs: Number of files to download concurrently
+        part_jobs: Number of parts of one file to download concurrently
+        verify: Check the downloaded bytes against the objects' ETags
+        stats: Optional DownloadStats to add the downloaded bytes to
 
     Returns:
         Tuple of (successful_download, failed_download)
@@ -498,28 +874,19 @@ def download_tarball(
         )
         return 0, 1
 
-    success_count = 0
-    fail_count = 0
-
     print(f"  Downloading tarball...")
 
-    for name, size in tarballs:
-        filename = name.split("/")[-1]
-        local_path = output_dir / filename
-
-        # Skip if already exists
-        if local_path.exists():
-            print(f"        \tSKIP (exists): {filename} ({size/BYTES_TO_MB:.2f} MB)")
-            success_count += 1
-            continue
-
-        print(f"        \tDownloading: {filename} ({size/BYTES_TO_MB:.2f} MB)")
-        if download_file(s3_client, bucket_name, name, local_path):
-            success_count += 1
-        else:
-            fail_count += 1
-
-    return success_count, fail_count
+    return download_files(
+        s3_client,
+        bucket_name,
+        tarballs,
+        output_dir,
+        jobs=jobs,
+        part_jobs=part_jobs,
+        verify=verify,
+        stats=stats,
+        indent="        ",
+    )
 
 
 def parse_arguments(argv):
@@ -626,6 +993,27 @@ Examples:
         help="List all packages per architecture, do not download",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_DOWNLOAD_JOBS,
+        help=f"Number of files to download concurrently (default: {DEFAULT_DOWNLOAD_JOBS})",
+    )
+
+    parser.add_argument(
+        "--part-jobs",
+        type=int,
+        default=DEFAULT_PART_JOBS,
+        help=f"Number of parts of a multipart object to download concurrently (default: {DEFAULT_PART_JOBS})",
+    )
+
+    parser.add_argument(
+        "--verify",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Verify downloads against the S3 ETag checksums (default: True)",
+    )
+
     args = parser.parse_args(argv)
 
     if args.arch:
@@ -721,7 +1109,7 @@ def print_packages_per_arch(
                 size_tarball += tarball_size
                 total_size_tarball += tarball_size
                 size_mb = tarball_size / BYTES_TO_MB
-                print(f"    - {tarball_name.split("/")[-1]} ({size_mb:.2f} MB)")
+                print(f"    - {tarball_name.split('/')[-1]} ({size_mb:.2f} MB)")
             if not tarballs:
                 print(
                     f"  [WARN]: No tarball found for {arch} with version {version}. Skipping!"
@@ -771,6 +1159,9 @@ def download_prerelease_packages(
     tarball_output_dir: Path = None,
     list_archs: bool = False,
     list_packages_per_arch: bool = False,
+    jobs: int = DEFAULT_DOWNLOAD_JOBS,
+    part_jobs: int = DEFAULT_PART_JOBS,
+    verify: bool = True,
 ) -> Union[List[str], Dict[str, Dict[str, List[str]]], Tuple[int, int, List[str]]]:
     """Download prerelease packages from S3 bucket for promotion to release.
 
@@ -789,6 +1180,9 @@ def download_prerelease_packages(
         list_archs: Only list available architectures, do not download (default: False).
                    Set by CLI flag --list-archs
         list_packages_per_arch: List all packages per architecture and their sizes, do not download (default: False)
+        jobs: Number of files to download concurrently (default: DEFAULT_DOWNLOAD_JOBS)
+        part_jobs: Number of parts of a multipart object to download concurrently (default: DEFAULT_PART_JOBS)
+        verify: Verify downloads against the S3 ETag checksums (default: True)
 
     Returns:
         If list_archs=True: List of architecture names
@@ -816,7 +1210,10 @@ def download_prerelease_packages(
         print(f"Architecture: ALL")
     print("=" * 80)
 
-    s3_client = boto3.client("s3")
+    # Enough connections for every concurrently downloaded part
+    s3_client = boto3.client(
+        "s3", config=Config(max_pool_connections=max(10, jobs * part_jobs))
+    )
     # List architectures
     if architectures:
 
@@ -861,6 +1258,7 @@ def download_prerelease_packages(
         print(f"Tarball output directory: {tarball_output_dir.absolute()}")
 
     # Download packages for each architecture
+    stats = DownloadStats()
     total_success = 0
     total_fail = 0
 
@@ -875,6 +1273,10 @@ def download_prerelease_packages(
             version,
             output_dir,
             include_dependencies,
+            jobs=jobs,
+            part_jobs=part_jobs,
+            verify=verify,
+            stats=stats,
         )
         success_count += success
         fail_count += fail
@@ -889,6 +1291,10 @@ def download_prerelease_packages(
                 arch,
                 version,
                 tarball_output_dir,
+                jobs=jobs,
+                part_jobs=part_jobs,
+                verify=verify,
+                stats=stats,
             )
             success_count += success
             fail_count += fail
@@ -906,6 +1312,7 @@ def download_prerelease_packages(
     print(f"Total architectures: {len(architectures)}")
     print(f"Total successful downloads: {total_success}")
     print(f"Total failed downloads: {total_fail}")
+    print(f"Downloaded: {stats.summary()}")
 
     print(f"\nOutput directory: {output_dir.absolute()}/<arch>")
     if include_tarballs:
@@ -939,4 +1346,7 @@ if __name__ == "__main__":
         tarball_output_dir=args.tarball_output_dir,
         list_archs=args.list_archs,
         list_packages_per_arch=args.list_packages_per_arch,
+        jobs=args.jobs,
+        part_jobs=args.part_jobs,
+        verify=args.verify,
     )
@@ -4,76 +4,191 @@
 # SPDX-License-Identifier: MIT
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 import os
 import pathlib
 import re
+import shutil
+import struct
 import subprocess
 import sys
 
-try:
-    from elftools.elf.elffile import ELFFile
-    from elftools.elf.dynamic import DynamicSection
-    from elftools.common.exceptions import ELFError
-    from elftools.elf.dynamic import ENUM_D_TAG
-except ImportError:
-    sys.exit("Error : pyelftools failed to import. Make sure its installed\n")
+ELF_MAGIC = b"\x7fELF"
+PT_DYNAMIC = 2
+DT_NULL = 0
+DT_RPATH = 15
+DT_RUNPATH = 29
 
+# Outcomes of converting a single file.
+STATUS_NOT_ELF = "not_elf"
+STATUS_NO_RUNPATH = "no_runpath"
+STATUS_CONVERTED = "converted"
+STATUS_PATCHELF = "patchelf"
+STATUS_FAILED = "failed"
 
-def convert_runpath_to_rpath(search_path):
+
+@dataclass
+class ConversionSummary:
+    """Counts of files by conversion outcome, plus failure messages."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    failures: list[str] = field(default_factory=list)
+
+    def add(self, path: str, status: str, message: str = ""):
+        self.counts[status] = self.counts.get(status, 0) + 1
+        if status == STATUS_FAILED:
+            self.failures.append(f"{path}: {message}")
+
+    def __str__(self):
+        files = sum(self.counts.values())
+        elf_files = files - self.counts.get(STATUS_NOT_ELF, 0)
+        return (
+            f"{files} files, {elf_files} ELF: "
+            f"{self.counts.get(STATUS_CONVERTED, 0)} converted in place, "
+            f"{self.counts.get(STATUS_PATCHELF, 0)} converted with patchelf, "
+            f"{self.counts.get(STATUS_NO_RUNPATH, 0)} without DT_RUNPATH, "
+            f"{self.counts.get(STATUS_FAILED, 0)} failed"
+        )
+
+
+def _find_dynamic_tags(f) -> tuple[str, list[tuple[int, int]]]:
+    """Reads the dynamic section of an ELF file via its PT_DYNAMIC segment.
+
+    Returns the struct format of a tag and (file offset, tag) for each dynamic
+    entry up to DT_NULL. Section headers are not needed, so stripped files are
+    handled too.
+    """
+    ident = f.read(16)
+    if len(ident) < 16 or ident[:4] != ELF_MAGIC:
+        raise ValueError("not an ELF file")
+    elf_class, elf_data = ident[4], ident[5]
+    if elf_class not in (1, 2) or elf_data not in (1, 2):
+        raise ValueError(f"unsupported ELF class {elf_class} / encoding {elf_data}")
+    endian = "<" if elf_data == 1 else ">"
+    is_64 = elf_class == 2
+    header_format = endian + ("HHIQQQIHHH" if is_64 else "HHIIIIIHHH")
+    header = struct.unpack(header_format, f.read(struct.calcsize(header_format)))
+    e_phoff, e_phentsize, e_phnum = header[4], header[8], header[9]
+    phdr_format = endian + ("IIQQQQ" if is_64 else "IIIII")
+    tag_format = endian + ("q" if is_64 else "i")
+    entry_size = 16 if is_64 else 8
+
+    for i in range(e_phnum):
+        f.seek(e_phoff + i * e_phentsize)
+        phdr = struct.unpack(phdr_format, f.read(struct.calcsize(phdr_format)))
+        if phdr[0] != PT_DYNAMIC:
+            continue
+        p_offset, p_filesz = (phdr[2], phdr[5]) if is_64 else (phdr[1], phdr[4])
+        f.seek(p_offset)
+        data = f.read(p_filesz)
+        tags = []
+        for entry_offset in range(0, len(data) - entry_size + 1, entry_size):
+            (tag,) = struct.unpack_from(tag_format, data, entry_offset)
+            if tag == DT_NULL:
+                break
+            tags.append((p_offset + entry_offset, tag))
+        return tag_format, tags
+    return tag_format, []
+
+
+def _convert_with_patchelf(path: str) -> tuple[str, str]:
+    patchelf = shutil.which("patchelf")
+    if patchelf is None:
+        return STATUS_FAILED, "has DT_RPATH and DT_RUNPATH and patchelf was not found"
+    rpath = subprocess.check_output([patchelf, "--print-rpath", path], text=True)
+    subprocess.check_call(
+        [patchelf, "--force-rpath", "--set-rpath", rpath.strip(), path]
+    )
+    return STATUS_PATCHELF, ""
+
+
+def convert_file_runpath_to_rpath(path: str) -> tuple[str, str]:
+    """Changes the DT_RUNPATH tag of one ELF file to DT_RPATH in place.
+
+    The dynamic entry keeps its value (the same string table offset), so only
+    the tag is rewritten. Files that already have a DT_RPATH as well are
+    converted with patchelf, since two DT_RPATH entries are not valid.
+
+    Returns a (status, message) tuple.
+    """
+    try:
+        with open(path, "rb+") as f:
+            if f.read(4) != ELF_MAGIC:
+                return STATUS_NOT_ELF, ""
+            f.seek(0)
+            tag_format, tags = _find_dynamic_tags(f)
+            runpath_offsets = [offset for offset, tag in tags if tag == DT_RUNPATH]
+            if not runpath_offsets:
+                return STATUS_NO_RUNPATH, ""
+            if len(runpath_offsets) > 1 or any(tag == DT_RPATH for _, tag in tags):
+                f.close()
+                return _convert_with_patchelf(path)
+            f.seek(runpath_offsets[0])
+            f.write(struct.pack(tag_format, DT_RPATH))
+            return STATUS_CONVERTED, ""
+    except (OSError, ValueError, struct.error, subprocess.CalledProcessError) as e:
+        return STATUS_FAILED, str(e)
+
+
+def _collect_files(search_path) -> list[str]:
+    """Lists regular files under `search_path`, following symlinks.
+
+    Each file is listed once, however many links or symlinks lead to it.
+    """
+    files = []
+    seen: set[tuple[int, int]] = set()
+    for path, dirs, filenames in os.walk(search_path, topdown=True, followlinks=True):
+        for filename in filenames:
+            filename = os.path.join(path, filename)
+            try:
+                st = os.stat(filename)
+            except OSError:
+                # Broken symlink.
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in seen or not st.st_size:
+                continue
+            seen.add(key)
+            files.append(filename)
+    return files
+
+
+def convert_runpath_to_rpath(search_path, max_workers=None) -> ConversionSummary:
     """Update ELF binaries and libraries in `search_path` by changing DT_RUNPATH to DT_RPATH.
 
     This function performs the following steps:
-    1. Iterate through all files in `search_path`, skipping any directories listed in `excludes`.
-    2. Check if each file is an ELF binary.
-    3. Locate the DT_RUNPATH tag and its offset within the file.
-    4. Modify the tag byte from DT_RUNPATH (0x1d) to DT_RPATH (0xf) and write the change back.
+    1. Collect every file under `search_path` (following symlinks), once per inode.
+    2. Across a process pool, identify ELF files by their magic bytes.
+    3. Locate the DT_RUNPATH tag in the PT_DYNAMIC segment of each ELF file.
+    4. Rewrite the tag from DT_RUNPATH (0x1d) to DT_RPATH (0xf) in place,
+       falling back to patchelf when the file also has a DT_RPATH.
 
     Parameters:
     search_path : str
         The root directory to search for ELF files.
-    excludes : list[str]
-        A list of directory names to exclude from processing.
+    max_workers : int | None
+        Number of worker processes (default: number of CPUs). 1 converts files
+        in this process.
 
-    Returns: None
+    Returns: ConversionSummary
     """
     print(f"convert_runpath_to_rpath {search_path}")
-    excludes = []
-    for path, dirs, files in os.walk(search_path, topdown=True, followlinks=True):
-        dirs[:] = [d for d in dirs if d not in excludes]
-        for filename in files:
-            filename = os.path.join(path, filename)
-            print("Opening file ", filename)
-            # Open the file and check if its ELF file
-            try:
-                with open(filename, "rb+") as file:
-                    elffile = ELFFile(file)
-                    # Find the dynamic section and look for DT_RUNPATH tag
-                    section = elffile.get_section_by_name(".dynamic")
-                    if not section:
-                        break
-                    n = 0
-                    for tag in section.iter_tags():
-                        # DT_RUNPATH tag found. Toggle the byte to DT_RPATH
-                        if tag.entry.d_tag == "DT_RUNPATH":
-                            offset = section.header.sh_offset + n * section._tagsize
-                            section.stream.seek(offset)
-                            section.stream.write(bytes([ENUM_D_TAG["DT_RPATH"]]))
-                            print("DT_RUNPATH changed to DT_RPATH ")
-                            break
-                        # DT_RUNPATH tag not found. Loop to the next tag
-                        n = n + 1
-            except ELFError:
-                print("Discarding file as its not an ELF file", filename)
-                continue
-            except FileNotFoundError:
-                print("Discarding file with bad links", filename)
-                continue
-            except OSError:
-                print("Discarding file with OS error", filename)
-                continue
-            except Exception as ex:
-                print("Discarding file ", filename, ex)
-                continue
+    files = _collect_files(search_path)
+    summary = ConversionSummary()
+    if max_workers == 1 or len(files) < 2:
+        results = map(convert_file_runpath_to_rpath, files)
+        for filename, (status, message) in zip(files, results):
+            summary.add(filename, status, message)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(convert_file_runpath_to_rpath, files, chunksize=64)
+            for filename, (status, message) in zip(files, results):
+                summary.add(filename, status, message)
+    for failure in summary.failures:
+        print(f"Discarding file: {failure}")
+    print(f"convert_runpath_to_rpath summary: {summary}")
+    return summary
 
 
 def update_config_file(cfg_path):
@@ -167,14 +282,6 @@ def main():
         argparser.print_help()
         sys.exit(0)
 
-    # pyelftools is a mandatory requirement for this script. Exit if requirement is not met
-    if "ELFFile" not in globals():
-        print(
-            "Please install pyelftools using 'pip3 install pyelftools' "
-            + "before using the script : runpath_to_rpath.py"
-        )
-        sys.exit(0)
-
     # Find the elf files in the search path and update DT_RUNPATH to DT_RPATH
     convert_runpath_to_rpath(args.searchdir)
     # Update rocm clang configs to default to DT_RPATH
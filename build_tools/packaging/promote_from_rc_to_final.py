@@ -36,7 +36,14 @@ TESTING:
 """
 
 import argparse
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import csv
+import hashlib
+import io
 import shutil
+import struct
 from packaging.version import Version
 import pathlib
 from pkginfo import Wheel
@@ -45,26 +52,9 @@ import tempfile
 import tarfile
 import fileinput
 import os
-import importlib.util
-
-# Need dynamic load as change_wheel_version needs to be imported via parent directory
-this_file = pathlib.Path(__file__).resolve()
-build_tools_dir = this_file.parent.parent
-# ../third_party/change_wheel_version/change_wheel_version.py
-change_wheel_version_path = (
-    build_tools_dir / "third_party" / "change_wheel_version" / "change_wheel_version.py"
-)
-
-spec = importlib.util.spec_from_file_location(
-    "third_party_change_wheel_version", change_wheel_version_path
-)
-change_wheel_version = importlib.util.module_from_spec(spec)
-assert spec.loader is not None
-spec.loader.exec_module(change_wheel_version)
-
-assert hasattr(
-    change_wheel_version, "change_wheel_version"
-), "change_wheel_version module does not expose change_wheel_version function"
+import threading
+from typing import Callable
+import zipfile
 
 
 def parse_arguments(argv):
@@ -93,6 +83,12 @@ For tar.gz., the version is extract from <.tar.gz>/PKG-INFO file.
         help="Deletes old file after successful promotion",
         action="store_true",
     )
+    parser.add_argument(
+        "--jobs",
+        help="Number of wheels to promote concurrently (default: number of CPUs)",
+        type=int,
+        default=None,
+    )
     parser.add_argument(
         "--prerelease-type",
         help="Prerelease type to use instead of 'rc' (e.g. 'dev' or 'a')",
@@ -104,95 +100,254 @@ For tar.gz., the version is extract from <.tar.gz>/PKG-INFO file.
     return parser.parse_args(argv)
 
 
-def wheel_change_extra_files(new_dir_path: pathlib.Path, old_version, new_version):
-    # extract "rocm_sdk_core" from /tmp/tmp3swrl25j/wheel/rocm_sdk_core-7.10.0
-    package_name_no_version = new_dir_path.name.split(str(new_version))[0][:-1]
+def _record_hash(data: bytes) -> str:
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest())
+    return "sha256=" + digest.rstrip(b"=").decode()
 
-    # correct capitalization and hyphenation
-    # of interest for amdgpu arch: wheels are all lower case
-    # (e.g.  rocm_sdk_libraries_gfx94x_dcgpu-7.10.0rc1-py3-none-linux_x86_64.whl)
-    # but inside we have to match to rocm_sdk_libraries_gfx94X-dcgpu/ with a capital "X-dcgpu" instead of "x_dcgpu"
-    if "gfx" in package_name_no_version:
-        files = list(new_dir_path.glob("*gfx*"))
-        for file in files:
-            if len(file.name) == len(package_name_no_version):
-                package_name_no_version = file.name
-
-    old_rocm_version = (
-        str(old_version)
-        if not "rocm" in str(old_version)
-        else str(old_version).split("+rocm")[-1]
+
+def _copy_zip_member_raw(
+    src: zipfile.ZipFile, dst: zipfile.ZipFile, info: zipfile.ZipInfo, arcname: str
+):
+    """Copies the compressed bytes of a member verbatim, possibly renaming it.
+
+    zipfile has no public API for this, so the local header is written from a
+    copy of the member's ZipInfo and the member is registered with `dst` the
+    same way ZipFile.write() does.
+    """
+    src.fp.seek(info.header_offset)
+    header = struct.unpack(
+        zipfile.structFileHeader, src.fp.read(zipfile.sizeFileHeader)
     )
-    new_rocm_version = (
-        str(new_version)
-        if not "rocm" in str(new_version)
-        else str(new_version).split("+rocm")[-1]
+    if header[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    src.fp.seek(
+        header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH],
+        os.SEEK_CUR,
     )
 
-    print("    Changing ROCm-specific files that contain the version")
+    new_info = copy.copy(info)
+    new_info.filename = new_info.orig_filename = arcname
+    # Sizes and CRC are known, so they go in the local header instead of a
+    # data descriptor, and zip64 extras are regenerated for the new offsets.
+    new_info.flag_bits &= ~0x08
+    new_info.extra = zipfile._strip_extra(info.extra, (1,))
+    new_info.header_offset = dst.fp.tell()
+    dst.fp.write(new_info.FileHeader(zip64=None))
+    remaining = info.compress_size
+    while remaining:
+        block = src.fp.read(min(remaining, 1 << 20))
+        if not block:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        dst.fp.write(block)
+        remaining -= len(block)
+    dst.start_dir = dst.fp.tell()
+    dst.filelist.append(new_info)
+    dst.NameToInfo[arcname] = new_info
+    dst._didModify = True
+
+
+def _rocm_version(version: Version) -> str:
+    return (
+        str(version) if not "rocm" in str(version) else str(version).split("+rocm")[-1]
+    )
 
-    # rocm packages
-    if new_dir_path.name.startswith("rocm"):
-        files_to_change = [
-            new_dir_path / package_name_no_version / "_dist_info.py",
-        ]
-    # only torch and NOT triton, torchaudio, torchvision
-    elif "torch" == package_name_no_version:
-        files_to_change = [
-            new_dir_path / package_name_no_version / "_rocm_init.py",
-            new_dir_path / package_name_no_version / "version.py",
-        ]
 
-        # special handling
+def _find_package_dir(top_level_names: set[str], distribution: str) -> str:
+    # correct capitalization and hyphenation
+    # of interest for amdgpu arch: wheels are all lower case
+    # (e.g.  rocm_sdk_libraries_gfx94x_dcgpu-7.10.0rc1-py3-none-linux_x86_64.whl)
+    # but inside we have to match to rocm_sdk_libraries_gfx94X-dcgpu/ with a capital "X-dcgpu" instead of "x_dcgpu"
+    if "gfx" in distribution:
+        for name in sorted(top_level_names):
+            if "gfx" in name and len(name) == len(distribution):
+                return name
+    return distribution
+
+
+def wheel_version_rewrites(
+    distribution: str,
+    top_level_names: set[str],
+    dist_info_dir: str,
+    old_version: Version,
+    new_version: Version,
+) -> dict:
+    """Gets the ROCm-specific files (other than METADATA) that contain the version.
+
+    Returns a dict of archive name to a function rewriting its contents.
+    """
+    package_dir = _find_package_dir(top_level_names, distribution)
+    old_rocm_version = _rocm_version(old_version)
+    new_rocm_version = _rocm_version(new_version)
+
+    def replace_version(text: str) -> str:
+        return text.replace(old_rocm_version, new_rocm_version)
+
+    def replace_rocm_requirements(text: str) -> str:
         # we only want to change required-dist matching "rocm"
-        metadata_path = (
-            new_dir_path
-            / f"{package_name_no_version}-{old_version}.dist-info"
-            / "METADATA"
+        return "".join(
+            (
+                replace_version(line)
+                if "Requires-Dist" in line and "rocm" in line
+                else line
+            )
+            for line in text.splitlines(keepends=True)
         )
-        print(f"      {metadata_path}")
-        with fileinput.input(
-            files=(metadata_path),
-            encoding="utf-8",
-            inplace=True,
-        ) as f:
-            for line in f:
-                if "Requires-Dist" in line:
-                    if "rocm" in line:
-                        print(line.replace(old_rocm_version, new_rocm_version), end="")
-                        continue
-                print(line, end="")
+
+    # rocm packages
+    if distribution.startswith("rocm"):
+        files_to_change = [f"{package_dir}/_dist_info.py"]
+    # only torch and NOT triton, torchaudio, torchvision
+    elif "torch" == package_dir:
+        files_to_change = [f"{package_dir}/_rocm_init.py", f"{package_dir}/version.py"]
+        return {
+            **{name: replace_version for name in files_to_change},
+            f"{dist_info_dir}/METADATA": replace_rocm_requirements,
+        }
     # torchaudio, torchvision
-    elif not "triton" in package_name_no_version:
-        files_to_change = [
-            new_dir_path / package_name_no_version / "version.py",
-        ]
+    elif not "triton" in package_dir:
+        files_to_change = [f"{package_dir}/version.py"]
     # triton
     else:
         # no additional (rocm-specific) files needed to be changed that contain the version
-        return
-
-    for f in files_to_change:
-        print(f"      {f}")
-    with fileinput.input(files=(files_to_change), encoding="utf-8", inplace=True) as f:
-        for line in f:
-            print(line.replace(old_rocm_version, new_rocm_version), end="")
-
-    print("    ...done")
-
+        return {}
+    return {name: replace_version for name in files_to_change}
+
+
+def _replace_metadata_version(text: str, new_version: Version) -> str:
+    lines = text.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        if not line.strip():
+            break  # End of the headers.
+        if line.startswith("Version:"):
+            ending = line[len(line.rstrip("\r\n")) :]
+            lines[i] = f"Version: {new_version}{ending}"
+            break
+    return "".join(lines)
+
+
+def rewrite_wheel_version(
+    wheel: pathlib.Path, new_version: Version, log: Callable[[str], None] = print
+) -> pathlib.Path:
+    """Writes a copy of a wheel with a new version next to it.
+
+    Only the members that contain the version (METADATA, RECORD and the
+    ROCm-specific files from `wheel_version_rewrites`) are decompressed and
+    rewritten. All other members are renamed as needed (for the .dist-info and
+    .data directories) and their compressed bytes are copied verbatim, with
+    their RECORD hashes carried over. A file to rewrite that is missing from
+    the wheel is an error.
+
+    Returns the path of the new wheel.
+    """
+    name_parts = wheel.name.removesuffix(".whl").split("-")
+    if len(name_parts) not in (5, 6):
+        raise ValueError(f"Invalid wheel filename: {wheel.name}")
+    distribution, old_version_str = name_parts[0], name_parts[1]
+    old_version = Version(old_version_str)
+    # `wheel pack` sorts the tags, so we need to do the same.
+    tag = "-".join(".".join(sorted(t.split("."))) for t in name_parts[-3:])
+    new_wheel = wheel.with_name(
+        "-".join([distribution, str(new_version), *name_parts[2:-3], tag]) + ".whl"
+    )
+    new_slug = f"{distribution}-{new_version}"
 
-def promote_wheel(filename: pathlib.Path, prerelease_type: str) -> bool:
-    print(f"Promoting whl from rc to final: {filename}")
+    with zipfile.ZipFile(wheel) as src:
+        infos = src.infolist()
+        top_level_names = {info.filename.split("/", 1)[0] for info in infos}
+        dist_info_dirs = [
+            name for name in top_level_names if name.endswith(".dist-info")
+        ]
+        if len(dist_info_dirs) != 1:
+            raise ValueError(f"Expected one .dist-info directory in {wheel}")
+        old_dist_info = dist_info_dirs[0]
+        old_slug = old_dist_info.removesuffix(".dist-info")
+        renames = {
+            old_dist_info: f"{new_slug}.dist-info",
+            f"{old_slug}.data": f"{new_slug}.data",
+        }
+        record_name = f"{old_dist_info}/RECORD"
+
+        rewrites = wheel_version_rewrites(
+            distribution, top_level_names, old_dist_info, old_version, new_version
+        )
+        metadata_name = f"{old_dist_info}/METADATA"
+        extra_metadata_rewrite = rewrites.get(metadata_name, lambda text: text)
+        rewrites[metadata_name] = lambda text: extra_metadata_rewrite(
+            _replace_metadata_version(text, new_version)
+        )
+        missing = sorted(set(rewrites) - {info.filename for info in infos})
+        if missing:
+            raise ValueError(
+                f"Files to rewrite are missing in {wheel.name}: {', '.join(missing)}"
+            )
+        for name in rewrites:
+            log(f"      {name}")
+
+        old_records = {}
+        with src.open(record_name) as f:
+            for row in csv.reader(io.TextIOWrapper(f, encoding="utf-8")):
+                if row:
+                    old_records[row[0]] = row[1:3]
+
+        records: list[list[str]] = []
+        new_record_info = None
+        tmp_wheel = new_wheel.with_name(f".{new_wheel.name}.tmp{os.getpid()}")
+        try:
+            with zipfile.ZipFile(tmp_wheel, "w") as dst:
+                for info in infos:
+                    top, sep, rest = info.filename.partition("/")
+                    arcname = renames.get(top, top) + sep + rest
+                    if info.filename == record_name:
+                        new_record_info = (info, arcname)
+                        continue
+                    if info.filename in rewrites:
+                        text = src.read(info).decode("utf-8")
+                        data = rewrites[info.filename](text).encode("utf-8")
+                        new_info = zipfile.ZipInfo(arcname, date_time=info.date_time)
+                        new_info.external_attr = info.external_attr
+                        new_info.compress_type = info.compress_type
+                        dst.writestr(new_info, data)
+                        records.append([arcname, _record_hash(data), str(len(data))])
+                        continue
+                    _copy_zip_member_raw(src, dst, info, arcname)
+                    if info.is_dir():
+                        continue
+                    if info.filename in old_records:
+                        records.append([arcname, *old_records[info.filename]])
+                    else:
+                        data = src.read(info)
+                        records.append([arcname, _record_hash(data), str(len(data))])
+
+                record_info, record_arcname = new_record_info
+                records.append([record_arcname, "", ""])
+                record_text = io.StringIO()
+                csv.writer(record_text, lineterminator="\n").writerows(records)
+                new_info = zipfile.ZipInfo(
+                    record_arcname, date_time=record_info.date_time
+                )
+                new_info.external_attr = record_info.external_attr
+                new_info.compress_type = record_info.compress_type
+                dst.writestr(new_info, record_text.getvalue())
+            os.replace(tmp_wheel, new_wheel)
+        finally:
+            tmp_wheel.unlink(missing_ok=True)
+    return new_wheel
+
+
+def promote_wheel(
+    filename: pathlib.Path, prerelease_type: str, log: Callable[[str], None] = print
+) -> bool:
+    log(f"Promoting whl from rc to final: {filename}")
 
     original_wheel = Wheel(filename)
     original_version = Version(original_wheel.version)
     new_base_version = str(original_version.base_version)
 
-    print(f"  Detected version: {original_version}")
+    log(f"  Detected version: {original_version}")
 
     if original_version.local:  # torch packages
         if not prerelease_type in original_version.local:
-            print(
+            log(
                 f"  [ERROR] Only prerelease versions of type '{prerelease_type}' can be promoted! Skipping!"
             )
             return False
@@ -200,27 +355,24 @@ def promote_wheel(filename: pathlib.Path, prerelease_type: str) -> bool:
         new_base_version = str(original_version.public)
     else:  # rocm packages
         if not prerelease_type in str(original_version):
-            print(
+            log(
                 f"  [ERROR] Only prerelease versions of type '{prerelease_type}' can be promoted! Skipping!"
             )
             return False
         new_local_version = None
 
-    print(f"  New base version: {new_base_version}")
-    print(f"  New local version: {new_local_version}")
+    log(f"  New base version: {new_base_version}")
+    log(f"  New local version: {new_local_version}")
 
-    print("  Starting to execute version change")
-    new_wheel_path = change_wheel_version.change_wheel_version(
-        filename,
-        new_base_version,
-        new_local_version,
-        callback_func=wheel_change_extra_files,
+    new_version = Version(
+        new_base_version + (f"+{new_local_version}" if new_local_version else "")
     )
-    print("  Version change done")
+    log(f"  Rewriting files that contain the version in {filename.name}")
+    new_wheel_path = rewrite_wheel_version(filename, new_version, log)
 
     new_wheel = Wheel(new_wheel_path)
     new_version = Version(new_wheel.version)
-    print(f"New wheel has {new_version} and path is {new_wheel_path}")
+    log(f"New wheel has {new_version} and path is {new_wheel_path}")
     return True
 
 
@@ -327,15 +479,42 @@ def promote_targz_tarball(
     return True
 
 
+_print_lock = threading.Lock()
+
+
+def _promote_wheel_file(file: pathlib.Path, delete: bool, prerelease_type: str):
+    # Wheels are promoted concurrently: print the output of each wheel as one
+    # block, so that lines of different wheels do not interleave.
+    lines = []
+    try:
+        if promote_wheel(file, prerelease_type, log=lines.append) and delete:
+            lines.append(f"Removing old wheel: {file}")
+            os.remove(file)
+    finally:
+        with _print_lock:
+            print("\n".join(lines), flush=True)
+
+
 def main(
     input_dir: pathlib.Path,
     match_files: str = "*",
     delete: bool = False,
     prerelease_type: str = "rc",
+    jobs: int | None = None,
 ) -> None:
     print(f"Looking for .whl and .tar.gz in {input_dir}/{match_files}")
 
-    files = input_dir.glob(match_files)
+    files = sorted(input_dir.glob(match_files))
+
+    # Wheels are rewritten concurrently: most of the work is copying
+    # compressed members, which releases the GIL.
+    wheels = [file for file in files if file.suffix == ".whl" and not file.is_dir()]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for future in [
+            executor.submit(_promote_wheel_file, wheel, delete, prerelease_type)
+            for wheel in wheels
+        ]:
+            future.result()
 
     for file in files:
         print("")
@@ -343,9 +522,7 @@ def main(
             print(f"Skipping directory: {file}")
             continue
         if file.suffix == ".whl":
-            if promote_wheel(file, prerelease_type) and delete:
-                print(f"Removing old wheel: {file}")
-                os.remove(file)
+            continue
         elif file.suffixes[-1] == ".gz" and file.suffixes[-2] == ".tar":
             if file.name.startswith("therock-dist"):
                 promote_targz_tarball(file, delete, prerelease_type)
@@ -362,4 +539,10 @@ if __name__ == "__main__":
     p = parse_arguments(sys.argv[1:])
     print(" ...done")
 
-    main(p.input_dir, p.match_files, p.delete_old_on_success, p.prerelease_type[0])
+    main(
+        p.input_dir,
+        p.match_files,
+        p.delete_old_on_success,
+        p.prerelease_type[0],
+        jobs=p.jobs,
+    )
@@ -18,16 +18,54 @@ S3 buckets in `us-east-2` currently used are:
 
     * `therock-dev-python`
     * `therock-nightly-python`
+
+With `--simple-dir`, a PEP 503 "simple" index (one page per project, with
+sha256 fragments and `data-dist-info-metadata` hashes where known) is written
+as well. `--manifest` persists the known files (name, version, size, hashes)
+between runs, so that only files added or changed since the last run are
+inspected and only the pages of affected projects are rendered. Pages whose
+content did not change are not rewritten, so a subsequent `aws s3 sync` only
+uploads what changed:
+
+    ```bash
+    ./build_tools/packaging/python/generate_release_index.py \
+        --bucket=therock-dev-python \
+        --subdir=gfx110X-all \
+        --output=index.html \
+        --manifest=index-manifest.json \
+        --simple-dir=simple
+    ```
+
+`update_local_index` does the same for a local directory of packages (see
+`build_tools/github_actions/upload_python_packages.py`).
 """
 
 import argparse
+import base64
 import boto3
+import concurrent.futures
+import hashlib
 import html
 import io
+import json
+import os
+import re
 import sys
 import textwrap
+import zipfile
+from pathlib import Path
+from typing import Callable, Optional
 from urllib.parse import quote
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from _therock_utils.hash_util import calculate_hash
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = "index-manifest.json"
+DIST_SUFFIXES = (".whl", ".tar.gz")
+# Concurrent S3 requests when fetching hashes of new files
+MAX_WORKERS = 16
+
 
 def parse_arguments():
     p = argparse.ArgumentParser()
@@ -52,6 +90,16 @@ def parse_arguments():
         default="-",
         help="The file to write the HTML to or '-' for stdout (the default)",
     )
+    p.add_argument(
+        "--manifest",
+        type=Path,
+        help="JSON file recording the indexed files between runs",
+    )
+    p.add_argument(
+        "--simple-dir",
+        type=Path,
+        help="Directory to write a PEP 503 simple index to",
+    )
     return p.parse_args()
 
 
@@ -85,9 +133,353 @@ def add_releases(objects: list, base_url: str, subdir: str, file: io.TextIOWrapp
     )
 
 
+def normalize_project_name(name: str) -> str:
+    """Normalizes a project name as specified by PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parse_dist_filename(filename: str) -> Optional[tuple[str, str]]:
+    """Gets the (normalized project name, version) of a wheel or sdist file."""
+    if filename.endswith(".whl"):
+        parts = filename[: -len(".whl")].split("-")
+        if len(parts) < 5:
+            return None
+        return normalize_project_name(parts[0]), parts[1]
+    if filename.endswith(".tar.gz"):
+        name, sep, version = filename[: -len(".tar.gz")].rpartition("-")
+        if not sep:
+            return None
+        return normalize_project_name(name), version
+    return None
+
+
+def load_manifest(manifest_path: Path) -> dict[str, dict]:
+    """Loads the files recorded by a previous run ({} if there is none)."""
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest["files"]
+
+
+def save_manifest(manifest_path: Path, files: dict[str, dict]):
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+    tmp_path.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "files": files}, indent=1)
+    )
+    os.replace(tmp_path, manifest_path)
+
+
+def update_manifest(
+    known: dict[str, dict],
+    listing: dict[str, list],
+    describe: Callable[[str], dict],
+) -> tuple[dict[str, dict], set[str]]:
+    """Applies the files added, changed or removed since the previous run.
+
+    Args:
+        known: Files recorded by the previous run (see `load_manifest`).
+        listing: Current files, mapping the file name to a stamp that changes
+            with its contents (e.g. `[size, etag]`). Files whose stamp did not
+            change keep their recorded entry.
+        describe: Gets the hashes (`{"sha256": ..., "metadata_sha256": ...}`,
+            either may be None) of a new or changed file. Called concurrently.
+
+    Returns:
+        Tuple of (files, projects with added, changed or removed files)
+    """
+    files = {}
+    new_files = []
+    for filename, stamp in listing.items():
+        entry = known.get(filename)
+        if entry is not None and entry["stamp"] == stamp:
+            files[filename] = entry
+            continue
+        parsed = parse_dist_filename(filename)
+        if parsed is not None:
+            new_files.append((filename, stamp, parsed))
+
+    changed_projects = {
+        known[filename]["project"] for filename in known.keys() - files.keys()
+    }
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        all_hashes = executor.map(describe, [filename for filename, _, _ in new_files])
+        for (filename, stamp, (project, version)), hashes in zip(new_files, all_hashes):
+            files[filename] = {
+                "project": project,
+                "version": version,
+                "size": stamp[0],
+                "stamp": stamp,
+                "sha256": hashes.get("sha256"),
+                "metadata_sha256": hashes.get("metadata_sha256"),
+            }
+            changed_projects.add(project)
+    return files, changed_projects
+
+
+def render_project_page(project: str, entries: list[tuple[str, dict]], base_url: str):
+    """Renders the PEP 503 page listing the files of one project."""
+    name = html.escape(project)
+    lines = [
+        "<!DOCTYPE html>",
+        "<html>",
+        "  <head>",
+        '    <meta name="pypi:repository-version" content="1.0">',
+        f"    <title>Links for {name}</title>",
+        "  </head>",
+        "  <body>",
+        f"    <h1>Links for {name}</h1>",
+    ]
+    for filename, entry in sorted(entries):
+        url = f"{base_url}/{quote(filename)}"
+        if entry.get("sha256"):
+            url += f"#sha256={entry['sha256']}"
+        attributes = ""
+        if entry.get("metadata_sha256"):
+            # PEP 714 renames the PEP 658 attribute to data-core-metadata.
+            metadata_hash = f"sha256={entry['metadata_sha256']}"
+            attributes = (
+                f' data-dist-info-metadata="{metadata_hash}"'
+                f' data-core-metadata="{metadata_hash}"'
+            )
+        lines.append(
+            f'    <a href="{html.escape(url)}"{attributes}>{html.escape(filename)}</a><br>'
+        )
+    lines += ["  </body>", "</html>", ""]
+    return "\n".join(lines)
+
+
+def render_root_page(projects: list[str]):
+    """Renders the PEP 503 root page listing all projects."""
+    lines = [
+        "<!DOCTYPE html>",
+        "<html>",
+        "  <head>",
+        '    <meta name="pypi:repository-version" content="1.0">',
+        "    <title>Simple index</title>",
+        "  </head>",
+        "  <body>",
+    ]
+    for project in sorted(projects):
+        lines.append(f'    <a href="{quote(project)}/">{html.escape(project)}</a><br>')
+    lines += ["  </body>", "</html>", ""]
+    return "\n".join(lines)
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Writes a file unless it already has this content. Returns if written."""
+    try:
+        if path.read_text() == text:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return True
+
+
+def write_simple_index(
+    files: dict[str, dict],
+    simple_dir: Path,
+    base_url: str,
+    changed_projects: Optional[set[str]] = None,
+) -> list[Path]:
+    """Writes a PEP 503 simple index of `files` to `simple_dir`.
+
+    Args:
+        files: Indexed files, as returned by `update_manifest`.
+        simple_dir: Directory to write `index.html` and `<project>/index.html`.
+        base_url: URL of the directory containing the files, absolute or
+            relative to the project pages.
+        changed_projects: Projects whose pages may be outdated. Pages of other
+            projects are only written if missing. If None, all pages are
+            rendered and pages of projects without files are removed.
+
+    Returns:
+        The pages that were written or removed.
+    """
+    by_project: dict[str, list[tuple[str, dict]]] = {}
+    for filename, entry in files.items():
+        by_project.setdefault(entry["project"], []).append((filename, entry))
+
+    if changed_projects is None:
+        projects = set(by_project)
+        if simple_dir.is_dir():
+            projects.update(d.name for d in simple_dir.iterdir() if d.is_dir())
+    else:
+        projects = set(changed_projects)
+        projects.update(
+            project
+            for project in by_project
+            if not (simple_dir / project / "index.html").exists()
+        )
+
+    updated = []
+    for project in sorted(projects):
+        page = simple_dir / project / "index.html"
+        if project in by_project:
+            text = render_project_page(project, by_project[project], base_url)
+            if write_if_changed(page, text):
+                updated.append(page)
+        elif page.exists():
+            page.unlink()
+            if not any(page.parent.iterdir()):
+                page.parent.rmdir()
+            updated.append(page)
+
+    root_page = simple_dir / "index.html"
+    if write_if_changed(root_page, render_root_page(list(by_project))):
+        updated.append(root_page)
+    return updated
+
+
+def read_wheel_metadata(wheel_path: Path) -> Optional[bytes]:
+    """Reads the METADATA file of a wheel, or None if it has none."""
+    try:
+        with zipfile.ZipFile(wheel_path) as zf:
+            for name in zf.namelist():
+                dist_info, _, filename = name.partition("/")
+                if dist_info.endswith(".dist-info") and filename == "METADATA":
+                    return zf.read(name)
+    except zipfile.BadZipFile:
+        pass
+    return None
+
+
+def list_local_dists(dist_dir: Path) -> dict[str, list]:
+    """Lists the packages in a directory as {file name: [size, mtime_ns]}."""
+    listing = {}
+    for entry in os.scandir(dist_dir):
+        if entry.is_file() and entry.name.endswith(DIST_SUFFIXES):
+            st = entry.stat()
+            listing[entry.name] = [st.st_size, st.st_mtime_ns]
+    return listing
+
+
+def describe_local_dist(dist_dir: Path, filename: str) -> dict:
+    """Hashes a package, writing the PEP 658 `.metadata` file of wheels."""
+    path = dist_dir / filename
+    hashes = {"sha256": calculate_hash(path, "sha256").hexdigest()}
+    metadata = read_wheel_metadata(path) if filename.endswith(".whl") else None
+    if metadata is not None:
+        (dist_dir / f"{filename}.metadata").write_bytes(metadata)
+        hashes["metadata_sha256"] = hashlib.sha256(metadata).hexdigest()
+    return hashes
+
+
+def update_local_index(
+    dist_dir: Path,
+    simple_dir: Optional[Path] = None,
+    manifest_path: Optional[Path] = None,
+) -> list[Path]:
+    """Incrementally updates a PEP 503 simple index of a local package directory.
+
+    Only packages added or changed since the previous run (as recorded in the
+    manifest) are hashed and only the pages of their projects are rendered.
+
+    Args:
+        dist_dir: Directory containing the wheels and sdists.
+        simple_dir: Directory for the index (default: `dist_dir/simple`).
+        manifest_path: Manifest of the indexed files (default:
+            `dist_dir/index-manifest.json`).
+
+    Returns:
+        The pages that were written or removed.
+    """
+    simple_dir = simple_dir or dist_dir / "simple"
+    manifest_path = manifest_path or dist_dir / MANIFEST_NAME
+    known = load_manifest(manifest_path)
+    files, changed_projects = update_manifest(
+        known,
+        list_local_dists(dist_dir),
+        lambda filename: describe_local_dist(dist_dir, filename),
+    )
+    for filename in known.keys() - files.keys():
+        (dist_dir / f"{filename}.metadata").unlink(missing_ok=True)
+
+    base_url = Path(os.path.relpath(dist_dir, simple_dir / "project")).as_posix()
+    updated = write_simple_index(
+        files, simple_dir, base_url, changed_projects if known else None
+    )
+    save_manifest(manifest_path, files)
+    return updated
+
+
+def list_s3_dists(
+    s3_client, bucket_name: str, subdir: str
+) -> tuple[list[str], dict[str, list]]:
+    """Lists a bucket subdirectory once.
+
+    Returns:
+        Tuple of (all object names except `index.html`, packages as
+        {file name: [size, etag, has `.metadata` file]})
+    """
+    objects = []
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=f"{subdir}/"):
+        objects.extend(page.get("Contents", []))
+
+    names = [obj["Key"][len(subdir) + 1 :] for obj in objects]
+    name_set = set(names)
+    listing = {
+        name: [obj["Size"], obj["ETag"], f"{name}.metadata" in name_set]
+        for name, obj in zip(names, objects)
+        if "/" not in name and name.endswith(DIST_SUFFIXES)
+    }
+    return [name for name in names if name != "index.html"], listing
+
+
+def get_s3_sha256(s3_client, bucket_name: str, key: str) -> Optional[str]:
+    """Gets the sha256 of an object from its checksum or metadata, if recorded."""
+    response = s3_client.head_object(
+        Bucket=bucket_name, Key=key, ChecksumMode="ENABLED"
+    )
+    checksum = response.get("ChecksumSHA256")
+    # Checksums of multipart uploads ("<checksum>-<parts>") are not file hashes.
+    if checksum and "-" not in checksum:
+        return base64.b64decode(checksum).hex()
+    return response.get("Metadata", {}).get("checksum-sha256")
+
+
+def describe_s3_dist(
+    s3_client, bucket_name: str, subdir: str, filename: str, has_metadata: bool
+) -> dict:
+    key = f"{subdir}/{filename}"
+    hashes = {"sha256": get_s3_sha256(s3_client, bucket_name, key)}
+    if has_metadata:
+        hashes["metadata_sha256"] = get_s3_sha256(
+            s3_client, bucket_name, f"{key}.metadata"
+        )
+    return hashes
+
+
 def main(args):
-    objects = get_objects(args.bucket, args.subdir)
     url = f"https://{args.bucket}.{args.endpoint}/{args.subdir}"
+    if args.manifest or args.simple_dir:
+        s3_client = boto3.client("s3")
+        objects, listing = list_s3_dists(s3_client, args.bucket, args.subdir)
+        known = load_manifest(args.manifest) if args.manifest else {}
+        files, changed_projects = update_manifest(
+            known,
+            listing,
+            lambda filename: describe_s3_dist(
+                s3_client, args.bucket, args.subdir, filename, listing[filename][2]
+            ),
+        )
+        print(
+            f"Indexed {len(files)} packages, updated {len(changed_projects)} projects",
+            file=sys.stderr,
+        )
+        if args.simple_dir:
+            write_simple_index(
+                files, args.simple_dir, url, changed_projects if known else None
+            )
+        if args.manifest:
+            save_manifest(args.manifest, files)
+    else:
+        objects = get_objects(args.bucket, args.subdir)
 
     with sys.stdout if args.output == "-" else open(args.output, "w") as f:
         f.write(
@@ -0,0 +1,277 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for download_prerelease_packages.py.
+
+The tests run against an in-memory stand-in for the S3 client, so they need no
+network access or AWS credentials.
+"""
+
+import hashlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from botocore.exceptions import ClientError, ResponseStreamingError
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+import download_prerelease_packages
+from download_prerelease_packages import (
+    DownloadStats,
+    download_file,
+    download_files,
+    has_version_in_arch,
+    list_architectures,
+    list_packages_for_arch,
+)
+
+
+class DroppingBody(io.BytesIO):
+    """Response body whose connection drops after `limit` bytes."""
+
+    def __init__(self, data: bytes, limit: int):
+        super().__init__(data)
+        self.limit = limit
+
+    def read(self, size=-1):
+        if self.tell() >= self.limit:
+            raise ResponseStreamingError(error="Connection broken")
+        return super().read(min(size, self.limit - self.tell()))
+
+
+class FakeS3Client:
+    """Serves objects from a dict, with multipart ETags like S3."""
+
+    def __init__(self, objects: dict[str, bytes], part_size: int = 0):
+        self.objects = objects
+        self.part_size = part_size
+        self.list_calls = 0
+        self.get_calls = []
+        self.fail_after_gets = None
+        # Number of upcoming responses whose stream drops halfway.
+        self.drop_streams = 0
+
+    def _parts(self, key: str) -> list[bytes]:
+        data = self.objects[key]
+        if not self.part_size or len(data) <= self.part_size:
+            return []
+        return [
+            data[i : i + self.part_size] for i in range(0, len(data), self.part_size)
+        ]
+
+    def etag(self, key: str) -> str:
+        parts = self._parts(key)
+        if not parts:
+            return f'"{hashlib.md5(self.objects[key]).hexdigest()}"'
+        digests = b"".join(hashlib.md5(part).digest() for part in parts)
+        return f'"{hashlib.md5(digests).hexdigest()}-{len(parts)}"'
+
+    def get_paginator(self, name):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                client.list_calls += 1
+                keys = sorted(k for k in client.objects if k.startswith(Prefix))
+                # Two pages, like a truncated listing.
+                for page in (keys[: len(keys) // 2], keys[len(keys) // 2 :]):
+                    yield {
+                        "Contents": [
+                            {"Key": k, "Size": len(client.objects[k])} for k in page
+                        ]
+                    }
+
+        return Paginator()
+
+    def head_object(self, Bucket, Key, PartNumber=None):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        parts = self._parts(Key)
+        length = len(self.objects[Key])
+        if PartNumber is not None and parts:
+            length = len(parts[PartNumber - 1])
+        return {"ETag": self.etag(Key), "ContentLength": length}
+
+    def get_object(self, Bucket, Key, Range=None, PartNumber=None):
+        if self.fail_after_gets is not None:
+            if len(self.get_calls) >= self.fail_after_gets:
+                raise ClientError({"Error": {"Code": "SlowDown"}}, "GetObject")
+        self.get_calls.append((Key, Range, PartNumber))
+        data = self.objects[Key]
+        if PartNumber is not None:
+            data = self._parts(Key)[PartNumber - 1]
+        elif Range is not None:
+            data = data[int(Range[len("bytes=") :].rstrip("-")) :]
+        if self.drop_streams:
+            self.drop_streams -= 1
+            return {"Body": DroppingBody(data, len(data) // 2)}
+        return {"Body": io.BytesIO(data)}
+
+
+class DownloadPrereleasePackagesTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_listing_is_shared_across_architectures(self):
+        client = FakeS3Client(
+            {
+                "v3/whl/gfx1151/rocm_sdk_core-7.10.0rc2-py3-none-linux_x86_64.whl": b"a",
+                "v3/whl/gfx1151/numpy-2.0.0-cp312-cp312-linux_x86_64.whl": b"bb",
+                "v3/whl/gfx1151/index.html": b"",
+                "v3/whl/gfx950-dcgpu/torch-2.9.0+rocm7.10.0rc2-cp312.whl": b"c",
+                "v3/whl/gfx950-dcgpu/other-1.0.tar.gz": b"d",
+                "v3/whl/gfx90a/torch-2.9.0+rocm7.10.0rc1-cp312.whl": b"e",
+            }
+        )
+        self.assertEqual(
+            list_architectures(client, "bucket", "v3/whl/", "7.10.0rc2"),
+            ["gfx1151", "gfx950-dcgpu"],
+        )
+        self.assertFalse(
+            has_version_in_arch(client, "bucket", "v3/whl/", "gfx90a", "7.10.0rc2")
+        )
+        self.assertEqual(
+            list_packages_for_arch(client, "bucket", "v3/whl/", "gfx950-dcgpu", "rc2"),
+            (
+                [("v3/whl/gfx950-dcgpu/torch-2.9.0+rocm7.10.0rc2-cp312.whl", 1)],
+                [],
+                [("v3/whl/gfx950-dcgpu/other-1.0.tar.gz", 1)],
+            ),
+        )
+        self.assertEqual(client.list_calls, 1)
+
+    def test_download_and_skip_existing(self):
+        objects = {f"v3/whl/gfx1151/pkg{i}.whl": os.urandom(1000 + i) for i in range(6)}
+        client = FakeS3Client(objects)
+        listed = [(key, len(data)) for key, data in objects.items()]
+        stats = DownloadStats()
+        self.assertEqual(
+            download_files(
+                client, "bucket", listed, self.temp_dir, jobs=3, stats=stats
+            ),
+            (6, 0),
+        )
+        for key, data in objects.items():
+            self.assertEqual((self.temp_dir / key.split("/")[-1]).read_bytes(), data)
+        self.assertEqual(stats.files, 6)
+        self.assertEqual(stats.downloaded_bytes, sum(map(len, objects.values())))
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir)), [f"pkg{i}.whl" for i in range(6)]
+        )
+
+        client.get_calls.clear()
+        self.assertEqual(
+            download_files(client, "bucket", listed, self.temp_dir), (6, 0)
+        )
+        self.assertEqual(client.get_calls, [])
+
+    def test_multipart_download_resumes_missing_parts(self):
+        data = os.urandom(10 * 1024 + 17)
+        client = FakeS3Client({"big.tar.gz": data}, part_size=1024)
+        local_path = self.temp_dir / "big.tar.gz"
+
+        client.fail_after_gets = 4
+        self.assertFalse(
+            download_file(client, "bucket", "big.tar.gz", local_path, part_jobs=1)
+        )
+        self.assertFalse(local_path.exists())
+
+        client.fail_after_gets = None
+        client.get_calls.clear()
+        stats = DownloadStats()
+        self.assertTrue(
+            download_file(
+                client, "bucket", "big.tar.gz", local_path, part_jobs=3, stats=stats
+            )
+        )
+        self.assertEqual(local_path.read_bytes(), data)
+        self.assertEqual(
+            sorted(part for _, _, part in client.get_calls), list(range(5, 12))
+        )
+        self.assertEqual(stats.resumed_bytes, 4 * 1024)
+        self.assertEqual(os.listdir(self.temp_dir), ["big.tar.gz"])
+
+    def test_single_part_download_resumes_with_range(self):
+        data = os.urandom(5000)
+        client = FakeS3Client({"pkg.whl": data})
+        local_path = self.temp_dir / "pkg.whl"
+        download_prerelease_packages._save_part_state(
+            self.temp_dir / "pkg.whl.part.json",
+            {"etag": client.etag("pkg.whl"), "size": len(data)},
+        )
+        (self.temp_dir / "pkg.whl.part").write_bytes(data[:3000])
+
+        self.assertTrue(download_file(client, "bucket", "pkg.whl", local_path))
+        self.assertEqual(local_path.read_bytes(), data)
+        self.assertEqual(client.get_calls, [("pkg.whl", "bytes=3000-", None)])
+
+    @mock.patch.object(download_prerelease_packages, "STREAM_RETRY_BACKOFF_SECONDS", 0)
+    def test_dropped_stream_continues_from_offset(self):
+        data = os.urandom(5000)
+        client = FakeS3Client({"pkg.whl": data})
+        client.drop_streams = 2
+        local_path = self.temp_dir / "pkg.whl"
+
+        self.assertTrue(download_file(client, "bucket", "pkg.whl", local_path))
+        self.assertEqual(local_path.read_bytes(), data)
+        self.assertEqual(
+            client.get_calls,
+            [
+                ("pkg.whl", "bytes=0-", None),
+                ("pkg.whl", "bytes=2500-", None),
+                ("pkg.whl", "bytes=3750-", None),
+            ],
+        )
+
+    @mock.patch.object(download_prerelease_packages, "STREAM_RETRY_BACKOFF_SECONDS", 0)
+    def test_dropped_part_stream_is_refetched(self):
+        data = os.urandom(4 * 1024 + 17)
+        client = FakeS3Client({"big.tar.gz": data}, part_size=1024)
+        client.drop_streams = 1
+        local_path = self.temp_dir / "big.tar.gz"
+
+        self.assertTrue(
+            download_file(client, "bucket", "big.tar.gz", local_path, part_jobs=1)
+        )
+        self.assertEqual(local_path.read_bytes(), data)
+        self.assertEqual([part for _, _, part in client.get_calls], [1, 1, 2, 3, 4, 5])
+
+    @mock.patch.object(download_prerelease_packages, "STREAM_RETRY_BACKOFF_SECONDS", 0)
+    def test_persistently_dropped_stream_is_a_failure(self):
+        data = os.urandom(5000)
+        client = FakeS3Client({"pkg.whl": data})
+        client.drop_streams = 100
+        local_path = self.temp_dir / "pkg.whl"
+
+        self.assertFalse(download_file(client, "bucket", "pkg.whl", local_path))
+        self.assertEqual(
+            len(client.get_calls), download_prerelease_packages.STREAM_ATTEMPTS
+        )
+        # The partial download is kept for a later resume.
+        self.assertTrue((self.temp_dir / "pkg.whl.part").exists())
+
+    def test_checksum_mismatch_is_a_failure(self):
+        data = os.urandom(3000)
+        client = FakeS3Client({"pkg.whl": data})
+        etag = client.etag("pkg.whl")
+        client.objects["pkg.whl"] = data[:-1] + bytes([data[-1] ^ 1])
+        client.etag = lambda key: etag
+        local_path = self.temp_dir / "pkg.whl"
+
+        self.assertFalse(download_file(client, "bucket", "pkg.whl", local_path))
+        self.assertEqual(os.listdir(self.temp_dir), [])
+        self.assertTrue(
+            download_file(client, "bucket", "pkg.whl", local_path, verify=False)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the simple index generation in generate_release_index.py."""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent / "python"))
+import generate_release_index
+from generate_release_index import (
+    load_manifest,
+    parse_dist_filename,
+    update_local_index,
+)
+
+
+def _write_wheel(path: Path, metadata: bytes):
+    name, version = path.name.split("-")[:2]
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(f"{name}/__init__.py", "")
+        zf.writestr(f"{name}-{version}.dist-info/METADATA", metadata)
+
+
+class GenerateReleaseIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.dist_dir = Path(tempfile.mkdtemp())
+        self.simple_dir = self.dist_dir / "simple"
+
+    def tearDown(self):
+        shutil.rmtree(self.dist_dir, ignore_errors=True)
+
+    def test_parse_dist_filename(self):
+        self.assertEqual(
+            parse_dist_filename("rocm_sdk_core-7.10.0-py3-none-linux_x86_64.whl"),
+            ("rocm-sdk-core", "7.10.0"),
+        )
+        self.assertEqual(
+            parse_dist_filename("torch-2.7.1+rocm7.10.0-cp312-cp312-win_amd64.whl"),
+            ("torch", "2.7.1+rocm7.10.0"),
+        )
+        self.assertEqual(
+            parse_dist_filename("Typing.Extensions-4.0.tar.gz"),
+            ("typing-extensions", "4.0"),
+        )
+        self.assertIsNone(parse_dist_filename("index.html"))
+
+    def test_pages_and_metadata(self):
+        wheel = self.dist_dir / "rocm_sdk_core-7.10.0-py3-none-linux_x86_64.whl"
+        _write_wheel(wheel, b"Metadata-Version: 2.1\nName: rocm-sdk-core\n")
+        (self.dist_dir / "rocm-7.10.0.tar.gz").write_bytes(b"sdist")
+
+        update_local_index(self.dist_dir)
+
+        metadata = Path(f"{wheel}.metadata").read_bytes()
+        self.assertEqual(metadata, b"Metadata-Version: 2.1\nName: rocm-sdk-core\n")
+        page = (self.simple_dir / "rocm-sdk-core" / "index.html").read_text()
+        wheel_sha256 = hashlib.sha256(wheel.read_bytes()).hexdigest()
+        metadata_sha256 = hashlib.sha256(metadata).hexdigest()
+        self.assertIn(
+            f'<a href="../../{wheel.name}#sha256={wheel_sha256}"'
+            f' data-dist-info-metadata="sha256={metadata_sha256}"'
+            f' data-core-metadata="sha256={metadata_sha256}">{wheel.name}</a>',
+            page,
+        )
+        sdist_page = (self.simple_dir / "rocm" / "index.html").read_text()
+        self.assertIn(
+            f'<a href="../../rocm-7.10.0.tar.gz#sha256={hashlib.sha256(b"sdist").hexdigest()}">',
+            sdist_page,
+        )
+        root_page = (self.simple_dir / "index.html").read_text()
+        self.assertIn('<a href="rocm/">rocm</a>', root_page)
+        self.assertIn('<a href="rocm-sdk-core/">rocm-sdk-core</a>', root_page)
+
+    def test_only_changes_are_applied(self):
+        for name in ["numpy-2.0.0", "rocm-7.10.0", "rocm-7.10.1"]:
+            (self.dist_dir / f"{name}.tar.gz").write_bytes(name.encode())
+        self.assertEqual(len(update_local_index(self.dist_dir)), 3)
+        self.assertEqual(
+            set(load_manifest(self.dist_dir / "index-manifest.json")),
+            {"numpy-2.0.0.tar.gz", "rocm-7.10.0.tar.gz", "rocm-7.10.1.tar.gz"},
+        )
+
+        # Nothing changed: no package is hashed again and no page is written.
+        with mock.patch.object(
+            generate_release_index, "describe_local_dist"
+        ) as describe:
+            self.assertEqual(update_local_index(self.dist_dir), [])
+        describe.assert_not_called()
+
+        (self.dist_dir / "rocm-7.10.1.tar.gz").unlink()
+        (self.dist_dir / "rocm-7.10.2.tar.gz").write_bytes(b"new")
+        (self.dist_dir / "numpy-2.0.0.tar.gz").unlink()
+        with mock.patch.object(
+            generate_release_index,
+            "describe_local_dist",
+            wraps=generate_release_index.describe_local_dist,
+        ) as describe:
+            updated = update_local_index(self.dist_dir)
+        describe.assert_called_once_with(self.dist_dir, "rocm-7.10.2.tar.gz")
+        self.assertEqual(
+            updated,
+            [
+                self.simple_dir / "numpy" / "index.html",
+                self.simple_dir / "rocm" / "index.html",
+                self.simple_dir / "index.html",
+            ],
+        )
+        self.assertFalse((self.simple_dir / "numpy").exists())
+        page = (self.simple_dir / "rocm" / "index.html").read_text()
+        self.assertIn("rocm-7.10.2.tar.gz", page)
+        self.assertNotIn("rocm-7.10.1.tar.gz", page)
+
+
+if __name__ == "__main__":
+    unittest.main()
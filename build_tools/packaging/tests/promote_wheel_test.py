@@ -0,0 +1,271 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for wheel promotion in promote_from_rc_to_final.py.
+
+Unlike promote_from_rc_to_final_test.py, these use small synthetic wheels and
+need no network access.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from pkginfo import Wheel
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+import promote_from_rc_to_final
+from promote_from_rc_to_final import _record_hash
+
+
+class _UnseekableFile(io.RawIOBase):
+    """Write-only stream that makes zipfile use data descriptors."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        return self.f.write(b)
+
+
+def _write_wheel(path: Path, files: dict[str, bytes], stream: bool = False):
+    name, version = path.name.split("-")[:2]
+    dist_info = f"{name}-{version}.dist-info"
+    files = {
+        **files,
+        f"{dist_info}/WHEEL": b"Wheel-Version: 1.0\nTag: py3-none-linux_x86_64\n",
+    }
+    records = [[n, _record_hash(data), str(len(data))] for n, data in files.items()]
+    records.append([f"{dist_info}/RECORD", "", ""])
+    record_text = io.StringIO()
+    csv.writer(record_text, lineterminator="\n").writerows(records)
+    with contextlib.ExitStack() as stack:
+        f = stack.enter_context(open(path, "wb"))
+        if stream:
+            f = _UnseekableFile(f)
+        zf = stack.enter_context(
+            zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED)
+        )
+        for n, data in files.items():
+            zf.writestr(n, data)
+        zf.writestr(f"{dist_info}/RECORD", record_text.getvalue())
+
+
+def _raw_member(path: Path, name: str) -> tuple[int, int, int]:
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+        return info.CRC, info.compress_size, info.compress_type
+
+
+def _local_extra_ids(path: Path, name: str) -> list[int]:
+    """Returns the ids of the extra fields in the local header of a member."""
+    with zipfile.ZipFile(path) as zf:
+        header_offset = zf.getinfo(name).header_offset
+    with open(path, "rb") as f:
+        f.seek(header_offset)
+        header = struct.unpack(zipfile.structFileHeader, f.read(zipfile.sizeFileHeader))
+        f.seek(header[zipfile._FH_FILENAME_LENGTH], os.SEEK_CUR)
+        extra = f.read(header[zipfile._FH_EXTRA_FIELD_LENGTH])
+    ids = []
+    while extra:
+        field_id, field_size = struct.unpack("<HH", extra[:4])
+        ids.append(field_id)
+        extra = extra[4 + field_size :]
+    return ids
+
+
+class PromoteWheelTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assertValidRecord(self, wheel: Path):
+        with zipfile.ZipFile(wheel) as zf:
+            self.assertIsNone(zf.testzip())
+            (record_name,) = [n for n in zf.namelist() if n.endswith("/RECORD")]
+            rows = list(csv.reader(io.StringIO(zf.read(record_name).decode())))
+            self.assertEqual(
+                sorted(row[0] for row in rows),
+                sorted(n for n in zf.namelist() if not n.endswith("/")),
+            )
+            for name, digest, size in rows:
+                if name == record_name:
+                    continue
+                data = zf.read(name)
+                self.assertEqual((digest, size), (_record_hash(data), str(len(data))))
+
+    def test_promote_rocm_wheel(self):
+        wheel = (
+            self.temp_dir
+            / "rocm_sdk_libraries_gfx94x_dcgpu-7.10.0rc1-py3-none-linux_x86_64.whl"
+        )
+        package_dir = "rocm_sdk_libraries_gfx94X-dcgpu"
+        dist_info = "rocm_sdk_libraries_gfx94x_dcgpu-7.10.0rc1.dist-info"
+        _write_wheel(
+            wheel,
+            {
+                f"{package_dir}/_dist_info.py": b'__version__ = "7.10.0rc1"\n',
+                f"{package_dir}/lib/libfoo.so": os.urandom(1 << 16) + bytes(1 << 16),
+                f"{dist_info}/METADATA": b"Metadata-Version: 2.1\n"
+                b"Name: rocm-sdk-libraries-gfx94X-dcgpu\nVersion: 7.10.0rc1\n\n"
+                b"Version: 7.10.0rc1 in the description\n",
+            },
+        )
+        raw_before = _raw_member(wheel, f"{package_dir}/lib/libfoo.so")
+
+        promote_from_rc_to_final.main(self.temp_dir, delete=True, jobs=2)
+
+        new_wheel = wheel.with_name(wheel.name.replace("7.10.0rc1", "7.10.0"))
+        self.assertFalse(wheel.exists())
+        self.assertEqual(Wheel(new_wheel).version, "7.10.0")
+        self.assertValidRecord(new_wheel)
+        new_dist_info = "rocm_sdk_libraries_gfx94x_dcgpu-7.10.0.dist-info"
+        with zipfile.ZipFile(new_wheel) as zf:
+            self.assertEqual(
+                zf.read(f"{package_dir}/_dist_info.py"), b'__version__ = "7.10.0"\n'
+            )
+            self.assertTrue(
+                zf.read(f"{new_dist_info}/METADATA").endswith(
+                    b"Version: 7.10.0rc1 in the description\n"
+                )
+            )
+            self.assertIn(f"{new_dist_info}/WHEEL", zf.namelist())
+        self.assertEqual(
+            _raw_member(new_wheel, f"{package_dir}/lib/libfoo.so"), raw_before
+        )
+
+    def test_promote_torch_wheel_copies_members_verbatim(self):
+        wheel = self.temp_dir / "torch-2.7.1+rocm7.10.0rc1-cp312-cp312-linux_x86_64.whl"
+        dist_info = "torch-2.7.1+rocm7.10.0rc1.dist-info"
+        big = os.urandom(1 << 16) + bytes(1 << 16)
+        _write_wheel(
+            wheel,
+            {
+                "torch/version.py": b"__version__ = '2.7.1+rocm7.10.0rc1'\n",
+                "torch/_rocm_init.py": b"ROCM = '7.10.0rc1'\n",
+                "torch/lib/libtorch.so": big,
+                f"{dist_info}/METADATA": b"Metadata-Version: 2.1\nName: torch\n"
+                b"Version: 2.7.1+rocm7.10.0rc1\n"
+                b"Requires-Dist: rocm[libraries]==7.10.0rc1\n"
+                b"Requires-Dist: other==7.10.0rc1\n",
+            },
+        )
+        raw_before = _raw_member(wheel, "torch/lib/libtorch.so")
+
+        promote_from_rc_to_final.main(self.temp_dir)
+
+        new_wheel = (
+            self.temp_dir / "torch-2.7.1+rocm7.10.0-cp312-cp312-linux_x86_64.whl"
+        )
+        self.assertTrue(wheel.exists())
+        self.assertEqual(Wheel(new_wheel).version, "2.7.1+rocm7.10.0")
+        self.assertValidRecord(new_wheel)
+        self.assertEqual(_raw_member(new_wheel, "torch/lib/libtorch.so"), raw_before)
+        with zipfile.ZipFile(new_wheel) as zf:
+            self.assertEqual(zf.read("torch/lib/libtorch.so"), big)
+            self.assertEqual(zf.read("torch/_rocm_init.py"), b"ROCM = '7.10.0'\n")
+            self.assertEqual(
+                zf.read("torch-2.7.1+rocm7.10.0.dist-info/METADATA"),
+                b"Metadata-Version: 2.1\nName: torch\nVersion: 2.7.1+rocm7.10.0\n"
+                b"Requires-Dist: rocm[libraries]==7.10.0\n"
+                b"Requires-Dist: other==7.10.0rc1\n",
+            )
+
+    def _write_rocm_wheel(
+        self, name: str, files: dict[str, bytes], stream: bool = False
+    ) -> Path:
+        wheel = self.temp_dir / f"{name}-7.10.0rc1-py3-none-linux_x86_64.whl"
+        metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: 7.10.0rc1\n"
+        _write_wheel(
+            wheel,
+            {**files, f"{name}-7.10.0rc1.dist-info/METADATA": metadata.encode()},
+            stream=stream,
+        )
+        return wheel
+
+    def test_data_descriptor_and_zip64_members_round_trip(self):
+        big = os.urandom(1 << 13)
+        # Members past the (lowered) zip64 limit need zip64 extra fields.
+        with mock.patch.object(zipfile, "ZIP64_LIMIT", 1 << 12):
+            wheel = self._write_rocm_wheel(
+                "rocm_sdk_core",
+                {
+                    "rocm_sdk_core/_dist_info.py": b'__version__ = "7.10.0rc1"\n',
+                    "rocm_sdk_core/lib/libbig.so": big,
+                    "rocm_sdk_core/lib/libsmall.so": b"small",
+                },
+                stream=True,
+            )
+            with zipfile.ZipFile(wheel) as zf:
+                self.assertTrue(all(i.flag_bits & 0x08 for i in zf.infolist()))
+            new_wheel = promote_from_rc_to_final.rewrite_wheel_version(
+                wheel, promote_from_rc_to_final.Version("7.10.0"), log=lambda _: None
+            )
+
+        self.assertValidRecord(new_wheel)
+        with zipfile.ZipFile(new_wheel) as zf:
+            self.assertEqual(zf.read("rocm_sdk_core/lib/libbig.so"), big)
+            self.assertEqual(zf.read("rocm_sdk_core/lib/libsmall.so"), b"small")
+            for name in [
+                "rocm_sdk_core/lib/libbig.so",
+                "rocm_sdk_core/lib/libsmall.so",
+            ]:
+                self.assertFalse(zf.getinfo(name).flag_bits & 0x08, name)
+        self.assertIn(1, _local_extra_ids(new_wheel, "rocm_sdk_core/lib/libbig.so"))
+        self.assertNotIn(
+            1, _local_extra_ids(new_wheel, "rocm_sdk_core/lib/libsmall.so")
+        )
+        self.assertEqual(
+            _raw_member(new_wheel, "rocm_sdk_core/lib/libbig.so"),
+            _raw_member(wheel, "rocm_sdk_core/lib/libbig.so"),
+        )
+
+    def test_missing_rewrite_target_is_an_error(self):
+        wheel = self._write_rocm_wheel(
+            "rocm_sdk_core", {"rocm_sdk_core/__init__.py": b""}
+        )
+
+        with self.assertRaisesRegex(ValueError, "rocm_sdk_core/_dist_info.py"):
+            promote_from_rc_to_final.rewrite_wheel_version(
+                wheel, promote_from_rc_to_final.Version("7.10.0"), log=lambda _: None
+            )
+        self.assertEqual(list(self.temp_dir.iterdir()), [wheel])
+
+    def test_concurrent_output_is_grouped_per_wheel(self):
+        wheels = [
+            self._write_rocm_wheel(
+                name, {f"{name}/_dist_info.py": b'__version__ = "7.10.0rc1"\n'}
+            )
+            for name in ["rocm_sdk_core", "rocm_sdk_devel", "rocm_sdk_libraries"]
+        ]
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            promote_from_rc_to_final.main(self.temp_dir, jobs=3)
+
+        lines = output.getvalue().splitlines()
+        for wheel in wheels:
+            start = lines.index(f"Promoting whl from rc to final: {wheel}")
+            block = lines[start : start + 8]
+            name = wheel.name.split("-")[0]
+            self.assertEqual(block[5], f"      {name}/_dist_info.py")
+            self.assertEqual(block[6], f"      {name}-7.10.0rc1.dist-info/METADATA")
+            self.assertTrue(block[7].startswith("New wheel has 7.10.0"), block)
+
+
+if __name__ == "__main__":
+    unittest.main()
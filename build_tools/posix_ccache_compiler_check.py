@@ -4,17 +4,19 @@
 """Script meant to be used in the ccache compiler_check directive on POSIX.
 
 Syntax:
-  posix_ccache_compiler_check.py compiler_check_cache_dir compiler_path
+  posix_ccache_compiler_check.py compiler_check_cache_dir compiler_path \
+      [stat_signature]
 
 It expects one argument for the compiler path to check and will print a
 fingerprint for the compiler that should be stable across builds. CCache then
 will hash this fingerprint and include it in the cache key for any uses of the
 compiler.
 
-Currently, the algorithm simply passes the compiler binary and every valid
-shared library (skipping loader libraries) to sha256sum and post processes
-it to eliminate absolute path names that cause false cache misses. This result
-should be deterministic for all compilers built in the same way.
+Currently, the algorithm simply computes the sha256 of the compiler binary and
+every valid shared library (skipping loader libraries), hashing the files in
+parallel, and emits them in `sha256sum` order with absolute path names reduced
+to basenames, since they cause false cache misses. This result should be
+deterministic for all compilers built in the same way.
 
 Because this script is very hot (it is invoked for every invocation of ccache),
 we take some extra pains to maintain directory of fingerprint caches. This
@@ -23,6 +25,12 @@ and merely serves to save excess fingerprinting. It is always safe to
 delete this cache, and it doesn't cost much to store excess variants, so we
 take no effort to maintain it.
 
+The hottest path avoids Python entirely: posix_ccache_compiler_check.sh looks
+the compiler up in the `fast/` index of the same directory and only runs this
+script on a miss, passing the `stat` signature it computed. This script then
+writes the index entry (the signature line followed by the fingerprint) for
+the next invocation.
+
 This script is typically snapshotted into the ccache directory and hardcoded
 in configurations.
 
@@ -32,13 +40,46 @@ ccache works, consult with someone who does.
 """
 
 import hashlib
+import os
 from pathlib import Path
 import sys
 
 compiler_hash_cache_dir = Path(sys.argv[1])
-compiler_exe = Path(sys.argv[2]).resolve()
+compiler_arg = sys.argv[2]
+stat_signature = sys.argv[3] if len(sys.argv) > 3 else None
+compiler_exe = Path(compiler_arg).resolve()
 compiler_exe_stat = compiler_exe.stat()
 
+
+def atomic_write_text(path: Path, contents: str):
+    # Atomically write a cache file using rename. It is ok if this is racy: we
+    # just need it to be atomic.
+    commit_file = Path(f"{path}.tmp{os.getpid()}")
+    try:
+        commit_file.parent.mkdir(parents=True, exist_ok=True)
+        commit_file.write_text(contents)
+        os.rename(commit_file, path)
+    except OSError:
+        # Ignore.
+        ...
+    try:
+        commit_file.unlink()
+    except OSError:
+        # Ignore.
+        ...
+
+
+def write_fast_index_entry(fingerprint: str):
+    # Must match the entry naming in posix_ccache_compiler_check.sh.
+    if stat_signature is None:
+        return
+    entry_name = compiler_arg.replace("%", "%25").replace("/", "%2F")
+    atomic_write_text(
+        compiler_hash_cache_dir / "fast" / entry_name,
+        f"{stat_signature}\n{fingerprint}\n",
+    )
+
+
 # First hash the canonical path of the compiler and the mtime. We use this to
 # store a full compiler check output in the compiler_hash dir by this hash.
 fingerprint_version = 1
@@ -50,16 +91,26 @@ compiler_exe_path_hash_file = compiler_hash_cache_dir / compiler_exe_path_hash
 
 # Common case: We have previously computed this. Just read the file and print it.
 if compiler_exe_path_hash_file.exists():
-    print(compiler_exe_path_hash_file.read_text())
+    compiler_fingerprint = compiler_exe_path_hash_file.read_text()
+    write_fast_index_entry(compiler_fingerprint)
+    print(compiler_fingerprint)
     sys.exit(0)
 
 
 # Cache miss: compute a full content hash.
-import os
+from concurrent.futures import ThreadPoolExecutor
 import re
 import subprocess
 
 
+def sha256_file(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
 def compute_compiler_fingerprint():
     ldd_lines = (
         subprocess.check_output(["ldd", str(compiler_exe)]).decode().splitlines()
@@ -83,37 +134,18 @@ def compute_compiler_fingerprint():
             continue
         lib_paths.append(lib_path_str)
 
-    def _norm_fingerprint_path(line: str):
-        # Line is: {hash} {path}
-        # Rewrite the path to just be the basename.
-        hash, path_str = line.split(None, 2)
-        path_str = str(Path(path_str).name)
-        return f"{hash}\t{path_str}"
-
-    raw_fingerprint_lines = (
-        subprocess.check_output(["sha256sum"] + lib_paths).decode().splitlines()
-    )
-    fingerprint_lines = [_norm_fingerprint_path(line) for line in raw_fingerprint_lines]
+    # hashlib releases the GIL while hashing, so threads hash libraries in
+    # parallel. Lines are {hash}\t{basename}, in the order given to sha256sum
+    # by earlier versions of this script (keeping fingerprints unchanged).
+    with ThreadPoolExecutor(max_workers=min(8, len(lib_paths))) as executor:
+        hashes = list(executor.map(sha256_file, lib_paths))
+    fingerprint_lines = [
+        f"{hash}\t{Path(path_str).name}" for hash, path_str in zip(hashes, lib_paths)
+    ]
     return "\n".join(fingerprint_lines)
 
 
 compiler_fingerprint = compute_compiler_fingerprint()
-
-# Atomically write the hash cache file using rename. It is ok if this is
-# racy: we just need it to be atomic.
-hash_commit_file = Path(f"{compiler_exe_path_hash_file}.tmp{os.getpid()}")
-hash_commit_file.parent.mkdir(parents=True, exist_ok=True)
-try:
-    hash_commit_file.write_text(compiler_fingerprint)
-    os.rename(hash_commit_file, compiler_exe_path_hash_file)
-except OSError:
-    # Ignore.
-    ...
-
-try:
-    hash_commit_file.unlink()
-except OSError:
-    # Ignore.
-    ...
-
+atomic_write_text(compiler_exe_path_hash_file, compiler_fingerprint)
+write_fast_index_entry(compiler_fingerprint)
 print(compiler_fingerprint)
@@ -0,0 +1,40 @@
+#!/bin/bash
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+#
+# Fast path for the ccache compiler_check directive on POSIX.
+#
+# Syntax:
+#   posix_ccache_compiler_check.sh python_exe compiler_check_py \
+#       compiler_check_cache_dir compiler_path
+#
+# ccache runs the compiler check for every compilation, so this avoids
+# starting a Python interpreter when the fingerprint of the compiler is
+# already known. posix_ccache_compiler_check.py maintains a fingerprint index
+# under `compiler_check_cache_dir/fast`, with one entry per compiler path. The
+# first line of an entry is the `stat` signature (device, inode, size and
+# mtime) of the compiler it was computed for and the remaining lines are the
+# fingerprint. If the signature still matches, the fingerprint is printed
+# using only shell builtins and a single `stat`. Otherwise the Python script
+# computes the fingerprint (printing exactly the same output) and refreshes
+# the entry.
+#
+# This script is typically snapshotted into the ccache directory next to the
+# Python script by setup_ccache.py. See that script for validation steps.
+
+python_exe="$1"
+check_script="$2"
+cache_dir="$3"
+compiler="$4"
+
+if signature="$(TZ=UTC stat -L -c '%d:%i:%s:%y' -- "$compiler" 2>/dev/null)"; then
+  entry_name="${compiler//\%/%25}"
+  entry="${cache_dir}/fast/${entry_name//\//%2F}"
+  if [[ -r "$entry" ]] && mapfile -t lines < "$entry" &&
+    [[ "${lines[0]}" == "$signature" && ${#lines[@]} -gt 1 ]]; then
+    printf '%s\n' "${lines[@]:1}"
+    exit 0
+  fi
+  exec "$python_exe" "$check_script" "$cache_dir" "$compiler" "$signature"
+fi
+exec "$python_exe" "$check_script" "$cache_dir" "$compiler"
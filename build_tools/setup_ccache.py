@@ -26,6 +26,7 @@ Typical usage for the current shell (will set the CCACHE_CONFIGPATH var):
 
 import argparse
 from pathlib import Path
+import shutil
 import sys
 import subprocess
 
@@ -33,6 +34,8 @@ THIS_DIR = Path(__file__).resolve().parent
 REPO_ROOT = THIS_DIR.parent
 POSIX_CCACHE_COMPILER_CHECK_PATH = THIS_DIR / "posix_ccache_compiler_check.py"
 POSIX_COMPILER_CHECK_SCRIPT = POSIX_CCACHE_COMPILER_CHECK_PATH.read_text()
+POSIX_CCACHE_COMPILER_CHECK_SH_PATH = THIS_DIR / "posix_ccache_compiler_check.sh"
+POSIX_COMPILER_CHECK_SH_SCRIPT = POSIX_CCACHE_COMPILER_CHECK_SH_PATH.read_text()
 CACHE_SRV = "http://bazelremote-svc.bazelremote-ns.svc.cluster.local:8080|layout=bazel|connect-timeout=50"
 
 # See https://ccache.dev/manual/4.6.1.html#_configuration
@@ -55,6 +58,22 @@ CONFIG_PRESETS_MAP = {
 }
 
 
+def gen_compiler_check_command(dir: Path, compiler_check_file: Path) -> str:
+    """Gets the ccache compiler_check command.
+
+    When bash is available, the shell fast path answers cache hits from the
+    fingerprint index without starting Python.
+    """
+    python_command = (
+        f"{sys.executable} {compiler_check_file} {dir / 'compiler_check_cache'}"
+    )
+    bash = shutil.which("bash")
+    if bash is None:
+        return f"{python_command} %compiler%"
+    compiler_check_sh_file = compiler_check_file.with_suffix(".sh")
+    return f"{bash} {compiler_check_sh_file} {python_command} %compiler%"
+
+
 def gen_config(dir: Path, compiler_check_file: Path, args: argparse.Namespace):
     lines = []
 
@@ -88,8 +107,7 @@ def gen_config(dir: Path, compiler_check_file: Path, args: argparse.Namespace):
 
     # Compiler check.
     lines.append(
-        f"compiler_check = {sys.executable} {compiler_check_file} "
-        f"{dir / 'compiler_check_cache'} %compiler%"
+        f"compiler_check = {gen_compiler_check_command(dir, compiler_check_file)}"
     )
 
     # Slop settings.
@@ -112,6 +130,7 @@ def run(args: argparse.Namespace):
     dir: Path = args.dir
     config_file = dir / "ccache.conf"
     compiler_check_file = dir / "compiler_check.py"
+    compiler_check_sh_file = compiler_check_file.with_suffix(".sh")
 
     config_contents = gen_config(dir, compiler_check_file, args)
     compiler_check_script = POSIX_COMPILER_CHECK_SCRIPT
@@ -120,6 +139,7 @@ def run(args: argparse.Namespace):
         dir.mkdir(parents=True, exist_ok=True)
         config_file.write_text(config_contents)
         compiler_check_file.write_text(compiler_check_script)
+        compiler_check_sh_file.write_text(POSIX_COMPILER_CHECK_SH_SCRIPT)
 
     else:
         # Check to see if updated.
@@ -128,14 +148,15 @@ def run(args: argparse.Namespace):
                 f"NOTE: {config_file} does not match expected. Run with --init to regenerate",
                 file=sys.stderr,
             )
-        if (
-            not compiler_check_file.exists()
-            or compiler_check_file.read_text() != compiler_check_script
-        ):
-            print(
-                f"NOTE: {compiler_check_file} does not match expected. Run with --init to regenerate it",
-                file=sys.stderr,
-            )
+        for check_file, check_script in [
+            (compiler_check_file, compiler_check_script),
+            (compiler_check_sh_file, POSIX_COMPILER_CHECK_SH_SCRIPT),
+        ]:
+            if not check_file.exists() or check_file.read_text() != check_script:
+                print(
+                    f"NOTE: {check_file} does not match expected. Run with --init to regenerate it",
+                    file=sys.stderr,
+                )
 
     # Reset statistic counters
     if args.reset_stats:
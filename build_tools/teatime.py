@@ -28,6 +28,16 @@ Other arguments:
 * --log-timestamps: Log lines will be written with a starting column of the
   time in seconds since start, and a header/trailer will be added with more
   timing information.
+* --capture-memory-mb N: In non-interactive mode, output is captured so that it
+  can be dumped on failure. Only the most recent N MiB are kept in memory;
+  older output is spilled to a temporary file (default: 16).
+
+Output is processed in batches of whatever the child has written so far: log
+lines in a batch share one timestamp. The log file is flushed by a background
+thread every LOG_FLUSH_INTERVAL seconds while it has unflushed output (and when
+finishing), so the log stays current when the child goes quiet or hangs. If
+the log file name ends with `.zst`, the log is written zstd-compressed
+(requires pyzstd).
 
 CI systems can set `TEATIME_LABEL_GH_GROUP=1` in the environment, which will
 cause labeled console output to be printed using GitHub Actions group markers
@@ -36,23 +46,118 @@ with interactive group handles.
 """
 
 import argparse
-import io
+import collections
 import os
 from pathlib import Path
 import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from typing import BinaryIO, Iterator
+
+# Maximum number of seconds between flushes of the log file.
+LOG_FLUSH_INTERVAL = 1.0
+
+# Maximum number of bytes read from the child per batch of lines.
+READ_BATCH_SIZE = 1 << 16
+
+
+class SpillBuffer:
+    """Write-only byte buffer keeping the most recent output in memory.
+
+    Once more than `max_memory_bytes` are buffered, the oldest data is moved
+    to an anonymous temporary file, so memory use stays bounded no matter how
+    much output a child produces. `dump()` writes everything back in order.
+    """
+
+    def __init__(self, max_memory_bytes: int):
+        self.max_memory_bytes = max_memory_bytes
+        self._chunks: collections.deque[bytes] = collections.deque()
+        self._memory_bytes = 0
+        self._spill_file: BinaryIO | None = None
+
+    @property
+    def spilled_bytes(self) -> int:
+        if self._spill_file is None:
+            return 0
+        return self._spill_file.tell()
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(data)
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes and self._chunks:
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile()
+            chunk = self._chunks.popleft()
+            self._spill_file.write(chunk)
+            self._memory_bytes -= len(chunk)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def dump(self, out: BinaryIO):
+        if self._spill_file is not None:
+            self._spill_file.seek(0)
+            shutil.copyfileobj(self._spill_file, out)
+        for chunk in self._chunks:
+            out.write(chunk)
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._chunks.clear()
+        self._memory_bytes = 0
+
+
+def _open_log_file(path: Path) -> BinaryIO:
+    if path.name.endswith(".zst"):
+        try:
+            import pyzstd
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "pyzstd is required for zstd-compressed log files. "
+                "Install it with: pip install pyzstd"
+            )
+        return pyzstd.ZstdFile(path, mode="wb")
+    return open(path, "wb")
+
+
+def iter_line_batches(stream: BinaryIO) -> Iterator[list[bytes]]:
+    """Yields lists of complete lines as they become available on a stream.
+
+    Each batch holds the lines from one read of up to READ_BATCH_SIZE bytes
+    (a partial trailing line is held back for the next batch). A final line
+    without a newline is yielded at EOF.
+    """
+    read = getattr(stream, "read1", stream.read)
+    pending = b""
+    while True:
+        data = read(READ_BATCH_SIZE)
+        if not data:
+            break
+        lines = (pending + data).splitlines(keepends=True)
+        pending = b"" if lines[-1].endswith(b"\n") else lines.pop()
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
 
 
 class OutputSink:
     def __init__(self, args: argparse.Namespace):
         self.start_time = time.time()
         self.interactive: bool = args.interactive
+        self.capture: SpillBuffer | None = None
         if self.interactive:
             self.out = sys.stdout.buffer
         else:
-            self.out = io.BytesIO()
+            self.capture = SpillBuffer(args.capture_memory_mb << 20)
+            self.out = self.capture
 
         # Label management.
         self.label: str | None = args.label
@@ -81,17 +186,43 @@ class OutputSink:
         self.log_file = None
         if self.log_path is not None:
             self.log_path.parent.mkdir(parents=True, exist_ok=True)
-            self.log_file = open(self.log_path, "wb")
+            self.log_file = _open_log_file(self.log_path)
         self.log_timestamps: bool = args.log_timestamps
+        # Guards log_file writes against the flusher thread.
+        self.log_lock = threading.Lock()
+        self.log_dirty = False
+        self.log_flusher: threading.Thread | None = None
+        self.log_flusher_stop = threading.Event()
 
     def start(self):
         if self.gh_group_label is not None:
             self.out.write(b"::group::" + self.gh_group_label + b"\n")
-        if self.log_file and self.log_timestamps:
-            self.log_file.write(f"BEGIN\t{self.start_time}\n".encode())
+        if self.log_file is not None:
+            if self.log_timestamps:
+                self.log_file.write(f"BEGIN\t{self.start_time}\n".encode())
+            self.log_flusher = threading.Thread(target=self._flush_log, daemon=True)
+            self.log_flusher.start()
+
+    def _flush_log(self):
+        """Flushes unflushed log output every LOG_FLUSH_INTERVAL seconds."""
+        while not self.log_flusher_stop.wait(LOG_FLUSH_INTERVAL):
+            with self.log_lock:
+                if self.log_dirty:
+                    self.log_file.flush()
+                    self.log_dirty = False
+
+    def write_log(self, data: bytes):
+        """Writes raw data to the log file (if any)."""
+        if self.log_file is not None:
+            with self.log_lock:
+                self.log_file.write(data)
+                self.log_dirty = True
 
     def finish(self, rc: int):
         end_time = time.time()
+        if self.log_flusher is not None:
+            self.log_flusher_stop.set()
+            self.log_flusher.join()
         if self.log_file is not None:
             if self.log_timestamps:
                 self.log_file.write(
@@ -109,21 +240,33 @@ class OutputSink:
             self.out.write(
                 b"[" + self.label + status_msg.encode() + run_pretty.encode() + b"]\n"
             )
+        if self.capture is not None:
+            self.capture.close()
 
     def writeline(self, line: bytes):
+        self.writelines([line])
+
+    def writelines(self, lines: list[bytes]):
+        """Writes a batch of lines, sharing one timestamp in the log."""
         if self.interactive_prefix is not None:
-            self.out.write(self.interactive_prefix)
-        self.out.write(line)
+            prefix = self.interactive_prefix
+            self.out.write(b"".join(prefix + line for line in lines))
+        else:
+            self.out.write(b"".join(lines))
         if self.interactive:
             self.out.flush()
         if self.log_file is not None:
             if self.log_timestamps:
                 now = time.time()
-                self.log_file.write(
-                    f"{round((now - self.start_time) * 10) / 10}\t".encode()
-                )
-            self.log_file.write(line)
-            self.log_file.flush()
+                stamp = f"{round((now - self.start_time) * 10) / 10}\t".encode()
+                self.write_log(b"".join(stamp + line for line in lines))
+            else:
+                self.write_log(b"".join(lines))
+
+    def dump_capture(self, out: BinaryIO):
+        """Writes captured (non-interactive) output to `out`."""
+        if self.capture is not None:
+            self.capture.dump(out)
 
 
 def run(args: argparse.Namespace, child_arg_list: list[str] | None, sink: OutputSink):
@@ -135,17 +278,15 @@ def run(args: argparse.Namespace, child_arg_list: list[str] | None, sink: Output
         # Subprocess mode.
         if sink.log_file:
             child_arg_list_pretty = shlex.join(child_arg_list)
-            sink.log_file.write(
-                f"EXEC\t{os.getcwd()}\t{child_arg_list_pretty}\n".encode()
-            )
+            sink.write_log(f"EXEC\t{os.getcwd()}\t{child_arg_list_pretty}\n".encode())
         child = subprocess.Popen(
             child_arg_list, stderr=subprocess.STDOUT, stdout=subprocess.PIPE
         )
         child_stream = child.stdout
 
     try:
-        for line in child_stream:
-            sink.writeline(line)
+        for lines in iter_line_batches(child_stream):
+            sink.writelines(lines)
     except KeyboardInterrupt:
         if child:
             child.terminate()
@@ -153,7 +294,7 @@ def run(args: argparse.Namespace, child_arg_list: list[str] | None, sink: Output
         rc = child.wait()
         if rc != 0 and not args.interactive:
             # Dump all output on failure.
-            sys.stdout.buffer.write(sink.out.getvalue())
+            sink.dump_capture(sys.stdout.buffer)
         sys.exit(rc)
 
 
@@ -185,7 +326,18 @@ def main(cl_args: list[str]):
         default=False,
         help="Log timestamps along with log lines to the log file",
     )
-    p.add_argument("file", type=Path, help="Also log output to this file")
+    p.add_argument(
+        "--capture-memory-mb",
+        type=int,
+        default=16,
+        help="MiB of non-interactive output kept in memory for dumping on "
+        "failure; older output is spilled to a temporary file",
+    )
+    p.add_argument(
+        "file",
+        type=Path,
+        help="Also log output to this file (zstd-compressed if it ends in .zst)",
+    )
     args = p.parse_args(cl_args)
 
     # Allow some things to be overriden by env vars.
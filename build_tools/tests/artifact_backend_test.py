@@ -4,20 +4,28 @@
 
 """Unit tests for artifact_backend.py."""
 
+import hashlib
+import io
 import os
+import shutil
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Dict, Tuple
 from unittest import mock
 
 sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
 
 from _therock_utils.artifact_backend import (
     ArtifactBackend,
+    ArtifactIndex,
+    ArtifactObject,
     LocalDirectoryBackend,
     S3Backend,
+    compile_artifact_filter,
     create_backend_from_env,
+    plan_artifact_copy,
 )
 from _therock_utils.workflow_outputs import WorkflowOutputRoot
 
@@ -275,6 +283,148 @@ class TestLocalDirectoryBackend(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.backend.copy_artifact("test.tar.zst", s3_source)
 
+    def test_list_objects_includes_sidecars(self):
+        """Test list_objects reports archives and sidecars with sizes."""
+        (self.backend.base_path / "blas_lib_gfx94X.tar.zst").write_bytes(b"abc")
+        (self.backend.base_path / "blas_lib_gfx94X.tar.zst.sha256sum").write_text("x")
+        (self.backend.base_path / "logs").mkdir()
+
+        objects = self.backend.list_objects()
+
+        self.assertEqual(
+            sorted(objects),
+            ["blas_lib_gfx94X.tar.zst", "blas_lib_gfx94X.tar.zst.sha256sum"],
+        )
+        self.assertEqual(objects["blas_lib_gfx94X.tar.zst"].size, 3)
+
+    def test_copied_objects_are_up_to_date(self):
+        """Test a second copy plan skips files copied by the first one."""
+        source = LocalDirectoryBackend(
+            staging_dir=Path(self.temp_dir),
+            output_root=_make_local_root(run_id="source-run"),
+        )
+        dest = LocalDirectoryBackend(
+            staging_dir=Path(self.temp_dir),
+            output_root=_make_local_root(run_id="dest-run"),
+        )
+        artifact_key = "test_lib_generic.tar.zst"
+        (source.base_path / artifact_key).write_bytes(b"test content")
+        (source.base_path / f"{artifact_key}.sha256sum").write_text("abc\n")
+
+        plan = plan_artifact_copy(
+            [artifact_key], source.list_objects(), dest.list_objects()
+        )
+        self.assertEqual(
+            [obj.key for obj in plan.to_copy],
+            [artifact_key, f"{artifact_key}.sha256sum"],
+        )
+        for obj in plan.to_copy:
+            dest.copy_object(obj.key, source, size=obj.size)
+
+        plan = plan_artifact_copy(
+            [artifact_key], source.list_objects(), dest.list_objects()
+        )
+        self.assertEqual(plan.to_copy, [])
+        self.assertEqual(len(plan.up_to_date), 2)
+
+
+class TestArtifactIndex(unittest.TestCase):
+    """Tests for ArtifactIndex and backend index caching."""
+
+    def setUp(self):
+        self.index = ArtifactIndex.from_filenames(
+            [
+                "blas_lib_gfx94X.tar.xz",
+                "blas_lib_gfx94X.tar.zst",
+                "blas_test_gfx942.tar.zst",
+                "base_lib_generic.tar.zst",
+                "base_lib_generic.tar.zst.sha256sum",
+                "README.md",
+            ]
+        )
+
+    def test_find_prefers_zst_and_keeps_order(self):
+        """Test find orders by name, target family, then component."""
+        found = self.index.find(
+            {"blas", "base"}, ["generic", "gfx94X", "gfx942"], ["lib", "test"]
+        )
+        self.assertEqual(
+            found,
+            [
+                "base_lib_generic.tar.zst",
+                "blas_lib_gfx94X.tar.zst",
+                "blas_test_gfx942.tar.zst",
+            ],
+        )
+
+    def test_for_target_families(self):
+        """Test selecting archives by target family skips sidecars."""
+        self.assertEqual(
+            self.index.for_target_families(["generic", "gfx942"]),
+            {"base_lib_generic.tar.zst", "blas_test_gfx942.tar.zst"},
+        )
+        self.assertEqual(len(self.index), 4)
+
+    def test_backend_index_is_cached_until_upload(self):
+        """Test the backend lists once and re-lists after it is written to."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        backend = LocalDirectoryBackend(
+            staging_dir=temp_dir, output_root=_make_local_root()
+        )
+        archive = temp_dir / "blas_lib_generic.tar.zst"
+        archive.write_bytes(b"x")
+
+        with mock.patch.object(
+            backend, "list_objects", wraps=backend.list_objects
+        ) as mock_list:
+            self.assertEqual(len(backend.artifact_index()), 0)
+            self.assertEqual(len(backend.artifact_index()), 0)
+            self.assertEqual(mock_list.call_count, 1)
+
+            backend.upload_artifact(archive, archive.name)
+            self.assertEqual(len(backend.artifact_index()), 1)
+            self.assertEqual(mock_list.call_count, 2)
+
+    def test_compile_artifact_filter(self):
+        """Test includes must match and excludes must not."""
+        predicate = compile_artifact_filter(["blas", "fft"], ["_dbg_"])
+        self.assertTrue(predicate("blas_lib_gfx94X.tar.zst"))
+        self.assertFalse(predicate("blas_dbg_gfx94X.tar.zst"))
+        self.assertFalse(predicate("rand_lib_gfx94X.tar.zst"))
+        self.assertTrue(compile_artifact_filter([], [])("anything"))
+
+
+class TestPlanArtifactCopy(unittest.TestCase):
+    """Tests for plan_artifact_copy."""
+
+    def test_plan(self):
+        """Test changed, unchanged, sidecar and missing objects are planned."""
+        source = {
+            "a.tar.zst": ArtifactObject("a.tar.zst", 10, '"e1"'),
+            "a.tar.zst.sha256sum": ArtifactObject("a.tar.zst.sha256sum", 1, '"e2"'),
+            "b.tar.zst": ArtifactObject("b.tar.zst", 20, '"e3"'),
+        }
+        dest = {
+            "a.tar.zst": ArtifactObject("a.tar.zst", 10, '"e1"'),
+            "b.tar.zst": ArtifactObject("b.tar.zst", 20, '"stale"'),
+        }
+
+        plan = plan_artifact_copy(["b.tar.zst", "a.tar.zst", "c.tar.zst"], source, dest)
+
+        self.assertEqual(
+            [obj.key for obj in plan.to_copy], ["a.tar.zst.sha256sum", "b.tar.zst"]
+        )
+        self.assertEqual([obj.key for obj in plan.up_to_date], ["a.tar.zst"])
+        self.assertEqual(plan.missing, ["c.tar.zst"])
+        self.assertEqual(plan.copy_bytes, 21)
+
+    def test_objects_without_etag_are_copied(self):
+        """Test objects are never skipped when no fingerprint is known."""
+        source = {"a.tar.zst": ArtifactObject("a.tar.zst", 0)}
+        plan = plan_artifact_copy(["a.tar.zst"], source, dict(source))
+        self.assertEqual([obj.key for obj in plan.to_copy], ["a.tar.zst"])
+
 
 class TestS3Backend(unittest.TestCase):
     """Tests for S3Backend with mocked boto3 client."""
@@ -472,8 +622,14 @@ class TestS3Backend(unittest.TestCase):
         """Test S3 server-side copy within the same bucket."""
         mock_client = mock.MagicMock()
         mock_client_prop.return_value = mock_client
-        # sha256sum exists in source
-        mock_client.head_object.return_value = {}
+
+        # sha256sum exists in source, chunk and member indexes do not
+        def head_object(Bucket, Key):
+            if Key.endswith((".chunks.json", ".members.json")):
+                raise Exception("Not found")
+            return {}
+
+        mock_client.head_object.side_effect = head_object
 
         source = S3Backend(
             output_root=_make_s3_root(
@@ -509,6 +665,87 @@ class TestS3Backend(unittest.TestCase):
             "dest-run-linux/artifact_lib_generic.tar.zst.sha256sum",
         )
 
+    @mock.patch.object(S3Backend, "s3_client", new_callable=mock.PropertyMock)
+    def test_copy_artifact_copies_chunk_index(self, mock_client_prop):
+        """Test S3 copy includes the chunk and member index sidecars when present."""
+        mock_client = mock.MagicMock()
+        mock_client_prop.return_value = mock_client
+        mock_client.head_object.return_value = {}
+
+        source = S3Backend(
+            output_root=_make_s3_root(
+                bucket="test-bucket", run_id="source-run", external_repo=""
+            )
+        )
+        dest = S3Backend(
+            output_root=_make_s3_root(
+                bucket="test-bucket", run_id="dest-run", external_repo=""
+            )
+        )
+
+        dest.copy_artifact("artifact_lib_generic.tar.zst", source)
+
+        self.assertEqual(mock_client.copy.call_count, 4)
+        mock_client.copy.assert_any_call(
+            {
+                "Bucket": "test-bucket",
+                "Key": "source-run-linux/artifact_lib_generic.tar.zst.chunks.json",
+            },
+            "test-bucket",
+            "dest-run-linux/artifact_lib_generic.tar.zst.chunks.json",
+        )
+        mock_client.copy.assert_any_call(
+            {
+                "Bucket": "test-bucket",
+                "Key": "source-run-linux/artifact_lib_generic.tar.zst.members.json",
+            },
+            "test-bucket",
+            "dest-run-linux/artifact_lib_generic.tar.zst.members.json",
+        )
+
+    @mock.patch.object(S3Backend, "s3_client", new_callable=mock.PropertyMock)
+    def test_read_artifact_range(self, mock_client_prop):
+        """Test ranged reads issue a GET with an inclusive byte range."""
+        mock_client = mock.MagicMock()
+        mock_client_prop.return_value = mock_client
+        mock_client.get_object.return_value = {"Body": io.BytesIO(b"abcd")}
+
+        backend = S3Backend(output_root=_make_s3_root(external_repo=""))
+        data = backend.read_artifact_range("blas_lib_gfx94X.tar.zst", 100, 4)
+
+        self.assertEqual(data, b"abcd")
+        mock_client.get_object.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="test-run-456-linux/blas_lib_gfx94X.tar.zst",
+            Range="bytes=100-103",
+        )
+
+    @mock.patch.object(S3Backend, "s3_client", new_callable=mock.PropertyMock)
+    def test_read_artifact_range_errors(self, mock_client_prop):
+        """Test ranged read errors map to missing, denied and empty results."""
+        from botocore.exceptions import ClientError
+
+        mock_client = mock.MagicMock()
+        mock_client_prop.return_value = mock_client
+        backend = S3Backend(output_root=_make_s3_root(external_repo=""))
+
+        def fail_with(code):
+            mock_client.get_object.side_effect = ClientError(
+                {"Error": {"Code": code}}, "GetObject"
+            )
+
+        fail_with("NoSuchKey")
+        with self.assertRaises(FileNotFoundError):
+            backend.read_artifact_range("a.tar.zst.chunks.json")
+        fail_with("AccessDenied")
+        with self.assertRaises(PermissionError):
+            backend.read_artifact_range("a.tar.zst.chunks.json")
+        fail_with("InvalidRange")
+        self.assertEqual(backend.read_artifact_range("a.tar.zst.chunks.json"), b"")
+        fail_with("SlowDown")
+        with self.assertRaises(ClientError):
+            backend.read_artifact_range("a.tar.zst.chunks.json")
+
     @mock.patch.object(S3Backend, "s3_client", new_callable=mock.PropertyMock)
     def test_copy_artifact_cross_bucket(self, mock_client_prop):
         """Test S3 server-side copy across different buckets."""
@@ -545,6 +782,61 @@ class TestS3Backend(unittest.TestCase):
             "ROCm-rocm-libraries/dest-run-linux/artifact_lib_generic.tar.zst",
         )
 
+    @mock.patch.object(S3Backend, "s3_client", new_callable=mock.PropertyMock)
+    def test_list_objects(self, mock_client_prop):
+        """Test list_objects returns sizes and ETags, skipping nested keys."""
+        mock_client = mock.MagicMock()
+        mock_client_prop.return_value = mock_client
+        mock_paginator = mock.MagicMock()
+        mock_client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = [
+            {
+                "Contents": [
+                    {
+                        "Key": "external/test-run-456-linux/blas_lib_gfx94X.tar.zst",
+                        "Size": 100,
+                        "ETag": '"abc"',
+                    },
+                    {
+                        "Key": "external/test-run-456-linux/logs/build.log",
+                        "Size": 5,
+                        "ETag": '"def"',
+                    },
+                ]
+            }
+        ]
+
+        objects = self.backend.list_objects()
+
+        mock_paginator.paginate.assert_called_once_with(
+            Bucket="test-bucket", Prefix="external/test-run-456-linux/"
+        )
+        self.assertEqual(
+            objects,
+            {
+                "blas_lib_gfx94X.tar.zst": ArtifactObject(
+                    "blas_lib_gfx94X.tar.zst", 100, '"abc"'
+                )
+            },
+        )
+
+    @mock.patch.object(S3Backend, "s3_client", new_callable=mock.PropertyMock)
+    def test_copy_object_tunes_large_copies(self, mock_client_prop):
+        """Test large copies pass a multipart TransferConfig sized to the object."""
+        mock_client = mock.MagicMock()
+        mock_client_prop.return_value = mock_client
+        source = S3Backend(output_root=_make_s3_root(run_id="source-run"))
+
+        self.backend.copy_object("big.tar.zst", source, size=4 << 30)
+
+        args, kwargs = mock_client.copy.call_args
+        self.assertEqual(
+            args[0],
+            {"Bucket": "test-bucket", "Key": "external/source-run-linux/big.tar.zst"},
+        )
+        config = kwargs["Config"]
+        self.assertGreaterEqual(config.multipart_chunksize * 1000, 4 << 30)
+
     def test_copy_artifact_wrong_backend_type_raises(self):
         """Test copy_artifact raises TypeError when source is a different backend type."""
         import tempfile
@@ -558,6 +850,101 @@ class TestS3Backend(unittest.TestCase):
             self.backend.copy_artifact("test.tar.zst", local_source)
 
 
+class FakeS3Client:
+    """In-memory S3 with multipart ETags derived from the transfer parts."""
+
+    def __init__(self):
+        self.objects: Dict[str, Tuple[bytes, str]] = {}
+        self.copies = 0
+
+    @staticmethod
+    def _etag(data: bytes, config) -> str:
+        from boto3.s3.transfer import TransferConfig
+
+        config = config or TransferConfig()
+        if len(data) < config.multipart_threshold:
+            return f'"{hashlib.md5(data).hexdigest()}"'
+        part_size = config.multipart_chunksize
+        parts = [data[i : i + part_size] for i in range(0, len(data), part_size)]
+        digests = b"".join(hashlib.md5(part).digest() for part in parts)
+        return f'"{hashlib.md5(digests).hexdigest()}-{len(parts)}"'
+
+    def upload_file(self, filename, bucket, key, Config=None):
+        data = Path(filename).read_bytes()
+        self.objects[f"{bucket}/{key}"] = (data, self._etag(data, Config))
+
+    def copy(self, copy_source, bucket, key, Config=None):
+        self.copies += 1
+        data, _ = self.objects[f"{copy_source['Bucket']}/{copy_source['Key']}"]
+        self.objects[f"{bucket}/{key}"] = (data, self._etag(data, Config))
+
+    def head_object(self, Bucket, Key):
+        data, etag = self.objects[f"{Bucket}/{Key}"]
+        return {"ContentLength": len(data), "ETag": etag}
+
+    def get_paginator(self, name):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                prefix = f"{Bucket}/"
+                yield {
+                    "Contents": [
+                        {"Key": key[len(prefix) :], "Size": len(data), "ETag": etag}
+                        for key, (data, etag) in client.objects.items()
+                        if key.startswith(prefix + Prefix)
+                    ]
+                }
+
+        return Paginator()
+
+
+class TestS3BackendCopyFingerprints(unittest.TestCase):
+    """Tests that copied S3 objects are recognized as up to date."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.client = FakeS3Client()
+        self.source = S3Backend(output_root=_make_s3_root(run_id="source-run"))
+        self.dest = S3Backend(output_root=_make_s3_root(run_id="dest-run"))
+        self.source._s3_client = self.client
+        self.dest._s3_client = self.client
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _plan(self, keys):
+        return plan_artifact_copy(
+            keys, self.source.list_objects(), self.dest.list_objects()
+        )
+
+    def test_copies_match_uploads_with_default_part_sizes(self):
+        """Test large uploads and copies split objects into the same parts.
+
+        boto3's defaults use 8 MiB parts, while copies of large objects use
+        larger parts; ETags only match if both use the same parts.
+        """
+        sizes = {"small.tar.zst": 10 << 20, "big.tar.zst": 96 << 20}
+        for key, size in sizes.items():
+            path = self.temp_dir / key
+            path.write_bytes(os.urandom(1 << 20) * (size >> 20))
+            self.source.upload_artifact(path, key)
+
+        plan = self._plan(sizes)
+        self.assertEqual(len(plan.to_copy), 2)
+        for obj in plan.to_copy:
+            self.dest.copy_object(obj.key, self.source, size=obj.size)
+        self.assertTrue(self.source.list_objects()["big.tar.zst"].etag.endswith('-6"'))
+
+        plan = self._plan(sizes)
+        self.assertEqual(plan.to_copy, [])
+        self.assertEqual(len(plan.up_to_date), 2)
+
+        # Copies without a known size look it up and use the same parts.
+        self.dest.copy_artifact("big.tar.zst", self.source)
+        self.assertEqual(self._plan(sizes).to_copy, [])
+
+
 class TestCreateBackendFromEnv(unittest.TestCase):
     """Tests for create_backend_from_env factory function."""
 
@@ -0,0 +1,264 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for artifact_delta.py."""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict, Set
+
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+
+from _therock_utils.artifact_backend import LocalDirectoryBackend, S3Backend
+from _therock_utils.artifact_delta import (
+    ChunkIndex,
+    DeltaCache,
+    CHUNK_INDEX_SUFFIX,
+    chunk_index_path,
+    download_artifact_delta,
+)
+from _therock_utils.artifacts import _open_archive_for_read
+from _therock_utils.workflow_outputs import WorkflowOutputRoot
+
+FILESET_TOOL = Path(__file__).parent.parent / "fileset_tool.py"
+ARTIFACT_KEY = "blas_lib_gfx94X.tar.zst"
+
+
+class ArtifactDeltaTestBase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.artifact_dir = self.temp_dir / "blas_lib_gfx94X"
+        self.stage_dir = self.artifact_dir / "math-libs" / "stage"
+        self.stage_dir.mkdir(parents=True)
+        (self.artifact_dir / "artifact_manifest.txt").write_text("math-libs/stage\n")
+        # Members of at least the minimum frame size get their own frames.
+        for i in range(4):
+            (self.stage_dir / f"lib{i}.so").write_bytes(os.urandom(1 << 20))
+        (self.stage_dir / "README").write_text("hello")
+
+        self.backend = LocalDirectoryBackend(
+            staging_dir=self.temp_dir / "staging",
+            output_root=WorkflowOutputRoot.for_local(run_id="1", platform="linux"),
+        )
+        self.cache = DeltaCache(self.temp_dir / "cache")
+        self.dest_path = self.temp_dir / "download" / ARTIFACT_KEY
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def archive_and_upload(self) -> Path:
+        archive_path = self.temp_dir / "upload" / ARTIFACT_KEY
+        subprocess.check_call(
+            [
+                sys.executable,
+                str(FILESET_TOOL),
+                "artifact-archive",
+                str(self.artifact_dir),
+                "-o",
+                str(archive_path),
+                "--compression-type",
+                "zstd",
+                "--chunked",
+            ]
+        )
+        self.backend.upload_artifact(archive_path, ARTIFACT_KEY)
+        return archive_path
+
+
+class ArtifactDeltaTest(ArtifactDeltaTestBase):
+    def test_chunked_archive_is_regular_tar_zst(self):
+        archive_path = self.archive_and_upload()
+        index = ChunkIndex.load(chunk_index_path(archive_path))
+        self.assertEqual(index.size, archive_path.stat().st_size)
+        self.assertGreaterEqual(len(index.chunks), 4)
+        with _open_archive_for_read(archive_path) as tf:
+            names = tf.getnames()
+        self.assertEqual(names[0], "artifact_manifest.txt")
+        self.assertIn("math-libs/stage/lib3.so", names)
+        # The chunk index is uploaded next to the archive.
+        self.assertTrue(self.backend.artifact_exists(ARTIFACT_KEY + ".chunks.json"))
+
+    def test_delta_fetch_reuses_unchanged_chunks(self):
+        self.archive_and_upload()
+        stats = download_artifact_delta(
+            self.backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertTrue(stats.full_download)
+        self.assertIsNotNone(self.cache.lookup(ARTIFACT_KEY))
+
+        (self.stage_dir / "lib2.so").write_bytes(os.urandom(1 << 20))
+        archive_path = self.archive_and_upload()
+        stats = download_artifact_delta(
+            self.backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertFalse(stats.full_download)
+        self.assertGreater(stats.reused_bytes, 3 << 20)
+        self.assertLess(stats.downloaded_bytes, archive_path.stat().st_size // 2)
+        self.assertEqual(self.dest_path.read_bytes(), archive_path.read_bytes())
+
+    def test_rebuild_with_touched_files_reuses_all_chunks(self):
+        first_archive = self.archive_and_upload().read_bytes()
+        download_artifact_delta(self.backend, ARTIFACT_KEY, self.dest_path, self.cache)
+
+        # A rebuild rewrites the staged files with the same content.
+        for path in [
+            *self.stage_dir.iterdir(),
+            self.artifact_dir / "artifact_manifest.txt",
+        ]:
+            st = path.stat()
+            os.utime(path, (st.st_atime + 3600, st.st_mtime + 3600))
+        archive_path = self.archive_and_upload()
+        self.assertEqual(archive_path.read_bytes(), first_archive)
+        with _open_archive_for_read(archive_path) as tf:
+            for member in tf.getmembers():
+                self.assertEqual((member.mtime, member.uid, member.gid), (0, 0, 0))
+                self.assertEqual((member.uname, member.gname), ("", ""))
+
+        stats = download_artifact_delta(
+            self.backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertFalse(stats.full_download)
+        self.assertEqual(stats.downloaded_bytes, 0)
+        self.assertEqual(self.dest_path.read_bytes(), first_archive)
+
+    def test_delta_fetch_without_index_downloads_everything(self):
+        archive_path = self.archive_and_upload()
+        download_artifact_delta(self.backend, ARTIFACT_KEY, self.dest_path, self.cache)
+        self.backend._artifact_path(ARTIFACT_KEY + ".chunks.json").unlink()
+
+        stats = download_artifact_delta(
+            self.backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertTrue(stats.full_download)
+        self.assertEqual(stats.downloaded_bytes, archive_path.stat().st_size)
+
+    def test_corrupt_cache_chunks_are_refetched(self):
+        archive_path = self.archive_and_upload()
+        download_artifact_delta(self.backend, ARTIFACT_KEY, self.dest_path, self.cache)
+        cached_archive = self.cache.cache_dir / ARTIFACT_KEY
+        data = bytearray(cached_archive.read_bytes())
+        data[-1] ^= 0xFF
+        cached_archive.write_bytes(bytes(data))
+
+        stats = download_artifact_delta(
+            self.backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertFalse(stats.full_download)
+        self.assertGreater(stats.downloaded_bytes, 0)
+        self.assertEqual(self.dest_path.read_bytes(), archive_path.read_bytes())
+
+
+class FakeS3Client:
+    """In-memory S3 serving ranged GETs, with optionally denied keys."""
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+        self.denied: Set[str] = set()
+
+    @staticmethod
+    def _error(code: str, status: int) -> ClientError:
+        return ClientError(
+            {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+            "GetObject",
+        )
+
+    def get_object(self, Bucket, Key, Range):
+        key = f"{Bucket}/{Key}"
+        if key in self.denied:
+            raise self._error("AccessDenied", 403)
+        if key not in self.objects:
+            raise self._error("NoSuchKey", 404)
+        data = self.objects[key]
+        first, last = Range.removeprefix("bytes=").split("-")
+        if int(first) >= len(data):
+            raise self._error("InvalidRange", 416)
+        end = int(last) + 1 if last else len(data)
+        return {"Body": io.BytesIO(data[int(first) : end])}
+
+    def download_file(self, bucket, key, filename):
+        Path(filename).write_bytes(self.objects[f"{bucket}/{key}"])
+
+
+class S3ArtifactDeltaTest(ArtifactDeltaTestBase):
+    """Runs delta fetches against S3 where the chunk index is unreadable."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = FakeS3Client()
+        self.s3_backend = S3Backend(
+            output_root=WorkflowOutputRoot(
+                bucket="test-bucket",
+                external_repo="",
+                run_id="1",
+                platform="linux",
+            )
+        )
+        self.s3_backend._s3_client = self.client
+
+    def publish_to_s3(self) -> Path:
+        archive_path = self.archive_and_upload()
+        for key in [ARTIFACT_KEY, ARTIFACT_KEY + CHUNK_INDEX_SUFFIX]:
+            loc = self.s3_backend.output_root.artifact(key)
+            self.client.objects[f"test-bucket/{loc.relative_path}"] = (
+                self.backend.read_artifact_range(key)
+            )
+        return archive_path
+
+    def index_key(self) -> str:
+        loc = self.s3_backend.output_root.artifact(ARTIFACT_KEY + CHUNK_INDEX_SUFFIX)
+        return f"test-bucket/{loc.relative_path}"
+
+    def test_s3_delta_fetch_reuses_unchanged_chunks(self):
+        self.publish_to_s3()
+        download_artifact_delta(
+            self.s3_backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        (self.stage_dir / "lib2.so").write_bytes(os.urandom(1 << 20))
+        archive_path = self.publish_to_s3()
+
+        stats = download_artifact_delta(
+            self.s3_backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertFalse(stats.full_download)
+        self.assertEqual(self.dest_path.read_bytes(), archive_path.read_bytes())
+
+    def test_denied_index_downloads_everything(self):
+        self.publish_to_s3()
+        download_artifact_delta(
+            self.s3_backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        archive_path = self.publish_to_s3()
+        self.client.denied.add(self.index_key())
+
+        stats = download_artifact_delta(
+            self.s3_backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertTrue(stats.full_download)
+        self.assertEqual(self.dest_path.read_bytes(), archive_path.read_bytes())
+
+    def test_empty_index_downloads_everything(self):
+        self.publish_to_s3()
+        download_artifact_delta(
+            self.s3_backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        archive_path = self.publish_to_s3()
+        # A ranged GET of an empty object fails with 416 InvalidRange.
+        self.client.objects[self.index_key()] = b""
+
+        stats = download_artifact_delta(
+            self.s3_backend, ARTIFACT_KEY, self.dest_path, self.cache
+        )
+        self.assertTrue(stats.full_download)
+        self.assertEqual(self.dest_path.read_bytes(), archive_path.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -162,6 +162,11 @@ class FailingBackend(ArtifactBackend):
             return self._real_backend.artifact_exists(artifact_key)
         return False
 
+    def read_artifact_range(self, artifact_key, start=0, length=None):
+        if self._real_backend:
+            return self._real_backend.read_artifact_range(artifact_key, start, length)
+        raise FileNotFoundError(f"No backend configured: {artifact_key}")
+
 
 class ArtifactManagerTestBase(unittest.TestCase):
     """Base class for artifact_manager tests with common setup/teardown."""
@@ -861,6 +866,19 @@ class TestCopy(ArtifactManagerTestBase):
             dest_backend.artifact_exists("downstream-artifact_lib_generic.tar.zst")
         )
 
+    @mock.patch("artifact_manager._delay_for_retry")
+    def test_copy_skips_up_to_date_files(self, mock_delay):
+        """Test that a repeated copy does not copy unchanged files again."""
+        self._create_source_artifact("test-artifact", "lib", "generic")
+        self._run_copy()
+
+        with mock.patch.object(
+            LocalDirectoryBackend, "copy_object", autospec=True
+        ) as mock_copy_object:
+            self._run_copy()
+
+        mock_copy_object.assert_not_called()
+
     @mock.patch("artifact_manager._delay_for_retry")
     def test_copy_dry_run_does_not_copy(self, mock_delay):
         """Test that --dry-run lists artifacts without copying."""
@@ -1013,5 +1031,38 @@ class TestCopy(ArtifactManagerTestBase):
         )
 
 
+class TestInfo(ArtifactManagerTestBase):
+    """Tests for the info subcommand."""
+
+    def test_info_lists_available_files_for_run(self):
+        """Test that info with --run-id lists the stage's files in the backend."""
+        import artifact_manager
+
+        self._create_staged_artifact("test-artifact", "lib", "generic")
+        self._create_staged_artifact("test-artifact", "lib", "gfx94X")
+
+        with mock.patch("artifact_manager.log") as mock_log:
+            artifact_manager.main(
+                [
+                    "info",
+                    "--stage",
+                    "upstream-stage",
+                    "--topology",
+                    str(self.topology_path),
+                    "--run-id",
+                    "local",
+                    "--platform",
+                    TEST_PLATFORM,
+                    "--local-staging-dir",
+                    str(self.staging_dir),
+                ]
+            )
+
+        output = [call.args[0] for call in mock_log.call_args_list]
+        self.assertIn("Produced files available (1):", output)
+        self.assertIn("  - test-artifact_lib_generic.tar.zst", output)
+        self.assertNotIn("  - test-artifact_lib_gfx94X.tar.zst", output)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,16 +2,23 @@
 # SPDX-License-Identifier: MIT
 
 from pathlib import Path
+import io
 import os
 import platform
+import tarfile
 import tempfile
 import textwrap
+import time
 import unittest
 import sys
 
 sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
 
-from _therock_utils.artifacts import ArtifactName
+from _therock_utils.artifacts import (
+    ArtifactName,
+    ArtifactPopulator,
+    ParallelArtifactFlattener,
+)
 import _therock_utils.artifact_builder as builder
 
 
@@ -628,5 +635,153 @@ class ComponentScannerTest(TmpDirTestCase):
             )
 
 
+class ArtifactPopulatorArchiveTest(TmpDirTestCase):
+    def make_archive(self) -> Path:
+        archive_path = self.temp_dir / "foo_lib_generic.tar.xz"
+
+        def add_bytes(tf, name: str, data: bytes, mode: int = 0o644):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = mode
+            info.mtime = 1_000_000
+            tf.addfile(info, io.BytesIO(data))
+
+        with tarfile.open(archive_path, "w:xz") as tf:
+            add_bytes(tf, "artifact_manifest.txt", b"a/stage\nb/stage\n")
+            dir_info = tarfile.TarInfo("a/stage/lib")
+            dir_info.type = tarfile.DIRTYPE
+            tf.addfile(dir_info)
+            add_bytes(tf, "a/stage/lib/libfoo.so.1", b"x" * 100_000, mode=0o755)
+            link_info = tarfile.TarInfo("a/stage/lib/libfoo.so")
+            link_info.type = tarfile.SYMTYPE
+            link_info.linkname = "libfoo.so.1"
+            tf.addfile(link_info)
+            hardlink_info = tarfile.TarInfo("b/stage/bin/foo")
+            hardlink_info.type = tarfile.LNKTYPE
+            hardlink_info.linkname = "a/stage/lib/libfoo.so.1"
+            tf.addfile(hardlink_info)
+        return archive_path
+
+    def testPopulate(self):
+        archive_path = self.make_archive()
+        output_dir = self.temp_dir / "out"
+        populator = ArtifactPopulator(output_path=output_dir)
+        start_time = time.time()
+        populator(archive_path)
+
+        self.assertEqual(populator.relpaths, {"a/stage", "b/stage"})
+        lib = output_dir / "a" / "stage" / "lib" / "libfoo.so.1"
+        self.assertEqual(lib.read_bytes(), b"x" * 100_000)
+        # Extracted files carry the extraction time, not the archived mtime
+        # (which is 0 in reproducible archives).
+        self.assertGreaterEqual(lib.stat().st_mtime, int(start_time))
+        self.assertEqual(
+            os.readlink(output_dir / "a" / "stage" / "lib" / "libfoo.so"),
+            "libfoo.so.1",
+        )
+        hardlink = output_dir / "b" / "stage" / "bin" / "foo"
+        self.assertTrue(os.path.samefile(hardlink, lib))
+        if platform.system() != "Windows":
+            self.assertTrue(os.access(lib, os.X_OK))
+
+    def testFlattenReplacesExisting(self):
+        archive_path = self.make_archive()
+        output_dir = self.temp_dir / "flat"
+        (output_dir / "lib").mkdir(parents=True)
+        (output_dir / "lib" / "libfoo.so").write_text("stale")
+        ArtifactPopulator(output_path=output_dir, flatten=True)(archive_path)
+
+        self.assertTrue((output_dir / "lib" / "libfoo.so").is_symlink())
+        self.assertTrue(
+            os.path.samefile(
+                output_dir / "bin" / "foo", output_dir / "lib" / "libfoo.so.1"
+            )
+        )
+
+    def testMemberOutsideManifest(self):
+        archive_path = self.temp_dir / "bad_lib_generic.tar.xz"
+        with tarfile.open(archive_path, "w:xz") as tf:
+            for name, data in [
+                ("artifact_manifest.txt", b"a/stage\n"),
+                ("a/stagefoo/bar", b"bar"),
+            ]:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+        with self.assertRaisesRegex(IOError, "not in manifest"):
+            ArtifactPopulator(output_path=self.temp_dir / "out")(archive_path)
+
+
+class ParallelArtifactFlattenerTest(TmpDirTestCase):
+    def make_archive(self, name: str, members: list[tuple]) -> Path:
+        """Members are (name, bytes), (name, None) for dirs or (name, "=target")."""
+        archive_path = self.temp_dir / f"{name}.tar.xz"
+        with tarfile.open(archive_path, "w:xz") as tf:
+            manifest = b"stage\n"
+            info = tarfile.TarInfo("artifact_manifest.txt")
+            info.size = len(manifest)
+            tf.addfile(info, io.BytesIO(manifest))
+            for member_name, contents in members:
+                info = tarfile.TarInfo(f"stage/{member_name}")
+                if contents is None:
+                    info.type = tarfile.DIRTYPE
+                    tf.addfile(info)
+                elif isinstance(contents, str):
+                    info.type = tarfile.LNKTYPE
+                    info.linkname = f"stage/{contents[1:]}"
+                    tf.addfile(info)
+                else:
+                    info.size = len(contents)
+                    tf.addfile(info, io.BytesIO(contents))
+        return archive_path
+
+    def testLastWriterWins(self):
+        archives = [
+            self.make_archive(
+                "a_lib_generic",
+                [("lib", None), ("lib/a.so", b"a"), ("lib/common.txt", b"from a")],
+            ),
+            self.make_archive(
+                "b_lib_generic",
+                [("lib/b.so", b"b"), ("lib/common.txt", b"from b")],
+            ),
+            self.make_archive("c_lib_generic", [("bin/c", b"c")]),
+        ]
+        parallel_dir = self.temp_dir / "parallel"
+        flattener = ParallelArtifactFlattener(output_path=parallel_dir, max_workers=3)
+        flattener(*archives)
+        serial_dir = self.temp_dir / "serial"
+        ArtifactPopulator(output_path=serial_dir, flatten=True)(*archives)
+
+        self.assertEqual(flattener.relpaths, {"stage"})
+        self.assertEqual((parallel_dir / "lib" / "common.txt").read_text(), "from b")
+        for relpath in ["lib/a.so", "lib/b.so", "lib/common.txt", "bin/c"]:
+            self.assertEqual(
+                (parallel_dir / relpath).read_bytes(),
+                (serial_dir / relpath).read_bytes(),
+            )
+
+    def testHardlinkToOverriddenFile(self):
+        archives = [
+            self.make_archive("a_lib_generic", [("f", b"old"), ("g", "=f")]),
+            self.make_archive("b_lib_generic", [("f", b"new")]),
+        ]
+        output_dir = self.temp_dir / "out"
+        ParallelArtifactFlattener(output_path=output_dir, max_workers=2)(*archives)
+        self.assertEqual((output_dir / "f").read_bytes(), b"new")
+        self.assertTrue(os.path.samefile(output_dir / "g", output_dir / "f"))
+
+    def testFileDirectoryConflict(self):
+        archives = [
+            self.make_archive("a_lib_generic", [("x", None)]),
+            self.make_archive("b_lib_generic", [("x", b"file")]),
+        ]
+        flattener = ParallelArtifactFlattener(
+            output_path=self.temp_dir / "out", max_workers=2
+        )
+        with self.assertRaisesRegex(IOError, "conflicts"):
+            flattener(*archives)
+
+
 if __name__ == "__main__":
     unittest.main()
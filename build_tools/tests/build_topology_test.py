@@ -553,6 +553,77 @@ class BuildTopologyTest(unittest.TestCase):
         foundation_inbound = topology.get_inbound_artifacts("foundation")
         self.assertEqual(len(foundation_inbound), 0)
 
+    def test_get_transitive_artifact_deps(self):
+        """Test transitive artifact dependency collection."""
+        self.write_topology(
+            """
+            [artifact_groups.group1]
+            description = "Group 1"
+            type = "generic"
+
+            [artifacts.A]
+            artifact_group = "group1"
+            type = "target-neutral"
+            artifact_deps = ["B"]
+
+            [artifacts.B]
+            artifact_group = "group1"
+            type = "target-neutral"
+            artifact_deps = ["C"]
+
+            [artifacts.C]
+            artifact_group = "group1"
+            type = "target-neutral"
+        """
+        )
+
+        topology = BuildTopology(self.topology_path)
+        self.assertEqual(topology.get_transitive_artifact_deps("A"), {"B", "C"})
+        self.assertEqual(topology.get_transitive_artifact_deps("C"), set())
+        self.assertEqual(topology.get_transitive_artifact_deps("unknown"), set())
+
+    def test_get_artifacts_for_submodule(self):
+        """Test mapping a submodule to the artifacts built from it."""
+        self.write_topology(
+            """
+            [source_sets.libs]
+            description = "Libraries"
+            submodules = ["rocm-libraries"]
+
+            [source_sets.systems]
+            description = "Systems"
+            submodules = ["rocm-systems"]
+
+            [artifact_groups.math]
+            description = "Math"
+            type = "per-arch"
+            source_sets = ["libs", "systems"]
+
+            [artifact_groups.runtime]
+            description = "Runtime"
+            type = "generic"
+            source_sets = ["systems"]
+
+            [artifacts.blas]
+            artifact_group = "math"
+            type = "target-specific"
+
+            [artifacts.core-runtime]
+            artifact_group = "runtime"
+            type = "target-neutral"
+        """
+        )
+
+        topology = BuildTopology(self.topology_path)
+        self.assertEqual(
+            topology.get_artifacts_for_submodule("rocm-libraries"), {"blas"}
+        )
+        self.assertEqual(
+            topology.get_artifacts_for_submodule("rocm-systems"),
+            {"blas", "core-runtime"},
+        )
+        self.assertEqual(topology.get_artifacts_for_submodule("unknown"), set())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,152 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for export_source_archive.py."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+
+from export_source_archive import (
+    ArchiveWriter,
+    create_archive,
+    create_split_archives,
+    group_files_by_submodule,
+    main,
+)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.check_output(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            "-c",
+            "protocol.file.allow=always",
+            *args,
+        ],
+        cwd=cwd,
+        stderr=subprocess.DEVNULL,
+    ).decode()
+
+
+def _read_members(archive_path: Path) -> dict[str, bytes]:
+    if archive_path.name.endswith(".tar.zst"):
+        import pyzstd
+
+        fileobj = pyzstd.ZstdFile(archive_path)
+        tf = tarfile.open(fileobj=fileobj, mode="r|")
+    else:
+        tf = tarfile.open(archive_path)
+    members = {}
+    with tf:
+        for member in tf:
+            if member.issym():
+                members[member.name] = f"-> {member.linkname}".encode()
+            else:
+                members[member.name] = tf.extractfile(member).read()
+    return members
+
+
+class ExportSourceArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        sub_dir = self.temp_dir / "sub"
+        sub_dir.mkdir()
+        _git(sub_dir, "init", "-q")
+        (sub_dir / "lib.c").write_text("int lib;\n")
+        _git(sub_dir, "add", ".")
+        _git(sub_dir, "commit", "-q", "-m", "sub")
+
+        self.source_dir = self.temp_dir / "src"
+        self.source_dir.mkdir()
+        _git(self.source_dir, "init", "-q")
+        (self.source_dir / "CMakeLists.txt").write_text("project(x)\n")
+        (self.source_dir / "big.bin").write_bytes(os.urandom(1 << 16))
+        (self.source_dir / "link").symlink_to("CMakeLists.txt")
+        _git(self.source_dir, "submodule", "add", "-q", str(sub_dir), "deps/sub")
+        _git(self.source_dir, "add", ".")
+        _git(self.source_dir, "commit", "-q", "-m", "main")
+        self.revision = _git(self.source_dir, "rev-parse", "HEAD").strip()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_create_archive(self):
+        for suffix in [".tar.gz", ".tar.xz", ".tar.zst"]:
+            with self.subTest(suffix=suffix):
+                output = self.temp_dir / f"out{suffix}"
+                writer = ArchiveWriter.create(output, compresslevel=3, threads=2)
+                try:
+                    create_archive(writer, self.source_dir, None, jobs=4)
+                finally:
+                    writer.close()
+
+                members = _read_members(output)
+                self.assertEqual(members["GIT_REVISION"], self.revision.encode())
+                self.assertEqual(members["CMakeLists.txt"], b"project(x)\n")
+                self.assertEqual(
+                    members["big.bin"], (self.source_dir / "big.bin").read_bytes()
+                )
+                self.assertEqual(members["link"], b"-> CMakeLists.txt")
+                self.assertEqual(members["deps/sub/lib.c"], b"int lib;\n")
+
+    def test_create_split_archives(self):
+        output = self.temp_dir / "out" / "therock.tar.gz"
+        output.parent.mkdir()
+        submodule_archives = create_split_archives(
+            output,
+            self.temp_dir / "out" / "submodules",
+            self.source_dir,
+            compresslevel=3,
+            jobs=4,
+            threads=0,
+        )
+
+        self.assertEqual(
+            submodule_archives,
+            [self.temp_dir / "out" / "submodules" / "deps_sub.tar.gz"],
+        )
+        superproject = _read_members(output)
+        self.assertIn("GIT_REVISION", superproject)
+        self.assertIn("CMakeLists.txt", superproject)
+        self.assertNotIn("deps/sub/lib.c", superproject)
+        self.assertEqual(set(_read_members(submodule_archives[0])), {"deps/sub/lib.c"})
+
+    def test_relative_source_dir(self):
+        output = self.temp_dir / "out.tar.gz"
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            main(["--source-dir", "src", "--output", str(output), "--jobs", "2"])
+        finally:
+            os.chdir(cwd)
+
+        members = _read_members(output)
+        self.assertEqual(members["GIT_REVISION"], self.revision.encode())
+        self.assertEqual(members["CMakeLists.txt"], b"project(x)\n")
+        self.assertEqual(members["deps/sub/lib.c"], b"int lib;\n")
+
+    def test_group_files_by_submodule(self):
+        superproject, submodules = group_files_by_submodule(
+            ["a.txt", "deps/sub/x.c", "deps/sub/nested/y.c", "deps/subdir/z.c"],
+            ["deps/sub"],
+        )
+        self.assertEqual(superproject, ["a.txt", "deps/subdir/z.c"])
+        self.assertEqual(
+            submodules, {"deps/sub": ["deps/sub/x.c", "deps/sub/nested/y.c"]}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
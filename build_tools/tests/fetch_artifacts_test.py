@@ -9,7 +9,7 @@ from unittest.mock import MagicMock
 
 sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
 
-from _therock_utils.artifact_backend import ArtifactBackend
+from _therock_utils.artifact_backend import ArtifactBackend, ArtifactIndex
 from fetch_artifacts import (
     list_artifacts_for_group,
     filter_artifacts,
@@ -24,12 +24,14 @@ class ArtifactsIndexPageTest(unittest.TestCase):
         # Test that filtering by artifact_group works correctly
         backend = MagicMock(spec=ArtifactBackend)
         backend.base_uri = "s3://therock-ci-artifacts/ROCm-TheRock/123-linux"
-        backend.list_artifacts.return_value = [
-            "rocblas_lib_gfx94X.tar.xz",  # matches gfx94X
-            "rocblas_lib_gfx110X.tar.xz",  # doesn't match
-            "amd-llvm_lib_generic.tar.xz",  # matches generic
-            "hipblas_lib_gfx94X.tar.xz",  # matches gfx94X
-        ]
+        backend.artifact_index.return_value = ArtifactIndex.from_filenames(
+            [
+                "rocblas_lib_gfx94X.tar.xz",  # matches gfx94X
+                "rocblas_lib_gfx110X.tar.xz",  # doesn't match
+                "amd-llvm_lib_generic.tar.xz",  # matches generic
+                "hipblas_lib_gfx94X.tar.xz",  # matches gfx94X
+            ]
+        )
 
         result = list_artifacts_for_group(backend, "gfx94X")
 
@@ -43,13 +45,15 @@ class ArtifactsIndexPageTest(unittest.TestCase):
         """Test that amdgpu_targets matches individual-target split archives."""
         backend = MagicMock(spec=ArtifactBackend)
         backend.base_uri = "s3://therock-ci-artifacts/123-linux"
-        backend.list_artifacts.return_value = [
-            "blas_lib_generic.tar.zst",
-            "blas_lib_gfx942.tar.zst",
-            "blas_lib_gfx1100.tar.zst",
-            "blas_test_generic.tar.zst",
-            "blas_test_gfx942.tar.zst",
-        ]
+        backend.artifact_index.return_value = ArtifactIndex.from_filenames(
+            [
+                "blas_lib_generic.tar.zst",
+                "blas_lib_gfx942.tar.zst",
+                "blas_lib_gfx1100.tar.zst",
+                "blas_test_generic.tar.zst",
+                "blas_test_gfx942.tar.zst",
+            ]
+        )
 
         result = list_artifacts_for_group(
             backend, "gfx94X-dcgpu", amdgpu_targets=["gfx942"]
@@ -67,12 +71,14 @@ class ArtifactsIndexPageTest(unittest.TestCase):
         backend = MagicMock(spec=ArtifactBackend)
         backend.base_uri = "s3://therock-ci-artifacts/123-linux"
         # Mix of old (family-named) and new (target-named) archives
-        backend.list_artifacts.return_value = [
-            "blas_lib_gfx94X-dcgpu.tar.xz",  # old: family name
-            "fft_lib_gfx942.tar.zst",  # new: individual target
-            "amd-llvm_lib_generic.tar.xz",  # generic
-            "rand_lib_gfx110X-all.tar.xz",  # different family
-        ]
+        backend.artifact_index.return_value = ArtifactIndex.from_filenames(
+            [
+                "blas_lib_gfx94X-dcgpu.tar.xz",  # old: family name
+                "fft_lib_gfx942.tar.zst",  # new: individual target
+                "amd-llvm_lib_generic.tar.xz",  # generic
+                "rand_lib_gfx110X-all.tar.xz",  # different family
+            ]
+        )
 
         result = list_artifacts_for_group(
             backend, "gfx94X-dcgpu", amdgpu_targets=["gfx942"]
@@ -87,11 +93,13 @@ class ArtifactsIndexPageTest(unittest.TestCase):
         """Test that omitting amdgpu_targets preserves old family-only matching."""
         backend = MagicMock(spec=ArtifactBackend)
         backend.base_uri = "s3://therock-ci-artifacts/123-linux"
-        backend.list_artifacts.return_value = [
-            "blas_lib_gfx94X-dcgpu.tar.xz",
-            "blas_lib_gfx942.tar.zst",
-            "amd-llvm_lib_generic.tar.xz",
-        ]
+        backend.artifact_index.return_value = ArtifactIndex.from_filenames(
+            [
+                "blas_lib_gfx94X-dcgpu.tar.xz",
+                "blas_lib_gfx942.tar.zst",
+                "amd-llvm_lib_generic.tar.xz",
+            ]
+        )
 
         # No amdgpu_targets — should only match family name + generic
         result = list_artifacts_for_group(backend, "gfx94X-dcgpu")
@@ -104,12 +112,14 @@ class ArtifactsIndexPageTest(unittest.TestCase):
         """Test fetching with multiple individual targets."""
         backend = MagicMock(spec=ArtifactBackend)
         backend.base_uri = "s3://therock-ci-artifacts/123-linux"
-        backend.list_artifacts.return_value = [
-            "blas_lib_generic.tar.zst",
-            "blas_lib_gfx942.tar.zst",
-            "blas_lib_gfx90a.tar.zst",
-            "blas_lib_gfx1100.tar.zst",
-        ]
+        backend.artifact_index.return_value = ArtifactIndex.from_filenames(
+            [
+                "blas_lib_generic.tar.zst",
+                "blas_lib_gfx942.tar.zst",
+                "blas_lib_gfx90a.tar.zst",
+                "blas_lib_gfx1100.tar.zst",
+            ]
+        )
 
         result = list_artifacts_for_group(
             backend, "gfx94X-dcgpu", amdgpu_targets=["gfx942", "gfx90a"]
@@ -124,12 +134,14 @@ class ArtifactsIndexPageTest(unittest.TestCase):
         """Test that files not matching ArtifactName pattern are skipped."""
         backend = MagicMock(spec=ArtifactBackend)
         backend.base_uri = "s3://therock-ci-artifacts/123-linux"
-        backend.list_artifacts.return_value = [
-            "blas_lib_generic.tar.zst",
-            "README.md",
-            "some_random_file.txt",
-            "blas_lib_gfx942.tar.zst",
-        ]
+        backend.artifact_index.return_value = ArtifactIndex.from_filenames(
+            [
+                "blas_lib_generic.tar.zst",
+                "README.md",
+                "some_random_file.txt",
+                "blas_lib_gfx942.tar.zst",
+            ]
+        )
 
         result = list_artifacts_for_group(
             backend, "gfx94X-dcgpu", amdgpu_targets=["gfx942"]
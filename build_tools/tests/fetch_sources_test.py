@@ -0,0 +1,217 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the reference-cached fetching in fetch_sources.py."""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+
+from fetch_sources import (
+    get_reference_mirror_dir,
+    run_parallel,
+    update_reference_mirror,
+    update_submodules,
+)
+
+# Allow file:// submodule URLs in the git processes spawned by fetch_sources.
+GIT_ENV = {
+    "GIT_CONFIG_COUNT": "1",
+    "GIT_CONFIG_KEY_0": "protocol.file.allow",
+    "GIT_CONFIG_VALUE_0": "always",
+}
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.check_output(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            "-c",
+            "init.defaultBranch=main",
+            *args,
+        ],
+        cwd=cwd,
+        stderr=subprocess.DEVNULL,
+    ).decode()
+
+
+class ReferenceMirrorDirTest(unittest.TestCase):
+    def test_equivalent_urls_share_a_mirror(self):
+        cache = Path("/cache")
+        mirror = get_reference_mirror_dir(
+            cache, "https://github.com/ROCm/rocm-libraries"
+        )
+        self.assertEqual(mirror.parent, cache)
+        self.assertTrue(mirror.name.startswith("rocm-libraries-"))
+        self.assertTrue(mirror.name.endswith(".git"))
+        for url in [
+            "https://github.com/ROCm/rocm-libraries.git",
+            "https://github.com/ROCm/rocm-libraries/",
+        ]:
+            self.assertEqual(get_reference_mirror_dir(cache, url), mirror)
+
+    def test_same_basename_different_urls(self):
+        cache = Path("/cache")
+        self.assertNotEqual(
+            get_reference_mirror_dir(cache, "https://github.com/ROCm/llvm-project"),
+            get_reference_mirror_dir(cache, "https://github.com/llvm/llvm-project"),
+        )
+
+    def test_unsafe_characters_are_replaced(self):
+        mirror = get_reference_mirror_dir(Path("/cache"), "git@host:group/a b+c.git")
+        self.assertRegex(mirror.name, r"^a_b_c-[0-9a-f]{12}\.git$")
+
+
+class RunParallelTest(unittest.TestCase):
+    def test_results_in_input_order(self):
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        self.assertEqual(run_parallel(slow_square, range(5), 3), [0, 1, 4, 9, 16])
+
+    def test_all_items_run_before_first_failure_is_raised(self):
+        done = []
+        lock = threading.Lock()
+
+        def fn(n):
+            if n in (1, 3):
+                raise ValueError(f"item {n}")
+            with lock:
+                done.append(n)
+
+        with self.assertRaisesRegex(ValueError, "item 1"):
+            run_parallel(fn, range(5), 2)
+        self.assertEqual(sorted(done), [0, 2, 4])
+
+
+class ReferenceCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_dir = self.temp_dir / "cache"
+        env_patch = mock.patch.dict(os.environ, GIT_ENV)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+
+        # Two upstream repositories, served from local bare repos.
+        self.upstream_urls = {}
+        for name in ["liba", "libb"]:
+            work_dir = self.temp_dir / "work" / name
+            work_dir.mkdir(parents=True)
+            _git(work_dir, "init", "-q")
+            (work_dir / "README").write_text(f"{name}\n")
+            _git(work_dir, "add", ".")
+            _git(work_dir, "commit", "-q", "-m", name)
+            bare_dir = self.temp_dir / "upstream" / f"{name}.git"
+            _git(self.temp_dir, "clone", "-q", "--bare", str(work_dir), str(bare_dir))
+            self.upstream_urls[name] = bare_dir.as_uri()
+
+        self.super_dir = self.temp_dir / "super"
+        self.super_dir.mkdir()
+        _git(self.super_dir, "init", "-q")
+        for name, url in self.upstream_urls.items():
+            _git(
+                self.super_dir,
+                "-c",
+                "protocol.file.allow=always",
+                "submodule",
+                "add",
+                "-q",
+                "--name",
+                name,
+                url,
+                f"deps/{name}",
+            )
+        _git(self.super_dir, "commit", "-q", "-m", "super")
+        # Start from a fresh clone of the superproject, without submodules.
+        self.checkout_dir = self.temp_dir / "checkout"
+        _git(self.temp_dir, "clone", "-q", str(self.super_dir), str(self.checkout_dir))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _args(self, dissociate: bool) -> argparse.Namespace:
+        return argparse.Namespace(
+            reference_cache=str(self.cache_dir), fetch_jobs=2, dissociate=dissociate
+        )
+
+    def _alternates(self, name: str) -> Path:
+        git_dir = _git(
+            self.checkout_dir / "deps" / name, "rev-parse", "--absolute-git-dir"
+        ).strip()
+        return Path(git_dir) / "objects" / "info" / "alternates"
+
+    def test_mirror_is_created_and_refreshed_without_pruning(self):
+        url = self.upstream_urls["liba"]
+        mirror_dir = update_reference_mirror(self.cache_dir, url)
+        self.assertEqual(mirror_dir, get_reference_mirror_dir(self.cache_dir, url))
+        self.assertTrue((mirror_dir / "HEAD").exists())
+
+        upstream_dir = self.temp_dir / "upstream" / "liba.git"
+        head = _git(upstream_dir, "rev-parse", "main").strip()
+        _git(upstream_dir, "branch", "topic", head)
+        update_reference_mirror(self.cache_dir, url)
+        self.assertEqual(_git(mirror_dir, "rev-parse", "topic").strip(), head)
+
+        # Objects of branches deleted upstream stay available in the mirror.
+        _git(upstream_dir, "branch", "-D", "topic")
+        update_reference_mirror(self.cache_dir, url)
+        self.assertEqual(_git(mirror_dir, "rev-parse", "topic").strip(), head)
+
+    def test_unreachable_url_falls_back_to_no_mirror(self):
+        missing_url = (self.temp_dir / "missing.git").as_uri()
+        self.assertIsNone(update_reference_mirror(self.cache_dir, missing_url))
+
+    def test_update_submodules_dissociates_by_default(self):
+        update_submodules(
+            self._args(dissociate=True), self.checkout_dir, ["liba", "libb"], []
+        )
+
+        for name in ["liba", "libb"]:
+            readme = self.checkout_dir / "deps" / name / "README"
+            self.assertEqual(readme.read_text(), f"{name}\n")
+            self.assertFalse(self._alternates(name).exists())
+            self.assertTrue(
+                (
+                    get_reference_mirror_dir(self.cache_dir, self.upstream_urls[name])
+                    / "HEAD"
+                ).exists()
+            )
+
+    def test_update_submodules_without_dissociate_borrows_objects(self):
+        update_submodules(
+            self._args(dissociate=False), self.checkout_dir, ["liba", "libb"], []
+        )
+
+        for name in ["liba", "libb"]:
+            mirror_dir = get_reference_mirror_dir(
+                self.cache_dir, self.upstream_urls[name]
+            )
+            alternates = self._alternates(name).read_text()
+            self.assertIn(os.fspath(mirror_dir / "objects"), alternates)
+
+    def test_update_submodules_without_cache(self):
+        args = argparse.Namespace(reference_cache=None, fetch_jobs=2, dissociate=True)
+        update_submodules(args, self.checkout_dir, ["libb"], [])
+
+        self.assertTrue((self.checkout_dir / "deps" / "libb" / "README").exists())
+        self.assertFalse((self.checkout_dir / "deps" / "liba" / "README").exists())
+        self.assertFalse(self.cache_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
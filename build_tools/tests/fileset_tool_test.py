@@ -12,6 +12,13 @@ import tempfile
 import unittest
 
 sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+from _therock_utils.artifacts import (
+    _list_archive_members,
+    extract_archive,
+    is_seekable_zstd_archive,
+    load_member_index,
+    member_index_path,
+)
 from _therock_utils.hash_util import calculate_hash
 
 FILESET_TOOL = Path(__file__).parent.parent / "fileset_tool.py"
@@ -293,6 +300,107 @@ class FilesetToolTest(unittest.TestCase):
         self.assertEqual(os.stat(flat_orig).st_ino, os.stat(flat_link).st_ino)
         self.assertEqual(flat_orig.read_text(), "hardlink test content")
 
+    @unittest.skipIf(is_windows(), "Hardlinks not supported the same way on Windows")
+    def testArtifactArchiveMemberIndex(self):
+        """Test the member index lists archives and reads members by offset."""
+        artifact_dir = self.temp_dir / "blas_lib_generic"
+        lib_dir = artifact_dir / "example" / "stage" / "lib"
+        write_text(artifact_dir / "artifact_manifest.txt", "example/stage\n")
+        write_text(lib_dir / "small.txt", "small")
+        (lib_dir / "libbig.so.1").write_bytes(os.urandom(3 << 20))
+        (lib_dir / "libbig.so").symlink_to("libbig.so.1")
+        os.link(lib_dir / "small.txt", lib_dir / "small_link.txt")
+
+        for compression, extra_args, has_frames, suffix in [
+            ("xz", [], False, ".tar.xz"),
+            ("zstd", ["--chunked"], True, ".tar.zst"),
+            ("zstd", ["--seekable", "--frame-size", str(1 << 20)], False, ".tar.zst"),
+        ]:
+            with self.subTest(compression=compression, extra_args=extra_args):
+                archive = self.temp_dir / f"blas_lib_generic{suffix}"
+                run_command(
+                    [
+                        sys.executable,
+                        FILESET_TOOL,
+                        "artifact-archive",
+                        artifact_dir,
+                        "-o",
+                        archive,
+                        "--compression-type",
+                        compression,
+                        "--member-index",
+                        *extra_args,
+                    ]
+                )
+                index = load_member_index(archive)
+                self.assertEqual(index.prefixes, ["example/stage"])
+                self.assertEqual(bool(index.frames), has_frames)
+                self.assertEqual(
+                    index.read_member(archive, "example/stage/lib/libbig.so.1"),
+                    (lib_dir / "libbig.so.1").read_bytes(),
+                )
+                self.assertEqual(
+                    index.read_member(archive, "example/stage/lib/small_link.txt"),
+                    b"small",
+                )
+                self.assertEqual(
+                    index.get_member("example/stage/lib/libbig.so").linkname,
+                    "libbig.so.1",
+                )
+
+                # Listing from the index matches listing the archive itself.
+                from_index = _list_archive_members(archive)
+                member_index_path(archive).unlink()
+                self.assertEqual(from_index, _list_archive_members(archive))
+
+    def testArtifactArchiveSeekableExtract(self):
+        """Test seekable archives extract in parallel like extractall."""
+        artifact_dir = self.temp_dir / "blas_lib_generic"
+        lib_dir = artifact_dir / "example" / "stage" / "lib"
+        write_text(artifact_dir / "artifact_manifest.txt", "example/stage\n")
+        for i in range(8):
+            (lib_dir / f"lib{i}.so.1").parent.mkdir(parents=True, exist_ok=True)
+            (lib_dir / f"lib{i}.so.1").write_bytes(os.urandom((i + 1) << 18))
+        (lib_dir / "lib0.so").symlink_to("lib0.so.1")
+        os.link(lib_dir / "lib1.so.1", lib_dir / "lib1_link.so.1")
+        write_text(lib_dir / "empty" / "sub" / "README", "hello")
+
+        archive = self.temp_dir / "blas_lib_generic.tar.zst"
+        run_command(
+            [
+                sys.executable,
+                FILESET_TOOL,
+                "artifact-archive",
+                artifact_dir,
+                "-o",
+                archive,
+                "--compression-type",
+                "zstd",
+                "--seekable",
+                "--frame-size",
+                str(1 << 18),
+            ]
+        )
+        self.assertTrue(is_seekable_zstd_archive(archive))
+
+        serial_dir = self.temp_dir / "serial"
+        parallel_dir = self.temp_dir / "parallel"
+        extract_archive(archive, serial_dir, max_workers=1)
+        extract_archive(archive, parallel_dir, max_workers=4)
+        serial = sorted(p.relative_to(serial_dir) for p in serial_dir.rglob("*"))
+        parallel = sorted(p.relative_to(parallel_dir) for p in parallel_dir.rglob("*"))
+        self.assertEqual(serial, parallel)
+        for relpath in serial:
+            expected = serial_dir / relpath
+            actual = parallel_dir / relpath
+            self.assertEqual(actual.is_symlink(), expected.is_symlink())
+            if expected.is_file() and not expected.is_symlink():
+                self.assertEqual(actual.read_bytes(), expected.read_bytes())
+        self.assertEqual(
+            (parallel_dir / "example/stage/lib/lib1_link.so.1").read_bytes(),
+            (lib_dir / "lib1.so.1").read_bytes(),
+        )
+
     def testArtifactFlattenSplit(self):
         """Test artifact-flatten-split discovers and flattens split artifact dirs."""
         artifacts_dir = self.temp_dir / "artifacts"
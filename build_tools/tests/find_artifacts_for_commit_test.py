@@ -1,16 +1,22 @@
 # Copyright Advanced Micro Devices, Inc.
 # SPDX-License-Identifier: MIT
 
+import http.server
 import os
 from pathlib import Path
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 
 sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
 
 from find_artifacts_for_commit import (
+    ArtifactProbeCache,
     ArtifactRunInfo,
+    check_if_artifacts_exist,
     find_artifacts_for_commit,
 )
 from _therock_utils.workflow_outputs import WorkflowOutputRoot
@@ -335,5 +341,70 @@ class FindArtifactsCrossRunTest(unittest.TestCase):
         self.assertEqual(results[0].workflow_run_id, str(self.FAKE_RUN_NEWER["id"]))
 
 
+class _IndexHandler(http.server.BaseHTTPRequestHandler):
+    """Serves HEAD requests: 200 for paths in `existing`, 404 otherwise."""
+
+    existing: set[str] = set()
+    requests: list[str] = []
+
+    def do_HEAD(self):
+        type(self).requests.append(self.path)
+        self.send_response(200 if self.path in self.existing else 404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class ArtifactProbeCacheTest(unittest.TestCase):
+    """Tests for check_if_artifacts_exist() against a local HTTP stand-in."""
+
+    def setUp(self):
+        _IndexHandler.existing = {"/run-1/index-gfx94X-dcgpu.html"}
+        _IndexHandler.requests = []
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _IndexHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "probe_cache.json"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def _info(self, run_id: str) -> mock.Mock:
+        info = mock.Mock(spec=ArtifactRunInfo)
+        port = self.server.server_address[1]
+        info.s3_index_url = f"http://127.0.0.1:{port}/{run_id}/index-gfx94X-dcgpu.html"
+        return info
+
+    def test_results_are_cached(self):
+        cache = ArtifactProbeCache(self.cache_path)
+        self.assertTrue(check_if_artifacts_exist(self._info("run-1"), cache))
+        self.assertFalse(check_if_artifacts_exist(self._info("run-2"), cache))
+        self.assertTrue(check_if_artifacts_exist(self._info("run-1"), cache))
+        self.assertFalse(check_if_artifacts_exist(self._info("run-2"), cache))
+        self.assertEqual(len(_IndexHandler.requests), 2)
+
+    def test_cache_persists_to_disk(self):
+        cache = ArtifactProbeCache(self.cache_path)
+        check_if_artifacts_exist(self._info("run-1"), cache)
+        cache.save()
+
+        reloaded = ArtifactProbeCache(self.cache_path)
+        self.assertTrue(check_if_artifacts_exist(self._info("run-1"), reloaded))
+        self.assertEqual(len(_IndexHandler.requests), 1)
+
+    def test_negative_results_expire(self):
+        cache = ArtifactProbeCache(self.cache_path, negative_ttl_seconds=0.01)
+        self.assertFalse(check_if_artifacts_exist(self._info("run-2"), cache))
+        # The index was uploaded since the last check.
+        _IndexHandler.existing.add("/run-2/index-gfx94X-dcgpu.html")
+        time.sleep(0.02)
+        self.assertTrue(check_if_artifacts_exist(self._info("run-2"), cache))
+        self.assertEqual(len(_IndexHandler.requests), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,7 @@
 import os
 from pathlib import Path
 import sys
+import time
 import unittest
 from unittest import mock
 
@@ -227,5 +228,47 @@ class FindLatestArtifactsMultiGroupTest(unittest.TestCase):
         self.assertIsNone(results)
 
 
+class FindLatestArtifactsConcurrencyTest(unittest.TestCase):
+    """Tests for concurrent commit lookups in find_latest_artifacts()."""
+
+    @staticmethod
+    def _fake_lookup(found_commits: set[str], delays: dict[str, float]):
+        looked_up = []
+
+        def lookup(commit, artifact_groups, **kwargs):
+            looked_up.append(commit)
+            time.sleep(delays.get(commit, 0))
+            if commit not in found_commits:
+                return []
+            info = mock.Mock()
+            info.git_commit_sha = commit
+            info.artifact_group = artifact_groups[0]
+            info.workflow_run_id = "1"
+            return [info]
+
+        return lookup, looked_up
+
+    @mock.patch("find_latest_artifacts.gha_query_recent_branch_commits")
+    def test_newest_match_wins_even_if_older_finishes_first(self, mock_commits):
+        mock_commits.return_value = ["c0", "c1", "c2", "c3"]
+        lookup, _ = self._fake_lookup({"c1", "c2"}, delays={"c1": 0.1})
+        with mock.patch("find_latest_artifacts.find_artifacts_for_commit", lookup):
+            results = find_latest_artifacts(
+                artifact_groups=["gfx94X-dcgpu"], max_workers=4
+            )
+        self.assertEqual(results[0].git_commit_sha, "c1")
+
+    @mock.patch("find_latest_artifacts.gha_query_recent_branch_commits")
+    def test_stops_submitting_after_match(self, mock_commits):
+        mock_commits.return_value = [f"c{i}" for i in range(20)]
+        lookup, looked_up = self._fake_lookup({"c0"}, delays={})
+        with mock.patch("find_latest_artifacts.find_artifacts_for_commit", lookup):
+            results = find_latest_artifacts(
+                artifact_groups=["gfx94X-dcgpu"], max_workers=2
+            )
+        self.assertEqual(results[0].git_commit_sha, "c0")
+        self.assertLessEqual(len(looked_up), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for merge_compile_commands.py."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+
+import merge_compile_commands
+
+
+def _entry(file: str, directory: str = "/build/a") -> dict:
+    return {
+        "directory": directory,
+        "command": f"/usr/bin/cc -I{directory}/include -c {file}",
+        "file": file,
+        "output": f"{file}.o",
+    }
+
+
+class MergeCompileCommandsTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.output = self.temp_dir / "merged.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_input(self, name: str, entries: list[dict]) -> Path:
+        path = self.temp_dir / name
+        path.write_text(json.dumps(entries, indent=2))
+        return path
+
+    def test_merges_and_deduplicates(self):
+        a = self.write_input("a.json", [_entry("x.c"), _entry("y.c")])
+        b = self.write_input("b.json", [_entry("y.c"), _entry("z.c", "/build/b")])
+        empty = self.temp_dir / "empty.json"
+        empty.touch()
+        merge_compile_commands.main(
+            [
+                str(self.output),
+                str(a),
+                str(empty),
+                str(self.temp_dir / "missing"),
+                str(b),
+            ]
+        )
+        self.assertEqual(
+            json.loads(self.output.read_text()),
+            [_entry("x.c"), _entry("y.c"), _entry("z.c", "/build/b")],
+        )
+
+    def test_streams_entries_across_reads(self):
+        entries = [_entry(f"file{i}.c") for i in range(200)]
+        path = self.write_input("a.json", entries)
+        with mock.patch.object(merge_compile_commands, "READ_SIZE", 7):
+            self.assertEqual(list(merge_compile_commands.iter_entries(path)), entries)
+
+    def test_rewrite_prefix(self):
+        a = self.write_input("a.json", [_entry("/build/a/x.c")])
+        merge_compile_commands.main(
+            ["--rewrite-prefix", "/build=/home/me/build", str(self.output), str(a)]
+        )
+        (entry,) = json.loads(self.output.read_text())
+        self.assertEqual(entry, _entry("/home/me/build/a/x.c", "/home/me/build/a"))
+
+    def test_unchanged_inputs_are_not_merged_again(self):
+        a = self.write_input("a.json", [_entry("x.c")])
+        merge_compile_commands.main([str(self.output), str(a)])
+        expected = self.output.read_text()
+
+        # Rewriting an input with the same contents only touches the output.
+        a.write_text(a.read_text())
+        with mock.patch.object(merge_compile_commands, "merge") as merge:
+            merge_compile_commands.main([str(self.output), str(a)])
+        merge.assert_not_called()
+        self.assertEqual(self.output.read_text(), expected)
+
+        self.write_input("a.json", [_entry("y.c")])
+        merge_compile_commands.main([str(self.output), str(a)])
+        self.assertEqual(json.loads(self.output.read_text()), [_entry("y.c")])
+
+
+if __name__ == "__main__":
+    unittest.main()
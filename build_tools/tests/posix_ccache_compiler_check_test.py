@@ -0,0 +1,74 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for posix_ccache_compiler_check.{py,sh}."""
+
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BUILD_TOOLS_DIR = Path(__file__).parent.parent
+CHECK_PY = BUILD_TOOLS_DIR / "posix_ccache_compiler_check.py"
+CHECK_SH = BUILD_TOOLS_DIR / "posix_ccache_compiler_check.sh"
+
+
+@unittest.skipUnless(
+    platform.system() == "Linux" and shutil.which("ldd") and shutil.which("bash"),
+    "requires Linux with ldd and bash",
+)
+class PosixCcacheCompilerCheckTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_dir = self.temp_dir / "compiler_check_cache"
+        self.compiler = self.temp_dir / "bin" / "clang"
+        self.compiler.parent.mkdir()
+        shutil.copy2(sys.executable, self.compiler)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def check_py(self) -> str:
+        return subprocess.check_output(
+            [sys.executable, CHECK_PY, self.cache_dir, self.compiler], text=True
+        )
+
+    def check_sh(self, check_script: Path = CHECK_PY) -> str:
+        return subprocess.check_output(
+            [
+                "bash",
+                CHECK_SH,
+                sys.executable,
+                check_script,
+                self.cache_dir,
+                self.compiler,
+            ],
+            text=True,
+        )
+
+    def test_fast_path_matches_python(self):
+        expected = self.check_py()
+        self.assertTrue(expected.startswith(f"{expected[:64]}\tclang\n"))
+        self.assertEqual(self.check_sh(), expected)
+        self.assertEqual(len(list((self.cache_dir / "fast").iterdir())), 1)
+        # Hits are answered without running the Python script.
+        self.assertEqual(
+            self.check_sh(check_script=self.temp_dir / "missing"), expected
+        )
+
+    def test_modified_compiler_is_fingerprinted_again(self):
+        first = self.check_sh()
+        with open(self.compiler, "ab") as f:
+            f.write(b"\0")
+        second = self.check_sh()
+        self.assertNotEqual(first.splitlines()[0], second.splitlines()[0])
+        self.assertEqual(first.splitlines()[1:], second.splitlines()[1:])
+        self.assertEqual(self.check_sh(check_script=self.temp_dir / "missing"), second)
+
+
+if __name__ == "__main__":
+    unittest.main()
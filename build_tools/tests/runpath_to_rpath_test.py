@@ -0,0 +1,109 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for packaging/linux/runpath_to_rpath.py."""
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent / "packaging" / "linux"))
+
+import runpath_to_rpath
+from runpath_to_rpath import (
+    DT_RPATH,
+    DT_RUNPATH,
+    STATUS_CONVERTED,
+    STATUS_FAILED,
+    STATUS_NO_RUNPATH,
+    STATUS_NOT_ELF,
+    convert_file_runpath_to_rpath,
+    convert_runpath_to_rpath,
+)
+
+DT_NEEDED = 1
+
+
+def _make_elf(tags: list[int], is_64: bool = True) -> bytes:
+    """Builds a minimal little-endian ELF with one PT_DYNAMIC segment."""
+    ehsize, phentsize = (64, 56) if is_64 else (52, 32)
+    dyn_offset = ehsize + phentsize
+    entry_format = "<qQ" if is_64 else "<iI"
+    dynamic = b"".join(struct.pack(entry_format, tag, 1) for tag in tags + [0])
+    ident = b"\x7fELF" + bytes([2 if is_64 else 1, 1, 1]) + bytes(9)
+    if is_64:
+        header = struct.pack(
+            "<HHIQQQIHHHHHH", 3, 62, 1, 0, ehsize, 0, 0, ehsize, phentsize, 1, 0, 0, 0
+        )
+        phdr = struct.pack(
+            "<IIQQQQQQ", 2, 6, dyn_offset, 0, 0, len(dynamic), len(dynamic), 8
+        )
+    else:
+        header = struct.pack(
+            "<HHIIIIIHHHHHH", 3, 3, 1, 0, ehsize, 0, 0, ehsize, phentsize, 1, 0, 0, 0
+        )
+        phdr = struct.pack(
+            "<IIIIIIII", 2, dyn_offset, 0, 0, len(dynamic), len(dynamic), 6, 4
+        )
+    return ident + header + phdr + dynamic
+
+
+def _dynamic_tags(path: Path) -> list[int]:
+    with open(path, "rb") as f:
+        _, tags = runpath_to_rpath._find_dynamic_tags(f)
+    return [tag for _, tag in tags]
+
+
+class RunpathToRpathTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_converts_runpath_in_place(self):
+        for is_64 in [True, False]:
+            with self.subTest(is_64=is_64):
+                path = self.temp_dir / f"lib{is_64}.so"
+                path.write_bytes(_make_elf([DT_NEEDED, DT_RUNPATH], is_64=is_64))
+                self.assertEqual(
+                    convert_file_runpath_to_rpath(str(path)), (STATUS_CONVERTED, "")
+                )
+                self.assertEqual(_dynamic_tags(path), [DT_NEEDED, DT_RPATH])
+                self.assertEqual(
+                    convert_file_runpath_to_rpath(str(path)), (STATUS_NO_RUNPATH, "")
+                )
+
+    def test_runpath_and_rpath_require_patchelf(self):
+        path = self.temp_dir / "lib.so"
+        path.write_bytes(_make_elf([DT_RPATH, DT_RUNPATH]))
+        with mock.patch.object(runpath_to_rpath.shutil, "which", return_value=None):
+            status, message = convert_file_runpath_to_rpath(str(path))
+        self.assertEqual(status, STATUS_FAILED)
+        self.assertIn("patchelf", message)
+        self.assertEqual(_dynamic_tags(path), [DT_RPATH, DT_RUNPATH])
+
+    def test_convert_tree(self):
+        lib_dir = self.temp_dir / "lib"
+        lib_dir.mkdir()
+        for i in range(4):
+            (lib_dir / f"lib{i}.so.1").write_bytes(_make_elf([DT_RUNPATH]))
+            (lib_dir / f"lib{i}.so").symlink_to(f"lib{i}.so.1")
+        (lib_dir / "README").write_text("not an ELF")
+        (lib_dir / "broken.so").symlink_to("missing.so")
+
+        summary = convert_runpath_to_rpath(self.temp_dir, max_workers=2)
+        self.assertEqual(
+            summary.counts, {STATUS_CONVERTED: 4, STATUS_NOT_ELF: 1}, summary
+        )
+        for i in range(4):
+            self.assertEqual(_dynamic_tags(lib_dir / f"lib{i}.so.1"), [DT_RPATH])
+
+
+if __name__ == "__main__":
+    unittest.main()
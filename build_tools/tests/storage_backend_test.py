@@ -13,11 +13,13 @@ sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
 from _therock_utils.workflow_outputs import WorkflowOutputRoot
 from _therock_utils.storage_location import StorageLocation
 from _therock_utils.storage_backend import (
+    AdaptiveConcurrencyLimiter,
     LocalStorageBackend,
     S3StorageBackend,
     StorageBackend,
     create_storage_backend,
     infer_content_type,
+    multipart_settings,
 )
 
 
@@ -604,7 +606,9 @@ class TestS3StorageBackendMaxPoolConnections(unittest.TestCase):
             mock_boto3.assert_called_once()
             config = mock_boto3.call_args.kwargs.get("config")
             self.assertIsNotNone(config)
-            self.assertEqual(config.max_pool_connections, 10)
+            # Up to 40 concurrent uploads of up to 16 parts each.
+            self.assertEqual(backend._limiter.maximum, 40)
+            self.assertEqual(config.max_pool_connections, 40 * 16)
 
     def test_custom_concurrency_sets_pool_connections(self):
         with mock.patch("boto3.client") as mock_boto3:
@@ -612,7 +616,15 @@ class TestS3StorageBackendMaxPoolConnections(unittest.TestCase):
             _ = backend.s3_client
 
             config = mock_boto3.call_args.kwargs.get("config")
-            self.assertEqual(config.max_pool_connections, 20)
+            self.assertEqual(config.max_pool_connections, 80 * 16)
+
+    def test_max_concurrency_sets_pool_connections(self):
+        with mock.patch("boto3.client") as mock_boto3:
+            backend = S3StorageBackend(upload_concurrency=20, max_upload_concurrency=30)
+            _ = backend.s3_client
+
+            config = mock_boto3.call_args.kwargs.get("config")
+            self.assertEqual(config.max_pool_connections, 30 * 16)
 
 
 class TestS3StorageBackendCredentialResolution(unittest.TestCase):
@@ -721,11 +733,144 @@ class TestCreateStorageBackend(unittest.TestCase):
         self.assertIsInstance(backend, S3StorageBackend)
         self.assertEqual(backend._upload_concurrency, 25)
 
-    def test_upload_concurrency_ignored_for_local(self):
+    def test_upload_concurrency_passed_to_local_backend(self):
         backend = create_storage_backend(
             staging_dir=Path("/tmp/staging"), upload_concurrency=25
         )
         self.assertIsInstance(backend, LocalStorageBackend)
+        self.assertEqual(backend._concurrency_limiter().limit, 25)
+
+
+# ---------------------------------------------------------------------------
+# Transfer engine
+# ---------------------------------------------------------------------------
+
+
+class TestMultipartSettings(unittest.TestCase):
+    def test_small_files_are_single_part(self):
+        self.assertIsNone(multipart_settings(0))
+        self.assertIsNone(multipart_settings(8 << 20))
+
+    def test_part_size_scales_with_file_size(self):
+        part_size, parts_in_flight = multipart_settings(1 << 30)
+        self.assertEqual(part_size, 16 << 20)
+        self.assertEqual(parts_in_flight, 16)
+
+        part_size, _ = multipart_settings(100 << 30)
+        self.assertGreaterEqual(part_size, (100 << 30) // 1000)
+        self.assertEqual(part_size % (1 << 20), 0)
+
+    def test_few_parts_limit_concurrency(self):
+        part_size, parts_in_flight = multipart_settings(64 << 20)
+        self.assertEqual(parts_in_flight, (64 << 20) // part_size)
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    def test_grows_while_throughput_improves(self):
+        limiter = AdaptiveConcurrencyLimiter(2, maximum=4)
+        with mock.patch("_therock_utils.storage_backend.time.monotonic") as clock:
+            clock.return_value = 0.0
+            limiter._reset_window(None)
+            for window, size in enumerate([100, 200, 400]):
+                clock.return_value = float(window + 1)
+                for _ in range(limiter.limit):
+                    limiter.acquire()
+                    limiter.release(size)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_default_maximum_allows_growth(self):
+        limiter = AdaptiveConcurrencyLimiter(10)
+        self.assertEqual(limiter.limit, 10)
+        self.assertEqual(limiter.maximum, 40)
+
+    def test_backoff_gives_up_slot_while_waiting(self):
+        limiter = AdaptiveConcurrencyLimiter(1, maximum=1)
+        limiter.acquire()
+        in_flight_during_wait = []
+        with mock.patch(
+            "_therock_utils.storage_backend.time.sleep",
+            side_effect=lambda _: in_flight_during_wait.append(limiter.in_flight),
+        ):
+            limiter.backoff(1.0)
+        self.assertEqual(in_flight_during_wait, [0])
+        self.assertEqual(limiter.in_flight, 1)
+        limiter.release()
+
+        # Threads without a slot just wait.
+        with mock.patch("_therock_utils.storage_backend.time.sleep") as sleep:
+            limiter.backoff(2.0)
+        sleep.assert_called_once_with(2.0)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_throttle_halves_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(8)
+        limiter.on_throttle()
+        self.assertEqual(limiter.limit, 4)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        limiter.on_throttle()
+        self.assertEqual(limiter.limit, 1)
+
+
+class TestS3StorageBackendTransferEngine(unittest.TestCase):
+    def test_large_file_uses_multipart_config(self):
+        backend = S3StorageBackend()
+        mock_client = mock.MagicMock()
+        backend._s3_client = mock_client
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "big.tar.xz"
+            with open(source, "wb") as f:
+                f.truncate(256 << 20)
+            backend.upload_file(source, StorageLocation("bucket", "run-1/big.tar.xz"))
+
+        config = mock_client.upload_file.call_args.kwargs["Config"]
+        self.assertEqual(config.multipart_chunksize, 16 << 20)
+        self.assertEqual(backend.metrics.total_bytes, 256 << 20)
+        self.assertEqual(len(backend.metrics.records), 1)
+
+    def test_throttling_reduces_concurrency(self):
+        from botocore.exceptions import ClientError
+
+        backend = S3StorageBackend(upload_concurrency=8)
+        mock_client = mock.MagicMock()
+        mock_client.upload_file.side_effect = [
+            ClientError({"Error": {"Code": "SlowDown"}}, "PutObject"),
+            None,
+        ]
+        backend._s3_client = mock_client
+
+        with mock.patch("_therock_utils.storage_backend.time.sleep"):
+            backend.upload_file(
+                Path("/tmp/a.log"), StorageLocation("bucket", "run-1/a.log")
+            )
+
+        self.assertEqual(backend._limiter.limit, 4)
+        self.assertEqual(backend.metrics.throttle_events, 1)
+        self.assertEqual(backend.metrics.records[0].attempts, 2)
+
+
+class TestLocalStorageBackendConcurrentUpload(unittest.TestCase):
+    def test_concurrent_upload_records_metrics(self):
+        with tempfile.TemporaryDirectory() as staging, tempfile.TemporaryDirectory() as src:
+            staging_dir = Path(staging)
+            src_dir = Path(src)
+            files = []
+            for i in range(6):
+                (src_dir / f"{i}.bin").write_bytes(b"x" * (i + 1))
+                files.append(
+                    (src_dir / f"{i}.bin", StorageLocation("bucket", f"run-1/{i}.bin"))
+                )
+
+            backend = LocalStorageBackend(staging_dir, upload_concurrency=3)
+            self.assertEqual(backend.upload_files(files), 6)
+
+            for i in range(6):
+                self.assertEqual(
+                    (staging_dir / "run-1" / f"{i}.bin").read_bytes(), b"x" * (i + 1)
+                )
+            self.assertEqual(backend.metrics.total_bytes, 21)
+            self.assertLessEqual(backend.metrics.peak_concurrency, 3)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for teatime.py."""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
+
+from teatime import SpillBuffer, iter_line_batches
+
+TEATIME = Path(__file__).parent.parent / "teatime.py"
+
+
+class SpillBufferTest(unittest.TestCase):
+    def test_spills_oldest_output(self):
+        buffer = SpillBuffer(max_memory_bytes=10)
+        chunks = [f"line {i}\n".encode() for i in range(100)]
+        for chunk in chunks:
+            buffer.write(chunk)
+        self.assertGreater(buffer.spilled_bytes, 0)
+        self.assertLessEqual(buffer._memory_bytes, 10)
+
+        out = io.BytesIO()
+        buffer.dump(out)
+        self.assertEqual(out.getvalue(), b"".join(chunks))
+        buffer.close()
+
+    def test_small_output_stays_in_memory(self):
+        buffer = SpillBuffer(max_memory_bytes=1 << 20)
+        buffer.write(b"hello\n")
+        self.assertEqual(buffer.spilled_bytes, 0)
+        out = io.BytesIO()
+        buffer.dump(out)
+        self.assertEqual(out.getvalue(), b"hello\n")
+
+
+class IterLineBatchesTest(unittest.TestCase):
+    def test_lines_are_reassembled(self):
+        data = b"".join(f"line {i}\n".encode() for i in range(20000)) + b"tail"
+        lines = [
+            line
+            for batch in iter_line_batches(io.BufferedReader(io.BytesIO(data)))
+            for line in batch
+        ]
+        self.assertEqual(lines, data.splitlines(keepends=True))
+
+
+class TeatimeTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def run_teatime(self, log_name: str, script: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [
+                sys.executable,
+                str(TEATIME),
+                "--no-interactive",
+                "--log-timestamps",
+                "--capture-memory-mb",
+                "0",
+                str(self.temp_dir / log_name),
+                "--",
+                sys.executable,
+                "-c",
+                script,
+            ],
+            capture_output=True,
+            env={**os.environ, "TEATIME_FORCE_INTERACTIVE": ""},
+        )
+
+    def test_failure_dumps_spilled_output(self):
+        result = self.run_teatime(
+            "out.log", "import sys\nfor i in range(1000): print(i)\nsys.exit(3)"
+        )
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(
+            result.stdout, b"".join(f"{i}\n".encode() for i in range(1000))
+        )
+        log_lines = (self.temp_dir / "out.log").read_bytes().splitlines()
+        self.assertTrue(log_lines[0].startswith(b"BEGIN\t"))
+        self.assertTrue(log_lines[-1].startswith(b"END\t"))
+        self.assertEqual(log_lines[-2].split(b"\t")[1], b"999")
+
+    def test_success_is_quiet_and_logs_compressed(self):
+        import pyzstd
+
+        result = self.run_teatime("out.log.zst", "print('hello')")
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, b"")
+        log_text = pyzstd.decompress((self.temp_dir / "out.log.zst").read_bytes())
+        self.assertIn(b"\thello\n", log_text)
+
+    def test_log_is_flushed_while_child_is_quiet(self):
+        log_path = self.temp_dir / "out.log"
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                str(TEATIME),
+                "--no-interactive",
+                str(log_path),
+                "--",
+                sys.executable,
+                "-c",
+                "import time\nprint('last words', flush=True)\ntime.sleep(20)",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env={**os.environ, "TEATIME_FORCE_INTERACTIVE": ""},
+        )
+        try:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                if log_path.exists() and b"last words\n" in log_path.read_bytes():
+                    break
+                time.sleep(0.1)
+            # The child is still running: the line got there by an idle flush.
+            self.assertIsNone(proc.poll())
+            self.assertIn(b"last words\n", log_path.read_bytes())
+        finally:
+            proc.kill()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -337,6 +337,7 @@ function(therock_provide_artifact slice_name)
   # that the current archive loop doesn't handle.
   set(_archive_files)
   set(_archive_sha_files)
+  set(_archive_members_files)
   set(_artifacts_dir "${THEROCK_BINARY_DIR}/artifacts")
   file(MAKE_DIRECTORY "${_artifacts_dir}")
   if(_should_split)
@@ -358,6 +359,8 @@ function(therock_provide_artifact slice_name)
     list(APPEND _archive_files "${_archive_file}")
     set(_archive_sha_file "${_archive_file}.sha256sum")
     list(APPEND _archive_sha_files "${_archive_sha_file}")
+    set(_archive_members_file "${_archive_file}.members.json")
+    list(APPEND _archive_members_files "${_archive_members_file}")
     # TODO(#726): Lower compression levels are much faster for development and CI.
     #             Set back to 6+ for production builds?
     set(_archive_compression_level 2)
@@ -365,12 +368,14 @@ function(therock_provide_artifact slice_name)
       OUTPUT
         "${_archive_file}"
         "${_archive_sha_file}"
+        "${_archive_members_file}"
       COMMENT "Creating archive ${_archive_file}"
       COMMAND
         "${Python3_EXECUTABLE}" "${_fileset_tool}"
         artifact-archive "${_component_dir}"
           -o "${_archive_file}"
           --compression-level "${_archive_compression_level}"
+          --member-index
           --hash-file "${_archive_sha_file}" --hash-algorithm sha256
       DEPENDS
         "${_manifest_file}"
@@ -385,7 +390,7 @@ function(therock_provide_artifact slice_name)
   add_custom_target(
     "${_archive_target_name}+expunge"
     COMMAND
-      "${CMAKE_COMMAND}" -E rm -f ${_archive_files} ${_archive_sha_files}
+      "${CMAKE_COMMAND}" -E rm -f ${_archive_files} ${_archive_sha_files} ${_archive_members_files}
     VERBATIM
   )
   add_dependencies(therock-expunge "${_archive_target_name}+expunge")
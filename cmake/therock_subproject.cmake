@@ -1164,9 +1164,10 @@ function(therock_subproject_merge_compile_commands)
     COMMENT "Merging compile_commands.json"
     COMMAND "${Python3_EXECUTABLE}"
       "${_merge_script}" "${_merged_file}" ${_fragment_files}
-    COMMAND "${CMAKE_COMMAND}" -E copy "${_merged_file}" "${_merged_file_in_source_dir}"
+    COMMAND "${CMAKE_COMMAND}" -E copy_if_different "${_merged_file}" "${_merged_file_in_source_dir}"
     BYPRODUCTS
        "${_merged_file_in_source_dir}"
+       "${_merged_file}.stamp"
     DEPENDS
       "${_merge_script}"
       ${_fragment_files}
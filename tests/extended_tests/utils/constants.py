@@ -13,6 +13,7 @@ class Constants:
     DEFAULT_CONFIG_FILE = Path(__file__).resolve().parent.parent / "configs/config.yml"
     DEFAULT_LOG_DIR = "./logs"
     DEFAULT_RESULTS_DIR = "./results"
+    SYSTEM_CACHE_FILE = "system_context.json"
 
     # File Extensions
     EXT_JSON = ".json"
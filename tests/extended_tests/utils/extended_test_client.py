@@ -59,14 +59,19 @@ class ExtendedTestClient:
         if auto_detect:
             self.detect_system()
 
-    def detect_system(self):
+    def detect_system(self, refresh: bool = False):
         """Detect and cache system information.
 
         Collects: Platform (OS, kernel), Hardware (CPU, GPU, memory),
         ROCm (version, build), and BIOS info. Stores in self.system_context.
+
+        Args:
+            refresh: Ignore the persisted system snapshot and re-probe everything
         """
         # Use SystemDetector for detection
-        self.system_context = self.system_detector.detect_all(verbose=True)
+        self.system_context = self.system_detector.detect_all(
+            verbose=True, use_cache=not refresh
+        )
 
     def upload_results(
         self,
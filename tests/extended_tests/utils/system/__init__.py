@@ -13,6 +13,7 @@ from .system_detector import (
 from .hardware import HardwareDetector, CpuInfo, GpuInfo
 from .platform import PlatformDetector, PlatformInfo
 from .rocm_detector import ROCmDetector
+from .system_cache import SystemContextCache
 
 __all__ = [
     "SystemDetector",
@@ -26,4 +27,5 @@ __all__ = [
     "PlatformDetector",
     "PlatformInfo",
     "ROCmDetector",
+    "SystemContextCache",
 ]
@@ -0,0 +1,170 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Persisted system context snapshot keyed by boot, kernel and ROCm install.
+
+System detection shells out to lspci, rocminfo, amd-smi, dmidecode and the
+package manager, which costs several seconds per test invocation. None of that
+information changes until the machine reboots, the kernel changes or the ROCm
+install is modified, so the detected fields are stored in a JSON snapshot and
+reused while the fingerprint still matches.
+"""
+
+import json
+import os
+import platform
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..constants import Constants
+from ..logger import log
+from .rocm_detector import _get_rocm_path
+
+# Bump when the snapshot layout (not the SystemContext fields) changes.
+SNAPSHOT_VERSION = 2
+
+# Files whose mtime/size identify a particular ROCm install.
+_ROCM_FINGERPRINT_FILES = [
+    ".info/version",
+    ".info/version-rocm",
+    "bin",
+    "lib",
+]
+
+
+def get_cache_path() -> Path:
+    """Get path of the system context snapshot file.
+
+    Returns:
+        Path: Snapshot file path, overridable with THEROCK_SYSTEM_CACHE_DIR
+    """
+    cache_dir = os.getenv("THEROCK_SYSTEM_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir) / Constants.SYSTEM_CACHE_FILE
+    xdg_cache = os.getenv("XDG_CACHE_HOME") or (Path.home() / ".cache")
+    return Path(xdg_cache) / "therock" / Constants.SYSTEM_CACHE_FILE
+
+
+def is_cache_enabled() -> bool:
+    """Check whether snapshot caching is enabled (THEROCK_SYSTEM_CACHE=0 disables)."""
+    return os.getenv("THEROCK_SYSTEM_CACHE", "1").lower() not in ("0", "false", "off")
+
+
+def _read_boot_id() -> str:
+    """Read the kernel boot id, falling back to boot time where unavailable."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id", "r") as f:
+            return f.read().strip()
+    except OSError:
+        pass
+    try:
+        import psutil
+
+        return str(int(psutil.boot_time()))
+    except Exception:
+        return "unknown"
+
+
+def _rocm_install_fingerprint() -> Dict[str, Any]:
+    """Build a cheap fingerprint of the ROCm install from stat() data only."""
+    rocm_path = _get_rocm_path()
+    stats = {}
+    for rel_path in _ROCM_FINGERPRINT_FILES:
+        try:
+            st = os.stat(os.path.join(rocm_path, rel_path))
+            stats[rel_path] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stats[rel_path] = None
+    return {
+        "rocm_path": rocm_path,
+        "therock_bin_dir": os.getenv("THEROCK_BIN_DIR", ""),
+        "stats": stats,
+    }
+
+
+def compute_fingerprint() -> Dict[str, Any]:
+    """Compute the fingerprint that a cached snapshot must match to be reused.
+
+    Returns:
+        Dict[str, Any]: Boot id, kernel release, hostname and ROCm install stats
+    """
+    return {
+        "boot_id": _read_boot_id(),
+        "kernel": platform.release(),
+        "hostname": platform.node(),
+        "rocm": _rocm_install_fingerprint(),
+    }
+
+
+class SystemContextCache:
+    """Load and store detected system context fields keyed by a fingerprint.
+
+    Example:
+        >>> cache = SystemContextCache()
+        >>> fields = cache.load()  # None on miss or stale fingerprint
+        >>> cache.store(context.to_dict())
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize cache.
+
+        Args:
+            path: Snapshot file path (default: get_cache_path())
+        """
+        self.path = Path(path) if path else get_cache_path()
+        self.fingerprint = compute_fingerprint()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load cached fields if the snapshot matches the current fingerprint.
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached SystemContext fields, or None
+        """
+        try:
+            with open(self.path, "r") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.debug(f"Ignoring unreadable system cache {self.path}: {e}")
+            return None
+
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            log.debug("System cache version mismatch, ignoring")
+            return None
+        if snapshot.get("fingerprint") != self.fingerprint:
+            log.debug("System cache fingerprint changed, ignoring")
+            return None
+        fields = snapshot.get("fields")
+        return fields if isinstance(fields, dict) else None
+
+    def store(self, fields: Dict[str, Any]):
+        """Atomically write detected fields to the snapshot file.
+
+        Args:
+            fields: SystemContext fields (as from SystemContext.to_dict()) and
+                the raw probe results (platform_info, rocm_info)
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "fingerprint": self.fingerprint,
+            "fields": fields,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(snapshot, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.debug(f"Failed to write system cache {self.path}: {e}")
+
+    def invalidate(self):
+        """Remove the snapshot file, forcing a full detection next time."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -3,13 +3,15 @@
 
 """System detector combining platform, hardware, and ROCm detection into unified context."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
 from ..logger import log
 from .hardware import HardwareDetector
-from .platform import PlatformDetector
+from .platform import PlatformDetector, PlatformInfo
 from .rocm_detector import ROCmDetector
+from .system_cache import SystemContextCache, is_cache_enabled
 
 
 def format_memory_size(size_gb: int) -> str:
@@ -133,26 +135,59 @@ class SystemContext:
         return asdict(self)
 
 
+# SystemContext field groups, keyed by the probe that produces them. Cached
+# snapshots are validated per group so that only missing groups are re-probed.
+# The raw platform_info and rocm_info probe results are cached along with their
+# fields, since callers use them directly (e.g. as build info for the results API).
+PROBE_FIELDS = {
+    "platform": [
+        "os_name",
+        "os_version",
+        "kernel",
+        "hostname",
+        "system_ip",
+        "sbios",
+        "platform_info",
+    ],
+    "cpu": [f.name for f in fields(SystemContext) if f.name.startswith("cpu_")],
+    "gpu": [f.name for f in fields(SystemContext) if f.name.startswith("gpu_")],
+    "rocm": [f.name for f in fields(SystemContext) if f.name.startswith("rocm_")]
+    + ["rocm_info"],
+}
+
+
 class SystemDetector:
     """System detector for comprehensive platform, hardware, and ROCm detection.
 
+    Detected fields are persisted through SystemContextCache and reused until
+    the boot id, kernel or ROCm install changes. When a refresh is needed only
+    the missing probe groups run, concurrently.
+
     Example:
         >>> detector = SystemDetector()
         >>> context = detector.detect_all()
         >>> print(f"OS: {context.os_name}, GPU: {context.gpu_name}")
     """
 
-    def __init__(self):
-        """Initialize system detector with empty state."""
+    def __init__(self, cache: Optional[SystemContextCache] = None):
+        """Initialize system detector with empty state.
+
+        Args:
+            cache: Snapshot cache to use (default: SystemContextCache())
+        """
         self.platform_info = None
         self.hardware = None
         self.rocm_info = None
+        self._cache = cache
+        # Fields of the probe groups loaded from the cache instead of detected
+        self._cached_fields: Dict[str, Any] = {}
 
-    def detect_all(self, verbose: bool = True) -> SystemContext:
+    def detect_all(self, verbose: bool = True, use_cache: bool = True) -> SystemContext:
         """Detect complete system information (platform, hardware, ROCm).
 
         Args:
             verbose: Log detection progress (default: True)
+            use_cache: Reuse/refresh the persisted snapshot (default: True)
 
         Returns:
             SystemContext: Complete system information
@@ -160,70 +195,137 @@ class SystemDetector:
         if verbose:
             log.info("Detecting system information...")
 
-        # Detect platform
-        self.platform_info = PlatformDetector.detect()
-        if verbose:
-            log.debug(
-                f"Platform: {self.platform_info.os_name} {self.platform_info.os_version}"
+        use_cache = use_cache and is_cache_enabled()
+        cached = {}
+        if use_cache:
+            if self._cache is None:
+                self._cache = SystemContextCache()
+            cached = self._cache.load() or {}
+
+        missing = []
+        self._cached_fields = {}
+        for probe, names in PROBE_FIELDS.items():
+            if all(name in cached for name in names):
+                self._cached_fields.update({name: cached[name] for name in names})
+            else:
+                missing.append(probe)
+        if "platform_info" in self._cached_fields:
+            self.platform_info = PlatformInfo(**self._cached_fields["platform_info"])
+        if "rocm_info" in self._cached_fields:
+            self.rocm_info = self._cached_fields["rocm_info"]
+
+        if not missing:
+            if verbose:
+                log.info(f"System detection loaded from cache {self._cache.path}")
+            return self.build_system_context()
+
+        if verbose and use_cache and cached:
+            log.debug(f"Refreshing stale system cache groups: {', '.join(missing)}")
+        self._run_probes(missing, verbose)
+        context = self.build_system_context()
+
+        if use_cache:
+            self._cache.store(
+                {
+                    **context.to_dict(),
+                    "platform_info": asdict(self.platform_info),
+                    "rocm_info": self.rocm_info,
+                }
             )
 
-        # Detect hardware
-        self.hardware = HardwareDetector()
-        self.hardware.detect_all()
         if verbose:
-            log.debug("Hardware detection complete")
+            log.info("System detection complete")
 
-        # Detect ROCm
-        self.rocm_info = ROCmDetector.detect_rocm_info()
-        if verbose:
-            log.debug(f"ROCm: {self.rocm_info['rocm_version']}")
+        return context
 
-        # Build system context
-        context = self.build_system_context()
+    def _run_probes(self, probes: List[str], verbose: bool):
+        """Run the requested detection probes concurrently.
 
-        if verbose:
-            log.info("System detection complete")
+        Probes are dominated by subprocess calls (lspci, amd-smi, rocminfo,
+        dmidecode, package managers), so threads give real overlap.
 
-        return context
+        Args:
+            probes: Subset of PROBE_FIELDS keys to detect
+            verbose: Log detection progress
+        """
+        self.hardware = self.hardware or HardwareDetector()
+        tasks = {
+            "platform": PlatformDetector.detect,
+            "cpu": self.hardware.detect_cpu,
+            "gpu": self.hardware.detect_gpu,
+            "rocm": ROCmDetector.detect_rocm_info,
+        }
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {probe: executor.submit(tasks[probe]) for probe in probes}
+            results = {probe: future.result() for probe, future in futures.items()}
+
+        if "platform" in results:
+            self.platform_info = results["platform"]
+            if verbose:
+                log.debug(
+                    f"Platform: {self.platform_info.os_name} {self.platform_info.os_version}"
+                )
+        if "cpu" in results or "gpu" in results:
+            if verbose:
+                log.debug("Hardware detection complete")
+        if "rocm" in results:
+            self.rocm_info = results["rocm"]
+            if verbose:
+                log.debug(f"ROCm: {self.rocm_info['rocm_version']}")
 
     def build_system_context(self) -> SystemContext:
         """Build SystemContext dataclass from detected platform, hardware, and ROCm info.
 
+        Probe groups loaded from the cache by detect_all() use the cached fields.
+
         Returns:
             SystemContext: Complete system context
 
         Raises:
             RuntimeError: If detect_all() hasn't been called
         """
+        hardware_cached = all(
+            name in self._cached_fields
+            for name in PROBE_FIELDS["cpu"] + PROBE_FIELDS["gpu"]
+        )
         if (
             self.platform_info is None
-            or self.hardware is None
+            or (self.hardware is None and not hardware_cached)
             or self.rocm_info is None
         ):
             raise RuntimeError(
                 "System detection not complete. Call detect_all() first."
             )
 
-        # Get CPU info
-        cpu = (
-            self.hardware.get_cpu() if self.hardware.get_is_cpu_initialized() else None
+        detected = {}
+        for probe, builder in self._PROBE_BUILDERS.items():
+            if all(name in self._cached_fields for name in PROBE_FIELDS[probe]):
+                detected.update(
+                    {name: self._cached_fields[name] for name in PROBE_FIELDS[probe]}
+                )
+            else:
+                detected.update(builder(self))
+        return SystemContext(
+            **{f.name: detected[f.name] for f in fields(SystemContext)}
         )
 
-        # Get GPU info
-        gpu_devices = []
-        if self.hardware.get_is_gpu_initialized():
-            gpu = self.hardware.getGpu()
-            gpu_devices = gpu.adapters if gpu.adapters else []
-
-        return SystemContext(
-            # Platform
+    def _platform_fields(self) -> Dict[str, Any]:
+        """Build platform fields of SystemContext."""
+        return dict(
             os_name=self.platform_info.os_name,
             os_version=self.platform_info.os_version,
             kernel=self.platform_info.kernel_release,
             hostname=self.platform_info.hostname,
             system_ip=PlatformDetector.get_system_ip(),
             sbios=self.platform_info.sbios,
-            # CPU
+        )
+
+    def _cpu_fields(self) -> Dict[str, Any]:
+        """Build CPU fields of SystemContext."""
+        cpu = (
+            self.hardware.get_cpu() if self.hardware.get_is_cpu_initialized() else None
+        )
+        return dict(
             cpu_model=cpu.getCpuModelName() if cpu else "Unknown",
             cpu_cores=cpu.getCpuCores() if cpu else 0,
             cpu_sockets=cpu.getCpuSockets() if cpu else 0,
@@ -233,7 +335,16 @@ class SystemDetector:
             cpu_l1_cache=cpu.getCpuL1Cache() if cpu else 0,
             cpu_l2_cache=cpu.getCpuL2Cache() if cpu else 0,
             cpu_l3_cache=cpu.getCpuL3Cache() if cpu else 0,
-            # GPU
+        )
+
+    def _gpu_fields(self) -> Dict[str, Any]:
+        """Build GPU fields of SystemContext."""
+        gpu_devices = []
+        if self.hardware.get_is_gpu_initialized():
+            gpu = self.hardware.getGpu()
+            gpu_devices = gpu.adapters if gpu.adapters else []
+
+        return dict(
             gpu_count=len(gpu_devices),
             gpu_name=gpu_devices[0].product_name if gpu_devices else "Unknown",
             gpu_marketing_name=(
@@ -252,7 +363,11 @@ class SystemDetector:
             gpu_host_driver=gpu_devices[0].host_driver if gpu_devices else "Unknown",
             gpu_firmwares=gpu_devices[0].firmwares if gpu_devices else [],
             gpu_devices=[adapter.product_name for adapter in gpu_devices],
-            # ROCm
+        )
+
+    def _rocm_fields(self) -> Dict[str, Any]:
+        """Build ROCm fields of SystemContext."""
+        return dict(
             rocm_version=self.rocm_info["rocm_version"],
             rocm_build_type=self.rocm_info["rocm_build_type"],
             rocm_build_lib_type=self.rocm_info["rocm_build_lib_type"],
@@ -261,6 +376,13 @@ class SystemDetector:
             rocm_install_type=self.rocm_info["install_type"],
         )
 
+    _PROBE_BUILDERS = {
+        "platform": _platform_fields,
+        "cpu": _cpu_fields,
+        "gpu": _gpu_fields,
+        "rocm": _rocm_fields,
+    }
+
     def print_system_summary(self, context: SystemContext):
         """Print formatted system information summary to console.
 
@@ -0,0 +1,139 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the cached system detection in utils/system."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.fspath(Path(__file__).parents[3]))
+from extended_tests.utils.system import system_detector
+from extended_tests.utils.system.platform import PlatformInfo
+from extended_tests.utils.system.system_cache import SystemContextCache
+from extended_tests.utils.system.system_detector import SystemDetector
+
+ROCM_INFO = {
+    "rocm_version": "7.10.0-1",
+    "rocm_build_type": "release",
+    "rocm_build_lib_type": "shared",
+    "rocm_package_manager": "pip",
+    "rocm_package_manager_version": "25.0",
+    "install_type": "tarball",
+}
+PLATFORM_INFO = PlatformInfo(
+    os_name="Ubuntu",
+    os_version="24.04",
+    kernel="6.8.0",
+    hostname="node0",
+    architecture="x86_64",
+    sbios="1.2.3",
+)
+
+
+class FakeHardwareDetector:
+    def detect_cpu(self):
+        return None
+
+    def detect_gpu(self):
+        return []
+
+    def get_is_cpu_initialized(self):
+        return False
+
+    def get_is_gpu_initialized(self):
+        return False
+
+
+class SystemDetectorCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_path = self.temp_dir / "system_context.json"
+        self.probes = []
+        patches = [
+            mock.patch.dict(os.environ, {"THEROCK_SYSTEM_CACHE": "1"}),
+            mock.patch.object(
+                system_detector.PlatformDetector,
+                "detect",
+                side_effect=lambda: self.probed("platform", PLATFORM_INFO),
+            ),
+            mock.patch.object(
+                system_detector.PlatformDetector,
+                "get_system_ip",
+                return_value="10.0.0.1",
+            ),
+            mock.patch.object(
+                system_detector.ROCmDetector,
+                "detect_rocm_info",
+                side_effect=lambda: self.probed("rocm", dict(ROCM_INFO)),
+            ),
+            mock.patch.object(
+                system_detector, "HardwareDetector", FakeHardwareDetector
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def probed(self, probe, result):
+        self.probes.append(probe)
+        return result
+
+    def detect(self):
+        detector = SystemDetector(cache=SystemContextCache(self.cache_path))
+        return detector, detector.detect_all(verbose=False)
+
+    def test_miss_detects_and_stores(self):
+        detector, context = self.detect()
+        self.assertEqual(sorted(self.probes), ["platform", "rocm"])
+        self.assertEqual(detector.rocm_info, ROCM_INFO)
+        self.assertEqual(context.rocm_install_type, "tarball")
+        self.assertEqual(context.os_name, "Ubuntu")
+        self.assertTrue(self.cache_path.exists())
+
+    def test_hit_restores_probe_results(self):
+        _, expected = self.detect()
+        self.probes.clear()
+
+        detector, context = self.detect()
+        self.assertEqual(self.probes, [])
+        self.assertEqual(context, expected)
+        self.assertEqual(detector.rocm_info, ROCM_INFO)
+        self.assertEqual(detector.platform_info, PLATFORM_INFO)
+        self.assertEqual(detector.build_system_context(), expected)
+
+    def test_stale_fingerprint_detects_again(self):
+        self.detect()
+        snapshot = json.loads(self.cache_path.read_text())
+        snapshot["fingerprint"]["boot_id"] = "previous-boot"
+        self.cache_path.write_text(json.dumps(snapshot))
+        self.probes.clear()
+
+        detector, _ = self.detect()
+        self.assertEqual(sorted(self.probes), ["platform", "rocm"])
+        self.assertEqual(detector.rocm_info, ROCM_INFO)
+
+    def test_missing_group_is_probed_alone(self):
+        _, expected = self.detect()
+        snapshot = json.loads(self.cache_path.read_text())
+        del snapshot["fields"]["rocm_info"]
+        self.cache_path.write_text(json.dumps(snapshot))
+        self.probes.clear()
+
+        detector, context = self.detect()
+        self.assertEqual(self.probes, ["rocm"])
+        self.assertEqual(context, expected)
+        self.assertEqual(detector.platform_info, PLATFORM_INFO)
+        self.assertIn("rocm_info", json.loads(self.cache_path.read_text())["fields"])
+
+
+if __name__ == "__main__":
+    unittest.main()
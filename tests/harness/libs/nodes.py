@@ -18,7 +18,7 @@ class Gpu(object):
 
     def runCmd(self, *cmd, env={}, **kwargs):
         """Runs cmd on assigned GPU only"""
-        env.update(self.env)
+        env = {**env, **self.env}
         return self.node.runCmd(*cmd, env=env, **kwargs)
 
 
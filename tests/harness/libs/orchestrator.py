@@ -3,12 +3,23 @@
 # SPDX-License-Identifier: MIT
 
 
+import os
+import json
+import time
+import queue
 import logging
+import threading
+from pathlib import Path
 from libs import utils
 
 
 log = logging.getLogger(__name__)
 
+# file (relative to the CTest build dir) to persist the test execution times
+DURATIONS_FILE = Path("Testing") / "Temporary" / "TheRockTestDurations.json"
+# cost data maintained by CTest itself, used if no durations are persisted yet
+CTEST_COST_FILE = Path("Testing") / "Temporary" / "CTestCostData.txt"
+
 
 class Orchestrator(object):
     """Orchestrator class to run sharded tests as per the GPUs available"""
@@ -18,36 +29,126 @@ class Orchestrator(object):
         self.gpus = node.getGpus()
         log.info(f"Total GPUs: {len(self.gpus)}")
 
-    def runCtest(self, *args, retries=3, **kwargs):
-        """Runs the CTest based tests in sharded parallel threads"""
-
-        def _runCtest(gpu, tests, *args, **kwargs):
-            """Runs an single CTest shard on an assigned GPU with auto retry of failed tests"""
-            cmd = ("ctest",)
-            for i in range(retries):
-                ret, out, _ = gpu.runCmd(*cmd, *tests, *args, **kwargs)
-                if ret == 0:
-                    return ret, out
-                tests = (*tests, "--rerun-failed")
-                log.info(f"[{gpu.node.host}]: Rerunning Failed Tests")
-            return ret, out
-
-        def _runCtestShards(gpu, shards, iShard, *args, **kwargs):
-            """Runs all the tests in default CTest sharding mode"""
-            tests = ("--tests-information", f"{iShard+1},,{shards}")
-            return _runCtest(gpu, tests, *args, **kwargs)
-
-        # shards tests
-        shards = len(self.gpus)
-        rets = utils.runParallel(
-            *[
-                (_runCtestShards, (gpu, shards, iShard, *args), kwargs)
-                for iShard, gpu in enumerate(self.gpus)
-            ]
-        )
+    def listCtests(self, *args, **kwargs):
+        """Lists the CTest test names in their CTest numbering order"""
+        ret, out, _ = self.node.runCmd("ctest", "--show-only=json-v1", *args, **kwargs)
+        assert ret == 0, f"Failed to list CTest tests: {out}"
+        return [test["name"] for test in json.loads(out).get("tests", [])]
+
+    @staticmethod
+    def loadDurations(cwd):
+        """Loads the previous execution times {testName: secs} of the CTest build dir"""
+        cwd = Path(cwd or ".")
+        try:
+            return json.loads((cwd / DURATIONS_FILE).read_text())
+        except (OSError, ValueError):
+            pass
+        # fallback to CTest's own cost data: '<name> <runs> <avgSecs>' lines
+        durations = {}
+        try:
+            for line in (cwd / CTEST_COST_FILE).read_text().splitlines():
+                if line.strip() == "---":
+                    break
+                name, _, cost = line.rsplit(" ", 2)
+                durations[name] = float(cost)
+        except (OSError, ValueError):
+            pass
+        return durations
+
+    @staticmethod
+    def saveDurations(cwd, durations):
+        """Persists the execution times {testName: secs} in the CTest build dir"""
+        path = Path(cwd or ".") / DURATIONS_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmpPath = path.with_name(f"{path.name}.tmp")
+        tmpPath.write_text(json.dumps(durations, indent=1, sort_keys=True))
+        os.replace(tmpPath, path)
+
+    def runCtest(self, *args, retries=3, report=None, **kwargs):
+        """Runs the CTest based tests on all GPUs in parallel
+
+        Individual tests are pulled from a shared queue by one runner thread per
+        GPU, longest first as per their previous execution times, so that no GPU
+        idles while others still have tests to run. Only the failed tests are
+        rerun (each test runs `retries` times at most), and each test result is added to the
+        `report` as soon as it finishes.
+        """
+        cwd = kwargs.get("cwd")
+        # tests are run by their CTest number, which counts all the tests
+        tests = self.listCtests(cwd=cwd)
+        selected = set(self.listCtests(*args, cwd=cwd)) if args else set(tests)
+        indices = [i for i, test in enumerate(tests) if test in selected]
+        log.info(f"Total CTest tests: {len(indices)}")
+        if not indices:
+            return True
+
+        # longest tests first, unknown (new) tests before all others
+        durations = self.loadDurations(cwd)
+        indices.sort(key=lambda i: -durations.get(tests[i], float("inf")))
+        testQueue = queue.Queue()
+        for i in indices:
+            testQueue.put((i, 1))
+
+        table = None
+        if report is not None:
+            table = report.addTable(title=f"CTest Results: {cwd}")
+            table.addRow("Test", "GPU", "Attempt", "Verdict", "ExecTime")
+        lock = threading.Lock()
+        verdicts = {}
+        pending = [len(indices)]  # tests whose final verdict is not known yet
+
+        def _runCtest(gpu, i, attempt):
+            """Runs a single CTest test (by its CTest number) on an assigned GPU"""
+            testNum = f"{i+1},{i+1}"
+            startTime = time.time()
+            passed = False
+            try:
+                ret, _, _ = gpu.runCmd(
+                    "ctest", "--tests-information", testNum, *args, **kwargs
+                )
+                passed = ret == 0
+            except Exception:
+                log.exception(f"[{gpu.node.host}]: Failed to run test: {tests[i]}")
+            finally:
+                # the test must always be settled, else the runners wait forever
+                _settleCtest(gpu, i, attempt, passed, time.time() - startTime)
+
+        def _settleCtest(gpu, i, attempt, passed, execTime):
+            """Records a test run, then either requeues the test or sets its verdict"""
+            with lock:
+                try:
+                    durations[tests[i]] = round(execTime, 3)
+                    if table is not None:
+                        verdictStr = ("FAIL", "PASS")[passed]
+                        execTimeStr = time.strftime("%H:%M:%S", time.gmtime(execTime))
+                        table.addRow(
+                            tests[i], gpu.index, attempt, verdictStr, execTimeStr
+                        )
+                except Exception:
+                    log.exception(f"[{gpu.node.host}]: Failed to record: {tests[i]}")
+                if passed or attempt >= retries:
+                    verdicts[tests[i]] = passed
+                    pending[0] -= 1
+                    if not pending[0]:
+                        # wake up all the runners to exit
+                        for _ in self.gpus:
+                            testQueue.put(None)
+                else:
+                    log.info(f"[{gpu.node.host}]: Rerunning Failed Test: {tests[i]}")
+                    testQueue.put((i, attempt + 1))
+
+        def _runTests(gpu):
+            """Test runner of a GPU, pulling tests from the shared queue till empty"""
+            while (item := testQueue.get()) is not None:
+                _runCtest(gpu, *item)
+
+        utils.runParallel(*[(_runTests, (gpu,), {}) for gpu in self.gpus])
+        self.saveDurations(cwd, durations)
+
         # reporting
-        result = True
-        for ret, out in rets:
-            result &= bool(ret == 0)
+        failed = [test for test, passed in verdicts.items() if not passed]
+        if failed:
+            log.info(f"Failed CTest tests: {failed}")
+        result = not failed
         assert result
         return result
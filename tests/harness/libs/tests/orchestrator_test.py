@@ -0,0 +1,152 @@
+# Copyright Advanced Micro Devices, Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the CTest scheduling in libs/orchestrator.py."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.fspath(Path(__file__).parents[2]))
+from libs import orchestrator
+
+TESTS = ["a", "b", "c", "d"]
+
+
+class FakeGpu:
+    def __init__(self, node, index):
+        self.node = node
+        self.index = index
+
+    def runCmd(self, *cmd, **kwargs):
+        return self.node.runTest(self, cmd)
+
+
+class FakeNode:
+    """Node whose CTest tests pass or fail as per a scripted list of outcomes.
+
+    outcomes[test] lists the result of each attempt: a return code, or an
+    exception to raise. Attempts beyond the list pass.
+    """
+
+    host = "fake-node"
+
+    def __init__(self, numGpus, outcomes):
+        self.gpus = [FakeGpu(self, i) for i in range(numGpus)]
+        self.outcomes = {test: list(results) for test, results in outcomes.items()}
+        self.runs = []  # (test, gpu index) in execution order
+        self.lock = threading.Lock()
+
+    def getGpus(self):
+        return self.gpus
+
+    def runCmd(self, *cmd, **kwargs):
+        assert cmd[:2] == ("ctest", "--show-only=json-v1"), cmd
+        return 0, json.dumps({"tests": [{"name": test} for test in TESTS]}), ""
+
+    def runTest(self, gpu, cmd):
+        assert cmd[:2] == ("ctest", "--tests-information"), cmd
+        first, last = cmd[2].split(",")
+        test = TESTS[int(first) - 1]
+        assert first == last, cmd
+        with self.lock:
+            self.runs.append((test, gpu.index))
+            results = self.outcomes.get(test, [])
+            result = results.pop(0) if results else 0
+        if isinstance(result, Exception):
+            raise result
+        return result, "", ""
+
+
+class FakeTable:
+    def __init__(self, failOn=None):
+        self.rows = []
+        self.failOn = failOn
+
+    def addRow(self, *row):
+        if row[0] == "Test":
+            return  # header
+        if row[0] == self.failOn:
+            raise RuntimeError("report failure")
+        self.rows.append(row)
+
+
+class FakeReport:
+    def __init__(self, table):
+        self.table = table
+
+    def addTable(self, title):
+        return self.table
+
+
+class OrchestratorTest(unittest.TestCase):
+    def setUp(self):
+        self.buildDir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.buildDir, ignore_errors=True)
+
+    def runCtest(self, node, **kwargs):
+        """Runs the tests, failing instead of hanging if the runners never exit"""
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = orchestrator.Orchestrator(node).runCtest(
+                    cwd=self.buildDir, **kwargs
+                )
+            except AssertionError as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout=30)
+        self.assertFalse(thread.is_alive(), "runCtest did not terminate")
+        return outcome
+
+    def testLongestTestsRunFirst(self):
+        orchestrator.Orchestrator.saveDurations(
+            self.buildDir, {"a": 1.0, "b": 5.0, "c": 3.0}
+        )
+        node = FakeNode(numGpus=1, outcomes={})
+        self.assertEqual(self.runCtest(node), {"result": True})
+        # unknown (new) tests run before all the others
+        self.assertEqual([test for test, _ in node.runs], ["d", "b", "c", "a"])
+        durations = orchestrator.Orchestrator.loadDurations(self.buildDir)
+        self.assertEqual(sorted(durations), TESTS)
+
+    def testOnlyFailedTestsAreRetried(self):
+        node = FakeNode(numGpus=2, outcomes={"b": [1, 1], "c": [1, 1, 1]})
+        table = FakeTable()
+        outcome = self.runCtest(node, retries=3, report=FakeReport(table))
+
+        self.assertIn("error", outcome)
+        attempts = {test: 0 for test in TESTS}
+        for test, _ in node.runs:
+            attempts[test] += 1
+        self.assertEqual(attempts, {"a": 1, "b": 3, "c": 3, "d": 1})
+        verdicts = {row[0]: row[3] for row in table.rows}
+        self.assertEqual(verdicts, {"a": "PASS", "b": "PASS", "c": "FAIL", "d": "PASS"})
+
+    def testRunnersExitWhenRunOrReportingFails(self):
+        node = FakeNode(numGpus=2, outcomes={"a": [OSError("lost node")]})
+        table = FakeTable(failOn="c")
+        outcome = self.runCtest(node, retries=2, report=FakeReport(table))
+
+        self.assertEqual(outcome, {"result": True})
+        self.assertEqual(
+            sorted(test for test, _ in node.runs), ["a", "a", "b", "c", "d"]
+        )
+        self.assertEqual(
+            sorted((row[0], row[2], row[3]) for row in table.rows),
+            [("a", 1, "FAIL"), ("a", 2, "PASS"), ("b", 1, "PASS"), ("d", 1, "PASS")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
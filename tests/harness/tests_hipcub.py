@@ -8,5 +8,7 @@ class TestHipCub:
 
     def test_hipcub(self, orch, therock_path, result):
         """A Test case to verify hipcub"""
-        result.testVerdict = orch.runCtest(cwd=f"{therock_path}/bin/hipcub")
+        result.testVerdict = orch.runCtest(
+            report=result, cwd=f"{therock_path}/bin/hipcub"
+        )
         assert result.testVerdict
@@ -8,5 +8,7 @@ class TestRocPrim:
 
     def test_rocprim(self, orch, therock_path, result):
         """A Test case to verify rocprim"""
-        result.testVerdict = orch.runCtest(cwd=f"{therock_path}/bin/rocprim")
+        result.testVerdict = orch.runCtest(
+            report=result, cwd=f"{therock_path}/bin/rocprim"
+        )
         assert result.testVerdict
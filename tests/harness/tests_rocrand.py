@@ -8,5 +8,7 @@ class TestRocRand:
 
     def test_rocrand(self, orch, therock_path, result):
         """A Test case to verify rocrand"""
-        result.testVerdict = orch.runCtest(cwd=f"{therock_path}/bin/rocRAND")
+        result.testVerdict = orch.runCtest(
+            report=result, cwd=f"{therock_path}/bin/rocRAND"
+        )
         assert result.testVerdict
@@ -8,5 +8,7 @@ class TestRocThrust:
 
     def test_rocthrust(self, orch, therock_path, result):
         """A Test case to verify rocthrust"""
-        result.testVerdict = orch.runCtest(cwd=f"{therock_path}/bin/rocthrust")
+        result.testVerdict = orch.runCtest(
+            report=result, cwd=f"{therock_path}/bin/rocthrust"
+        )
         assert result.testVerdict
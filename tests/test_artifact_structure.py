@@ -38,7 +38,11 @@ import pytest
 THIS_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(THIS_DIR.parent / "build_tools"))
 
-from _therock_utils.artifacts import ArtifactName, _open_archive_for_read
+from _therock_utils.artifacts import (
+    ArtifactName,
+    _open_archive_for_read,
+    load_member_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +64,20 @@ def list_archive_files(archive_path: Path) -> tuple[list[str], list[str]]:
 
     Reads artifact_manifest.txt (must be the first tar member) to get basedir
     prefixes, then strips those prefixes from each file member to produce
-    the flattened output path.
+    the flattened output path. When the archive has a member index sidecar,
+    both come from the index without decompressing the archive.
 
     Returns:
         (manifest_prefixes, flattened_file_paths)
     """
+    index = load_member_index(archive_path)
+    if index is not None:
+        return index.prefixes, [
+            path
+            for path, is_dir in index.flattened_members(archive_path)
+            if not is_dir and path
+        ]
+
     prefixes: list[str] = []
     flattened: list[str] = []
 